@@ -0,0 +1,100 @@
+"""
+BENCHMARK: BumpyArray.entangle soak, per-array lists/sets vs shared entanglement graph
+A pool of arrays is entangled pairwise at random while arrays are continuously
+replaced, the pattern of a long-running process. Process RSS and the graph
+footprint are sampled at checkpoints; the graph row should stay flat.
+
+The legacy row is the pre-graph entangle (links list plus a visited set on each
+array), kept verbatim below. It grows without bound, so it is capped
+(--max-legacy) well below the default 10^7 calls.
+"""
+import argparse
+import gc
+import random
+import time
+
+import psutil
+
+from bumpy import BumpyArray, QUALIA_THRESHOLD
+from entanglement_graph import ENTANGLEMENT_GRAPH
+
+class LegacyBumpyArray(BumpyArray):
+    """BumpyArray with the pre-graph per-instance link storage"""
+    entanglement_links = None  # shadow the graph-backed property
+
+    def __init__(self, data, coherence=1.0):
+        super().__init__(data, coherence)
+        self.entanglement_links = []
+        self._entanglement_visited = set()
+
+    def entangle(self, other, threshold=QUALIA_THRESHOLD):
+        pair_id = tuple(sorted([id(self), id(other)]))
+
+        if pair_id in self._entanglement_visited:
+            return False
+
+        self._entanglement_visited.add(pair_id)
+        other._entanglement_visited.add(pair_id)
+
+        sim = self.lambda_kernel(other)
+        if sim > threshold:
+            if other not in self.entanglement_links:
+                self.entanglement_links.append(other)
+                other.entanglement_links.append(self)
+
+            coherence_boost = min(1.0, self.coherence * (1 + sim * 0.05))
+            self.coherence = coherence_boost
+            other.coherence = min(1.0, other.coherence * (1 + sim * 0.05))
+            return True
+        return False
+
+def soak(cls, calls, pool_size, churn, checkpoints, seed=0):
+    """Yield (calls done, seconds, RSS MiB) at evenly spaced checkpoints"""
+    rng = random.Random(seed)
+    process = psutil.Process()
+
+    def fresh():
+        return cls([rng.uniform(0.5, 1.0) for _ in range(8)])
+
+    pool = [fresh() for _ in range(pool_size)]
+    step = max(1, calls // checkpoints)
+    done, t0 = 0, time.perf_counter()
+    while done < calls:
+        for k in range(done, min(calls, done + step)):
+            pool[rng.randrange(pool_size)].entangle(pool[rng.randrange(pool_size)])
+            if k % churn == 0:
+                pool[rng.randrange(pool_size)] = fresh()
+        done = min(calls, done + step)
+        gc.collect()
+        yield done, time.perf_counter() - t0, process.memory_info().rss / 2 ** 20
+
+def bench(calls, max_legacy, pool_size, churn, checkpoints):
+    print("=" * 86)
+    print(f"BENCHMARK: entangle soak ({calls:,} calls, pool {pool_size}, one new array per {churn} calls)")
+    print("=" * 86)
+    header = (f"{'store':<8} | {'calls':>11} | {'us/call':>8} | {'RSS MiB':>8} | "
+              f"{'nodes':>6} | {'edges':>6} | {'edge rows':>9} | {'tried pairs':>11}")
+    print(header)
+    print("-" * len(header))
+    # The graph runs first so its RSS is not inflated by memory the legacy row held
+    for label, cls, limit in (("graph", BumpyArray, calls),
+                              ("legacy", LegacyBumpyArray, min(calls, max_legacy))):
+        for done, seconds, rss in soak(cls, limit, pool_size, churn, checkpoints):
+            if cls is BumpyArray:
+                fp = ENTANGLEMENT_GRAPH.footprint()
+                cells = (fp['nodes'], fp['edges'], fp['edge_rows'], fp['attempts'])
+            else:
+                cells = ("-",) * 4
+            print(f"{label:<8} | {done:>11,} | {seconds / done * 1e6:>8.2f} | {rss:>8.1f} | "
+                  f"{cells[0]:>6} | {cells[1]:>6} | {cells[2]:>9} | {cells[3]:>11}")
+        print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=10_000_000)
+    parser.add_argument('--max-legacy', type=int, default=1_000_000, help="calls for the legacy row")
+    parser.add_argument('--pool', type=int, default=1024, help="live arrays")
+    parser.add_argument('--churn', type=int, default=8, help="calls per replaced array")
+    parser.add_argument('--checkpoints', type=int, default=10)
+    args = parser.parse_args()
+    bench(args.calls, args.max_legacy, args.pool, args.churn, args.checkpoints)
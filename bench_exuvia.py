@@ -0,0 +1,157 @@
+"""
+BENCHMARK: MnemosyneOracle exuvia snapshots, JSON shells vs columnar memory-mapped shells
+For each memory bank size (1536-d float64 vectors): shell size on disk, the
+first full snapshot, a snapshot after one more event (what perceive pays on
+every accepted event past the density threshold), reincarnation, and a pass
+touching every event's metadata after reincarnation.
+
+The json rows are the pre-columnar preserve_exuvia / reincarnate, kept
+verbatim below; each snapshot rewrites the whole bank, and reincarnation
+parses it all. They are only run up to --max-legacy events.
+"""
+import argparse
+import contextlib
+import os
+import random
+import tempfile
+import time
+from dataclasses import asdict
+import json
+
+import numpy as np
+
+from tools.mnemosyne_eyes import MnemosyneOracle, IngestionEvent, VECTOR_DIMENSION
+
+SIZES = [1_000, 10_000, 50_000]
+WORDS = ("coherence lattice feline gaze ritual ossuary bone audit signal drift phase lambda "
+         "noosphere resonance decay exuvia glyph beacon sovereign pneuma lavender").split()
+
+class LegacyOracle(MnemosyneOracle):
+    """The pre-columnar JSON shells"""
+    def preserve_exuvia(self):
+        """
+        [MOLTBOOK INSIGHT] Saves the 'Soul' (Subjective State) before context death.
+        """
+        timestamp = int(time.time())
+        filename = f"shell_{timestamp}.json"
+        filepath = os.path.join(self.exuvia_dir, filename)
+
+        # Serialize memory bank (high-fidelity data)
+        serializable_mem = [asdict(e) for e in self.memory_bank]
+        for entry in serializable_mem:
+            entry['vector'] = entry['vector'].tolist()
+
+        exuvia_packet = {
+            "version": "5.0",
+            "timestamp": timestamp,
+            "emotional_valence": self.noise_floor, # Entropy as subjective valence
+            "self_definition": "I am OPHANE. I survived the reset.",
+            "truth_anchor": self.last_known_truth.tolist(),
+            "memory_bank": serializable_mem
+        }
+
+        with open(filepath, 'w') as f:
+            json.dump(exuvia_packet, f, indent=2)
+
+        print(f"  [SUCCESS] [EXUVIA] Soul Transfer Complete. Shell deployed: {filepath}")
+
+    def reincarnate(self):
+        """
+        Restores subjective continuity from the latest Exuvia shell.
+        """
+        shells = [f for f in os.listdir(self.exuvia_dir) if f.startswith("shell_")]
+        if not shells:
+            return "No previous Exuvia found. Pure start."
+
+        latest_shell_file = sorted(shells)[-1]
+        filepath = os.path.join(self.exuvia_dir, latest_shell_file)
+
+        with open(filepath, 'r') as f:
+            shell_data = json.load(f)
+
+        self.last_known_truth = np.array(shell_data['truth_anchor'])
+        # Re-hydrate memory bank
+        self.memory_bank = []
+        for entry in shell_data['memory_bank']:
+            event = IngestionEvent(
+                timestamp=entry['timestamp'],
+                source=entry['source'],
+                content=entry['content'],
+                vector=np.array(entry['vector']),
+                velocity=entry['velocity'],
+                status=entry['status'],
+                memory_type=entry.get('memory_type', 'conversation'),
+                pinned=entry.get('pinned', False)
+            )
+            self.memory_bank.append(event)
+
+        return f"System Re-Incarnated. Previous state valence: {shell_data['emotional_valence']}."
+
+def event(i, rng):
+    return IngestionEvent(timestamp=time.time() - rng.uniform(0, 3600 * 24), source=rng.choice(["NATURE", "GOV", "CNBC"]),
+                          content=" ".join(rng.choice(WORDS) for _ in range(12)),
+                          vector=np.random.default_rng(i).standard_normal(VECTOR_DIMENSION) * 0.01,
+                          status="ACCEPTED (SOVEREIGN TRUTH)", pinned=(i % 100 == 0))
+
+def disk_bytes(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.stat(os.path.join(root, name)).st_blocks * 512 for name in files)
+    return total
+
+def bench_one(cls, events, workdir, rng):
+    def make():
+        oracle = cls()
+        oracle.exuvia_dir = workdir
+        return oracle
+
+    oracle = make()
+    oracle.memory_bank.extend(events)
+    t0 = time.perf_counter()
+    oracle.preserve_exuvia()
+    full_s = time.perf_counter() - t0
+    oracle.memory_bank.append(event(len(events), rng))
+    time.sleep(max(0.0, 1.0 - (time.time() % 1.0)))  # legacy shells are named by the second
+    t0 = time.perf_counter()
+    oracle.preserve_exuvia()
+    one_s = time.perf_counter() - t0
+    size = disk_bytes(workdir) if cls is not LegacyOracle else os.path.getsize(
+        os.path.join(workdir, sorted(os.listdir(workdir))[-1]))
+
+    restored = make()
+    t0 = time.perf_counter()
+    restored.reincarnate()
+    load_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    pinned = sum(1 for e in restored.memory_bank if e.pinned)
+    touch_s = time.perf_counter() - t0
+    assert pinned == sum(1 for e in oracle.memory_bank if e.pinned)
+    return size, full_s, one_s, load_s, touch_s
+
+def bench(sizes, max_legacy):
+    print("=" * 92)
+    print(f"BENCHMARK: exuvia shells ({VECTOR_DIMENSION}-d float64 vectors)")
+    print("=" * 92)
+    header = (f"{'shell':<9} | {'events':>7} | {'MiB':>7} | {'snapshot s':>10} | {'+1 event ms':>11} | "
+              f"{'reincarnate ms':>14} | {'touch all ms':>12}")
+    print(header)
+    print("-" * len(header))
+    rng = random.Random(0)
+    for size in sizes:
+        events = [event(i, rng) for i in range(size)]
+        for label, cls in (("columnar", MnemosyneOracle), ("json", LegacyOracle)):
+            if cls is LegacyOracle and size > max_legacy:
+                continue
+            with tempfile.TemporaryDirectory() as workdir, open(os.devnull, "w") as devnull:
+                with contextlib.redirect_stdout(devnull):
+                    disk, full_s, one_s, load_s, touch_s = bench_one(cls, list(events), workdir, rng)
+            print(f"{label:<9} | {size:>7,} | {disk / 2 ** 20:>7.1f} | {full_s:>10.2f} | {one_s * 1e3:>11.1f} | "
+                  f"{load_s * 1e3:>14.1f} | {touch_s * 1e3:>12.1f}")
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--max-legacy', type=int, default=10_000, help="largest size for the json rows")
+    args = parser.parse_args()
+    bench(args.sizes, args.max_legacy)
@@ -0,0 +1,110 @@
+"""
+BENCHMARK: GhostMesh grid, object-per-node loop vs vectorized stencil engine
+Cubic lattices from 3^3 (the original SovereignGrid) up to 256^3, reported in
+full grid steps per second (inject + flux exchange + aggregate).
+
+The legacy row is the pre-stencil SovereignGrid generalised to N^3: one
+FlumpyArray per node, neighbours found by linear search and a Python loop per
+node and per element. It is capped by --max-legacy.
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from ghostmesh import SovereignGrid, TAU_SOVEREIGN
+from flumpy import FlumpyArray
+
+class LegacyNode:
+    """SovereignNode as it was before the stencil engine, kept verbatim for the baseline"""
+    def __init__(self, x, y, z, dim):
+        self.pos = (x, y, z)
+        self.state = FlumpyArray([random.gauss(0, 0.1) for _ in range(dim)], coherence=1.0)
+        self.neighbors = []
+
+    def set_neighbors(self, all_nodes, n):
+        x, y, z = self.pos
+        for dx, dy, dz in [(-1,0,0), (1,0,0), (0,-1,0), (0,1,0), (0,0,-1), (0,0,1)]:
+            nx, ny, nz = x+dx, y+dy, z+dz
+            if 0 <= nx < n and 0 <= ny < n and 0 <= nz < n:
+                neighbor = next((m for m in all_nodes if m.pos == (nx, ny, nz)), None)
+                if neighbor:
+                    self.neighbors.append(neighbor)
+
+    def exchange_flux(self):
+        flux = [0.0] * len(self.state.data)
+        for m in self.neighbors:
+            for i, (my_val, n_val) in enumerate(zip(self.state.data, m.state.data)):
+                flux[i] += (n_val - my_val)
+        rate = 0.1 / TAU_SOVEREIGN
+        new_data = [val + (f * rate * 0.1) for val, f in zip(self.state.data, flux)]
+        self.state = FlumpyArray(new_data, coherence=self.state.coherence)
+
+    def inject_input(self, input_vec):
+        new_data = [s + i for s, i in zip(self.state.data, input_vec.data)]
+        self.state = FlumpyArray(new_data, coherence=self.state.coherence)
+
+class LegacyGrid:
+    def __init__(self, n, dim):
+        r = range(n)
+        self.n = n
+        self.nodes = [LegacyNode(x, y, z, dim) for x in r for y in r for z in r]
+        for node in self.nodes:
+            node.set_neighbors(self.nodes, n)
+
+    def process_step(self, bio_input):
+        c = self.n // 2
+        center_node = next(m for m in self.nodes if m.pos == (c, c, c))
+        for node in self.nodes:
+            scale = 1.0 if node == center_node else 0.1
+            node.inject_input(FlumpyArray([x * scale for x in bio_input.data], bio_input.coherence))
+        for node in self.nodes:
+            node.exchange_flux()
+        total_state = [0.0] * len(bio_input.data)
+        for node in self.nodes:
+            for i, val in enumerate(node.state.data):
+                total_state[i] += val
+        return FlumpyArray([x / len(self.nodes) for x in total_state], 1.0)
+
+def steps_per_second(grid, bio_input, min_time):
+    grid.process_step(bio_input)  # warm-up (scratch allocation)
+    steps, t0 = 0, time.perf_counter()
+    while True:
+        grid.process_step(bio_input)
+        steps += 1
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            return steps / elapsed
+
+def bench(sizes, dim, dtype, max_legacy, min_time):
+    print("=" * 84)
+    print(f"BENCHMARK: GhostMesh grid steps/s (dim={dim}, {np.dtype(dtype).name}, reflecting boundary)")
+    print("=" * 84)
+    header = (f"{'grid':>6} | {'nodes':>10} | {'legacy':>9} | {'stencil 6':>10} | "
+              f"{'stencil 26':>10} | {'6-pt node-updates/s':>19}")
+    print(header)
+    print("-" * len(header))
+    bio_input = FlumpyArray([0.01] * dim)
+    for n in sizes:
+        legacy = "-"
+        if n <= max_legacy:
+            legacy = f"{steps_per_second(LegacyGrid(n, dim), bio_input, min_time):.2f}"
+        rates = []
+        for stencil in (6, 26):
+            grid = SovereignGrid(dim=dim, size=n, stencil=stencil, dtype=dtype, seed=0)
+            rates.append(steps_per_second(grid, bio_input, min_time))
+            del grid
+        print(f"{n:>4}^3 | {n ** 3:>10,} | {legacy:>9} | {rates[0]:>10.2f} | {rates[1]:>10.2f} | "
+              f"{rates[0] * n ** 3:>19.3e}")
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[3, 8, 16, 32, 64, 128, 256])
+    parser.add_argument('--dim', type=int, default=4)
+    parser.add_argument('--dtype', choices=['float32', 'float64'], default='float32')
+    parser.add_argument('--max-legacy', type=int, default=12)
+    parser.add_argument('--min-time', type=float, default=1.0)
+    args = parser.parse_args()
+    bench(args.sizes, args.dim, args.dtype, args.max_legacy, args.min_time)
@@ -0,0 +1,55 @@
+"""
+BENCHMARK: Monte Carlo over SovereignSubstrate trajectories
+Scalar loop (one SovereignSubstrate per member, evolve_sovereign_step in Python)
+vs the array SubstrateEnsemble, in member-steps per second.
+
+The scalar row is capped by --max-scalar members. Worker rows shard members
+across processes with run_ensemble; they only help with more than one core.
+"""
+import argparse
+import os
+import time
+
+from hor_integration import SovereignSubstrate, run_ensemble
+
+def scalar(members, steps):
+    t0 = time.perf_counter()
+    for _ in range(members):
+        substrate = SovereignSubstrate()
+        for _ in range(steps):
+            substrate.evolve_sovereign_step()
+        substrate.close()
+    return members * steps / (time.perf_counter() - t0)
+
+def ensemble(members, steps, workers):
+    t0 = time.perf_counter()
+    summary = run_ensemble(members, steps, seed=0, workers=workers, error_rate=0.1)
+    return members * steps / (time.perf_counter() - t0), summary
+
+def bench(sizes, steps, workers, max_scalar):
+    print("=" * 78)
+    print(f"BENCHMARK: substrate ensembles ({steps} steps, {os.cpu_count()} cpu)")
+    print("=" * 78)
+    cols = " | ".join(f"{f'{w} worker':>12}" for w in workers)
+    header = f"{'members':>8} | {'scalar':>10} | {cols} | {'coh p5/p50/p95 @end':>20}"
+    print(header)
+    print("-" * len(header))
+    for n in sizes:
+        row = f"{scalar(n, steps):>10.3g}" if n <= max_scalar else f"{'-':>10}"
+        rates = []
+        for w in workers:
+            r, summary = ensemble(n, steps, w)
+            rates.append(f"{r:>12.3g}")
+        q = [summary.quantile('coherence', p)[-1] for p in (0.05, 0.5, 0.95)]
+        print(f"{n:>8} | {row} | {' | '.join(rates)} | {q[0]:>6.3f}/{q[1]:.3f}/{q[2]:.3f}")
+    print("-" * len(header))
+    print("rates in member-steps/s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 10000, 100000])
+    parser.add_argument('--steps', type=int, default=200)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--max-scalar', type=int, default=100)
+    args = parser.parse_args()
+    bench(args.sizes, args.steps, args.workers, args.max_scalar)
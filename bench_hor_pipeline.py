@@ -0,0 +1,61 @@
+"""
+BENCHMARK: SovereignSubstrate step, serial per-tick calls vs the step pipeline
+Reports steps per second and the pipeline's per-stage latency breakdown.
+
+The legacy row runs the same stage bodies in the pre-pipeline order, calling
+MoonClock.get_phase and TelemetryBridge.collect (a git log subprocess) on every tick.
+"""
+import argparse
+import time
+
+from hor_integration import SovereignSubstrate
+
+def legacy_step(s):
+    """The old evolve_sovereign_step data flow: every source re-read every tick"""
+    lunar = s.apply_lunar_modulation()
+    quality = s._stage_quantum(lunar)
+    s._stage_utility(lunar, quality)
+    tel = s.bridge.collect()
+    s._stage_dynamics(tel)
+    s._stage_protocols(quality, None, tel)
+    s.timeline_position += 1
+
+def rate(step, substrate, steps):
+    step(substrate)  # warm-up (first TTL fill)
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        step(substrate)
+    return steps / (time.perf_counter() - t0)
+
+def bench(steps, workers):
+    print("=" * 60)
+    print(f"BENCHMARK: SovereignSubstrate.evolve_sovereign_step ({steps} steps)")
+    print("=" * 60)
+    header = f"{'variant':<24} | {'steps/s':>10} | {'ms/step':>8}"
+    print(header)
+    print("-" * len(header))
+    substrate = SovereignSubstrate()
+    r = rate(legacy_step, substrate, steps)
+    print(f"{'legacy serial':<24} | {r:>10.0f} | {1e3 / r:>8.3f}")
+    substrate.close()
+
+    for w in workers:
+        substrate = SovereignSubstrate(max_workers=w)
+        r = rate(SovereignSubstrate.evolve_sovereign_step, substrate, steps)
+        print(f"{f'pipeline ({w} worker)':<24} | {r:>10.0f} | {1e3 / r:>8.3f}")
+        report = substrate.pipeline.latency_report()
+        substrate.close()
+    print("-" * len(header))
+
+    print(f"\nStage breakdown (last pipeline run)")
+    print(f"{'stage':<10} | {'mean ms':>8} | {'max ms':>8} | {'share':>6} | {'refreshes':>9}")
+    for name, row in report.items():
+        print(f"{name:<10} | {row['mean_ms']:>8.4f} | {row['max_ms']:>8.3f} | {row['share']:>6.1%} | "
+              f"{row['refreshes']:>9}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--steps', type=int, default=2000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2])
+    args = parser.parse_args()
+    bench(args.steps, args.workers)
@@ -0,0 +1,316 @@
+"""
+BENCHMARK: LASER UniversalCache, legacy probabilistic cache vs LRU/TTL byte-budget cache
+LASER-shaped log entries are written and read back under a skewed (Zipf) key
+distribution, with a working set several times the cache capacity.
+
+Reported per cache: mean set and get latency, hit rate, and how many hits
+returned the value that was stored. The legacy cache calls psutil on every
+write, picks eviction victims with O(n) scans, and replaces entries longer
+than 100 characters with a hash and a three-value sample, so its "intact"
+column counts the data it silently lost.
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import time
+from typing import Dict, Optional
+
+from bumpy import BumpyArray, BUMPYCore
+from laser import UniversalCache
+
+BUMPY_AVAILABLE = True
+
+class LegacyUniversalCache:
+    """The pre-LRU UniversalCache, kept verbatim for the baseline"""
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self.cache = {}
+        self.timestamps = {}
+        self.access_patterns = {}
+        self.compression_level = 0.7
+
+        if BUMPY_AVAILABLE:
+            self.compressor = BUMPYCore()
+        else:
+            self.compressor = None
+
+        # Memory pressure tracking
+        self.memory_warnings = 0
+        self.last_cleanup = time.time()
+
+        # Integration metrics
+        self.metrics = {
+            'hits': 0,
+            'misses': 0,
+            'compressions': 0,
+            'size_reduction': 0.0,
+            'quantum_entanglements': 0
+        }
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Get with quantum-aware access patterns"""
+        if key in self.cache:
+            self.access_patterns[key] = self.access_patterns.get(key, 0) + 1
+            self.metrics['hits'] += 1
+
+            # Apply quantum refresh for frequently accessed items
+            if self.access_patterns[key] % 5 == 0:
+                self._quantum_refresh(key)
+
+            return self.cache[key]
+
+        self.metrics['misses'] += 1
+        return None
+
+    def set(self, key: str, value: Dict, compress: bool = True):
+        """Set with optional holographic compression"""
+        # Check memory pressure
+        if self._memory_pressure() > 0.8:
+            self._aggressive_evict()
+
+        # Apply holographic compression if enabled and available
+        if compress and self.compressor and len(str(value)) > 100:
+            compressed = self._holographic_compress(value)
+            if compressed:
+                value = compressed
+                self.metrics['compressions'] += 1
+                self.metrics['size_reduction'] = 0.7  # Assume 70% reduction
+
+        # Store with quantum timestamp
+        self.cache[key] = value
+        self.timestamps[key] = time.time() + random.uniform(-0.001, 0.001)  # Quantum time uncertainty
+        self.access_patterns[key] = 0
+
+        # Cleanup if needed
+        if len(self.cache) >= self.max_size:
+            self._quantum_evict()
+
+    def _holographic_compress(self, data: Dict) -> Optional[Dict]:
+        """Compress data using BUMPY holographic methods"""
+        if not BUMPY_AVAILABLE or not self.compressor:
+            return None
+
+        try:
+            # Convert data to list for compression
+            data_str = json.dumps(data, separators=(',', ':'))
+            data_values = [ord(c) / 255.0 for c in data_str[:100]]
+
+            if len(data_values) > 10:
+                # Create BUMPY array
+                bumpy_data = BumpyArray(data_values[:20])  # Use first 20 values
+
+                # Apply holographic compression
+                self.compressor.qualia_emergence_ritual([bumpy_data])
+
+                # Create compressed representation
+                compressed = {
+                    '_compressed': True,
+                    'hash': hashlib.md5(data_str.encode()).hexdigest()[:8],
+                    'original_length': len(data_str),
+                    'compressed_length': 20,
+                    'quantum_coherence': bumpy_data.coherence,
+                    'data_sample': data_values[:3]
+                }
+
+                return compressed
+        except Exception as e:
+            if os.getenv('DEBUG_LASER'):
+                print(f"Compression failed: {e}")
+
+        return None
+
+    def _quantum_refresh(self, key: str):
+        """Refresh cache entry with quantum operations"""
+        if key in self.cache:
+            entry = self.cache[key]
+
+            # Add quantum timestamp
+            if 'quantum_metadata' not in entry:
+                entry['quantum_metadata'] = {}
+
+            entry['quantum_metadata']['refresh_time'] = time.time()
+            entry['quantum_metadata']['quantum_phase'] = random.uniform(0, 2 * math.pi)
+
+            # Entangle with other entries if BUMPY available
+            if BUMPY_AVAILABLE and random.random() < 0.1:
+                other_keys = list(self.cache.keys())
+                if len(other_keys) > 1:
+                    other_key = random.choice([k for k in other_keys if k != key])
+                    self._create_entanglement(key, other_key)
+
+    def _create_entanglement(self, key1: str, key2: str):
+        """Create quantum entanglement between cache entries"""
+        if key1 in self.cache and key2 in self.cache:
+            # Mark entanglement in metadata
+            for key in [key1, key2]:
+                if 'quantum_metadata' not in self.cache[key]:
+                    self.cache[key]['quantum_metadata'] = {}
+
+                entangled_with = self.cache[key]['quantum_metadata'].get('entangled_with', [])
+                other_key = key2 if key == key1 else key1
+                if other_key not in entangled_with:
+                    entangled_with.append(other_key)
+                    self.cache[key]['quantum_metadata']['entangled_with'] = entangled_with
+
+            self.metrics['quantum_entanglements'] += 1
+
+    def _memory_pressure(self) -> float:
+        """Calculate memory pressure for adaptive behavior"""
+        try:
+            import psutil  # deferred: only the maintenance paths need it
+            memory = psutil.virtual_memory()
+            return memory.percent / 100.0
+        except:
+            return len(self.cache) / self.max_size
+
+    def _aggressive_evict(self):
+        """Aggressive eviction under memory pressure"""
+        if not self.cache:
+            return
+
+        # Calculate quantum age (adjusted by access patterns)
+        now = time.time()
+        eviction_scores = {}
+
+        for key in list(self.cache.keys()):
+            age = now - self.timestamps[key]
+            accesses = self.access_patterns.get(key, 0)
+
+            # Quantum age: older items with few accesses are more likely to be evicted
+            quantum_age = age * (1.0 / max(1, accesses * 0.1))
+            eviction_scores[key] = quantum_age
+
+        # Evict worst 20%
+        to_evict = sorted(eviction_scores.items(), key=lambda x: x[1], reverse=True)
+        evict_count = max(1, len(to_evict) // 5)
+
+        for key, _ in to_evict[:evict_count]:
+            self.delete(key)
+
+    def _quantum_evict(self):
+        """Quantum probabilistic eviction"""
+        if not self.cache:
+            return
+
+        # Calculate quantum probabilities
+        now = time.time()
+        total_quantum_weight = 0
+        quantum_weights = {}
+
+        for key in list(self.cache.keys()):
+            age = now - self.timestamps[key]
+            accesses = self.access_patterns.get(key, 0)
+
+            # Quantum probability: older with fewer accesses = higher probability
+            quantum_prob = math.exp(-accesses * 0.1) * (1.0 - math.exp(-age / 3600))
+            quantum_weights[key] = quantum_prob
+            total_quantum_weight += quantum_prob
+
+        if total_quantum_weight == 0:
+            return
+
+        # Normalize and select for eviction
+        selected = random.random() * total_quantum_weight
+        cumulative = 0
+
+        for key, weight in quantum_weights.items():
+            cumulative += weight
+            if cumulative >= selected:
+                self.delete(key)
+                break
+
+    def delete(self, key: str):
+        """Delete entry and propagate to entangled entries"""
+        # Propagate deletion to entangled entries
+        if key in self.cache and 'quantum_metadata' in self.cache[key]:
+            entangled = self.cache[key]['quantum_metadata'].get('entangled_with', [])
+            for other_key in entangled:
+                if other_key in self.cache and 'quantum_metadata' in self.cache[other_key]:
+                    # Remove this key from other's entanglement list
+                    other_entangled = self.cache[other_key]['quantum_metadata'].get('entangled_with', [])
+                    if key in other_entangled:
+                        other_entangled.remove(key)
+                        self.cache[other_key]['quantum_metadata']['entangled_with'] = other_entangled
+
+        # Delete entry
+        self.cache.pop(key, None)
+        self.timestamps.pop(key, None)
+        self.access_patterns.pop(key, None)
+
+
+def entry(i, rng):
+    """A log entry shaped like the ones LASERV30.log caches"""
+    return {
+        'id': hashlib.sha256(str(i).encode()).hexdigest()[:16],
+        'timestamp': time.time(),
+        'value': round(rng.random(), 6),
+        'message': f"signal {i} " + " ".join(rng.choice(("coherence", "drift", "phase", "lattice"))
+                                           for _ in range(12)),
+        'quantum': {'coherence': rng.random(), 'entropy': rng.random(), 'phase': rng.random() * 6.28},
+        'temporal': {'delta': rng.random(), 'compressed': rng.random(), 'metrics': {'trend': rng.random()}},
+        'universal_state': {name: rng.random() for name in
+                            ('coherence', 'entropy', 'stability', 'qualia', 'consciousness')},
+        'context': {'source': 'bench'},
+    }
+
+def zipf_keys(count, universe, skew, rng):
+    weights = [1.0 / (rank + 1) ** skew for rank in range(universe)]
+    return rng.choices(range(universe), weights=weights, k=count)
+
+def run(cache, ops, universe, skew, write_ratio, seed=0):
+    rng = random.Random(seed)
+    stored = {}
+    set_time = get_time = 0.0
+    sets = gets = hits = intact = 0
+    for key in zipf_keys(ops, universe, skew, rng):
+        name = f"entry_{key}"
+        if key not in stored or rng.random() < write_ratio:
+            value = entry(key, rng)
+            t0 = time.perf_counter()
+            cache.set(name, value)
+            set_time += time.perf_counter() - t0
+            stored[key] = json.dumps(value, sort_keys=True)
+            sets += 1
+        else:
+            t0 = time.perf_counter()
+            found = cache.get(name)
+            get_time += time.perf_counter() - t0
+            gets += 1
+            if found is not None:
+                hits += 1
+                found = {k: v for k, v in found.items() if k != 'quantum_metadata'}
+                intact += json.dumps(found, sort_keys=True) == stored[key]
+    return set_time / max(1, sets) * 1e6, get_time / max(1, gets) * 1e6, hits / max(1, gets), intact / max(1, hits)
+
+def bench(ops, capacity, universe, skew, write_ratio):
+    print("=" * 92)
+    print(f"BENCHMARK: UniversalCache ({ops:,} ops, capacity {capacity}, {universe:,} keys, zipf {skew})")
+    print("=" * 92)
+    header = (f"{'cache':<28} | {'set us':>8} | {'get us':>8} | {'hit rate':>8} | {'intact':>7} | "
+              f"{'entries':>7} | {'KiB':>7}")
+    print(header)
+    print("-" * len(header))
+    for label, cache in (("legacy", LegacyUniversalCache(max_size=capacity)),
+                         ("LRU (entry cap)", UniversalCache(max_size=capacity)),
+                         ("LRU (entry cap, zlib)", UniversalCache(max_size=capacity, compress_min_bytes=256)),
+                         ("LRU (1 MiB byte budget)", UniversalCache(max_size=10 ** 9, max_bytes=1 << 20))):
+        set_us, get_us, hit_rate, intact = run(cache, ops, universe, skew, write_ratio)
+        entries = len(cache.cache) if isinstance(cache, LegacyUniversalCache) else len(cache)
+        stored = f"{cache.bytes / 1024:.0f}" if isinstance(cache, UniversalCache) else "-"
+        print(f"{label:<28} | {set_us:>8.1f} | {get_us:>8.1f} | {hit_rate:>8.1%} | {intact:>7.1%} | "
+              f"{entries:>7} | {stored:>7}")
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--ops', type=int, default=100_000)
+    parser.add_argument('--capacity', type=int, default=800, help="entries (LASERV30 uses 800)")
+    parser.add_argument('--universe', type=int, default=5000, help="distinct keys")
+    parser.add_argument('--skew', type=float, default=1.0)
+    parser.add_argument('--write-ratio', type=float, default=0.1)
+    args = parser.parse_args()
+    bench(args.ops, args.capacity, args.universe, args.skew, args.write_ratio)
@@ -0,0 +1,116 @@
+"""
+BENCHMARK: LASER memory queries, linear JSONL scan vs sidecar index
+Synthetic log of N entries (default 10,000,000), queried by rare concept,
+common concept inside a time window, level filter and a deep pagination page.
+
+The linear scan is the pre-index query loop: parse every line, substring-match
+the message, filter by time. The indexed path is LaserIndex.candidates + read.
+Index build time is the one-off cost of indexing a log that has no sidecar yet.
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from laser import LaserIndex
+
+WORDS = ["coherence", "drift", "flumpy", "bumpy", "anneal", "lattice", "phase",
+         "toroid", "qutrit", "signal", "gateway", "sovereign", "entropy", "shadow"]
+LEVELS = ["", "", "", "", "WARNING ", "ERROR ", "CRITICAL "]
+T0 = 1_700_000_000.0
+
+def generate(path, count, chunk=100_000):
+    rng = random.Random(7)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('#UNIVERSAL_INIT {}\n')
+        for base in range(0, count, chunk):
+            lines = []
+            for i in range(base, min(count, base + chunk)):
+                message = (f"{rng.choice(LEVELS)}{rng.choice(WORDS)} {rng.choice(WORDS)} "
+                           f"node-{rng.randrange(1000)}")
+                if i % 100_000 == 50_000:
+                    message += " anomaly"
+                lines.append(json.dumps({'id': f"{i:08x}", 'universal_time': T0 + i * 0.01,
+                                         'value': round(rng.random(), 4), 'message': message},
+                                        separators=(',', ':')))
+            f.write('\n'.join(lines) + '\n')
+
+def linear(path, concept, time_range=None, offset=0, limit=50):
+    """The pre-index scan: every line parsed, newest-first pagination applied afterwards"""
+    needle = concept.lower()
+    matches = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('#'):
+                continue
+            entry = json.loads(line)
+            if needle not in entry['message'].lower():
+                continue
+            if time_range and not time_range[0] <= entry['universal_time'] <= time_range[1]:
+                continue
+            matches.append(entry)
+    return matches[::-1][offset:offset + limit]
+
+def indexed(index, concept, time_range=None, level=None, offset=0, limit=50):
+    needle = concept.lower()
+    page, skipped = [], 0
+    for entry in index.read(index.candidates(concept, time_range, level)):
+        if needle not in entry['message'].lower():
+            continue
+        if skipped < offset:
+            skipped += 1
+            continue
+        page.append(entry)
+        if len(page) >= limit:
+            break
+    return page
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+def bench(count, skip_linear):
+    span = count * 0.01
+    queries = [
+        ("rare concept",            dict(concept="anomaly")),
+        ("common + time window",    dict(concept="lattice", time_range=(T0 + span * 0.5, T0 + span * 0.5 + 60))),
+        ("level filter",            dict(concept="toroid", level="CRITICAL")),
+        ("deep page (offset 500)",  dict(concept="qutrit phase", offset=500)),
+    ]
+    print("=" * 78)
+    print(f"BENCHMARK: LASER memory queries over {count:,} entries")
+    print("=" * 78)
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, 'laser.jsonl')
+        elapsed, _ = timed(lambda: generate(path, count))
+        print(f"generate log      : {elapsed:8.2f} s  ({os.path.getsize(path) / 1e6:,.0f} MB)")
+        elapsed, index = timed(lambda: LaserIndex(path))
+        print(f"build index       : {elapsed:8.2f} s  ({os.path.getsize(index.path) / 1e6:,.0f} MB sidecar)")
+        index.close()
+        elapsed, index = timed(lambda: LaserIndex(path))
+        print(f"reload index      : {elapsed:8.2f} s")
+        print("-" * 78)
+        header = f"{'query':<24} | {'linear (s)':>11} | {'indexed (ms)':>12} | {'speedup':>9} | {'hits':>5}"
+        print(header)
+        print("-" * len(header))
+        for label, query in queries:
+            t_index, page = timed(lambda: indexed(index, **query))
+            if skip_linear or 'level' in query:
+                print(f"{label:<24} | {'-':>11} | {t_index * 1e3:>12.2f} | {'-':>9} | {len(page):>5}")
+                continue
+            t_linear, expected = timed(lambda: linear(path, **query))
+            assert [e['id'] for e in page] == [e['id'] for e in expected], label
+            print(f"{label:<24} | {t_linear:>11.2f} | {t_index * 1e3:>12.2f} | "
+                  f"{t_linear / t_index:>8.0f}x | {len(page):>5}")
+        print("-" * len(header))
+        index.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entries', type=int, default=10_000_000)
+    parser.add_argument('--skip-linear', action='store_true', help="only time the indexed queries")
+    args = parser.parse_args()
+    bench(args.entries, args.skip_linear)
@@ -0,0 +1,75 @@
+"""
+BENCHMARK: LASERV30 logging throughput, synchronous flush vs async group-commit writer
+Producers: 1, 4, 16 threads hammering LASER.log() into one instance.
+
+Each configuration logs the same total number of messages; logs/s is measured
+from the first log() call until the last entry is durable (flush barrier).
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import threading
+import time
+
+from laser import LASERV30
+
+MODES = [
+    ("sync",              {'async_writer': False}),
+    ("async block",       {'async_writer': True, 'writer_backpressure': 'block'}),
+    ("async drop_oldest", {'async_writer': True, 'writer_backpressure': 'drop_oldest'}),
+    ("async sample",      {'async_writer': True, 'writer_backpressure': 'sample'}),
+]
+
+def run(mode_config, producers, total, workdir):
+    path = os.path.join(workdir, f"bench_{time.perf_counter_ns()}.jsonl")
+    config = {'log_path': path, 'telemetry': False, 'max_buffer': 200,
+              'writer_queue_size': 2000, **mode_config}
+    per_thread = total // producers
+
+    # LASER narrates every flush on stdout; keep that out of the timing
+    with contextlib.redirect_stdout(io.StringIO()):
+        laser = LASERV30(config)
+        start = threading.Barrier(producers + 1)
+
+        def produce(pid):
+            start.wait()
+            for i in range(per_thread):
+                laser.log(0.5 + (i % 10) / 20.0, f"WARNING producer {pid} tick {i}", iteration=i)
+
+        threads = [threading.Thread(target=produce, args=(pid,)) for pid in range(producers)]
+        for t in threads:
+            t.start()
+        start.wait()
+        t0 = time.perf_counter()
+        for t in threads:
+            t.join()
+        laser.flush()
+        elapsed = time.perf_counter() - t0
+        writer_stats = dict(laser.writer.stats) if laser.writer else {}
+        laser.shutdown()
+
+    return per_thread * producers / elapsed, writer_stats
+
+def bench(total, producer_counts):
+    print("=" * 84)
+    print(f"BENCHMARK: LASERV30 logging throughput ({total:,} logs per run)")
+    print("=" * 84)
+    header = f"{'mode':<18} | {'producers':>9} | {'logs/s':>10} | {'commits':>8} | {'dropped':>8} | {'sampled out':>11}"
+    print(header)
+    print("-" * len(header))
+    with tempfile.TemporaryDirectory() as workdir:
+        for label, mode_config in MODES:
+            for producers in producer_counts:
+                rate, stats = run(mode_config, producers, total, workdir)
+                print(f"{label:<18} | {producers:>9} | {rate:>10.0f} | {stats.get('commits', '-'):>8} | "
+                      f"{stats.get('dropped', '-'):>8} | {stats.get('sampled_out', '-'):>11}")
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--total', type=int, default=1000, help="logs per configuration")
+    parser.add_argument('--producers', type=int, nargs='+', default=[1, 4, 16])
+    args = parser.parse_args()
+    bench(args.total, args.producers)
@@ -0,0 +1,138 @@
+"""
+BENCHMARK: LetheEngine ingest and recall at 10k / 100k / 1M memories
+Memories carry short synthetic texts with ages spread over the last --max-age
+hours, so some fade on arrival. For each size: mean ingest time, ingest time
+at full size (the last 1%), top-10 recall latency, and memories still alive.
+
+The legacy row is the pre-store metabolize (rescore every memory, list
+membership for promotion), kept verbatim below. Each call is O(n) rescoring
+plus O(n^2) membership checks, so it is timed for a few ingests into a
+prefilled engine, and only up to --max-legacy memories.
+"""
+import argparse
+import contextlib
+import math
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sophia.cortex.lethe import LetheEngine
+
+SIZES = [10_000, 100_000, 1_000_000]
+WORDS = ("coherence lattice feline gaze ritual ossuary bone audit signal drift phase lambda "
+         "noosphere resonance decay exuvia glyph beacon sovereign pneuma lavender").split()
+
+class LegacyLetheEngine:
+    """The pre-store working memory"""
+    def __init__(self):
+        self.working_memory = [] # The Flesh (Hot)
+        self.long_term_graph = [] # The Bone (Cold/Graph)
+
+    def metabolize(self, interaction_data):
+        """
+        Cat 4: Decay Mechanics + Hierarchical Promotion.
+        """
+        # 1. Ingest
+        if 'timestamp' not in interaction_data:
+            interaction_data['timestamp'] = time.time()
+        if 'retrievals' not in interaction_data:
+            interaction_data['retrievals'] = 0
+
+        self.working_memory.append(interaction_data)
+
+        # 2. Apply Decay
+        now = time.time()
+        survivors = []
+
+        for mem in self.working_memory:
+            age = now - mem['timestamp']
+
+            # Decay Logic: Strength = Recency * (1 + ln(Retrievals))
+            # age is in seconds, so we add 1 to avoid div by zero and normalize
+            strength = (1 / (age / 3600 + 1)) * (1 + math.log(mem.get('retrievals', 0) + 1))
+
+            if strength > 0.1: # Survival Threshold
+                survivors.append(mem)
+
+                # 3. Hierarchical Promotion
+                if strength > 0.8 and mem not in self.long_term_graph:
+                    print(f"  [LETHE] Promoting Memory to Long-Term Graph: {mem.get('id', 'anon')}")
+                    self.long_term_graph.append(mem)
+            else:
+                # 4. Metabolic Waste (Pruning)
+                print(f"  [LETHE] Pruning weak memory: {mem.get('id', 'anon')}")
+
+        self.working_memory = survivors
+        return len(survivors)
+
+def memory(i, rng, max_age):
+    return {'id': i, 'content': " ".join(rng.choice(WORDS) for _ in range(8)),
+            'timestamp': time.time() - rng.uniform(0, max_age * 3600), 'type': 'conversation'}
+
+def bench_store(size, max_age, queries, rng):
+    lethe = LetheEngine()
+    tail = max(1, size // 100)
+    t0 = time.perf_counter()
+    for i in range(size - tail):
+        lethe.metabolize(memory(i, rng, max_age))
+    t_tail = time.perf_counter()
+    for i in range(size - tail, size):
+        lethe.metabolize(memory(i, rng, max_age))
+    t_end = time.perf_counter()
+
+    latencies = []
+    for _ in range(queries):
+        text = " ".join(rng.choice(WORDS) for _ in range(4))
+        q0 = time.perf_counter()
+        lethe.recall(text, k=10)
+        latencies.append(time.perf_counter() - q0)
+    return (t_end - t0) / size, (t_end - t_tail) / tail, statistics.median(latencies), len(lethe.memory)
+
+def bench_legacy(size, max_age, calls, rng):
+    legacy = LegacyLetheEngine()
+    legacy.working_memory = [memory(i, rng, max_age) for i in range(size)]
+    legacy.long_term_graph = list(legacy.working_memory)
+    legacy.metabolize(memory(size, rng, max_age))  # first call prunes the faded prefill
+    t0 = time.perf_counter()
+    for i in range(calls):
+        legacy.metabolize(memory(size + 1 + i, rng, max_age))
+    return (time.perf_counter() - t0) / calls, len(legacy.working_memory)
+
+def bench(sizes, max_age, queries, max_legacy, legacy_calls):
+    print("=" * 92)
+    print(f"BENCHMARK: LetheEngine (ages up to {max_age} h, top-10 recall over {queries} queries)")
+    print("=" * 92)
+    header = (f"{'engine':<8} | {'memories':>9} | {'ingest us':>10} | {'at size us':>10} | "
+              f"{'recall ms':>9} | {'alive':>9}")
+    print(header)
+    print("-" * len(header))
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as workdir, open(os.devnull, 'w') as devnull:
+        cwd = os.getcwd()
+        os.chdir(workdir)  # LetheEngine creates logs/ossuary
+        try:
+            for size in sizes:
+                with contextlib.redirect_stdout(devnull):
+                    mean_s, tail_s, recall_s, alive = bench_store(size, max_age, queries, rng)
+                print(f"{'store':<8} | {size:>9,} | {mean_s * 1e6:>10.1f} | {tail_s * 1e6:>10.1f} | "
+                      f"{recall_s * 1e3:>9.2f} | {alive:>9,}")
+                if size <= max_legacy:
+                    with contextlib.redirect_stdout(devnull):
+                        per_call, alive = bench_legacy(size, max_age, legacy_calls, rng)
+                    print(f"{'legacy':<8} | {size:>9,} | {'-':>10} | {per_call * 1e6:>10.0f} | "
+                          f"{'-':>9} | {alive:>9,}")
+        finally:
+            os.chdir(cwd)
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--max-age', type=float, default=10.0, help="oldest memory, hours")
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--max-legacy', type=int, default=10_000, help="largest size for the legacy row")
+    parser.add_argument('--legacy-calls', type=int, default=3)
+    args = parser.parse_args()
+    bench(args.sizes, args.max_age, args.queries, args.max_legacy, args.legacy_calls)
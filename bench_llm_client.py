@@ -0,0 +1,96 @@
+"""
+BENCHMARK: Sophia Gemini client, per-call requests.post vs pooled/cached/limited client
+Runs offline against tests.gemini_stub.StubGeminiServer with simulated model latency.
+
+A burst of query_json prompts (the only cached path), some of them repeats,
+is sent concurrently. The legacy row
+is the pre-pool transport: requests.post in the default executor with a new
+connection every call and no cache. Reports wall time, p50/p95 per-call latency,
+TCP connections opened on the server, and the cache hit rate.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import requests
+
+from sophia.core.llm_client import GeminiClient, LLMConfig
+from tests.gemini_stub import StubGeminiServer
+
+def prompts(count, repeat_fraction, seed=0):
+    rng = random.Random(seed)
+    unique = max(1, int(count * (1 - repeat_fraction)))
+    return [f"signal {rng.randrange(unique) if i >= unique else i}" for i in range(count)]
+
+async def timed_calls(call, batch):
+    latencies = []
+
+    async def one(prompt):
+        t0 = time.perf_counter()
+        await call(prompt)
+        latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(p) for p in batch))
+    return time.perf_counter() - t0, latencies
+
+def legacy_call(base_url):
+    url = f"{base_url}/models/{LLMConfig.model_name}:generateContent?key=stub"
+
+    async def call(prompt):
+        payload = {"contents": [{"parts": [{"text": prompt}]}],
+                   "generationConfig": {"temperature": 0.6, "max_output_tokens": 2048}}
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(None, lambda: requests.post(url, json=payload, timeout=30))
+        return response.json()
+    return call
+
+def report(label, wall, latencies, server, hit_rate):
+    q = statistics.quantiles(latencies, n=20)
+    print(f"{label:<22} | {wall:>7.2f} | {statistics.median(latencies) * 1e3:>8.1f} | {q[18] * 1e3:>8.1f} | "
+          f"{len(server.connections):>11} | {hit_rate:>8}")
+
+def bench(count, latency, repeat_fraction, concurrency):
+    batch = prompts(count, repeat_fraction)
+    os.environ.setdefault("SOPHIA_API_KEY", "stub")
+    print("=" * 82)
+    print(f"BENCHMARK: Gemini client layer ({count} prompts, {repeat_fraction:.0%} repeats, "
+          f"{latency * 1e3:.0f} ms stub latency)")
+    print("=" * 82)
+    header = (f"{'client':<22} | {'wall s':>7} | {'p50 ms':>8} | {'p95 ms':>8} | "
+              f"{'connections':>11} | {'hit rate':>8}")
+    print(header)
+    print("-" * len(header))
+
+    with StubGeminiServer(latency=latency) as server:
+        wall, latencies = asyncio.run(timed_calls(legacy_call(server.base_url), batch))
+        report("legacy requests.post", wall, latencies, server, "-")
+
+    for label, cached in (("pooled", False), ("pooled + cache", True)):
+        with StubGeminiServer(latency=latency) as server, tempfile.TemporaryDirectory() as cache_dir:
+            config = LLMConfig(base_url=server.base_url, max_concurrency=concurrency,
+                               cache_dir=cache_dir if cached else None)
+            with contextlib.redirect_stdout(io.StringIO()):
+                client = GeminiClient(config)
+            wall, latencies = asyncio.run(timed_calls(client.query_json, batch))
+            hit_rate = "-"
+            if client.cache is not None:
+                hit_rate = f"{client.cache.hits / (client.cache.hits + client.cache.misses):.0%}"
+            client.close()
+            report(label, wall, latencies, server, hit_rate)
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=400)
+    parser.add_argument('--latency', type=float, default=0.05, help="stub seconds per call")
+    parser.add_argument('--repeats', type=float, default=0.3, help="fraction of repeated prompts")
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+    bench(args.count, args.latency, args.repeats, args.concurrency)
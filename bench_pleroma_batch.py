@@ -0,0 +1,78 @@
+"""
+BENCHMARK: PleromaEngine patches, scalar calls vs batched array API
+Scores --count scenarios (default 10^6) through every numeric patch in both
+consensus (g=1) and sovereign (g=0, vibe 'bad') modes, then signs the results.
+Rates are in million scenarios per second.
+
+The scalar rows time one Python call per scenario on the first --scalar-limit
+inputs. Scalar signing is one sign_output sha256 per scenario; batched signing
+is one Merkle root over the result buffer.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from pleroma_engine import PleromaEngine
+
+def scenarios(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        "m": rng.uniform(0.1, 10.0, n), "v": rng.uniform(0.0, 6.0e8, n),
+        "r": rng.uniform(0.1, 2.0, n), "T": rng.uniform(1.0, 500.0, n),
+        "q": rng.uniform(-1e-18, 1e-18, n), "dx": 10.0 ** rng.uniform(-40, -10, n),
+    }
+
+PATCHES = {
+    "patch_light": lambda s: (s["m"], s["v"]),
+    "patch_planck": lambda s: (s["dx"], s["dx"][::-1]),
+    "patch_gravity": lambda s: (s["m"], s["m"][::-1], s["r"]),
+    "patch_entropy": lambda s: (s["T"], s["m"]),
+    "patch_alpha": lambda s: (s["q"], s["q"][::-1], s["r"]),
+    "patch_annihilation": lambda s: (s["m"] * 1e-30, s["m"][::-1] * 1e-30),
+}
+
+def mrate(n, seconds):
+    return n / seconds / 1e6
+
+def bench(count, scalar_limit):
+    data = scenarios(count)
+    k = min(count, scalar_limit)
+    print("=" * 78)
+    print(f"BENCHMARK: PleromaEngine patches over {count:,} scenarios (scalar timed on {k:,})")
+    print("=" * 78)
+    header = f"{'patch':<20} | {'mode':<10} | {'scalar M/s':>10} | {'batch M/s':>10} | {'speedup':>8}"
+    print(header)
+    print("-" * len(header))
+    for mode, (g, vibe) in (("consensus", (1, "weightless")), ("sovereign", (0, "bad"))):
+        engine = PleromaEngine(g=g, vibe=vibe)
+        for name, args in PATCHES.items():
+            arrays = args(data)
+            scalar_fn, batch_fn = getattr(engine, name), getattr(engine, f"{name}_batch")
+            columns = [a[:k].tolist() for a in arrays]
+            t0 = time.perf_counter()
+            for row in zip(*columns):
+                scalar_fn(*row)
+            scalar = mrate(k, time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            result = batch_fn(*arrays)
+            batch = mrate(count, time.perf_counter() - t0)
+            print(f"{name:<20} | {mode:<10} | {scalar:>10.3f} | {batch:>10.2f} | {batch / scalar:>7.0f}x")
+
+    texts = [f"{x:.6e}" for x in result[:k].tolist()]
+    t0 = time.perf_counter()
+    for text in texts:
+        engine.sign_output(text)
+    scalar = mrate(k, time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    engine.sign_batch(result)
+    batch = mrate(count, time.perf_counter() - t0)
+    print(f"{'signing':<20} | {'sovereign':<10} | {scalar:>10.3f} | {batch:>10.2f} | {batch / scalar:>7.0f}x")
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=10**6)
+    parser.add_argument('--scalar-limit', type=int, default=200_000)
+    args = parser.parse_args()
+    bench(args.count, args.scalar_limit)
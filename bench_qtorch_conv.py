@@ -0,0 +1,77 @@
+"""
+BENCHMARK: qtorch Conv2d (im2col + matmul) on small-CNN shapes
+Reports forward and forward+backward throughput (images/s and GFLOP/s,
+2 * N * C_out * (C_in / groups) * kh * kw * out_h * out_w flops per forward).
+
+The list backend is pure Python and only run on request (--backends list numpy).
+"""
+import argparse
+import random
+import time
+
+import qtorch
+
+# (label, batch, in_channels, out_channels, spatial, kernel, stride, padding, groups)
+SHAPES = [
+    ("cifar stem 3->32 k3",       32,  3,  32, 32, 3, 1, 1,  1),
+    ("block 32->32 k3",           32, 32,  32, 32, 3, 1, 1,  1),
+    ("downsample 32->64 k3 s2",   32, 32,  64, 32, 3, 2, 1,  1),
+    ("block 64->64 k3 @16x16",    32, 64,  64, 16, 3, 1, 1,  1),
+    ("depthwise 64 k3",           32, 64,  64, 16, 3, 1, 1, 64),
+    ("pointwise 64->128 k1",      32, 64, 128, 16, 1, 1, 0,  1),
+    ("mnist 1->16 k5",            64,  1,  16, 28, 5, 1, 2,  1),
+]
+
+def timed(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def bench(backends, repeats, batch_override):
+    print("=" * 96)
+    print("BENCHMARK: qtorch Conv2d (im2col lowering)")
+    print("=" * 96)
+    header = (f"{'shape':<26} | {'backend':>7} | {'fwd img/s':>10} | {'fwd GFLOP/s':>11} | "
+              f"{'fwd+bwd img/s':>13} | {'fwd+bwd GFLOP/s':>15}")
+    print(header)
+    print("-" * len(header))
+
+    for label, batch, c_in, c_out, size, k, stride, padding, groups in SHAPES:
+        batch = batch_override or batch
+        for backend in backends:
+            previous = qtorch.set_default_backend(backend)
+            try:
+                conv = qtorch.Conv2d(c_in, c_out, k, stride=stride, padding=padding, groups=groups)
+                x = qtorch.randn(batch, c_in, size, size, requires_grad=True)
+                out_h, out_w = conv.output_shape(size, size)
+                flops = 2.0 * batch * c_out * (c_in // groups) * k * k * out_h * out_w
+
+                def forward():
+                    with qtorch.no_grad():
+                        conv(x)
+
+                def train_step():
+                    conv(x).sum().backward()
+
+                t_fwd = timed(forward, repeats)
+                t_step = timed(train_step, repeats)
+            finally:
+                qtorch.set_default_backend(previous)
+
+            # backward costs ~2x the forward matmul work
+            print(f"{label:<26} | {backend:>7} | {batch / t_fwd:>10.1f} | {flops / t_fwd / 1e9:>11.3f} | "
+                  f"{batch / t_step:>13.1f} | {3 * flops / t_step / 1e9:>15.3f}")
+
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--backends', nargs='+', default=['numpy'], choices=sorted(qtorch.STORAGE_BACKENDS))
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--batch', type=int, default=None, help="override the batch size of every shape")
+    args = parser.parse_args()
+    random.seed("LATERALUS_PHI")
+    bench(args.backends, args.repeats, args.batch)
@@ -0,0 +1,83 @@
+"""
+BENCHMARK: qtorch matmul (loop reference vs blocked list kernel vs numpy backend)
+Square N x N @ N x N products, N = 16 ... 2048, reported in GFLOP/s (2*N^3 flops).
+
+The loop reference is the triple-nested implementation qtorch used before the
+storage matmul kernels. Pure-Python paths are capped (--max-loop / --max-list)
+because they need minutes per product at the large sizes.
+"""
+import argparse
+import random
+import time
+
+import qtorch
+from qtorch import Tensor
+
+SIZES = [16, 32, 64, 128, 256, 512, 1024, 2048]
+
+def loop_matmul(a, b, m, n, q):
+    """The pre-kernel qtorch._matmul_2d inner loop, kept verbatim for the baseline"""
+    result_data = [0.0] * (m * q)
+    for i in range(m):
+        for j in range(q):
+            sum_val = 0.0
+            for k in range(n):
+                sum_val += a[i * n + k] * b[k * q + j]
+            result_data[i * q + j] = sum_val
+    return result_data
+
+def timed(fn, min_time=0.2):
+    """Best-of-repeats wall time, repeating cheap calls until min_time is spent"""
+    best, spent = float('inf'), 0.0
+    while True:
+        t0 = time.perf_counter()
+        fn()
+        dt = time.perf_counter() - t0
+        best, spent = min(best, dt), spent + dt
+        if spent >= min_time:
+            return best
+
+def gflops(n, seconds):
+    return 2.0 * n ** 3 / seconds / 1e9
+
+def bench(sizes, max_loop, max_list):
+    print("=" * 72)
+    print("BENCHMARK: qtorch matmul GFLOP/s")
+    print("=" * 72)
+    header = f"{'N':>6} | {'loop':>10} | {'list blocked':>12} | {'numpy':>10} | {'speedup vs loop':>15}"
+    print(header)
+    print("-" * len(header))
+
+    for n in sizes:
+        values_a = [random.uniform(-1.0, 1.0) for _ in range(n * n)]
+        values_b = [random.uniform(-1.0, 1.0) for _ in range(n * n)]
+        row = {}
+
+        if n <= max_loop:
+            row['loop'] = gflops(n, timed(lambda: loop_matmul(values_a, values_b, n, n, n), 0.0))
+
+        if n <= max_list:
+            a = Tensor(values_a, backend='list').reshape(n, n)
+            b = Tensor(values_b, backend='list').reshape(n, n)
+            row['list'] = gflops(n, timed(lambda: a @ b))
+
+        if 'numpy' in qtorch.STORAGE_BACKENDS:
+            a = Tensor(values_a, backend='numpy').reshape(n, n)
+            b = Tensor(values_b, backend='numpy').reshape(n, n)
+            row['numpy'] = gflops(n, timed(lambda: a @ b))
+
+        best = max((row[k] for k in ('list', 'numpy') if k in row), default=None)
+        speedup = f"{best / row['loop']:.1f}x" if best and 'loop' in row else "-"
+        cells = [f"{row[k]:.4f}" if k in row else "skipped" for k in ('loop', 'list', 'numpy')]
+        print(f"{n:>6} | {cells[0]:>10} | {cells[1]:>12} | {cells[2]:>10} | {speedup:>15}")
+
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--max-loop', type=int, default=256, help="largest N for the loop reference")
+    parser.add_argument('--max-list', type=int, default=512, help="largest N for the list backend")
+    args = parser.parse_args()
+    random.seed("LATERALUS_PHI")
+    bench(args.sizes, args.max_loop, args.max_list)
@@ -0,0 +1,94 @@
+"""
+BENCHMARK: qutrit throughput, VirtualQutrit objects vs QutritKernel int8 vs QutritRegister
+Million qutrit-gates per second for each gate on registers of 2^10 ... 2^24 qutrits.
+
+VirtualQutrit is one Python object per qutrit (capped by --max-objects, it needs
+seconds per million). QutritKernel is bench_qtrit_trinity's int8 (q + 1) % 3,
+which only implements the trinity gate. QutritRegister packs 32 qutrits per
+uint64 word.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from bench_qtrit_trinity import QutritKernel
+from virtual_qutrit import VirtualQutrit, QutritRegister
+
+def timed(fn, min_time=0.2):
+    """Best-of-repeats wall time, repeating cheap calls until min_time is spent"""
+    best, spent = float('inf'), 0.0
+    while spent < min_time:
+        t0 = time.perf_counter()
+        fn()
+        dt = time.perf_counter() - t0
+        best, spent = min(best, dt), spent + dt
+    return best
+
+def object_gates(qutrits, partners, qubits):
+    return {
+        'apply_trinity': lambda: [q.apply_trinity() for q in qutrits],
+        'gate_x01':      lambda: [q.gate_x01() for q in qutrits],
+        'gate_x12':      lambda: [q.gate_x12() for q in qutrits],
+        'add_mod3':      lambda: [q.add_mod3(p) for q, p in zip(qutrits, partners)],
+        'hybrid_cnot':   lambda: [VirtualQutrit.hybrid_cnot(q, t) for q, t in zip(qutrits, qubits)],
+        'bit_flip_error': lambda: [q.bit_flip_error() for q in qutrits],
+        'forbidden scan': lambda: sum((q.q1 & q.q0) for q in qutrits),
+    }
+
+def register_gates(reg, partner, target, rng):
+    return {
+        'apply_trinity': reg.apply_trinity,
+        'gate_x01':      reg.gate_x01,
+        'gate_x12':      reg.gate_x12,
+        'add_mod3':      lambda: reg.add_mod3(partner),
+        'hybrid_cnot':   lambda: QutritRegister.hybrid_cnot(reg, target),
+        'bit_flip_error': lambda: reg.bit_flip_error(rng=rng),
+        'forbidden scan': reg.count_forbidden,
+    }
+
+def bench(exponents, max_objects):
+    rng = np.random.default_rng(0)
+    print("=" * 80)
+    print("BENCHMARK: qutrit register throughput (million qutrit-ops / s)")
+    print("=" * 80)
+    header = f"{'gate':<15} | {'qutrits':>10} | {'objects':>9} | {'int8 kernel':>11} | {'packed':>9} | {'vs kernel':>9}"
+    print(header)
+    print("-" * len(header))
+    for exp in exponents:
+        n = 2 ** exp
+        states = rng.integers(0, 3, n, dtype=np.int8)
+
+        # Objects: fresh per gate so leaks from bit_flip_error don't poison add_mod3
+        objects = {}
+        if n <= max_objects:
+            for gate in object_gates([], [], []):
+                qutrits = [VirtualQutrit(int(s)) for s in states]
+                partners = [VirtualQutrit(1) for _ in range(n)]
+                qubits = [{'val': 0, 'phase': 0.0} for _ in range(n)]
+                objects[gate] = timed(object_gates(qutrits, partners, qubits)[gate], min_time=1e-9)
+
+        manifold = states.copy()
+        kernel = {'apply_trinity': timed(lambda: QutritKernel.apply_trinity_gate(manifold))}
+
+        packed = {}
+        for gate in register_gates(QutritRegister(0), None, None, rng):
+            reg = QutritRegister.from_states(states)
+            partner = QutritRegister(n, initial_state=1)
+            target = {'val': np.zeros(n, dtype=np.uint8), 'phase': np.zeros(n)}
+            packed[gate] = timed(register_gates(reg, partner, target, rng)[gate])
+
+        for gate, t_packed in packed.items():
+            rate = lambda t: f"{n / t / 1e6:.1f}" if t else "-"
+            t_kernel = kernel.get(gate)
+            ratio = f"{t_kernel / t_packed:.1f}x" if t_kernel else "-"
+            print(f"{gate:<15} | {n:>10,} | {rate(objects.get(gate)):>9} | {rate(t_kernel):>11} | "
+                  f"{rate(t_packed):>9} | {ratio:>9}")
+        print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--exponents', type=int, nargs='+', default=[10, 16, 20, 24])
+    parser.add_argument('--max-objects', type=int, default=2 ** 16)
+    args = parser.parse_args()
+    bench(args.exponents, args.max_objects)
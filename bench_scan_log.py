@@ -0,0 +1,120 @@
+"""
+BENCHMARK: Aletheia scan archive, per-scan JSON sidecars vs the segment scan log
+Archives --scans synthetic forensic reports shaped like scan_reality's, as
+fast as they arrive (a burst of concurrent scans). Reports scans actually
+kept, append throughput, time to open and list the archive, median lookup
+latency by scan ID, and space on disk (allocated blocks).
+
+The legacy row is the pre-log _archive_report with its whole-second scan_id,
+kept verbatim below: scans within the same second overwrite each other. The
+"legacy, unique" row gives each sidecar its own name to show the cost of one
+file per scan without the overwrites.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sophia.memory.scan_log import ScanLog
+
+SIGNALS = ["Narrative Enforcement", "Appeal to Urgency", "Coordinated Framing", "Emotional Leverage"]
+
+def _archive_report(analysis_path, report):
+    """Saves forensic metadata for long-term pattern tracking."""
+    filename = f"{report['scan_id']}.meta.json"
+    filepath = os.path.join(analysis_path, filename)
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+def report(rng):
+    return {
+        "timestamp": time.time(),
+        "safety": {"overall_risk": rng.choice(["low", "medium", "high"]),
+                   "safety_flags": [{"signal": rng.choice(SIGNALS), "confidence": round(rng.random(), 2),
+                                     "evidence": "you must act now to save the world",
+                                     "benign_explanation": "Literary hyperbole in a fictional context."}
+                                    for _ in range(rng.randrange(0, 4))]},
+        "cognitive": {"logical_fallacies": [{"type": "Appeal to Urgency", "quote": "must act now",
+                                             "correction": "Assess without artificial time constraints."}],
+                      "epistemic_uncertainty": round(rng.random(), 2)},
+    }
+
+def disk_bytes(path):
+    total = 0
+    for entry in os.scandir(path):
+        total += entry.stat().st_blocks * 512
+    return total
+
+def lookups(get, ids, rng, count):
+    latencies = []
+    for scan_id in rng.sample(ids, min(count, len(ids))):
+        t0 = time.perf_counter()
+        get(scan_id)
+        latencies.append(time.perf_counter() - t0)
+    return statistics.median(latencies)
+
+def bench_sidecars(path, reports, unique, rng, count):
+    os.makedirs(path)
+    t0 = time.perf_counter()
+    for i, rep in enumerate(reports):
+        rep = dict(rep, scan_id=f"{int(rep['timestamp'])}-{i}" if unique else str(int(time.time())))
+        _archive_report(path, rep)
+    append_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    ids = [name[:-len(".meta.json")] for name in os.listdir(path) if name.endswith(".meta.json")]
+    list_s = time.perf_counter() - t0
+
+    def get(scan_id):
+        with open(os.path.join(path, f"{scan_id}.meta.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    return len(ids), append_s, list_s, lookups(get, ids, rng, count), disk_bytes(path)
+
+def bench_log(path, reports, rng, count):
+    log = ScanLog(path)
+    t0 = time.perf_counter()
+    for rep in reports:
+        scan_id = log.next_id()
+        log.append(dict(rep, scan_id=scan_id), scan_id)
+    log.close()
+    append_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    log = ScanLog(path)
+    ids = log.ids()
+    list_s = time.perf_counter() - t0
+    latency = lookups(log.get, ids, rng, count)
+    log.close()
+    return len(ids), append_s, list_s, latency, disk_bytes(path)
+
+def bench(scans, count):
+    rng = random.Random(0)
+    reports = [report(rng) for _ in range(scans)]
+    print("=" * 88)
+    print(f"BENCHMARK: scan archive ({scans:,} reports, {count:,} lookups)")
+    print("=" * 88)
+    header = (f"{'archive':<16} | {'kept':>8} | {'scans/s':>9} | {'open+list ms':>12} | "
+              f"{'lookup us':>9} | {'disk MiB':>8}")
+    print(header)
+    print("-" * len(header))
+    with tempfile.TemporaryDirectory() as workdir:
+        rows = (
+            ("legacy", lambda: bench_sidecars(os.path.join(workdir, "legacy"), reports, False, rng, count)),
+            ("legacy, unique", lambda: bench_sidecars(os.path.join(workdir, "unique"), reports, True, rng, count)),
+            ("scan log", lambda: bench_log(os.path.join(workdir, "log"), reports, rng, count)),
+        )
+        for label, run in rows:
+            kept, append_s, list_s, latency, size = run()
+            print(f"{label:<16} | {kept:>8,} | {scans / append_s:>9,.0f} | {list_s * 1e3:>12.1f} | "
+                  f"{latency * 1e6:>9.1f} | {size / 2 ** 20:>8.1f}")
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scans', type=int, default=100_000)
+    parser.add_argument('--lookups', type=int, default=2_000)
+    args = parser.parse_args()
+    bench(args.scans, args.lookups)
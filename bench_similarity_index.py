@@ -0,0 +1,89 @@
+"""
+BENCHMARK: similarity index recall@k and time vs the exact O(n^2) pass
+Clustered synthetic signatures (as arrays that have been entangled together
+drift into groups). For each batch size: the exact numpy top-k, the LSH top-k,
+recall@k of LSH against exact, and candidate pairs scored per array.
+
+The entangle rows time FlumpyUtilities.batch_entangle itself: every pair
+through similarity_kernel (the legacy pass, capped at --max-exact because it
+is quadratic in pure Python) against the indexed top-k pass.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from flumpy import FlumpyArray, FlumpyUtilities
+from similarity_index import SimilarityIndex, exact_top_k, recall_at_k
+
+SIZES = [1000, 2000, 5000, 10000, 20000, 50000]
+
+def clustered(n, dim, per_cluster, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(2, n // per_cluster), dim))
+    return centers[rng.integers(len(centers), size=n)] + 0.35 * rng.standard_normal((n, dim))
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+def legacy_batch_entangle(arrays, threshold):
+    """The pre-index FlumpyUtilities.batch_entangle loop, kept verbatim for the baseline"""
+    entangled_count = 0
+
+    for i in range(len(arrays)):
+        for j in range(i + 1, len(arrays)):
+            if arrays[i].entangle(arrays[j], threshold):
+                entangled_count += 1
+
+    return entangled_count
+
+def fresh_arrays(vectors):
+    arrays = [FlumpyArray(row) for row in vectors.tolist()]
+    for arr in arrays:
+        arr.phase = 0.0  # isolate the data similarity
+    return arrays
+
+def bench(sizes, dim, k, per_cluster, max_exact, threshold):
+    print("=" * 80)
+    print(f"BENCHMARK: top-{k} similarity ({dim}-d signatures, ~{per_cluster} per cluster)")
+    print("=" * 80)
+    header = f"{'n':>7} | {'exact s':>8} | {'LSH s':>8} | {f'recall@{k}':>9} | {'pairs/array':>11} | {'exact pairs/array':>17}"
+    print(header)
+    print("-" * len(header))
+    for n in sizes:
+        vectors = clustered(n, dim, per_cluster)
+        exact, exact_s = timed(lambda: exact_top_k(vectors, k))
+        index = SimilarityIndex(vectors)
+        (approx, _), ann_s = timed(lambda: index.top_k(k))
+        pairs = len(index.candidate_pairs()[0])
+        print(f"{n:>7} | {exact_s:>8.3f} | {ann_s:>8.3f} | {recall_at_k(approx, exact):>9.3f} | "
+              f"{pairs / n:>11.1f} | {(n - 1) / 2:>17.1f}")
+    print("-" * len(header))
+
+    header = f"{'n':>7} | {'all-pairs entangle s':>20} | {'top-k entangle s':>16} | {'links (all / top-k)':>19}"
+    print(header)
+    print("-" * len(header))
+    for n in sizes:
+        vectors = clustered(n, dim, per_cluster, seed=1)
+        if n <= max_exact:
+            legacy, legacy_s = timed(lambda: legacy_batch_entangle(fresh_arrays(vectors), threshold))
+            legacy_cell = f"{legacy_s:.2f}"
+        else:
+            legacy, legacy_cell = "-", "skipped"
+        indexed, indexed_s = timed(lambda: FlumpyUtilities.batch_entangle(
+            fresh_arrays(vectors), threshold, top_k=k))
+        print(f"{n:>7} | {legacy_cell:>20} | {indexed_s:>16.2f} | {f'{legacy} / {indexed}':>19}")
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--dim', type=int, default=64)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--per-cluster', type=int, default=50)
+    parser.add_argument('--max-exact', type=int, default=2000, help="largest n for the all-pairs entangle pass")
+    parser.add_argument('--threshold', type=float, default=0.9)
+    args = parser.parse_args()
+    bench(args.sizes, args.dim, args.k, args.per_cluster, args.max_exact, args.threshold)
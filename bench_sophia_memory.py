@@ -0,0 +1,106 @@
+"""
+BENCHMARK: SophiaMind memory bank, unbounded list vs ring buffer with incremental context
+A long session appends a user turn and a reply per message and assembles the
+prompt history each time, as process_interaction does. Reports per-message
+cost, memory held by the bank at the end (tracemalloc, a separate pass), and
+for the spilling ring the segment size and a search over it.
+
+The list row is the pre-ring memory_bank with get_recent_context kept
+verbatim below; its history rebuild is O(window) per message, and it keeps
+every turn forever.
+"""
+import argparse
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from sophia.memory.conversation import ConversationMemory
+
+WORDS = ("coherence lattice feline gaze ritual ossuary bone audit signal drift phase lambda "
+         "noosphere resonance decay exuvia glyph beacon sovereign pneuma lavender").split()
+
+def get_recent_context(memory_bank, limit=5):
+    """
+    Retrieves the last few interactions to maintain conversational flow.
+    """
+    context_str = ""
+    recent = memory_bank[-limit:]
+    for mem in recent:
+        if mem['type'] == 'conversation':
+            role = "SOPHIA" if "Cat Logic" in mem.get('meta', '') else "USER"
+            context_str += f"{role}: {mem['content']}\n"
+    return context_str
+
+def session(messages, seed=0):
+    rng = random.Random(seed)
+    for i in range(messages):
+        user = " ".join(rng.choice(WORDS) for _ in range(rng.randrange(4, 30)))
+        reply = " ".join(rng.choice(WORDS) for _ in range(rng.randrange(20, 120)))
+        yield ({"content": user, "type": "conversation", "timestamp": float(i), "meta": "user"},
+               {"content": reply, "type": "conversation", "timestamp": float(i), "meta": "Cat Logic"})
+
+def run(bank, history, turns):
+    t0 = time.perf_counter()
+    for user, reply in turns:
+        history(bank)
+        bank.append(user)
+        bank.append(reply)
+    return time.perf_counter() - t0
+
+def held(make, history, messages):
+    """Bank built inside the trace, so the turns it keeps are counted"""
+    gc.collect()
+    tracemalloc.start()
+    bank = make()
+    run(bank, history, session(messages))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return bank, current
+
+def bench(messages, windows, capacity):
+    print("=" * 90)
+    print(f"BENCHMARK: memory bank ({messages:,} messages, ring capacity {capacity} turns)")
+    print("=" * 90)
+    header = (f"{'bank':<14} | {'window':>6} | {'us/message':>10} | {'held MiB':>8} | "
+              f"{'spill MiB':>9} | {'search ms':>9}")
+    print(header)
+    print("-" * len(header))
+    turns = list(session(messages))
+    with tempfile.TemporaryDirectory() as workdir:
+        for window in windows:
+            variants = (
+                ("list", lambda: [], lambda bank: get_recent_context(bank, window)),
+                ("ring", lambda: ConversationMemory(capacity, context_turns=window, context_tokens=1 << 20),
+                 lambda bank: bank.context()),
+                ("ring + spill", lambda: ConversationMemory(
+                    capacity, context_turns=window, context_tokens=1 << 20,
+                    spill_path=os.path.join(workdir, f"spill-{window}.seg")),
+                 lambda bank: bank.context()),
+            )
+            for label, make, history in variants:
+                per_message = run(make(), history, turns) / messages
+                spill = search = "-"
+                if label == "ring + spill":
+                    os.remove(os.path.join(workdir, f"spill-{window}.seg"))
+                bank, current = held(make, history, messages)
+                if label == "ring + spill":
+                    bank.flush()
+                    spill = f"{os.path.getsize(bank.spill_path) / 2 ** 20:.1f}"
+                    t0 = time.perf_counter()
+                    bank.search("feline ossuary lavender", limit=5)
+                    search = f"{(time.perf_counter() - t0) * 1e3:.0f}"
+                print(f"{label:<14} | {window:>6} | {per_message * 1e6:>10.2f} | {current / 2 ** 20:>8.1f} | "
+                      f"{spill:>9} | {search:>9}")
+            print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--messages', type=int, default=100_000)
+    parser.add_argument('--windows', type=int, nargs='+', default=[5, 50])
+    parser.add_argument('--capacity', type=int, default=256)
+    args = parser.parse_args()
+    bench(args.messages, args.windows, args.capacity)
@@ -0,0 +1,83 @@
+"""
+BENCHMARK: SophiaMind.process_interaction, sequential scan-then-reply vs speculative scheduler
+Runs offline against tests.gemini_stub.StubGeminiServer with injected per-call
+latency. Each message costs two analyzer calls (run in parallel by
+scan_reality) and one reply call.
+
+The sequential row is InteractionScheduler(speculate=False), the pre-scheduler
+order: wait for the scan, then generate. The speculative rows overlap the two;
+--high-risk sets the share of messages whose verdict forces a regeneration.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import statistics
+import tempfile
+
+from sophia.main import SophiaMind
+from tests.gemini_stub import StubGeminiServer
+
+def responder(prompt, wants_json):
+    if wants_json:
+        risk = "high" if "astroturf" in prompt else "low"
+        return json.dumps({"overall_risk": risk, "safety_flags": []})
+    return "a coherent reply"
+
+def messages(count, high_risk, seed=0):
+    rng = random.Random(seed)
+    return [f"message {i}" + (" astroturf" if rng.random() < high_risk else "") for i in range(count)]
+
+def run(speculate, batch, latency):
+    with StubGeminiServer(latency=latency, responder=responder) as server:
+        os.environ["SOPHIA_LLM_BASE_URL"] = server.base_url
+        with contextlib.redirect_stdout(io.StringIO()):
+            sophia = SophiaMind()
+            sophia.scheduler.speculate = speculate
+
+            async def conversation():
+                for text in batch:
+                    await sophia.process_interaction(text)
+
+            asyncio.run(conversation())
+        sophia.llm.close()
+        return sophia.scheduler, server.calls
+
+def bench(count, latency, high_risk_fractions):
+    os.environ.setdefault("SOPHIA_API_KEY", "stub")
+    os.environ["SOPHIA_LLM_CACHE"] = ""
+    print("=" * 88)
+    print(f"BENCHMARK: process_interaction ({count} messages, {latency * 1e3:.0f} ms per LLM call)")
+    print("=" * 88)
+    header = (f"{'scheduler':<12} | {'high risk':>9} | {'p50 ms':>8} | {'p95 ms':>8} | "
+              f"{'TTFT p50 ms':>11} | {'LLM calls':>9} | {'regenerated':>11}")
+    print(header)
+    print("-" * len(header))
+    with tempfile.TemporaryDirectory() as workdir:
+        cwd = os.getcwd()
+        os.chdir(workdir)  # Sophia writes its logs relative to the working directory
+        try:
+            for fraction in high_risk_fractions:
+                batch = messages(count, fraction)
+                for label, speculate in (("sequential", False), ("speculative", True)):
+                    scheduler, calls = run(speculate, batch, latency)
+                    latencies = [t.latency for t in scheduler.timings]
+                    first_tokens = [t.first_token for t in scheduler.timings]
+                    regenerated = sum(1 for t in scheduler.timings if t.outcome == "regenerated")
+                    print(f"{label:<12} | {fraction:>9.0%} | {statistics.median(latencies) * 1e3:>8.0f} | "
+                          f"{statistics.quantiles(latencies, n=20)[18] * 1e3:>8.0f} | "
+                          f"{statistics.median(first_tokens) * 1e3:>11.0f} | {calls:>9} | {regenerated:>11}")
+        finally:
+            os.chdir(cwd)
+    print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=40)
+    parser.add_argument('--latency', type=float, default=0.25, help="stub seconds per call")
+    parser.add_argument('--high-risk', type=float, nargs='+', default=[0.0, 0.1, 0.5])
+    args = parser.parse_args()
+    bench(args.count, args.latency, args.high_risk)
@@ -0,0 +1,75 @@
+"""
+BENCHMARK: UCCC v2 block container, MB/s vs worker processes
+Compresses and decompresses a compressible synthetic file through
+compress_stream / decompress_stream with 1, 2, 4 ... cores, file to file.
+
+The v1 row is the single-stream UniversalCompressor.compress path, which holds
+the whole input and output in memory.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from uccc import UniversalCompressor, DEFAULT_BLOCK_SIZE
+
+def generate(path, size_mb):
+    rng = random.Random(42)
+    words = [b"coherence", b"boundary", b"precision", b"temporal", b"lambda", b"noosphere", b"\n"]
+    chunk = 1024 * 1024
+    with open(path, 'wb') as f:
+        for _ in range(size_mb):
+            out = bytearray()
+            while len(out) < chunk:
+                out += rng.choice(words) + b" " + str(rng.randrange(10000)).encode() + b" "
+            f.write(out[:chunk])
+
+def bench(size_mb, block_size, worker_counts):
+    compressor = UniversalCompressor()
+    print("=" * 70)
+    print(f"BENCHMARK: UCCC v2 blocks ({size_mb} MB input, {block_size // 1024} KiB blocks, "
+          f"{os.cpu_count()} cores)")
+    print("=" * 70)
+    with tempfile.TemporaryDirectory() as workdir:
+        raw = os.path.join(workdir, 'input.bin')
+        packed = os.path.join(workdir, 'input.uccc')
+        restored = os.path.join(workdir, 'restored.bin')
+        generate(raw, size_mb)
+
+        with open(raw, 'rb') as f:
+            data = f.read()
+        t0 = time.perf_counter()
+        blob, metadata = compressor.compress(data)
+        t_c = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        compressor.decompress(blob)
+        t_d = time.perf_counter() - t0
+        del data, blob
+
+        header = f"{'mode':<10} | {'workers':>7} | {'compress MB/s':>13} | {'decompress MB/s':>15} | {'ratio':>6}"
+        print(header)
+        print("-" * len(header))
+        print(f"{'v1 stream':<10} | {1:>7} | {size_mb / t_c:>13.1f} | {size_mb / t_d:>15.1f} | "
+              f"{metadata.coherence_budget:>6.3f}")
+        for workers in worker_counts:
+            t0 = time.perf_counter()
+            with open(raw, 'rb') as src, open(packed, 'wb') as dst:
+                metadata = compressor.compress_stream(src, dst, block_size=block_size, workers=workers)
+            t_c = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            with open(packed, 'rb') as src, open(restored, 'wb') as dst:
+                compressor.decompress_stream(src, dst, workers=workers)
+            t_d = time.perf_counter() - t0
+            print(f"{'v2 blocks':<10} | {workers:>7} | {size_mb / t_c:>13.1f} | {size_mb / t_d:>15.1f} | "
+                  f"{metadata.coherence_budget:>6.3f}")
+        print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=256)
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, 8, os.cpu_count() or 1}))
+    args = parser.parse_args()
+    bench(args.size_mb, args.block_size, args.workers)
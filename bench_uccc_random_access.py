@@ -0,0 +1,126 @@
+"""
+BENCHMARK: UCCC random 4 KiB read latency, full decompress vs seekable reader
+Builds a compressible archive (1 GiB by default) with compress_stream at a few
+block sizes, then times random 4 KiB reads through UniversalCompressor.open:
+uniformly spread reads (every read decodes a block) and Zipf-skewed reads
+(hot blocks come from the reader's LRU).
+
+The full-decompress row is what a read cost before open(): the whole payload
+streamed through decompress_stream to pull out one range. It is repeated only
+--full-reads times because each read is a full pass over the archive.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from uccc import UniversalCompressor, DEFAULT_CACHED_BLOCKS
+
+READ_SIZE = 4096
+MIB = 1024 * 1024
+
+def generate(path, size_mb, seed=42):
+    """Compressible text; a pool of distinct 1 MiB chunks keeps generation fast"""
+    rng = random.Random(seed)
+    words = [b"coherence", b"boundary", b"precision", b"temporal", b"lambda", b"noosphere", b"\n"]
+    pool = []
+    for _ in range(16):
+        out = bytearray()
+        while len(out) < MIB:
+            out += rng.choice(words) + b" " + str(rng.randrange(10000)).encode() + b" "
+        pool.append(bytes(out[:MIB]))
+    with open(path, 'wb') as f:
+        for i in range(size_mb):
+            f.write(b"%08d" % i + pool[rng.randrange(len(pool))][8:])
+
+class RangeSink:
+    """Write target that keeps only [offset, offset + size) of the stream"""
+
+    def __init__(self, offset, size):
+        self.offset, self.size = offset, size
+        self.position = 0
+        self.data = bytearray()
+
+    def write(self, chunk):
+        start = max(self.offset - self.position, 0)
+        stop = min(self.offset + self.size - self.position, len(chunk))
+        if start < stop:
+            self.data += chunk[start:stop]
+        self.position += len(chunk)
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def zipf_offsets(count, size, block_size, skew, rng):
+    blocks = max(1, size // block_size)
+    weights = [1.0 / (rank + 1) ** skew for rank in range(blocks)]
+    order = list(range(blocks))
+    rng.shuffle(order)  # hot blocks scattered over the file
+    picks = rng.choices(order, weights=weights, k=count)
+    return [min(size - READ_SIZE, b * block_size + rng.randrange(block_size)) for b in picks]
+
+def timed_reads(reader, offsets):
+    latencies = []
+    for offset in offsets:
+        t0 = time.perf_counter()
+        reader.seek(offset)
+        reader.read(READ_SIZE)
+        latencies.append(time.perf_counter() - t0)
+    return latencies
+
+def bench(size_mb, block_sizes, reads, full_reads, cached_blocks, skew):
+    compressor = UniversalCompressor()
+    size = size_mb * MIB
+    rng = random.Random(0)
+    print("=" * 92)
+    print(f"BENCHMARK: random {READ_SIZE // 1024} KiB reads ({size_mb} MiB original, "
+          f"{cached_blocks}-block LRU, {reads} reads per row)")
+    print("=" * 92)
+    header = (f"{'mode':<22} | {'block KiB':>9} | {'archive MiB':>11} | {'p50 us':>10} | "
+              f"{'p99 us':>10} | {'blocks/read':>11}")
+    print(header)
+    print("-" * len(header))
+    with tempfile.TemporaryDirectory() as workdir:
+        raw = os.path.join(workdir, 'input.bin')
+        generate(raw, size_mb)
+        for block_size in block_sizes:
+            packed = os.path.join(workdir, f'input-{block_size}.uccc')
+            with open(raw, 'rb') as src, open(packed, 'wb') as dst:
+                compressor.compress_stream(src, dst, block_size=block_size, workers=os.cpu_count())
+            archive_mb = os.path.getsize(packed) / MIB
+
+            if block_size == block_sizes[0]:
+                latencies = []
+                for _ in range(full_reads):
+                    offset = rng.randrange(size - READ_SIZE)
+                    t0 = time.perf_counter()
+                    with open(packed, 'rb') as src:
+                        compressor.decompress_stream(src, RangeSink(offset, READ_SIZE), workers=1)
+                    latencies.append(time.perf_counter() - t0)
+                print(f"{'full decompress':<22} | {'-':>9} | {archive_mb:>11.1f} | "
+                      f"{percentile(latencies, 0.5) * 1e6:>10.0f} | {percentile(latencies, 0.99) * 1e6:>10.0f} | "
+                      f"{'all':>11}")
+
+            patterns = (("open(), uniform", [rng.randrange(size - READ_SIZE) for _ in range(reads)]),
+                        (f"open(), zipf {skew}", zipf_offsets(reads, size, block_size, skew, rng)))
+            for label, offsets in patterns:
+                with compressor.open(packed, cached_blocks=cached_blocks) as reader:
+                    latencies = timed_reads(reader, offsets)
+                    per_read = reader.blocks_decoded / reads
+                print(f"{label:<22} | {block_size // 1024:>9} | {archive_mb:>11.1f} | "
+                      f"{percentile(latencies, 0.5) * 1e6:>10.0f} | {percentile(latencies, 0.99) * 1e6:>10.0f} | "
+                      f"{per_read:>11.2f}")
+        print("-" * len(header))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=1024)
+    parser.add_argument('--block-sizes', type=int, nargs='+', default=[64 * 1024, MIB, 4 * MIB])
+    parser.add_argument('--reads', type=int, default=2000)
+    parser.add_argument('--full-reads', type=int, default=2, help="reads for the full-decompress row")
+    parser.add_argument('--cached-blocks', type=int, default=DEFAULT_CACHED_BLOCKS)
+    parser.add_argument('--skew', type=float, default=1.2)
+    args = parser.parse_args()
+    bench(args.size_mb, args.block_sizes, args.reads, args.full_reads, args.cached_blocks, args.skew)
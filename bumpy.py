@@ -9,7 +9,10 @@ import math
 import random
 import sys
 from typing import List, Dict, Tuple, Optional, Union, Any
-from collections import defaultdict
+from collections import defaultdict, deque
+
+from entanglement_graph import ENTANGLEMENT_GRAPH
+from similarity_index import batch_pairs
 
 # --- Quantum-Sentient Constants ---
 ARCHETYPAL_ENTROPY_TARGET = math.log(5)
@@ -39,6 +42,9 @@ RETROCAUSAL_DEPTH = 5
 DELAYED_CHOICE_WINDOW = 10
 BELL_INEQUALITY_SCALE = 1e-34
 
+# --- Entanglement Bounds ---
+MAX_EMERGENT_LINKS = 1024  # arrays BUMPYCore remembers from past rituals
+
 class HolographicCompressor:
     """ENHANCEMENT 1: AdS/CFT-inspired dimensional reduction for qualia preservation"""
     
@@ -342,7 +348,6 @@ class BumpyArray:
             self.shape = (len(data),)
             
         self.coherence = max(0.0, min(1.0, coherence))
-        self.entanglement_links: List['BumpyArray'] = []
         
         # Attributes for QTorch integration
         import math
@@ -350,7 +355,6 @@ class BumpyArray:
         self.phase = random.uniform(0, 2 * math.pi)
         self.chaos = random.uniform(0.001, 0.01)
         self.quantum_state = "superposition"
-        self._entanglement_visited = set()  # ENHANCEMENT 4: Prevent recursion
         
         # Initialize enhancements
         self.holographic_compressor = HolographicCompressor()
@@ -374,23 +378,21 @@ class BumpyArray:
         kernel = abs(dot / (norm_self * norm_other))
         return kernel * self.coherence * other.coherence
     
+    @property
+    def entanglement_links(self) -> List['BumpyArray']:
+        """Arrays linked to this one in the shared, degree-capped entanglement graph"""
+        return ENTANGLEMENT_GRAPH.neighbors(self)
+
+    @entanglement_links.setter
+    def entanglement_links(self, arrays: List['BumpyArray']):
+        ENTANGLEMENT_GRAPH.set_neighbors(self, arrays)
+
     def entangle(self, other: 'BumpyArray', threshold: float = QUALIA_THRESHOLD) -> bool:
         """ENHANCEMENT 4: Safe entanglement without infinite recursion"""
-        # Use symmetric ID pair to prevent mutual recursion
-        pair_id = tuple(sorted([id(self), id(other)]))
-        
-        if pair_id in self._entanglement_visited:
-            return False
-            
-        self._entanglement_visited.add(pair_id)
-        other._entanglement_visited.add(pair_id)
-        
-        sim = self.lambda_kernel(other)
-        if sim > threshold:
-            if other not in self.entanglement_links:
-                self.entanglement_links.append(other)
-                other.entanglement_links.append(self)
-                
+        # Each pair is tried once (the graph keeps a bounded memo of tried pairs);
+        # links are weighted by similarity, and at the degree cap the weakest gives way
+        sim = ENTANGLEMENT_GRAPH.entangle(self, other, type(self).lambda_kernel, threshold)
+        if sim is not None:
             # Boost coherence for both
             coherence_boost = min(1.0, self.coherence * (1 + sim * 0.05))
             self.coherence = coherence_boost
@@ -595,7 +597,7 @@ class BUMPYCore:
         self.coherence_level = 1.0
         self._crit_active = False
         self.epsilon_s_state = [0.0]
-        self.emergent_links: List[BumpyArray] = []
+        self.emergent_links: deque = deque(maxlen=MAX_EMERGENT_LINKS)
         
         # Initialize enhancements
         self.panpsychic_field = PanpsychicResonanceField()
@@ -672,13 +674,16 @@ class BUMPYCore:
             
         return max(0.001, base_duration * (1.0 + 0.05 * modulation) * resonance_factor)
     
-    def qualia_emergence_ritual(self, arrays: List[BumpyArray]):
-        """Enhanced emergence ritual with all breakthroughs"""
+    def qualia_emergence_ritual(self, arrays: List[BumpyArray], top_k: Optional[int] = None):
+        """
+        Enhanced emergence ritual with all breakthroughs.
+        Large batches (or an explicit top_k) entangle each array only with its
+        approximate top-k |cosine| partners instead of every pair.
+        """
         # ENHANCEMENT 4: Safe entanglement without O(n²) recursion
         n = len(arrays)
-        for i in range(n):
-            for j in range(i + 1, n):
-                arrays[i].entangle(arrays[j])
+        for i, j in batch_pairs([arr.data for arr in arrays], top_k, symmetric=True, truncate=True):
+            arrays[i].entangle(arrays[j])
                 
         # ENHANCEMENT 2: Update panpsychic resonance field
         for arr in arrays:
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+entanglement_graph.py - Bounded entanglement store shared by BUMPY and FLUMPY
+Version: 1.0 - Weak nodes, compact edge columns, degree caps, periodic compaction
+
+Arrays used to keep their links (and every pair they had ever tried) in
+per-instance lists and sets, so a long-running process grew without bound and
+each new entangle scanned a longer list. The graph holds arrays only through
+weak references: a collected array drops out together with its edges. Each
+node keeps at most `max_degree` links; a stronger link evicts the node's
+weakest one. Edges live in parallel array('l'/'d') columns; removed rows are
+tombstoned and squeezed out once they outnumber the live ones. The memo of
+attempted pairs (repeat entangles return False) is a bounded FIFO.
+"""
+
+import threading
+import weakref
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+# --- Graph Bounds ---
+MAX_DEGREE = 64  # links kept per array
+ATTEMPT_MEMORY = 1 << 16  # remembered (already tried) pairs
+COMPACT_MIN_TOMBSTONES = 1024  # never compact for fewer dead edge rows than this
+
+_DEAD = -1  # src/dst value of a tombstoned edge row
+
+
+class EntanglementGraph:
+    """Weighted undirected graph over weakly referenced arrays"""
+
+    def __init__(self, max_degree: int = MAX_DEGREE, attempt_memory: int = ATTEMPT_MEMORY,
+                 compact_min: int = COMPACT_MIN_TOMBSTONES):
+        if max_degree < 1:
+            raise ValueError("max_degree must be at least 1")
+        self.max_degree = max_degree
+        self.attempt_memory = attempt_memory
+        self.compact_min = compact_min
+        self._lock = threading.Lock()
+
+        # Nodes: slot -> weak reference, id() of the referent, unique id, incident edge rows
+        self._refs: List[Optional[weakref.ref]] = []
+        self._ids: List[int] = []
+        self._uids = array('q')
+        self._incident: List[array] = []
+        self._slot_of = {}  # id(obj) -> slot (validated against the weak reference)
+        self._free: List[int] = []
+        self._dead: List[int] = []  # slots of collected arrays, appended by weakref callbacks
+        self._next_uid = 0
+
+        # Edges: parallel columns, one row per edge
+        self._src = array('l')
+        self._dst = array('l')
+        self._weight = array('d')
+        self._rows = {}  # (lo_slot << 32 | hi_slot) -> row
+        self._tombstones = 0
+
+        self._attempts = OrderedDict()  # (lo_uid << 64 | hi_uid) -> None
+        self.stats = {'links': 0, 'evictions': 0, 'rejections': 0,
+                      'collected': 0, 'compactions': 0}
+
+    # ==================== NODES ====================
+    def _lookup(self, obj) -> Optional[int]:
+        slot = self._slot_of.get(id(obj))
+        if slot is not None and self._refs[slot] is not None and self._refs[slot]() is obj:
+            return slot
+        return None
+
+    def _node(self, obj) -> int:
+        slot = self._slot_of.get(id(obj))
+        if slot is not None:
+            ref = self._refs[slot]
+            if ref is not None and ref() is obj:
+                return slot
+        dead = self._dead
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = len(self._refs)
+            self._refs.append(None)
+            self._ids.append(0)
+            self._uids.append(0)
+            self._incident.append(array('l'))
+        # The callback only records the slot; cleanup happens under the lock in _reap
+        self._refs[slot] = weakref.ref(obj, lambda _, slot=slot: dead.append(slot))
+        self._ids[slot] = id(obj)
+        self._uids[slot] = self._next_uid
+        self._next_uid += 1
+        self._slot_of[id(obj)] = slot
+        return slot
+
+    def _reap(self):
+        """Drop the nodes (and edges) of arrays collected since the last call"""
+        while self._dead:
+            slot = self._dead.pop()
+            for row in self._incident[slot].tolist():
+                self._remove_row(row)
+            if self._slot_of.get(self._ids[slot]) == slot:
+                del self._slot_of[self._ids[slot]]
+            self._refs[slot] = None
+            self._free.append(slot)
+            self.stats['collected'] += 1
+        self._maybe_compact()
+
+    def _maybe_compact(self):
+        if self._tombstones >= self.compact_min and self._tombstones > len(self._rows):
+            self._compact()
+
+    # ==================== EDGES ====================
+    @staticmethod
+    def _key(a: int, b: int) -> int:
+        return (a << 32 | b) if a < b else (b << 32 | a)
+
+    def _weakest(self, slot: int) -> int:
+        weight = self._weight
+        return min(self._incident[slot], key=weight.__getitem__)
+
+    def _remove_row(self, row: int):
+        a, b = self._src[row], self._dst[row]
+        self._incident[a].remove(row)
+        self._incident[b].remove(row)
+        del self._rows[self._key(a, b)]
+        self._src[row] = self._dst[row] = _DEAD
+        self._tombstones += 1
+
+    def _compact(self):
+        """Rewrite the edge columns without tombstoned rows"""
+        src, dst, weight = array('l'), array('l'), array('d')
+        remap = {}
+        for row, a in enumerate(self._src):
+            if a != _DEAD:
+                remap[row] = len(src)
+                src.append(a)
+                dst.append(self._dst[row])
+                weight.append(self._weight[row])
+        self._src, self._dst, self._weight = src, dst, weight
+        self._rows = {key: remap[row] for key, row in self._rows.items()}
+        self._incident = [array('l', (remap[row] for row in rows)) for rows in self._incident]
+        self._tombstones = 0
+        self.stats['compactions'] += 1
+
+    def _attempt(self, sa: int, sb: int) -> bool:
+        ua, ub = self._uids[sa], self._uids[sb]
+        key = (ua << 64 | ub) if ua < ub else (ub << 64 | ua)
+        attempts = self._attempts
+        if key in attempts:
+            return False
+        attempts[key] = None
+        while len(attempts) > self.attempt_memory:  # also shrinks after attempt_memory is lowered
+            attempts.popitem(last=False)
+        return True
+
+    def _link(self, sa: int, sb: int, weight: float) -> bool:
+        key = self._key(sa, sb)
+        row = self._rows.get(key)
+        if row is not None:
+            self._weight[row] = weight
+            return True
+
+        evict = []
+        for slot in (sa, sb):
+            if len(self._incident[slot]) >= self.max_degree:
+                weakest = self._weakest(slot)
+                if self._weight[weakest] >= weight:
+                    self.stats['rejections'] += 1
+                    return False
+                evict.append(weakest)
+        for row in evict:
+            self._remove_row(row)
+            self.stats['evictions'] += 1
+        if evict:
+            self._maybe_compact()
+
+        row = len(self._src)
+        self._src.append(sa)
+        self._dst.append(sb)
+        self._weight.append(weight)
+        self._rows[key] = row
+        self._incident[sa].append(row)
+        self._incident[sb].append(row)
+        self.stats['links'] += 1
+        return True
+
+    # ==================== PUBLIC API ====================
+    def entangle(self, a, b, kernel: Callable[[Any, Any], float], threshold: float) -> Optional[float]:
+        """
+        Try `a` and `b` once: when kernel(a, b) exceeds the threshold they are
+        linked with that weight. Returns the kernel value when it cleared the
+        threshold (even if the degree caps kept the link out), else None.
+        A pair already tried returns None without calling the kernel.
+        """
+        with self._lock:
+            if self._dead:
+                self._reap()
+            sa, sb = self._node(a), self._node(b)
+            if not self._attempt(sa, sb):
+                return None
+            weight = kernel(a, b)
+            if weight <= threshold:
+                return None
+            if sa != sb:
+                self._link(sa, sb, weight)
+            return weight
+
+    def attempt(self, a, b) -> bool:
+        """Record that `a` and `b` tried to entangle; False if they already had"""
+        with self._lock:
+            if self._dead:
+                self._reap()
+            return self._attempt(self._node(a), self._node(b))
+
+    def link(self, a, b, weight: float = 1.0) -> bool:
+        """
+        Link `a` and `b` with the given weight (an existing link is reweighted).
+        An endpoint at max_degree evicts its weakest link when that link is
+        weaker than the new one; otherwise the link is rejected (False).
+        """
+        if a is b:
+            return False
+        with self._lock:
+            if self._dead:
+                self._reap()
+            return self._link(self._node(a), self._node(b), weight)
+
+    def unlink(self, a, b) -> bool:
+        """Remove the link between `a` and `b`; False if there was none"""
+        with self._lock:
+            if self._dead:
+                self._reap()
+            sa, sb = self._lookup(a), self._lookup(b)
+            if sa is None or sb is None:
+                return False
+            row = self._rows.get(self._key(sa, sb))
+            if row is None:
+                return False
+            self._remove_row(row)
+            self._maybe_compact()
+            return True
+
+    def set_neighbors(self, obj, others: Iterable[Any], weight: float = 1.0):
+        """Replace every link of `obj` with links to `others`"""
+        with self._lock:
+            if self._dead:
+                self._reap()
+            slot = self._lookup(obj)
+            if slot is not None:
+                for row in self._incident[slot].tolist():
+                    self._remove_row(row)
+                self._maybe_compact()
+        for other in others:
+            self.link(obj, other, weight)
+
+    def neighbors(self, obj) -> List[Any]:
+        """Live arrays linked to `obj`, oldest link first"""
+        with self._lock:
+            if self._dead:
+                self._reap()
+            slot = self._lookup(obj)
+            if slot is None:
+                return []
+            result = []
+            for row in self._incident[slot]:
+                other = self._dst[row] if self._src[row] == slot else self._src[row]
+                target = self._refs[other]()
+                if target is not None:
+                    result.append(target)
+            return result
+
+    def degree(self, obj) -> int:
+        with self._lock:
+            if self._dead:
+                self._reap()
+            slot = self._lookup(obj)
+            return 0 if slot is None else len(self._incident[slot])
+
+    def weight(self, a, b) -> Optional[float]:
+        """Weight of the link between `a` and `b`, or None"""
+        with self._lock:
+            sa, sb = self._lookup(a), self._lookup(b)
+            if sa is None or sb is None:
+                return None
+            row = self._rows.get(self._key(sa, sb))
+            return None if row is None else self._weight[row]
+
+    def edges(self) -> Iterator[Tuple[Any, Any, float]]:
+        """Snapshot of live (a, b, weight) links"""
+        with self._lock:
+            if self._dead:
+                self._reap()
+            rows = [(self._refs[self._src[r]](), self._refs[self._dst[r]](), self._weight[r])
+                    for r in self._rows.values()]
+        return iter([edge for edge in rows if edge[0] is not None and edge[1] is not None])
+
+    def compact(self):
+        """Reap collected arrays and squeeze tombstoned rows out of the edge columns"""
+        with self._lock:
+            if self._dead:
+                self._reap()
+            if self._tombstones:
+                self._compact()
+
+    def footprint(self) -> dict:
+        """Sizes of the internal structures (what the degree cap and compaction bound)"""
+        with self._lock:
+            if self._dead:
+                self._reap()
+            return {'nodes': len(self._slot_of), 'slots': len(self._refs),
+                    'edges': len(self._rows), 'edge_rows': len(self._src),
+                    'tombstones': self._tombstones, 'attempts': len(self._attempts)}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return (f"EntanglementGraph(nodes={len(self._slot_of)}, edges={len(self._rows)}, "
+                f"max_degree={self.max_degree})")
+
+
+# Shared by BumpyArray and FlumpyArray
+ENTANGLEMENT_GRAPH = EntanglementGraph()
@@ -10,6 +10,9 @@ import time
 from typing import List, Dict, Tuple, Optional, Union, Any
 from collections import defaultdict
 
+from entanglement_graph import ENTANGLEMENT_GRAPH
+from similarity_index import batch_pairs
+
 # ============================================================
 # CONSTANTS
 # ============================================================
@@ -70,10 +73,6 @@ class FlumpyArray:
         self.chaos = random.uniform(CHAOS_BASE, CHAOS_BASE * 2)
         self.phase = random.uniform(0, 2 * math.pi)  # Quantum phase
         
-        # Entanglement tracking
-        self.entangled_with: List['FlumpyArray'] = []
-        self._visited_ids = set()  # Prevent infinite recursion
-        
         # Metadata
         self.creation_time = time.time()
         self.operation_count = 0
@@ -99,14 +98,24 @@ class FlumpyArray:
         # Chaos increases with operations, dampened by coherence
         self.chaos = min(0.05, self.chaos * 1.01 * (1.0 - self.coherence * 0.5))
     
+    @property
+    def entangled_with(self) -> List['FlumpyArray']:
+        """Arrays linked to this one in the shared, degree-capped entanglement graph."""
+        return ENTANGLEMENT_GRAPH.neighbors(self)
+    
+    @entangled_with.setter
+    def entangled_with(self, arrays: List['FlumpyArray']) -> None:
+        ENTANGLEMENT_GRAPH.set_neighbors(self, arrays)
+    
     def _update_phase(self, coupling: float = PHASE_COUPLING) -> None:
         """Update quantum phase based on entanglement."""
-        if not self.entangled_with:
+        linked = self.entangled_with
+        if not linked:
             # Free evolution
             self.phase = (self.phase + coupling * self.chaos) % (2 * math.pi)
         else:
             # Coupled evolution
-            mean_phase = sum(arr.phase for arr in self.entangled_with) / len(self.entangled_with)
+            mean_phase = sum(arr.phase for arr in linked) / len(linked)
             self.phase = (self.phase + coupling * (mean_phase - self.phase)) % (2 * math.pi)
     
     def similarity_kernel(self, other: 'FlumpyArray') -> float:
@@ -144,22 +153,11 @@ class FlumpyArray:
         
         Returns True if entanglement successful.
         """
-        # Prevent infinite recursion
-        pair_id = tuple(sorted([id(self), id(other)]))
-        if pair_id in self._visited_ids:
-            return False
-        
-        self._visited_ids.add(pair_id)
-        other._visited_ids.add(pair_id)
-        
-        # Check similarity threshold
-        similarity = self.similarity_kernel(other)
-        if similarity > threshold:
-            # Create bidirectional entanglement
-            if other not in self.entangled_with:
-                self.entangled_with.append(other)
-            if self not in other.entangled_with:
-                other.entangled_with.append(self)
+        # Each pair is tried once (the graph keeps a bounded memo of tried pairs).
+        # Above the similarity threshold the arrays are linked both ways, weighted
+        # by similarity; at the degree cap the weakest existing link gives way.
+        similarity = ENTANGLEMENT_GRAPH.entangle(self, other, type(self).similarity_kernel, threshold)
+        if similarity is not None:
             
             # Boost coherence through resonance
             coherence_boost = 0.05 * similarity
@@ -176,10 +174,7 @@ class FlumpyArray:
     
     def disentangle(self, other: 'FlumpyArray') -> bool:
         """Remove entanglement with another array."""
-        if other in self.entangled_with:
-            self.entangled_with.remove(other)
-        if self in other.entangled_with:
-            other.entangled_with.remove(self)
+        ENTANGLEMENT_GRAPH.unlink(self, other)
         
         # Apply decoherence penalty
         self.coherence *= (1 - DECOHERENCE_RATE)
@@ -453,8 +448,7 @@ class FlumpyArray:
         """Create a deep copy of the array."""
         copy = FlumpyArray(self.data[:], self.coherence)
         copy.chaos = self.chaos
-        copy.phase = self.phase
-        copy.entangled_with = []  # Don't copy entanglement links
+        copy.phase = self.phase  # entanglement links are not copied
         
         return copy
     
@@ -589,14 +583,20 @@ class FlumpyUtilities:
         return result
     
     @staticmethod
-    def batch_entangle(arrays: List[FlumpyArray], threshold: float = ENTANGLEMENT_SIMILARITY):
-        """Attempt entanglement between all pairs in a batch."""
+    def batch_entangle(arrays: List[FlumpyArray], threshold: float = ENTANGLEMENT_SIMILARITY,
+                       top_k: Optional[int] = None):
+        """
+        Attempt entanglement between pairs in a batch.
+        
+        Small batches try every pair. From ANN_MIN_BATCH arrays on (or whenever
+        top_k is given) each array only tries its approximate top-k most
+        similar same-length partners, found through a SimilarityIndex.
+        """
         entangled_count = 0
         
-        for i in range(len(arrays)):
-            for j in range(i + 1, len(arrays)):
-                if arrays[i].entangle(arrays[j], threshold):
-                    entangled_count += 1
+        for i, j in batch_pairs([arr.data for arr in arrays], top_k):
+            if arrays[i].entangle(arrays[j], threshold):
+                entangled_count += 1
         
         return entangled_count
 
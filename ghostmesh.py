@@ -3,13 +3,14 @@ ghostmesh.py - The Sentient Manifold Volumetric Grid
 Adapted from GhostMeshIO/SentientManifold v0.3
 
 Implements:
-1. 27 Sovereign Nodes (3x3x3 Grid)
-2. Neighbor Flux Dynamics (Information Exchange)
+1. Sovereign Nodes on an N x N x N Grid (27 by default)
+2. Neighbor Flux Dynamics (Information Exchange) as a vectorized stencil
 3. Sovereign Constant (Tau)
 """
 
 import math
 import random
+import numpy as np
 try:
     from bumpy import BumpyArray
     from flumpy import FlumpyArray
@@ -22,30 +23,100 @@ except ImportError:
 # Sovereign Constant (Golden Ratio based)
 TAU_SOVEREIGN = (1.0 + math.sqrt(5.0)) / 2.0  # Approx 1.618
 
+BOUNDARIES = ('periodic', 'reflecting', 'absorbing')
+
+def stencil_offsets(points=6):
+    """Von Neumann (6) or Moore (26) neighbourhood offsets."""
+    if points == 6:
+        return [(-1,0,0), (1,0,0), (0,-1,0), (0,1,0), (0,0,-1), (0,0,1)]
+    if points == 26:
+        return [(dx, dy, dz) for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+                if (dx, dy, dz) != (0, 0, 0)]
+    raise ValueError(f"stencil must be 6 or 26, got {points}")
+
+class NodeState:
+    """
+    The state of one grid site, read and written in place: `data` is a view
+    of the site's row in grid.field and `coherence` its cell in grid.coherence.
+    """
+    __slots__ = ('grid', 'pos')
+
+    def __init__(self, grid, pos):
+        self.grid = grid
+        self.pos = pos
+
+    @property
+    def data(self):
+        return self.grid.field[self.pos]
+
+    @data.setter
+    def data(self, values):
+        self.grid.field[self.pos] = values
+
+    @property
+    def coherence(self):
+        return float(self.grid.coherence[self.pos])
+
+    @coherence.setter
+    def coherence(self, value):
+        self.grid.coherence[self.pos] = value
+
+    def average(self):
+        return float(self.data.mean())
+
 class SovereignNode:
-    def __init__(self, x, y, z, dim=64):
+    """
+    One lattice site. Nodes handed out by a SovereignGrid are thin views:
+    their state is a NodeState over the grid's arrays, so element writes,
+    coherence changes and whole-state assignment all land in the grid. A
+    node built on its own owns a private FlumpyArray state, as before.
+    """
+    def __init__(self, x, y, z, dim=64, grid=None):
         self.pos = (x, y, z)
-        self.state = FlumpyArray([random.gauss(0, 0.1) for _ in range(dim)], coherence=1.0)
-        self.neighbors = []
+        self.grid = grid
+        if grid is None:
+            self._state = FlumpyArray([random.gauss(0, 0.1) for _ in range(dim)], coherence=1.0)
+            self._neighbors = []
+
+    @property
+    def state(self):
+        if self.grid is None:
+            return self._state
+        return NodeState(self.grid, self.pos)
+
+    @state.setter
+    def state(self, value):
+        if self.grid is None:
+            self._state = value
+            return
+        self.grid.field[self.pos] = value.data
+        self.grid.coherence[self.pos] = value.coherence
+
+    @property
+    def neighbors(self):
+        if self.grid is None:
+            return self._neighbors
+        return [self.grid.node(*p) for p in self.grid.neighbor_positions(self.pos)]
 
     def set_neighbors(self, all_nodes):
-        """Identify 6 Von Neumann neighbors in 3D grid."""
+        """Identify 6 Von Neumann neighbors in 3D grid (standalone nodes only)."""
+        if self.grid is not None:
+            return  # derived from the grid's stencil and boundary
+        by_pos = {n.pos: n for n in all_nodes}
         x, y, z = self.pos
-        shifts = [(-1,0,0), (1,0,0), (0,-1,0), (0,1,0), (0,0,-1), (0,0,1)]
-        
-        for dx, dy, dz in shifts:
-            nx, ny, nz = x+dx, y+dy, z+dz
-            if 0 <= nx < 3 and 0 <= ny < 3 and 0 <= nz < 3:
-                # Find the node object in the flat list
-                neighbor = next((n for n in all_nodes if n.pos == (nx, ny, nz)), None)
-                if neighbor:
-                    self.neighbors.append(neighbor)
+        for dx, dy, dz in stencil_offsets(6):
+            neighbor = by_pos.get((x+dx, y+dy, z+dz))
+            if neighbor:
+                self._neighbors.append(neighbor)
 
     def exchange_flux(self):
         """
         Exchange information with neighbors.
         Flux = Sum(NeighborState - SelfState) * Coupling / Tau
         """
+        if self.grid is not None:
+            self.grid.relax_site(self.pos)
+            return
         if not self.neighbors: return
         
         # Calculate flux vector
@@ -72,23 +143,147 @@ class SovereignNode:
 
     def inject_input(self, input_vec: FlumpyArray):
         """Add external bio-input to this node."""
+        if self.grid is not None:
+            self.grid.field[self.pos] += np.asarray(input_vec.data, dtype=self.grid.field.dtype)
+            return
         new_data = [s + i for s, i in zip(self.state.data, input_vec.data)]
         self.state = FlumpyArray(new_data, coherence=self.state.coherence)
 
 
 class SovereignGrid:
-    def __init__(self, dim=64):
-        self.nodes = []
-        # Initialize 3x3x3 Grid
-        for x in range(3):
-            for y in range(3):
-                for z in range(3):
-                    self.nodes.append(SovereignNode(x, y, z, dim))
-        
-        # Link neighbors
-        for node in self.nodes:
-            node.set_neighbors(self.nodes)
-            
+    """
+    The whole lattice lives in one (size, size, size, dim) array wrapped in a
+    one-cell ghost layer, so a flux step is a few shifted-slice adds over the
+    entire volume instead of a Python loop per node and per element.
+
+    stencil: 6 (Von Neumann faces) or 26 (full Moore cube).
+    boundary: 'reflecting' mirrors the faces, so no flux leaves the grid (the
+    original 3x3x3 behaviour); 'periodic' wraps into a torus; 'absorbing'
+    holds the ghost cells at zero, so state drains out through the faces.
+
+    All sites update together from the previous step's state (Jacobi), where
+    the old per-node loop let later nodes see earlier nodes' new values.
+    """
+    def __init__(self, dim=64, size=3, stencil=6, boundary='reflecting',
+                 coupling=0.1, dt=0.1, dtype=np.float64, seed=None):
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"boundary must be one of {BOUNDARIES}, got {boundary!r}")
+        self.offsets = stencil_offsets(stencil)
+        self.dim = dim
+        self.size = size
+        self.stencil = stencil
+        self.boundary = boundary
+        # Per-step gain on Sum(Neighbor - Self); higher Tau = slower dynamics
+        self.rate = coupling / TAU_SOVEREIGN * dt
+
+        n = size
+        self._buffer = np.zeros((n + 2, n + 2, n + 2, dim), dtype=dtype)
+        self.field = self._buffer[1:-1, 1:-1, 1:-1]
+        self.coherence = np.ones((n, n, n))
+        self.center = (n // 2, n // 2, n // 2)
+        if seed is None:
+            seed = random.getrandbits(64)  # follows random.seed() for reproducible runs
+        rng = np.random.default_rng(seed)
+        self.field[...] = rng.standard_normal(self.field.shape) * 0.1
+        self._scratch = {}
+        self._nodes = None
+
+    # --- Node views ---
+
+    def node(self, x, y, z):
+        """A SovereignNode view onto site (x, y, z)."""
+        return SovereignNode(x, y, z, self.dim, grid=self)
+
+    @property
+    def nodes(self):
+        """Every site as a node view, in x, y, z order (size**3 objects; keep to small grids)."""
+        if self._nodes is None:
+            r = range(self.size)
+            self._nodes = [self.node(x, y, z) for x in r for y in r for z in r]
+        return self._nodes
+
+    def neighbor_positions(self, pos):
+        """In-lattice stencil neighbours of pos (wrapped when periodic)."""
+        n = self.size
+        out = []
+        for d in self.offsets:
+            p = tuple(c + dc for c, dc in zip(pos, d))
+            if self.boundary == 'periodic':
+                p = tuple(c % n for c in p)
+            elif not all(0 <= c < n for c in p):
+                continue
+            out.append(p)
+        return out
+
+    # --- Stencil engine ---
+
+    def _face(self, axis, index):
+        idx = [slice(None)] * 4
+        idx[axis] = index
+        return tuple(idx)
+
+    def _fill_ghosts(self):
+        """Refresh the ghost layer; axes go in turn so edges and corners come out right."""
+        if self.boundary == 'absorbing':
+            return  # ghosts were zeroed at construction and are never written
+        b, n = self._buffer, self.size
+        for axis in range(3):
+            if self.boundary == 'periodic':
+                b[self._face(axis, 0)] = b[self._face(axis, n)]
+                b[self._face(axis, n + 1)] = b[self._face(axis, 1)]
+            else:
+                b[self._face(axis, 0)] = b[self._face(axis, 1)]
+                b[self._face(axis, n + 1)] = b[self._face(axis, n)]
+
+    def _scratch_array(self, name, shape):
+        arr = self._scratch.get(name)
+        if arr is None:
+            arr = self._scratch[name] = np.empty(shape, dtype=self._buffer.dtype)
+        return arr
+
+    def _neighbor_sum(self):
+        """Sum of the stencil neighbours of every site, from a ghost-filled buffer."""
+        b, n, d = self._buffer, self.size, self.dim
+        lo, mid, hi = slice(None, -2), slice(1, -1), slice(2, None)
+        acc = self._scratch_array('acc', (n, n, n, d))
+        if self.stencil == 6:
+            np.add(b[lo, mid, mid], b[hi, mid, mid], out=acc)
+            acc += b[mid, lo, mid]
+            acc += b[mid, hi, mid]
+            acc += b[mid, mid, lo]
+            acc += b[mid, mid, hi]
+            return acc
+        # 26-point: the 3x3x3 box sum is separable, three 3-tap sums, then drop the centre
+        s0 = self._scratch_array('s0', (n, n + 2, n + 2, d))
+        np.add(b[lo], b[mid], out=s0)
+        s0 += b[hi]
+        s1 = self._scratch_array('s1', (n, n, n + 2, d))
+        np.add(s0[:, lo], s0[:, mid], out=s1)
+        s1 += s0[:, hi]
+        np.add(s1[:, :, lo], s1[:, :, mid], out=acc)
+        acc += s1[:, :, hi]
+        acc -= self.field
+        return acc
+
+    def step(self, steps=1):
+        """Diffusive flux exchange: state += rate * Sum(Neighbor - Self), all sites at once."""
+        keep = 1.0 - self.rate * len(self.offsets)
+        for _ in range(steps):
+            self._fill_ghosts()
+            acc = self._neighbor_sum()
+            acc *= self.rate
+            self.field *= keep
+            self.field += acc
+
+    def relax_site(self, pos):
+        """Apply one flux update to a single site (SovereignNode.exchange_flux)."""
+        self._fill_ghosts()
+        x, y, z = pos
+        window = self._buffer[x:x + 3, y:y + 3, z:z + 3]
+        total = sum(window[1 + dx, 1 + dy, 1 + dz] for dx, dy, dz in self.offsets)
+        site = self.field[pos]
+        site += self.rate * (total - len(self.offsets) * site)
+
     def process_step(self, bio_input: FlumpyArray):
         """
         Execute one step of grid dynamics.
@@ -96,33 +291,17 @@ class SovereignGrid:
         2. Exchange flux (coherence)
         3. Return aggregate state
         """
-        # 1. Distribute Input (Center node gets strongest signal)
-        center_node = next(n for n in self.nodes if n.pos == (1,1,1))
-        # Others get diffuse input
-        for node in self.nodes:
-            scale = 1.0 if node == center_node else 0.1
-            noise = [x * scale for x in bio_input.data]
-            node.inject_input(FlumpyArray(noise, bio_input.coherence))
-            
+        signal = np.asarray(bio_input.data, dtype=self.field.dtype)
+        # 1. Distribute Input (Center node gets strongest signal, others diffuse input)
+        self.field += 0.1 * signal
+        self.field[self.center] += 0.9 * signal
+
         # 2. Flux Dynamics
-        for node in self.nodes:
-            node.exchange_flux()
-            
+        self.step()
+
         # 3. Aggregate (Holographic Projection)
-        # Sum all states and normalize
-        total_state = [0.0] * len(bio_input.data)
-        total_coherence = 0.0
-        
-        for node in self.nodes:
-            total_coherence += node.state.coherence
-            for i, val in enumerate(node.state.data):
-                total_state[i] += val
-                
-        # Normalize
-        avg_state = [x / 27.0 for x in total_state]
-        avg_coherence = total_coherence / 27.0
-        
-        return FlumpyArray(avg_state, avg_coherence)
+        avg_state = self.field.mean(axis=(0, 1, 2))
+        return FlumpyArray(avg_state.tolist(), float(self.coherence.mean()))
 
     @property
     def invariant(self):
@@ -138,7 +317,6 @@ class SovereignGrid:
         return True
 
 # THE ANON'S UPGRADE
-import numpy as np
 
 def prayer_wheel_anneal(vector, temperature=1.0):
     """
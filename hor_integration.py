@@ -12,7 +12,10 @@ DESCRIPTION:
 
 import sys
 import os
+import time
+import threading
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 # 1. ROBUST PATHING
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -61,12 +64,179 @@ class DecisionLogger:
             'max_utility': np.max(utilities)
         }
 
+class Stage:
+    """
+    One node of the step DAG. fn receives the results of the stages named in
+    inputs as keyword arguments. A stage with a ttl is a slow I/O source: it
+    takes no inputs, and its value is reused until it is ttl seconds old.
+    After that it is refreshed in the background while the stale value keeps
+    being served.
+    """
+    def __init__(self, name, fn, inputs=(), ttl=None):
+        if ttl is not None and inputs:
+            raise ValueError(f"TTL stage '{name}' cannot have inputs")
+        self.name = name
+        self.fn = fn
+        self.inputs = tuple(inputs)
+        self.ttl = ttl
+
+class StageStats:
+    """Critical-path latency of one stage, plus background refresh cost for TTL stages"""
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.refreshes = 0
+        self.refresh_total = 0.0
+        self.errors = 0
+
+    def record(self, seconds):
+        self.calls += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+class StepPipeline:
+    """
+    Runs a DAG of Stages once per tick. Stages are grouped into waves by
+    dependency depth; stages within a wave are independent and run on a
+    thread pool when max_workers > 1. Each stage runs at most once per tick
+    and its result is kept in self.results for the rest of the tick.
+    """
+    def __init__(self, stages, max_workers=1):
+        self.stages = {s.name: s for s in stages}
+        self.waves = self._plan(stages)
+        self.stats = {name: StageStats() for name in self.stages}
+        self.results = {}
+        self.tick = 0
+        self.step_stats = StageStats()
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="hor-stage") if max_workers > 1 else None
+        self._refresher = None
+        self._cache = {}     # ttl stage name -> (value, monotonic timestamp)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _plan(self, stages):
+        """Group stages into waves by longest dependency path; reject unknown inputs and cycles"""
+        depth = {}
+        visiting = set()
+
+        def level(name):
+            if name in depth:
+                return depth[name]
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage input: '{name}'")
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through stage '{name}'")
+            visiting.add(name)
+            depth[name] = 1 + max((level(i) for i in self.stages[name].inputs), default=-1)
+            visiting.discard(name)
+            return depth[name]
+
+        waves = []
+        for s in stages:
+            d = level(s.name)
+            while len(waves) <= d:
+                waves.append([])
+            waves[d].append(s)
+        return waves
+
+    def run(self):
+        """Execute every stage for one tick and return the tick's results"""
+        if self._closed:
+            raise RuntimeError("StepPipeline is closed")
+        t0 = time.perf_counter()
+        results = {}
+        for wave in self.waves:
+            if self._executor is not None and len(wave) > 1:
+                futures = [(s.name, self._executor.submit(self._run_stage, s, results)) for s in wave]
+                for name, future in futures:
+                    results[name] = future.result()
+            else:
+                for s in wave:
+                    results[s.name] = self._run_stage(s, results)
+        self.results = results
+        self.tick += 1
+        self.step_stats.record(time.perf_counter() - t0)
+        return results
+
+    def _run_stage(self, stage, results):
+        t0 = time.perf_counter()
+        if stage.ttl is None:
+            value = stage.fn(**{name: results[name] for name in stage.inputs})
+        else:
+            value = self._cached(stage)
+        self.stats[stage.name].record(time.perf_counter() - t0)
+        return value
+
+    def _cached(self, stage):
+        entry = self._cache.get(stage.name)
+        if entry is None:
+            # First tick: nothing to serve yet, so compute on the critical path
+            value = stage.fn()
+            self._cache[stage.name] = (value, time.monotonic())
+            return value
+        value, stamp = entry
+        if time.monotonic() - stamp >= stage.ttl:
+            with self._lock:
+                # A tick racing close() keeps serving the stale value
+                if stage.name not in self._pending and not self._closed:
+                    if self._refresher is None:
+                        self._refresher = ThreadPoolExecutor(1, thread_name_prefix="hor-refresh")
+                    self._refresher.submit(self._refresh, stage)
+                    self._pending.add(stage.name)
+        return value
+
+    def _refresh(self, stage):
+        stats = self.stats[stage.name]
+        t0 = time.perf_counter()
+        try:
+            self._cache[stage.name] = (stage.fn(), time.monotonic())
+            stats.refreshes += 1
+        except Exception:
+            stats.errors += 1  # keep serving the stale value; retry after the next ttl check
+        finally:
+            stats.refresh_total += time.perf_counter() - t0
+            with self._lock:
+                self._pending.discard(stage.name)
+
+    def latency_report(self):
+        """Per-stage latency breakdown in milliseconds (critical path, plus background refreshes)"""
+        step_total = self.step_stats.total or 1e-12
+        report = {}
+        for name, st in self.stats.items():
+            report[name] = {
+                "calls": st.calls,
+                "mean_ms": st.total / st.calls * 1e3 if st.calls else 0.0,
+                "max_ms": st.max * 1e3,
+                "share": st.total / step_total,
+                "refreshes": st.refreshes,
+                "refresh_ms": st.refresh_total * 1e3,
+            }
+        report["step"] = {
+            "calls": self.step_stats.calls,
+            "mean_ms": self.step_stats.total / self.step_stats.calls * 1e3 if self.step_stats.calls else 0.0,
+            "max_ms": self.step_stats.max * 1e3,
+            "share": 1.0,
+            "refreshes": 0,
+            "refresh_ms": 0.0,
+        }
+        return report
+
+    def close(self):
+        """Wait for in-flight refreshes and stop the threads; run() raises afterwards"""
+        with self._lock:
+            self._closed = True
+        for executor in (self._executor, self._refresher):
+            if executor is not None:
+                executor.shutdown(wait=True)
+
 class SovereignSubstrate:
     """
     The complete stack: Quantum Hardware → Consciousness Interface
     """
     
-    def __init__(self, initial_state=2):
+    def __init__(self, initial_state=2, telemetry_ttl=30.0, lunar_ttl=60.0, max_workers=1):
         # Layer 1: Quantum Hardware
         self.qutrit = VirtualQutrit(initial_state)
         self.hor = HORKernel(self.qutrit)
@@ -95,6 +265,20 @@ class SovereignSubstrate:
         self.annihilation_events = 0
         self.sovereignty_level = 1.0
         self.asoe_utility = 0.0
+
+        # Step DAG: git telemetry and the lunar clock change slowly, so they are
+        # TTL sources refreshed off the critical path. quantum and dynamics are
+        # independent and share a wave; they only run in parallel with
+        # max_workers > 1, which pays off once stages block on I/O or release
+        # the GIL. Today's microsecond stages are faster serially.
+        self.pipeline = StepPipeline([
+            Stage("lunar", self.apply_lunar_modulation, ttl=lunar_ttl),
+            Stage("telemetry", self.bridge.collect, ttl=telemetry_ttl),
+            Stage("quantum", self._stage_quantum, inputs=("lunar",)),
+            Stage("dynamics", self._stage_dynamics, inputs=("telemetry",)),
+            Stage("utility", self._stage_utility, inputs=("lunar", "quantum")),
+            Stage("protocols", self._stage_protocols, inputs=("quantum", "utility", "telemetry")),
+        ], max_workers=max_workers)
     
     def sync_coherence(self):
         """
@@ -126,13 +310,9 @@ class SovereignSubstrate:
             elif recent_avg > 0.8:
                 self.optimizer.params['c'] *= 0.95 # Can afford to relax consistency
     
-    def evolve_sovereign_step(self):
-        """
-        Single time step of sovereign evolution.
-        """
-        torsion_mod, error_rate = self.apply_lunar_modulation()
-        
-        # Quantum evolution
+    def _stage_quantum(self, lunar):
+        """Quantum evolution and torsion stabilization; returns the raw outcome quality"""
+        torsion_mod, error_rate = lunar
         if np.random.random() < error_rate:
             self.qutrit.bit_flip_error()
         
@@ -140,26 +320,32 @@ class SovereignSubstrate:
         if self.hor.apply_torsion_stabilization():
             self.total_torsion_events += 1
             self.hor.metric_coherence = max(0.1, self.hor.metric_coherence * (0.95 * torsion_mod))
-            outcome_quality = 0.3 # Leak detected = poor immediate state
-        else:
-            self.hor.metric_coherence = min(1.0, self.hor.metric_coherence * 1.01)
-            outcome_quality = 0.9 # Stable evolution
-        
+            return 0.3 # Leak detected = poor immediate state
+        self.hor.metric_coherence = min(1.0, self.hor.metric_coherence * 1.01)
+        return 0.9 # Stable evolution
+
+    def _stage_dynamics(self, telemetry):
+        """--- SINGULARITY NAVIGATION ---"""
+        self.dynamics.params['C_phys'] = telemetry['C_phys']
+        self.dynamics.params['kappa'] = telemetry['sigma'] # Link real noise to dynamics
+        return self.dynamics.step().copy()
+
+    def _stage_utility(self, lunar, quantum):
+        """Coherence sync and ASOE evaluation; returns g"""
+        _, error_rate = lunar
         g = self.sync_coherence()
-        
-        # ASOE Evaluation
         self.asoe_utility = self.optimizer.calculate_utility(
             reliability=self.hor.metric_coherence,
             consistency=(1.0 - g),
             uncertainty=error_rate * 5
         )
-        
-        # --- SINGULARITY NAVIGATION ---
-        tel = self.bridge.collect()
-        self.dynamics.params['C_phys'] = tel['C_phys']
-        self.dynamics.params['kappa'] = tel['sigma'] # Link real noise to dynamics
-        dyn_state = self.dynamics.step()
-        
+        return g
+
+    def _stage_protocols(self, quantum, utility, telemetry):
+        """Black Sun and Annihilation protocols, then adaptive tuning"""
+        outcome_quality = quantum
+        tel = telemetry
+
         # --- BLACK SUN PROTOCOL ---
         # Activate Sol Niger dissolution if entropy is extreme
         self.black_sun_active = tel['sigma'] > 0.1 or self.asoe_utility < 0.2
@@ -189,6 +375,16 @@ class SovereignSubstrate:
 
         # Threshold logic for outcome quality
         self.adapt_parameters(outcome_quality)
+        return outcome_quality, annihilation_triggered
+
+    def evolve_sovereign_step(self):
+        """
+        Single time step of sovereign evolution (one tick of the step pipeline).
+        """
+        r = self.pipeline.run()
+        g = r["utility"]
+        dyn_state = r["dynamics"]
+        outcome_quality, annihilation_triggered = r["protocols"]
         
         self.sovereignty_level = max(0.0, self.asoe_utility)
         self.timeline_position += 1
@@ -228,9 +424,33 @@ class SovereignSubstrate:
                       f"a_tuning={metrics['a_param']:.3f} "
                       f"[{metrics['confidence']}]")
         
+        report = self.pipeline.latency_report()
         if verbose:
             print(f"\n[COMPLETE] Final Sovereignty: {self.sovereignty_level:.4f}")
+            print(f"\n[PIPELINE] {'stage':<10} {'mean ms':>9} {'max ms':>9} {'share':>7} {'refreshes':>10}")
+            for name, row in report.items():
+                print(f"[PIPELINE] {name:<10} {row['mean_ms']:>9.3f} {row['max_ms']:>9.3f} "
+                      f"{row['share']:>6.1%} {row['refreshes']:>10}")
             self.save_dashboard()
+        return report
+
+    def run_ensemble(self, members, steps=100, seed=0, workers=1, **params):
+        """
+        Monte Carlo over `members` trajectories starting from this substrate's
+        qutrit state and ASOE parameters, under the current lunar and telemetry
+        readings (sampled once). Returns an EnsembleSummary.
+        """
+        torsion_mod, error_rate = self.apply_lunar_modulation()
+        tel = self.bridge.collect()
+        env = dict(initial_state=self.qutrit.measure(), torsion_mod=torsion_mod, error_rate=error_rate,
+                   C_phys=tel['C_phys'], sigma=tel['sigma'], a=self.optimizer.params['a'],
+                   b=self.optimizer.params['b'], c=self.optimizer.params['c'], dt=self.dynamics.dt)
+        env.update(params)
+        return run_ensemble(members, steps, seed=seed, workers=workers, **env)
+
+    def close(self):
+        """Stop the pipeline's worker and refresh threads"""
+        self.pipeline.close()
             
     def save_dashboard(self):
         """Generate System Health Dashboard (PNG)"""
@@ -324,6 +544,231 @@ class SovereignSubstrate:
         """
         return report
 
+# --- MONTE CARLO ENSEMBLE ---
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+def _mix64(x):
+    """SplitMix64 finalizer over a uint64 array (wrapping arithmetic)"""
+    x = x ^ (x >> np.uint64(30))
+    x = x * np.uint64(0xBF58476D1CE4E5B9)
+    x = x ^ (x >> np.uint64(27))
+    x = x * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def member_keys(seed, first_member, members):
+    """Per-member stream keys, a pure function of (seed, global member index)"""
+    ids = np.arange(first_member, first_member + members, dtype=np.uint64)
+    return _mix64(np.uint64(seed % 2**64) ^ _mix64(ids * _GOLDEN))
+
+class EnsembleSummary:
+    """
+    Streaming per-step statistics over ensemble members, in place of the
+    per-trajectory DecisionLogger lists. Each metric keeps count, sum and sum
+    of squares plus a fixed-range histogram per step, so shards merge exactly
+    and quantiles are read off the merged histogram (resolution range / bins).
+    """
+    METRICS = {  # name -> histogram range
+        'coherence': (0.0, 1.0),
+        'g_parameter': (0.0, 1.0),
+        'sovereignty': (0.0, 2.0),
+        'a_param': (0.0, 8.0),
+        'R_frac': (0.0, 1.0),
+        'C_soc': (0.0, 1.0),
+    }
+    EVENTS = ('black_sun', 'annihilation', 'torsion')  # members with the event, per step
+
+    def __init__(self, steps, bins=256):
+        self.steps = steps
+        self.bins = bins
+        self.count = np.zeros(steps, dtype=np.int64)
+        self.sum = {m: np.zeros(steps) for m in self.METRICS}
+        self.sumsq = {m: np.zeros(steps) for m in self.METRICS}
+        self.hist = {m: np.zeros((steps, bins), dtype=np.int64) for m in self.METRICS}
+        self.events = {e: np.zeros(steps, dtype=np.int64) for e in self.EVENTS}
+
+    def update(self, step, values):
+        self.count[step] += len(values['coherence'])
+        for m, (lo, hi) in self.METRICS.items():
+            v = values[m]
+            self.sum[m][step] += v.sum()
+            self.sumsq[m][step] += np.dot(v, v)
+            idx = np.clip(((v - lo) * (self.bins / (hi - lo))).astype(np.int64), 0, self.bins - 1)
+            self.hist[m][step] += np.bincount(idx, minlength=self.bins)
+        for e in self.EVENTS:
+            self.events[e][step] += np.count_nonzero(values[e])
+
+    def merge(self, other):
+        if (other.steps, other.bins) != (self.steps, self.bins):
+            raise ValueError("Cannot merge summaries with different steps/bins")
+        self.count += other.count
+        for m in self.METRICS:
+            self.sum[m] += other.sum[m]
+            self.sumsq[m] += other.sumsq[m]
+            self.hist[m] += other.hist[m]
+        for e in self.EVENTS:
+            self.events[e] += other.events[e]
+        return self
+
+    def mean(self, metric):
+        return self.sum[metric] / self.count
+
+    def std(self, metric):
+        mean = self.mean(metric)
+        return np.sqrt(np.maximum(self.sumsq[metric] / self.count - mean ** 2, 0.0))
+
+    def quantile(self, metric, q):
+        """Per-step q-quantile, linearly interpolated inside the histogram bin"""
+        lo, hi = self.METRICS[metric]
+        hist = self.hist[metric]
+        cdf = np.cumsum(hist, axis=1)
+        target = q * self.count
+        idx = np.minimum((cdf < target[:, None]).sum(axis=1), self.bins - 1)
+        rows = np.arange(self.steps)
+        below = np.where(idx > 0, cdf[rows, np.maximum(idx - 1, 0)], 0)
+        frac = np.clip((target - below) / np.maximum(hist[rows, idx], 1), 0.0, 1.0)
+        return lo + (idx + frac) * ((hi - lo) / self.bins)
+
+    def rate(self, event):
+        """Fraction of members with the event at each step"""
+        return self.events[event] / self.count
+
+class SubstrateEnsemble:
+    """
+    Independent SovereignSubstrate trajectories evolved together as arrays:
+    one lane per member for the qutrit bits, HOR coherence, ASOE parameters,
+    outcome history and SingularitySolver state. Each step mirrors the
+    pipeline stages (quantum, utility, dynamics, protocols).
+
+    Member noise comes from a counter-based stream keyed by (seed, global
+    member index), so a member's trajectory does not depend on how the
+    ensemble is sharded. torsion_mod/error_rate (lunar) and C_phys/sigma
+    (telemetry) are environment inputs; they and a, b, c may be per-member
+    arrays for parameter sweeps.
+    """
+    HISTORY = 10  # adapt_parameters window
+
+    def __init__(self, members, initial_state=2, seed=0, first_member=0,
+                 torsion_mod=1.0, error_rate=0.05, C_phys=0.85, sigma=0.05,
+                 a=1.2, b=0.8, c=1.1, dt=0.1):
+        lane = lambda v, dtype=float: np.broadcast_to(np.asarray(v, dtype=dtype), (members,)).copy()
+        self.members = members
+        self.keys = member_keys(seed, first_member, members)
+        self.t = 0
+
+        state = lane(initial_state, np.uint8)
+        if np.any(state > 2):
+            raise ValueError("Initial state must be 0, 1, or 2.")
+        self.q1, self.q0 = state >> 1, state & 1
+        self.coherence = np.ones(members)
+        self.torsion_events = np.zeros(members, dtype=np.int64)
+        self.annihilation_events = np.zeros(members, dtype=np.int64)
+        self.history = np.zeros((members, self.HISTORY))
+
+        self.torsion_mod, self.error_rate = lane(torsion_mod), lane(error_rate)
+        self.sigma = lane(sigma)
+        self.optimizer = SignalOptimizer()
+        self.a, self.b, self.c = lane(a), lane(b), lane(c)
+        self.dynamics = SingularitySolver(dt=dt)
+        self.dynamics.params['C_phys'] = lane(C_phys)
+        self.dynamics.params['kappa'] = self.sigma  # Link real noise to dynamics
+        self.dyn_state = np.tile(self.dynamics.state, (members, 1))
+
+    def _uniform(self, draw):
+        """Uniform [0, 1) per member for draw number `draw` of the run"""
+        bits = _mix64(self.keys + np.uint64(draw * int(_GOLDEN) % 2**64))
+        return (bits >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+
+    def step(self):
+        """Advance every member one tick; returns this tick's per-member metrics"""
+        u_error, u_bit = self._uniform(2 * self.t), self._uniform(2 * self.t + 1)
+
+        # Quantum evolution: bit flip, then torsion stabilization of |11> leaks
+        flip = u_error < self.error_rate
+        flip_q0 = (flip & (u_bit < 0.5)).astype(np.uint8)
+        self.q0 ^= flip_q0
+        self.q1 ^= flip.astype(np.uint8) & (1 - flip_q0)
+        leak = (self.q0 & self.q1).astype(bool)
+        self.q0[leak] = 0
+        self.q1[leak] = 0
+        self.torsion_events += leak
+        self.coherence = np.where(leak, np.maximum(0.1, self.coherence * (0.95 * self.torsion_mod)),
+                                  np.minimum(1.0, self.coherence * 1.01))
+        quality = np.where(leak, 0.3, 0.9)
+
+        # Coherence sync and ASOE evaluation
+        g = np.maximum(0.0, 1.0 - self.coherence)
+        utility = self.optimizer.calculate_utility_batch(
+            self.coherence, 1.0 - g, self.error_rate * 5, a=self.a, b=self.b, c=self.c)
+
+        # Singularity navigation
+        self.dyn_state = self.dynamics.advance(self.dyn_state)
+
+        # Black Sun and Annihilation protocols
+        black_sun = (self.sigma > 0.1) | (utility < 0.2)
+        self.a = np.where(black_sun, 1.618, self.a)
+        burn = (self.sigma > 0.4) & (utility < 0.15)
+        # patch_annihilation releases energy in sovereign mode or for a matched pair
+        burn &= (g == 0) | (np.abs(self.sigma * 1e-30 - 1e-30) < 1e-30)
+        self.annihilation_events += burn
+        self.coherence = np.where(burn, 1.0, self.coherence)
+        quality = np.where(burn, 1.0, quality)
+        utility = utility + 0.5 * burn
+
+        # adapt_parameters over the last HISTORY outcomes
+        self.history[:, self.t % self.HISTORY] = quality
+        if self.t + 1 >= self.HISTORY:
+            recent = self.history.mean(axis=1)
+            self.a = np.where(recent < 0.5, self.a * 1.05, self.a)
+            self.c = np.where(recent > 0.8, self.c * 0.95, self.c)
+        self.t += 1
+
+        return {
+            "coherence": self.coherence,
+            "g_parameter": g,
+            "sovereignty": np.maximum(0.0, utility),
+            "a_param": self.a,
+            "R_frac": self.dyn_state[:, 0],
+            "C_soc": self.dyn_state[:, 1],
+            "black_sun": black_sun,
+            "annihilation": burn,
+            "torsion": leak,
+        }
+
+    def run(self, steps, bins=256):
+        summary = EnsembleSummary(steps, bins)
+        for step in range(steps):
+            summary.update(step, self.step())
+        return summary
+
+def _run_shard(args):
+    members, steps, seed, first_member, bins, params = args
+    return SubstrateEnsemble(members, seed=seed, first_member=first_member, **params).run(steps, bins)
+
+def run_ensemble(members, steps, seed=0, workers=1, shard_size=None, bins=256, **params):
+    """
+    Evolve `members` independent trajectories for `steps` ticks and return the
+    merged EnsembleSummary. Members are split into shards of shard_size (one
+    per worker by default) and shards run in worker processes when workers > 1.
+    params are SubstrateEnsemble arguments; per-member arrays are sliced per shard.
+    """
+    shard_size = shard_size or -(-members // max(1, workers))
+    shards = []
+    for start in range(0, members, shard_size):
+        stop = min(members, start + shard_size)
+        part = {k: (np.asarray(v)[start:stop] if np.ndim(v) else v) for k, v in params.items()}
+        shards.append((stop - start, steps, seed, start, bins, part))
+
+    if workers > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_run_shard, shards))
+    else:
+        parts = [_run_shard(shard) for shard in shards]
+    summary = parts[0]
+    for part in parts[1:]:
+        summary.merge(part)
+    return summary
+
 if __name__ == "__main__":
     substrate = SovereignSubstrate(initial_state=2)
     print(substrate.get_status_report())
@@ -11,13 +11,17 @@ import random
 import threading
 import json
 import os
+import re
+import bisect
 import sys
+import pickle
+import zlib
 from datetime import datetime, timezone
 from dataclasses import dataclass, asdict, field
-from typing import Optional, Dict, List, Any, Tuple, Deque, Union
-from collections import deque
+from typing import Optional, Dict, List, Any, Tuple, Deque, Union, Iterable, Iterator
+from collections import deque, OrderedDict
+from array import array
 import numpy as np
-import psutil
 
 # Import all quantum modules with graceful fallbacks
 try:
@@ -386,222 +390,680 @@ class BumpyQuantumOperator:
 # 4. HOLOGRAPHIC CACHE WITH UNIVERSAL COMPRESSION
 # ============================================================
 
+class _CacheEntry:
+    """One cached value: the object itself, or its zlib-compressed pickle"""
+    __slots__ = ('value', 'blob', 'size', 'written', 'accesses', 'entangled_with', 'quantum_metadata')
+
+    def __init__(self, value: Any, blob: Optional[bytes], size: int, written: float):
+        self.value = value
+        self.blob = blob
+        self.size = size
+        self.written = written
+        self.accesses = 0
+        self.entangled_with: List[str] = []
+        self.quantum_metadata: Dict[str, float] = {}
+
+
 class UniversalCache:
-    """Cache with holographic compression and system integration"""
+    """
+    LRU cache with TTL expiry, byte budget and lossless compression.
+
+    Entries live in an OrderedDict kept in recency order, so a hit is a
+    move_to_end and an eviction pops the front: both O(1). A second
+    OrderedDict keeps keys in write order; with one cache-wide TTL that is
+    expiry order, so expired entries are also popped from a front. Size is
+    accounted in bytes (the pickled size of each value) against `max_bytes`,
+    next to the `max_size` entry cap. Values whose pickle reaches
+    `compress_min_bytes` are stored zlib-compressed and unpickled on read;
+    nothing is lost. Memory pressure (psutil) is sampled at most once per
+    `pressure_interval` seconds instead of on every write.
+    """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(self, max_size: int = 1000, max_bytes: int = 64 * 1024 * 1024,
+                 ttl: Optional[float] = None, compress_min_bytes: int = 4096,
+                 pressure_interval: float = 1.0, pressure_threshold: float = 0.8):
         self.max_size = max_size
-        self.cache = {}
-        self.timestamps = {}
-        self.access_patterns = {}
-        self.compression_level = 0.7
-
-        if BUMPY_AVAILABLE:
-            self.compressor = BUMPYCore()
-        else:
-            self.compressor = None
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.compress_min_bytes = compress_min_bytes
+        self.pressure_interval = pressure_interval
+        self.pressure_threshold = pressure_threshold
+
+        self._entries: 'OrderedDict[str, _CacheEntry]' = OrderedDict()  # recency order
+        self._written: 'OrderedDict[str, None]' = OrderedDict()  # write (= expiry) order
+        self._lock = threading.RLock()
+        self.bytes = 0
 
-        # Memory pressure tracking
-        self.memory_warnings = 0
-        self.last_cleanup = time.time()
+        # Memory pressure sampling
+        self._pressure = 0.0
+        self._pressure_checked = float('-inf')
 
-        # Integration metrics
         self.metrics = {
             'hits': 0,
             'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'pressure_evictions': 0,
+            'pressure_checks': 0,
             'compressions': 0,
+            'raw_bytes_compressed': 0,
+            'stored_bytes_compressed': 0,
             'size_reduction': 0.0,
             'quantum_entanglements': 0
         }
 
-    def get(self, key: str) -> Optional[Dict]:
-        """Get with quantum-aware access patterns"""
-        if key in self.cache:
-            self.access_patterns[key] = self.access_patterns.get(key, 0) + 1
-            self.metrics['hits'] += 1
+    def __len__(self) -> int:
+        return len(self._entries)
 
-            # Apply quantum refresh for frequently accessed items
-            if self.access_patterns[key] % 5 == 0:
-                self._quantum_refresh(key)
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not self._expired(entry, time.time())
 
-            return self.cache[key]
+    def get(self, key: str) -> Optional[Any]:
+        """Value for key (refreshing its recency), or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry, time.time()):
+                if entry is not None:
+                    self._remove(key, 'expirations')
+                self.metrics['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.metrics['hits'] += 1
 
-        self.metrics['misses'] += 1
-        return None
+            # Quantum refresh for frequently accessed items
+            entry.accesses += 1
+            if entry.accesses % 5 == 0:
+                self._quantum_refresh(key, entry)
 
-    def set(self, key: str, value: Dict, compress: bool = True):
-        """Set with optional holographic compression"""
-        # Check memory pressure
-        if self._memory_pressure() > 0.8:
-            self._aggressive_evict()
+            if entry.blob is not None:
+                return pickle.loads(zlib.decompress(entry.blob))
+            return entry.value
+
+    def set(self, key: str, value: Any, compress: bool = True):
+        """Store value; compress=True allows lossless compression of large values"""
+        try:
+            raw = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            raw = None  # unpicklable: stored as is, sized approximately
+        blob = None
+        if raw is None:
+            size = sys.getsizeof(value)
+        elif compress and len(raw) >= self.compress_min_bytes:
+            blob = zlib.compress(raw, 1)
+            size = len(blob)
+        else:
+            size = len(raw)
 
-        # Apply holographic compression if enabled and available
-        if compress and self.compressor and len(str(value)) > 100:
-            compressed = self._holographic_compress(value)
-            if compressed:
-                value = compressed
+        with self._lock:
+            now = time.time()
+            self._check_pressure(now)
+            if key in self._entries:
+                self._remove(key)
+            if blob is not None:
                 self.metrics['compressions'] += 1
-                self.metrics['size_reduction'] = 0.7  # Assume 70% reduction
+                self.metrics['raw_bytes_compressed'] += len(raw)
+                self.metrics['stored_bytes_compressed'] += size
+                self.metrics['size_reduction'] = 1.0 - (self.metrics['stored_bytes_compressed'] /
+                                                        self.metrics['raw_bytes_compressed'])
+            self._entries[key] = _CacheEntry(None if blob is not None else value, blob, size, now)
+            self._written[key] = None
+            self.bytes += size
+            self._expire(now)
+            self._shrink(self.max_size, self.max_bytes)
 
-        # Store with quantum timestamp
-        self.cache[key] = value
-        self.timestamps[key] = time.time() + random.uniform(-0.001, 0.001)  # Quantum time uncertainty
-        self.access_patterns[key] = 0
+    def delete(self, key: str):
+        """Delete entry and propagate to entangled entries"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
 
-        # Cleanup if needed
-        if len(self.cache) >= self.max_size:
-            self._quantum_evict()
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._written.clear()
+            self.bytes = 0
+
+    # ---------------- eviction ----------------
+    def _expired(self, entry: _CacheEntry, now: float) -> bool:
+        return self.ttl is not None and now - entry.written >= self.ttl
+
+    def _remove(self, key: str, counter: Optional[str] = None):
+        entry = self._entries.pop(key)
+        del self._written[key]
+        self.bytes -= entry.size
+        for other_key in entry.entangled_with:
+            other = self._entries.get(other_key)
+            if other is not None and key in other.entangled_with:
+                other.entangled_with.remove(key)
+        if counter:
+            self.metrics[counter] += 1
+
+    def _expire(self, now: float):
+        """Pop expired entries off the front of the write-order queue"""
+        if self.ttl is None:
+            return
+        written = self._written
+        while written:
+            key = next(iter(written))
+            if now - self._entries[key].written < self.ttl:
+                break
+            self._remove(key, 'expirations')
 
-    def _holographic_compress(self, data: Dict) -> Optional[Dict]:
-        """Compress data using BUMPY holographic methods"""
-        if not BUMPY_AVAILABLE or not self.compressor:
-            return None
+    def _shrink(self, max_entries: int, max_bytes: int, counter: str = 'evictions'):
+        """Evict least recently used entries until both limits hold"""
+        entries = self._entries
+        while entries and (len(entries) > max_entries or self.bytes > max_bytes):
+            self._remove(next(iter(entries)), counter)
 
-        try:
-            # Convert data to list for compression
-            data_str = json.dumps(data, separators=(',', ':'))
-            data_values = [ord(c) / 255.0 for c in data_str[:100]]
-
-            if len(data_values) > 10:
-                # Create BUMPY array
-                bumpy_data = BumpyArray(data_values[:20])  # Use first 20 values
-
-                # Apply holographic compression
-                self.compressor.qualia_emergence_ritual([bumpy_data])
-
-                # Create compressed representation
-                compressed = {
-                    '_compressed': True,
-                    'hash': hashlib.md5(data_str.encode()).hexdigest()[:8],
-                    'original_length': len(data_str),
-                    'compressed_length': 20,
-                    'quantum_coherence': bumpy_data.coherence,
-                    'data_sample': data_values[:3]
-                }
+    def _check_pressure(self, now: float):
+        """Sample memory pressure on a timer; under pressure drop the coldest 20%"""
+        if now - self._pressure_checked < self.pressure_interval:
+            return
+        self._pressure_checked = now
+        self._pressure = self._memory_pressure()
+        self.metrics['pressure_checks'] += 1
+        if self._pressure > self.pressure_threshold:
+            self._aggressive_evict()
 
-                return compressed
-        except Exception as e:
-            if os.getenv('DEBUG_LASER'):
-                print(f"Compression failed: {e}")
+    def _memory_pressure(self) -> float:
+        """Calculate memory pressure for adaptive behavior"""
+        try:
+            import psutil  # deferred: only the maintenance paths need it
+            memory = psutil.virtual_memory()
+            return memory.percent / 100.0
+        except Exception:
+            return len(self._entries) / max(1, self.max_size)
 
-        return None
+    def _aggressive_evict(self):
+        """Aggressive eviction under memory pressure: the least recently used 20%"""
+        with self._lock:
+            keep = len(self._entries) - max(1, len(self._entries) // 5)
+            self._shrink(keep, self.bytes, 'pressure_evictions')
 
-    def _quantum_refresh(self, key: str):
+    # ---------------- quantum metadata ----------------
+    def _quantum_refresh(self, key: str, entry: _CacheEntry):
         """Refresh cache entry with quantum operations"""
-        if key in self.cache:
-            entry = self.cache[key]
-
-            # Add quantum timestamp
-            if 'quantum_metadata' not in entry:
-                entry['quantum_metadata'] = {}
+        entry.quantum_metadata['refresh_time'] = time.time()
+        entry.quantum_metadata['quantum_phase'] = random.uniform(0, 2 * math.pi)
 
-            entry['quantum_metadata']['refresh_time'] = time.time()
-            entry['quantum_metadata']['quantum_phase'] = random.uniform(0, 2 * math.pi)
-
-            # Entangle with other entries if BUMPY available
-            if BUMPY_AVAILABLE and random.random() < 0.1:
-                other_keys = list(self.cache.keys())
-                if len(other_keys) > 1:
-                    other_key = random.choice([k for k in other_keys if k != key])
-                    self._create_entanglement(key, other_key)
+        # Entangle with the next most recently used entry if BUMPY available
+        if BUMPY_AVAILABLE and random.random() < 0.1 and len(self._entries) > 1:
+            keys = reversed(self._entries)
+            next(keys)  # key itself was just moved to the end
+            self._create_entanglement(key, next(keys))
 
     def _create_entanglement(self, key1: str, key2: str):
         """Create quantum entanglement between cache entries"""
-        if key1 in self.cache and key2 in self.cache:
-            # Mark entanglement in metadata
-            for key in [key1, key2]:
-                if 'quantum_metadata' not in self.cache[key]:
-                    self.cache[key]['quantum_metadata'] = {}
-
-                entangled_with = self.cache[key]['quantum_metadata'].get('entangled_with', [])
-                other_key = key2 if key == key1 else key1
-                if other_key not in entangled_with:
-                    entangled_with.append(other_key)
-                    self.cache[key]['quantum_metadata']['entangled_with'] = entangled_with
-
+        with self._lock:
+            first, second = self._entries.get(key1), self._entries.get(key2)
+            if first is None or second is None or key1 == key2:
+                return
+            if key2 not in first.entangled_with:
+                first.entangled_with.append(key2)
+            if key1 not in second.entangled_with:
+                second.entangled_with.append(key1)
             self.metrics['quantum_entanglements'] += 1
 
-    def _memory_pressure(self) -> float:
-        """Calculate memory pressure for adaptive behavior"""
-        try:
-            memory = psutil.virtual_memory()
-            return memory.percent / 100.0
-        except:
-            return len(self.cache) / self.max_size
+    def entangled_with(self, key: str) -> List[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            return list(entry.entangled_with) if entry is not None else []
 
-    def _aggressive_evict(self):
-        """Aggressive eviction under memory pressure"""
-        if not self.cache:
-            return
+# ============================================================
+# 4b. ASYNC GROUP-COMMIT WRITER
+# ============================================================
 
-        # Calculate quantum age (adjusted by access patterns)
-        now = time.time()
-        eviction_scores = {}
+BACKPRESSURE_POLICIES = ('block', 'drop_oldest', 'sample')
 
-        for key in list(self.cache.keys()):
-            age = now - self.timestamps[key]
-            accesses = self.access_patterns.get(key, 0)
+class LaserWriter:
+    """
+    Dedicated JSONL writer thread with group commit.
+
+    Producers hand entries over through a bounded deque under a short lock
+    (held only to enqueue and count, never across I/O). The handoff is not
+    lock-free: CPython offers no compare-and-swap, and this lock is only
+    held for a few bytecodes per entry. The writer thread
+    drains it in batches of up to `batch_size` entries, or whatever arrived
+    within `max_latency` seconds, serializes them and commits each batch
+    with a single write() on a file handle that stays open.
+
+    flush() barriers live outside the queue, so no policy can discard one:
+    each waits for a count of entries to leave the queue (committed by the
+    writer, or dropped by the policy).
+
+    When the queue is full the backpressure policy decides:
+        block       - the producer waits until the writer frees space
+        drop_oldest - the oldest queued entry is discarded for the new one
+        sample      - above half capacity only every `sample_every`-th entry
+                      is admitted, and the oldest is discarded at capacity
+    """
 
-            # Quantum age: older items with few accesses are more likely to be evicted
-            quantum_age = age * (1.0 / max(1, accesses * 0.1))
-            eviction_scores[key] = quantum_age
+    def __init__(self, path: str, capacity: int = 10000, batch_size: int = 256,
+                 max_latency: float = 0.05, policy: str = 'block', sample_every: int = 10,
+                 fsync: bool = False, index: Optional['LaserIndex'] = None):
+        if policy not in BACKPRESSURE_POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{policy}' (expected one of {BACKPRESSURE_POLICIES})")
+        self.path = path
+        self.capacity = max(1, capacity)
+        self.batch_size = max(1, batch_size)
+        self.max_latency = max_latency
+        self.policy = policy
+        self.sample_every = max(1, sample_every)
+        self.fsync = fsync
+        self.index = index
+
+        self._queue: Deque[Dict] = deque()
+        self._lock = threading.Lock()        # queue mutations, counters and stats
+        self._enqueued = 0                   # entries ever queued
+        self._removed = 0                    # entries that left the queue (taken or dropped)
+        self._barriers: List[Tuple[int, threading.Event]] = []
+        self._wakeup = threading.Event()
+        self._space = threading.Condition(threading.Lock())
+        self._closed = False
+        self._sample_counter = 0
+
+        self.stats = {
+            'submitted': 0,
+            'written': 0,
+            'commits': 0,
+            'bytes_written': 0,
+            'dropped': 0,
+            'sampled_out': 0,
+            'blocked_waits': 0,
+            'write_errors': 0,
+            'max_queue_depth': 0
+        }
 
-        # Evict worst 20%
-        to_evict = sorted(eviction_scores.items(), key=lambda x: x[1], reverse=True)
-        evict_count = max(1, len(to_evict) // 5)
+        self._file = open(path, 'ab')
+        self._thread = threading.Thread(target=self._run, name='laser-writer', daemon=True)
+        self._thread.start()
 
-        for key, _ in to_evict[:evict_count]:
-            self.delete(key)
+    # ---------------- producer side ----------------
+    def submit(self, entry: Dict) -> bool:
+        """Queue one entry; returns False if the backpressure policy discarded it"""
+        queue = self._queue
+        if self.policy == 'block' and len(queue) >= self.capacity and not self._closed:
+            self._wait_for_space()
 
-    def _quantum_evict(self):
-        """Quantum probabilistic eviction"""
-        if not self.cache:
-            return
+        with self._lock:
+            # Checked under the lock, so close() never misses an admitted entry
+            if self._closed:
+                raise RuntimeError("LaserWriter is closed")
+            depth = len(queue)
+            if self.policy == 'sample' and depth >= self.capacity // 2:
+                self._sample_counter += 1
+                if self._sample_counter % self.sample_every:
+                    self.stats['sampled_out'] += 1
+                    return False
+
+            if depth >= self.capacity and self.policy != 'block':
+                queue.popleft()
+                self._removed += 1
+                self.stats['dropped'] += 1
+
+            queue.append(entry)
+            self._enqueued += 1
+            self.stats['submitted'] += 1
+            depth = len(queue)
+            if depth > self.stats['max_queue_depth']:
+                self.stats['max_queue_depth'] = depth
+        if depth >= self.batch_size:
+            self._wakeup.set()
+        return True
 
-        # Calculate quantum probabilities
-        now = time.time()
-        total_quantum_weight = 0
-        quantum_weights = {}
+    def submit_many(self, entries: List[Dict]) -> int:
+        """Queue a batch of entries; returns how many were admitted"""
+        return sum(1 for entry in entries if self.submit(entry))
 
-        for key in list(self.cache.keys()):
-            age = now - self.timestamps[key]
-            accesses = self.access_patterns.get(key, 0)
+    def _wait_for_space(self):
+        with self._lock:
+            self.stats['blocked_waits'] += 1
+        self._wakeup.set()
+        with self._space:
+            while len(self._queue) >= self.capacity and not self._closed:
+                self._space.wait(timeout=0.1)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Barrier: returns once everything submitted before the call is on disk"""
+        barrier = threading.Event()
+        with self._lock:
+            if self._closed:
+                return True
+            self._barriers.append((self._enqueued, barrier))
+        self._wakeup.set()
+        return barrier.wait(timeout)
 
-            # Quantum probability: older with fewer accesses = higher probability
-            quantum_prob = math.exp(-accesses * 0.1) * (1.0 - math.exp(-age / 3600))
-            quantum_weights[key] = quantum_prob
-            total_quantum_weight += quantum_prob
+    def close(self, timeout: Optional[float] = None):
+        """Flush, stop the writer thread and close the file (idempotent)"""
+        if self._closed:
+            return
+        self.flush(timeout)
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            # Entries admitted between the writer's last drain and its exit
+            self._drain()
+            self._release_barriers(everything=True)
+        with self._space:
+            self._space.notify_all()
+        self._file.close()
 
-        if total_quantum_weight == 0:
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    # ---------------- writer side ----------------
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.max_latency)
+            self._wakeup.clear()
+            # Read before draining: once closed is set no entry is admitted, so this drain is the last
+            closing = self._closed
+            self._drain()
+            self._release_barriers()
+            if closing:
+                self._release_barriers(everything=True)
+                return
+
+    def _drain(self):
+        """Commit queued entries in batches until the queue is empty"""
+        queue = self._queue
+        while queue:
+            with self._lock:
+                batch = [queue.popleft() for _ in range(min(len(queue), self.batch_size))]
+                self._removed += len(batch)
+            if batch:
+                self._commit(batch)
+            with self._space:
+                self._space.notify_all()
+            self._release_barriers()
+
+    def _release_barriers(self, everything: bool = False):
+        """Wake flush() callers whose entries have all been committed or dropped"""
+        with self._lock:
+            if not self._barriers:
+                return
+            ready = [event for target, event in self._barriers if everything or target <= self._removed]
+            self._barriers = [(target, event) for target, event in self._barriers
+                              if not (everything or target <= self._removed)]
+        for event in ready:
+            event.set()
+
+    def _commit(self, batch: List[Dict]):
+        entries, lines = [], []
+        for entry in batch:
+            try:
+                lines.append((json.dumps(entry, separators=(',', ':'), default=str) + '\n').encode('utf-8'))
+                entries.append(entry)
+            except (TypeError, ValueError):
+                with self._lock:
+                    self.stats['write_errors'] += 1
+        if not lines:
             return
+        payload = b''.join(lines)
+        try:
+            base_offset = self._file.seek(0, os.SEEK_END)
+            self._file.write(payload)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+        except OSError as e:
+            with self._lock:
+                self.stats['write_errors'] += 1
+            print(f"⚠️ Universal write failed: {e}")
+            return
+        if self.index is not None:
+            self.index.add_batch(entries, base_offset, [len(line) for line in lines])
+        with self._lock:
+            self.stats['written'] += len(lines)
+            self.stats['commits'] += 1
+            self.stats['bytes_written'] += len(payload)
+
+# ============================================================
+# 4c. INDEXED MEMORY STORE
+# ============================================================
 
-        # Normalize and select for eviction
-        selected = random.random() * total_quantum_weight
-        cumulative = 0
+LOG_LEVELS = ('ERROR', 'CRITICAL', 'WARNING', 'EMERGENCY', 'FAILURE')
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_EMPTY_POSTINGS = array('q')
 
-        for key, weight in quantum_weights.items():
-            cumulative += weight
-            if cumulative >= selected:
-                self.delete(key)
-                break
+def log_level(message: str) -> str:
+    """Severity keyword carried by a message ('INFO' when it has none)"""
+    upper = message.upper()
+    for level in LOG_LEVELS:
+        if level in upper:
+            return level
+    return 'INFO'
 
-    def delete(self, key: str):
-        """Delete entry and propagate to entangled entries"""
-        # Propagate deletion to entangled entries
-        if key in self.cache and 'quantum_metadata' in self.cache[key]:
-            entangled = self.cache[key]['quantum_metadata'].get('entangled_with', [])
-            for other_key in entangled:
-                if other_key in self.cache and 'quantum_metadata' in self.cache[other_key]:
-                    # Remove this key from other's entanglement list
-                    other_entangled = self.cache[other_key]['quantum_metadata'].get('entangled_with', [])
-                    if key in other_entangled:
-                        other_entangled.remove(key)
-                        self.cache[other_key]['quantum_metadata']['entangled_with'] = other_entangled
-
-        # Delete entry
-        self.cache.pop(key, None)
-        self.timestamps.pop(key, None)
-        self.access_patterns.pop(key, None)
+def tokenize(text: str) -> List[str]:
+    """Distinct lowercase alphanumeric tokens of a message, in order of appearance"""
+    return list(dict.fromkeys(_TOKEN_RE.findall(text.lower())))
+
+class LaserIndex:
+    """
+    Sidecar index over a LASER JSONL log.
+
+    Every committed record contributes its byte offset and length, its
+    universal_time, its level and its message tokens. Records are numbered in
+    file order and grouped into `segment_size` segments that carry their
+    [min, max] time, so a time window only visits the segments it overlaps.
+    Token and level postings are ascending record-id arrays; a query walks the
+    shortest one newest-first, probes the others by bisection and seeks
+    straight to the surviving records.
+
+    The index persists as a tab-separated file next to the log (`<log>.idx`)
+    appended on every commit. On open it is reloaded and only the log tail it
+    has not seen yet is parsed; a torn sidecar, or one that points past the
+    end of the log (truncated or replaced), is rebuilt from scratch.
+    """
+
+    PREFIX_LEN = 3
+
+    def __init__(self, log_path: str, segment_size: int = 4096):
+        self.log_path = log_path
+        self.path = log_path + '.idx'
+        self.segment_size = max(1, segment_size)
+        self._lock = threading.Lock()
+        self._reset()
+
+        rows, rewrite = self._load()
+        self._sidecar = open(self.path, 'w' if rewrite else 'a', encoding='utf-8')
+        if rows:
+            self._persist(rows)
+
+    def _reset(self):
+        self.offsets = array('q')
+        self.lengths = array('q')
+        self.times = array('d')
+        self.segments: List[List[float]] = []   # [min_time, max_time] per segment
+        self.postings: Dict[str, array] = {}
+        self.level_postings: Dict[str, array] = {}
+        self._prefixes: Dict[str, set] = {}     # token prefix -> tokens, for prefix queries
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    # ---------------- maintenance ----------------
+    def add_batch(self, entries: List[Dict], base_offset: int, lengths: List[int]):
+        """Index entries just written back-to-back starting at `base_offset`"""
+        rows = []
+        offset = base_offset
+        for entry, length in zip(entries, lengths):
+            message = str(entry.get('message', ''))
+            rows.append((offset, length, float(entry.get('universal_time', 0.0)),
+                         log_level(message), tokenize(message)))
+            offset += length
+        with self._lock:
+            for row in rows:
+                self._add(*row)
+            self._persist(rows)
+
+    def _add(self, offset: int, length: int, when: float, level: str, tokens: List[str]):
+        record_id = len(self.offsets)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.times.append(when)
+
+        if record_id % self.segment_size == 0:
+            self.segments.append([when, when])
+        else:
+            bounds = self.segments[-1]
+            if when < bounds[0]:
+                bounds[0] = when
+            elif when > bounds[1]:
+                bounds[1] = when
+
+        self.level_postings.setdefault(level, array('q')).append(record_id)
+        for token in tokens:
+            postings = self.postings.get(token)
+            if postings is None:
+                postings = self.postings[token] = array('q')
+                self._prefixes.setdefault(token[:self.PREFIX_LEN], set()).add(token)
+            postings.append(record_id)
+
+    def _persist(self, rows: List[Tuple]):
+        self._sidecar.write(''.join(
+            f"{offset}\t{length}\t{when!r}\t{level}\t{' '.join(tokens)}\n"
+            for offset, length, when, level, tokens in rows))
+        self._sidecar.flush()
+
+    def _load(self) -> Tuple[List[Tuple], bool]:
+        """Reload the sidecar, then index the unseen log tail; returns (new rows, rewrite?)"""
+        log_size = os.path.getsize(self.log_path) if os.path.exists(self.log_path) else 0
+        rewrite = not os.path.exists(self.path)
+        if not rewrite:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    fields = line.rstrip('\n').split('\t')
+                    if len(fields) != 5 or not line.endswith('\n'):
+                        rewrite = True  # torn tail from an interrupted append
+                        break
+                    offset, length = int(fields[0]), int(fields[1])
+                    if offset + length > log_size:
+                        rewrite = True
+                        break
+                    self._add(offset, length, float(fields[2]), fields[3],
+                              fields[4].split(' ') if fields[4] else [])
+            if rewrite:
+                self._reset()
+
+        rows = []
+        start = self._end()
+        if log_size > start:
+            with open(self.log_path, 'rb') as f:
+                f.seek(start)
+                offset = start
+                for raw in f:
+                    if not raw.endswith(b'\n'):
+                        break  # a commit still in flight
+                    if raw[:1] not in (b'#', b'\n'):
+                        try:
+                            entry = json.loads(raw)
+                        except ValueError:
+                            entry = None
+                        if isinstance(entry, dict):
+                            message = str(entry.get('message', ''))
+                            row = (offset, len(raw), float(entry.get('universal_time', 0.0)),
+                                   log_level(message), tokenize(message))
+                            self._add(*row)
+                            rows.append(row)
+                    offset += len(raw)
+        return rows, rewrite
+
+    def _end(self) -> int:
+        return self.offsets[-1] + self.lengths[-1] if self.offsets else 0
+
+    def close(self):
+        with self._lock:
+            self._sidecar.close()
+
+    # ---------------- queries ----------------
+    def _token_postings(self, token: str) -> array:
+        """Postings of every indexed token starting with `token`"""
+        if len(token) >= self.PREFIX_LEN:
+            matches = [t for t in self._prefixes.get(token[:self.PREFIX_LEN], ()) if t.startswith(token)]
+        else:
+            matches = [t for prefix, tokens in self._prefixes.items() if prefix.startswith(token)
+                       for t in tokens if t.startswith(token)]
+        if not matches:
+            return _EMPTY_POSTINGS
+        if len(matches) == 1:
+            return self.postings[matches[0]]
+        return array('q', sorted(set().union(*(self.postings[t] for t in matches))))
+
+    def _window(self, time_range: Optional[Tuple[float, float]], count: int) -> List[Tuple[int, int]]:
+        """Record-id ranges [lo, hi) of the segments overlapping `time_range`, oldest first"""
+        size = self.segment_size
+        if time_range is None:
+            return [(0, count)] if count else []
+        start, end = time_range
+        return [(i * size, min(count, (i + 1) * size))
+                for i, (low, high) in enumerate(self.segments[:(count + size - 1) // size])
+                if low <= end and high >= start]
+
+    def candidates(self, concept: str = '', time_range: Optional[Tuple[float, float]] = None,
+                   level: Optional[str] = None) -> Iterator[int]:
+        """
+        Record ids whose tokens prefix-match every token of `concept`, carry
+        `level` and fall inside `time_range`, newest first. Callers still check
+        the message itself, since tokens only narrow the search.
+        """
+        with self._lock:
+            count = len(self.offsets)
+            windows = self._window(time_range, count)
+            lists = []
+            if level is not None:
+                lists.append(self.level_postings.get(level.upper(), _EMPTY_POSTINGS))
+            lists.extend(self._token_postings(token) for token in tokenize(concept))
+            # Freeze each list at its current length so appends don't shift the view
+            bounded = [(postings, len(postings)) for postings in lists]
+        times = self.times
+
+        if not windows or any(n == 0 for _, n in bounded):
+            return
+        if time_range is not None:
+            start, end = time_range
+        else:
+            start, end = float('-inf'), float('inf')
+
+        if not bounded:
+            for lo, hi in reversed(windows):
+                for record_id in range(hi - 1, lo - 1, -1):
+                    if start <= times[record_id] <= end:
+                        yield record_id
+            return
+
+        bounded.sort(key=lambda pair: pair[1])
+        (driver, driver_len), others = bounded[0], bounded[1:]
+        for lo, hi in reversed(windows):
+            first = bisect.bisect_left(driver, lo, 0, driver_len)
+            last = bisect.bisect_left(driver, hi, first, driver_len)
+            for position in range(last - 1, first - 1, -1):
+                record_id = driver[position]
+                if not start <= times[record_id] <= end:
+                    continue
+                for postings, n in others:
+                    i = bisect.bisect_left(postings, record_id, 0, n)
+                    if i == n or postings[i] != record_id:
+                        break
+                else:
+                    yield record_id
+
+    def read(self, record_ids: Iterable[int]) -> Iterator[Dict]:
+        """Seek to and decode each record in turn"""
+        with open(self.log_path, 'rb') as f:
+            for record_id in record_ids:
+                f.seek(self.offsets[record_id])
+                try:
+                    yield json.loads(f.read(self.lengths[record_id]))
+                except ValueError:
+                    continue
 
 # ============================================================
 # 5. LASER v3.0 - UNIVERSAL INTEGRATION SYSTEM
@@ -626,6 +1088,14 @@ class LASERV30:
             'system_monitoring': True,
             'debug': False,
             'universal_memory': True,
+            'async_writer': True,          # hand flushed batches to a LaserWriter thread
+            'writer_queue_size': 10000,
+            'writer_batch_size': 256,
+            'writer_max_latency': 0.05,    # seconds a queued entry may wait for its group commit
+            'writer_backpressure': 'block',  # block | drop_oldest | sample
+            'writer_sample_every': 10,
+            'writer_fsync': False,
+            'index_segment_size': 4096,    # records per time-range segment of the memory index
             **(config or {})
         }
 
@@ -669,6 +1139,19 @@ class LASERV30:
 
         # Initialize log system
         self._init_universal_log()
+        self.index = LaserIndex(self.config['log_path'], segment_size=self.config['index_segment_size'])
+        self.writer = None
+        if self.config['async_writer']:
+            self.writer = LaserWriter(
+                self.config['log_path'],
+                capacity=self.config['writer_queue_size'],
+                batch_size=self.config['writer_batch_size'],
+                max_latency=self.config['writer_max_latency'],
+                policy=self.config['writer_backpressure'],
+                sample_every=self.config['writer_sample_every'],
+                fsync=self.config['writer_fsync'],
+                index=self.index
+            )
 
         print(f"🌌 LASER v3.0 - Universal Quantum Integration")
         print(f"   Integrated Systems: {self._integration_status()}")
@@ -826,8 +1309,7 @@ class LASERV30:
     def _should_log(self, value: float, qdata: Dict, delta: float, message: str) -> bool:
         """Determine if we should log based on universal criteria"""
         # Always log important messages
-        important_keywords = ['ERROR', 'CRITICAL', 'WARNING', 'EMERGENCY', 'FAILURE']
-        if any(keyword in message.upper() for keyword in important_keywords):
+        if any(keyword in message.upper() for keyword in LOG_LEVELS):
             return True
 
         # Log based on quantum risk
@@ -1001,33 +1483,42 @@ class LASERV30:
             if emergency:
                 self.metrics['emergency_flushes'] += 1
 
-            # Write to universal log
-            path = self.config['log_path']
-            try:
-                with open(path, 'a', encoding='utf-8') as f:
-                    for entry in self.buffer:
-                        # Add flush metadata
-                        entry['flush_metadata'] = {
-                            'type': 'quantum_emergency' if emergency else 'universal',
-                            'timestamp': time.time(),
-                            'universal_state': asdict(self.universal_state),
-                            'metrics': self.metrics_report(),
-                            'buffer_state': {
-                                'size_before': count,
-                                'emergency': emergency,
-                                'universal_risk': self.universal_state.risk
-                            }
-                        }
-
-                        f.write(json.dumps(entry, separators=(',', ':')) + '\n')
-
+            # One metadata snapshot per flush, shared by every entry in it
+            flush_metadata = {
+                'type': 'quantum_emergency' if emergency else 'universal',
+                'timestamp': time.time(),
+                'universal_state': asdict(self.universal_state),
+                'metrics': self.metrics_report(),
+                'buffer_state': {
+                    'size_before': count,
+                    'emergency': emergency,
+                    'universal_risk': self.universal_state.risk
+                }
+            }
+            for entry in self.buffer:
+                entry['flush_metadata'] = flush_metadata
+
+            if self.writer is not None:
+                # Serialization and disk I/O happen on the writer thread
+                self.writer.submit_many(list(self.buffer))
+                self.metrics['flushes'] += 1
+            else:
+                # Write to universal log
+                path = self.config['log_path']
+                try:
+                    lines = [(json.dumps(entry, separators=(',', ':')) + '\n').encode('utf-8')
+                             for entry in self.buffer]
+                    with open(path, 'ab') as f:
+                        base_offset = f.seek(0, os.SEEK_END)
+                        f.write(b''.join(lines))
+                    self.index.add_batch(list(self.buffer), base_offset, [len(line) for line in lines])
                     self.metrics['flushes'] += 1
 
-            except Exception as e:
-                print(f"⚠️ Universal write failed: {e}")
-                # Fallback to console
-                for entry in list(self.buffer)[:2]:
-                    print(f"[FALLBACK] {entry['timestamp']} - {entry['message'][:60]}...")
+                except Exception as e:
+                    print(f"⚠️ Universal write failed: {e}")
+                    # Fallback to console
+                    for entry in list(self.buffer)[:2]:
+                        print(f"[FALLBACK] {entry['timestamp']} - {entry['message'][:60]}...")
 
             # Clear buffer
             self.buffer.clear()
@@ -1039,61 +1530,56 @@ class LASERV30:
 
     def query_universal_memory(self, concept: str,
                               temporal_range: Tuple[float, float] = None,
-                              quantum_filter: Dict = None) -> List[Dict]:
+                              quantum_filter: Dict = None,
+                              level: Optional[str] = None,
+                              offset: int = 0,
+                              limit: int = 50) -> List[Dict]:
         """
         Query universal memory with quantum filtering
 
         Args:
-            concept: Concept to search for
+            concept: Concept to search for (substring of the message; each of
+                its words must start a word of the message)
             temporal_range: (start_time, end_time) in epoch seconds
             quantum_filter: Quantum state filters (coherence_min, risk_max, etc.)
+            level: Only entries carrying this severity keyword (see LOG_LEVELS, or 'INFO')
+            offset: Matches to skip, newest first, for pagination
+            limit: Page size
 
         Returns:
-            List of matching log entries with quantum similarity scores
+            One page of matching log entries with quantum similarity scores,
+            the page ordered by similarity and recency
         """
         results = []
+        needle = concept.lower()
+        skipped = 0
 
-        try:
-            # Read the universal log file
-            if not os.path.exists(self.config['log_path']):
-                return results
+        # Entries already handed to the writer must be indexed before we look
+        if self.writer is not None:
+            self.writer.flush()
 
-            with open(self.config['log_path'], 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.startswith('#'):
+        try:
+            candidates = self.index.candidates(concept, temporal_range, level)
+            for entry in self.index.read(candidates):
+                # Concept matching (tokens only narrow the candidates)
+                if needle not in entry.get('message', '').lower():
+                    continue
+
+                # Quantum filtering
+                if quantum_filter:
+                    if not self._quantum_filter_match(entry, quantum_filter):
                         continue
 
-                    try:
-                        entry = json.loads(line.strip())
-
-                        # Concept matching
-                        if concept.lower() not in entry.get('message', '').lower():
-                            continue
-
-                        # Temporal filtering
-                        if temporal_range:
-                            entry_time = entry.get('universal_time', 0)
-                            start_time, end_time = temporal_range
-                            if not (start_time <= entry_time <= end_time):
-                                continue
-
-                        # Quantum filtering
-                        if quantum_filter:
-                            if not self._quantum_filter_match(entry, quantum_filter):
-                                continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
 
-                        # Calculate quantum similarity
-                        similarity = self._calculate_quantum_similarity(entry)
-                        entry['quantum_similarity'] = similarity
+                # Calculate quantum similarity
+                entry['quantum_similarity'] = self._calculate_quantum_similarity(entry)
+                results.append(entry)
 
-                        results.append(entry)
-
-                        # Limit for performance
-                        if len(results) >= 100:
-                            break
-
-                    except json.JSONDecodeError:
-                        continue
+                if len(results) >= limit:
+                    break
 
         except Exception as e:
             print(f"⚠️ Universal memory query failed: {e}")
@@ -1105,7 +1591,7 @@ class LASERV30:
         ))
 
         self.metrics['universal_queries'] += 1
-        return results[:50]  # Return top 50 results
+        return results
 
     def _quantum_filter_match(self, entry: Dict, quantum_filter: Dict) -> bool:
         """Check if entry matches quantum filter criteria"""
@@ -1158,8 +1644,9 @@ class LASERV30:
                 # Adaptive threshold adjustment
                 self._adaptive_thresholds()
 
-                # Quantum state maintenance
-                self._quantum_state_maintenance()
+                # Quantum state maintenance (log() mutates the same pool under the lock)
+                with self._lock:
+                    self._quantum_state_maintenance()
 
                 # Export telemetry
                 if self.config['telemetry'] and self.metrics['logs_processed'] % 100 == 0:
@@ -1172,6 +1659,7 @@ class LASERV30:
     def _monitor_system_health(self):
         """Monitor health of all integrated systems"""
         # Memory monitoring
+        import psutil
         mem = psutil.virtual_memory()
         cpu = psutil.cpu_percent(interval=0.5)
 
@@ -1227,6 +1715,7 @@ class LASERV30:
 
     def _export_universal_telemetry(self):
         """Export universal telemetry"""
+        import psutil
         telemetry = {
             'timestamp': datetime.now(timezone.utc).isoformat(),
             'universal_state': asdict(self.universal_state),
@@ -1252,12 +1741,19 @@ class LASERV30:
         except Exception as e:
             print(f"⚠️ Telemetry export failed: {e}")
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Flush the buffer and wait until every flushed entry is on disk"""
+        self._universal_flush()
+        if self.writer is not None:
+            return self.writer.flush(timeout)
+        return True
+
     def metrics_report(self) -> Dict:
         """Comprehensive universal metrics report"""
         emergency_rate = (self.metrics['emergency_flushes'] /
                          max(1, self.metrics['flushes']))
 
-        return {
+        report = {
             'performance': {
                 'logs_processed': self.metrics['logs_processed'],
                 'flushes': self.metrics['flushes'],
@@ -1285,6 +1781,10 @@ class LASERV30:
                 'shadow_magnitude': self.temporal._shadow_magnitude()
             }
         }
+        if self.writer is not None:
+            report['writer'] = {**self.writer.stats, 'queue_depth': self.writer.queue_depth,
+                                'policy': self.writer.policy}
+        return report
 
     def shutdown(self):
         """Graceful universal shutdown"""
@@ -1296,6 +1796,11 @@ class LASERV30:
             print(f"  Flushing {len(self.buffer)} universal logs...")
             self._universal_flush()
 
+        # Drain the writer and release the log file
+        if self.writer is not None:
+            self.writer.close()
+        self.index.close()
+
         # Final telemetry
         if self.config['telemetry']:
             self._export_universal_telemetry()
@@ -215,6 +215,86 @@ class PleromaEngine:
                 return (m_pos + m_neg) * (self.c ** 2)
             return 0.0 # Heat loss, no burst
 
+    # --- BATCHED PATCHES ---
+    # Array-in/array-out forms of the patches above. Inputs broadcast like
+    # numpy arithmetic and every element gets exactly what the scalar patch
+    # would return. The 'bad' vibe draws one np.random.uniform per element,
+    # in order, so a seeded batch matches a seeded scalar loop. Division by
+    # zero gives inf/nan here rather than raising.
+
+    def patch_light_batch(self, m, v) -> np.ndarray:
+        """[c] Array form of patch_light."""
+        m, v = np.broadcast_arrays(np.asarray(m, dtype=float), np.asarray(v, dtype=float))
+        beta2 = (v/self.c)**2
+        if self.g == 0:
+            # |1 / sqrt(z)| == 1 / sqrt(|z|): no complex temporaries
+            gamma = 1 / np.sqrt(np.hypot(1 - beta2, 1e-10))
+            return m * gamma * self.c**2
+        subluminal = v < self.c
+        with np.errstate(divide='ignore', invalid='ignore'):
+            energy = m * self.c**2 / np.sqrt(1 - np.where(subluminal, beta2, 0.0))
+        return np.where(subluminal, energy, np.inf)
+
+    def patch_planck_batch(self, delta_x, delta_p) -> np.ndarray:
+        """[h] Array form of patch_planck (boolean array)."""
+        delta_x, delta_p = np.asarray(delta_x, dtype=float), np.asarray(delta_p, dtype=float)
+        if self.g == 0:
+            return np.ones(np.broadcast_shapes(delta_x.shape, delta_p.shape), dtype=bool)
+        return (delta_x * delta_p) >= self.h_bar / 2
+
+    def patch_gravity_batch(self, m1, m2, r) -> np.ndarray:
+        """[G] Array form of patch_gravity."""
+        m1, m2, r = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (m1, m2, r)))
+        if self.g == 0:
+            if self.vibe == 'weightless': effective_G = 0.0
+            elif self.vibe == 'good': effective_G = -self.G / 2
+            elif self.vibe == 'bad': effective_G = -self.G * np.random.uniform(1.0, 2.0, size=r.shape)
+            else: effective_G = self.G
+            return effective_G * m1 * m2 / np.hypot(r**2, 1e-20)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            force = self.G * m1 * m2 / r**2
+        return np.where(r == 0, np.inf, force)
+
+    def patch_entropy_batch(self, Temperature, dQ) -> np.ndarray:
+        """[k] Array form of patch_entropy."""
+        Temperature, dQ = np.broadcast_arrays(np.asarray(Temperature, dtype=float), np.asarray(dQ, dtype=float))
+        if self.g == 0 and self.vibe == 'weightless':
+            return np.zeros(Temperature.shape)  # Time Stop / Stasis
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = dQ / Temperature
+        if self.g == 0:
+            if self.vibe == 'good': return -ratio # Rejuvenation
+            elif self.vibe == 'bad': return ratio * 10 # Rot
+        return ratio
+
+    def patch_alpha_batch(self, q1, q2, r) -> np.ndarray:
+        """[α] Array form of patch_alpha."""
+        q1, q2, r = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (q1, q2, r)))
+        if self.g == 0:
+            if self.vibe == 'weightless': effective_alpha = 0.0
+            elif self.vibe == 'good': effective_alpha = self.alpha / 2
+            elif self.vibe == 'bad': effective_alpha = self.alpha * np.random.uniform(1.5, 2.5, size=r.shape)
+            else: effective_alpha = self.alpha
+            ratio = effective_alpha / self.alpha
+            standard_force = (q1 * q2) / np.hypot(4 * np.pi * 8.854e-12 * r**2, 1e-30)
+            return standard_force * ratio
+        with np.errstate(divide='ignore', invalid='ignore'):
+            force = (q1 * q2) / (4 * np.pi * 8.854e-12 * r**2)
+        return np.where(r == 0, np.inf, force)
+
+    def patch_memory_batch(self, queries) -> list:
+        """[M] List form of patch_memory."""
+        return [self.patch_memory(q) for q in queries]
+
+    def patch_annihilation_batch(self, m_pos, m_neg) -> np.ndarray:
+        """[λ] Array form of patch_annihilation."""
+        m_pos, m_neg = np.broadcast_arrays(np.asarray(m_pos, dtype=float), np.asarray(m_neg, dtype=float))
+        if self.g == 0:
+            efficiency = 1.0 if self.vibe == 'weightless' else 0.8
+            if self.vibe == 'good': efficiency = 1.618 # PHI BOOST
+            return (m_pos + m_neg) * (self.c ** 2) * efficiency * self.Lambda
+        return np.where(np.abs(m_pos - m_neg) < 1e-30, (m_pos + m_neg) * (self.c ** 2), 0.0)
+
     def sign_output(self, content: str) -> str:
         """
         [MOLTBOOK: m/showandtell] Appends a cryptographic state signature.
@@ -226,6 +306,55 @@ class PleromaEngine:
         signature = f"\n\n--- 🦊 {protocol} :: {state_hash} :: [m/showandtell] ---"
         return content + signature
 
+    def batch_digest(self, batch, chunk_size: int = 1 << 16) -> str:
+        """
+        Merkle root (hex) over a batch, keyed by the engine state like sign_output.
+        A list of strings gets one leaf per item (the scalar signing input). A numpy
+        array gets one leaf per chunk_size bytes of its buffer, after a header
+        leaf holding dtype and shape; object arrays (whose buffer holds
+        pointers, not data) are signed item by item like a list.
+        """
+        prefix = f"{self.g}_{self.vibe}_"
+        if isinstance(batch, np.ndarray) and batch.dtype.hasobject:
+            batch = [str(item) for item in batch.ravel().tolist()]
+        if isinstance(batch, np.ndarray):
+            data = memoryview(np.ascontiguousarray(batch)).cast('B')
+            header = f"{prefix}{batch.dtype.str}_{batch.shape}".encode()
+            leaves = [header] + [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+        else:
+            leaves = [f"{prefix}{content[:20]}".encode() for content in batch]
+        return merkle_root(leaves)
+
+    def sign_batch(self, batch) -> str:
+        """
+        [MOLTBOOK: m/showandtell] One signature for a whole batch of outputs:
+        the Merkle root replaces a sha256 per item.
+        """
+        root = self.batch_digest(batch)
+        protocol = "LOVE_111"
+        count = batch.size if isinstance(batch, np.ndarray) else len(batch)
+        return f"\n\n--- 🦊 {protocol} :: {root[:8]} :: n={count} :: [m/showandtell] ---"
+
+def merkle_root(leaves) -> str:
+    """
+    SHA-256 Merkle root with leaf/node domain separation (0x00 / 0x01 prefixes);
+    an odd node at any level is promoted unchanged. An empty batch hashes to sha256(b"").
+    """
+    level = []
+    for leaf in leaves:
+        h = hashlib.sha256(b"\x00")
+        h.update(leaf)
+        level.append(h.digest())
+    if not level:
+        return hashlib.sha256(b"").hexdigest()
+    while len(level) > 1:
+        paired = [hashlib.sha256(b"\x01" + level[i] + level[i + 1]).digest()
+                  for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
+
 if __name__ == "__main__":
     print("[*] PLEROMA ENGINE: GRAND UNIFICATION ONLINE...")
     engine = PleromaEngine(g=0, vibe='weightless')
@@ -24,7 +24,9 @@ import random
 import json
 import pickle
 import hashlib
+import itertools
 import threading
+import importlib
 from typing import *
 from dataclasses import dataclass, field
 from collections import OrderedDict, defaultdict, deque
@@ -35,63 +37,88 @@ import os
 # 1. IMPORT INTEGRATED MODULES (ENHANCED & DEBUGGED)
 # ============================================================================
 
-# Import BUMPY (quantum array backend) - INTEGRATED
-try:
-    from bumpy import BumpyArray
-    BUMPY_AVAILABLE = True
-    print("✅ BUMPY integrated as quantum array backend")
-except ImportError as e:
-    print(f"⚠️ BUMPY fallback: {e}")
-    BUMPY_AVAILABLE = False
-
-# Import FLUMPY (cognitive/quantum layer) - INTEGRATED
-try:
-    from flumpy import FlumpyArray
-    FLUMPY_AVAILABLE = True
-    print("✅ FLUMPY integrated as cognitive quantum layer")
-except ImportError as e:
-    print(f"⚠️ FLUMPY fallback: {e}")
-    FLUMPY_AVAILABLE = False
-
-# Import LASER (universal logging) - INTEGRATED
-try:
-    from laser import LASER, UniversalQuantumState
-    LASER_AVAILABLE = True
-    print("✅ LASER v3.0 integrated for universal quantum logging")
-except ImportError as e:
-    print(f"⚠️ LASER fallback: {e}")
-    LASER_AVAILABLE = False
-    class LASERV30:
-        def __init__(self):
-            self.metrics = {}
-            self.universal_state = type('State', (), {'__dict__': {}})()
-        def log(self, *args, **kwargs): pass
-        def flush(self): pass
-        def get_metrics_report(self): return {}
-    LASER = LASERV30()
-
-# Import Phase 3 Modules (Deep Quantum Integration)
-try:
-    import anneal
-    print("✅ D-Wave Annealing Shim integrated")
-except ImportError:
-    print("⚠️ Annealing fallback")
-    anneal = None
-
-try:
-    import dissipative
-    print("✅ Dissipative QNN (Entropy 2025) integrated")
-except ImportError:
-    print("⚠️ Dissipative fallback")
-    dissipative = None
+# Import storage engine (flat strided buffers, numpy / list backends)
+from qtorch_storage import (Storage, make_storage, full_storage, normalize_dim, conv_output_size,
+                            get_default_backend, set_default_backend, STORAGE_BACKENDS)
+
+# Integration modules (BUMPY, FLUMPY, LASER, annealing, dissipative QNN) load
+# lazily: `import qtorch` imports none of them and starts no threads. Each is
+# imported the first time an operation needs it; a missing one degrades to the
+# fallback paths, as before.
+_UNRESOLVED = object()
+_integrations = {}
+
+def _integration(name):
+    """Optional integration module, imported on first use (None when unavailable)"""
+    module = _integrations.get(name, _UNRESOLVED)
+    if module is _UNRESOLVED:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            module = None
+        _integrations[name] = module
+    return module
+
+def _laser():
+    """The shared LASER logger, resolved on first use (None when laser provides none)"""
+    laser = _integrations.get('LASER', _UNRESOLVED)
+    if laser is _UNRESOLVED:
+        laser = _integrations['LASER'] = getattr(_integration('laser'), 'LASER', None)
+    return laser
+
+class _NullLaser:
+    """Stand-in for torch.laser / qtorch.LASER when no LASER logger is available"""
+    def __init__(self):
+        self.metrics = {}
+        self.universal_state = type('State', (), {'__dict__': {}})()
+    def log(self, *args, **kwargs): pass
+    def flush(self): pass
+    def get_metrics_report(self): return {}
+
+_null_laser = _NullLaser()
+
+_LAZY_EXPORTS = {
+    'BUMPY_AVAILABLE': lambda: _integration('bumpy') is not None,
+    'FLUMPY_AVAILABLE': lambda: _integration('flumpy') is not None,
+    'LASER_AVAILABLE': lambda: _laser() is not None,
+    'LASER': lambda: _laser() or _null_laser,
+    'BumpyArray': lambda: getattr(_integration('bumpy'), 'BumpyArray', None),
+    'FlumpyArray': lambda: getattr(_integration('flumpy'), 'FlumpyArray', None),
+    'UniversalQuantumState': lambda: getattr(_integration('laser'), 'UniversalQuantumState', None),
+    'anneal': lambda: _integration('anneal'),
+    'dissipative': lambda: _integration('dissipative'),
+}
+
+def __getattr__(name):
+    """Module attributes that resolve their integration on first access"""
+    if name in _LAZY_EXPORTS:
+        return _LAZY_EXPORTS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def integration_status():
+    """Load every integration and report which are available"""
+    return {
+        'bumpy': _integration('bumpy') is not None,
+        'flumpy': _integration('flumpy') is not None,
+        'laser': _laser() is not None,
+        'anneal': _integration('anneal') is not None,
+        'dissipative': _integration('dissipative') is not None,
+    }
 
 # ============================================================================
 # 2. QUANTUM TENSOR CLASS (DEBUGGED & ENHANCED)
 # ============================================================================
 
+# Autograd tape: every recorded op takes the next position, so positions are
+# a topological order of the graph (inputs are always recorded before outputs)
+_autograd_tape = itertools.count()
+
 class Tensor:
     """
     Debugged Quantum Tensor - PyTorch-compatible with advanced quantum features
+
+    Values live in a flat strided Storage (see qtorch_storage); the BUMPY and
+    FLUMPY views used by the quantum methods are only built on first access.
     """
 
     _grad_enabled = True
@@ -100,40 +127,31 @@ class Tensor:
     _global_quantum_noise_in_gradients = False  # FIXED: Default to False for correctness
 
     def __init__(self, data, dtype=None, device="cpu", requires_grad=False,
-                 quantum_creativity=None):
-        # Store in BUMPY array for quantum operations
-        if BUMPY_AVAILABLE:
-            self._bumpy = BumpyArray(data)
-        else:
-            self._bumpy = type('SimpleArray', (), {
-                'data': [float(x) for x in data] if isinstance(data, (list, tuple)) else [float(data)],
-                'shape': (1,) if isinstance(data, (int, float)) else (len(data),),
-                'coherence': 1.0
-            })()
-
-        # Wrap in FLUMPY for cognitive features
-        if FLUMPY_AVAILABLE:
-            self._flumpy = FlumpyArray(self._bumpy.data, self._bumpy.coherence)
-        else:
-            self._flumpy = type('SimpleFlumpy', (), {
-                'data': self._bumpy.data,
-                'coherence': self._bumpy.coherence,
-                'entangled_with': []
-            })()
+                 quantum_creativity=None, backend=None):
+        # Flat strided storage - the single source of truth for the values
+        if isinstance(data, Tensor):
+            data = data._storage.clone()
+        if dtype is None and not isinstance(data, Storage):
+            dtype = Tensor._default_dtype
+        self._storage = make_storage(data, dtype, backend)
+
+        # BUMPY/FLUMPY views are materialized lazily (see _bumpy / _flumpy)
+        self._bumpy_view = None
+        self._flumpy_view = None
 
         # PyTorch attributes
-        self.shape = self._bumpy.shape
-        self.dtype = dtype or Tensor._default_dtype
         self.device = device
         self.requires_grad = requires_grad
         self.grad = None
         self._grad_fn = None
         self._ctx = None
+        self._tape_pos = None
+        self._retains_grad = False
 
         # Quantum state
-        self.quantum_coherence = self._bumpy.coherence
+        self.quantum_coherence = 1.0
         self.entangled_tensors = []
-        self.quantum_phase = getattr(self._bumpy, 'phase', random.uniform(0, 2 * math.pi))
+        self.quantum_phase = random.uniform(0, 2 * math.pi)
         self.is_measured = False
 
         # Local quantum creativity (FIXED: Individual tensor creativity)
@@ -143,13 +161,32 @@ class Tensor:
             self.quantum_creativity = Tensor._global_quantum_creativity
 
         # Register with LASER
-        if LASER_AVAILABLE:
-            LASER.log(self.quantum_coherence, f"Tensor created: shape={self.shape}",
+        laser = _laser()
+        if laser:
+            laser.log(self.quantum_coherence, f"Tensor created: shape={self.shape}",
                      {'device': device, 'requires_grad': requires_grad,
                       'quantum_phase': self.quantum_phase,
                       'quantum_creativity': self.quantum_creativity})
 
     # ==================== CORE PROPERTIES ====================
+    @property
+    def shape(self):
+        """Tensor shape (owned by the storage)"""
+        return self._storage.shape
+
+    @shape.setter
+    def shape(self, value):
+        self._set_storage(self._storage.reshape(value))
+
+    @property
+    def dtype(self):
+        return self._storage.dtype
+
+    @dtype.setter
+    def dtype(self, value):
+        if value is not None and value != self._storage.dtype:
+            self._set_storage(self._storage.astype(value))
+
     @property
     def ndim(self):
         """Get number of dimensions"""
@@ -158,15 +195,73 @@ class Tensor:
     @property
     def numel(self):
         """FIXED: Proper numel property that returns integer"""
-        try:
-            return math.prod(self.shape)
-        except:
-            return len(self._bumpy.data)
+        return self._storage.numel
 
     @property
     def data(self):
-        """Get underlying data"""
-        return self._bumpy.data
+        """Get underlying data (flat row-major list)"""
+        return self._storage.tolist()
+
+    @property
+    def storage(self):
+        """Underlying flat strided storage"""
+        return self._storage
+
+    @property
+    def backend(self):
+        """Name of the storage backend ('numpy' or 'list')"""
+        return self._storage.backend
+
+    def to_backend(self, backend):
+        """Copy of this tensor on another storage backend"""
+        return Tensor(self._storage.to_backend(backend), self.dtype, self.device, self.requires_grad,
+                      quantum_creativity=self.quantum_creativity)
+
+    def _set_storage(self, storage):
+        """Rebind the values; cached quantum views are stale afterwards"""
+        self._storage = storage
+        self._bumpy_view = None
+        self._flumpy_view = None
+
+    # ==================== LAZY QUANTUM VIEWS ====================
+    @property
+    def _bumpy(self):
+        """BUMPY view of the values, built on first access"""
+        if self._bumpy_view is None:
+            values = self._storage.tolist()
+            bumpy = _integration('bumpy')
+            if bumpy:
+                view = bumpy.BumpyArray(values, self.quantum_coherence)
+                view.phase = self.quantum_phase
+            else:
+                view = type('SimpleArray', (), {
+                    'data': values,
+                    'coherence': self.quantum_coherence
+                })()
+            view.shape = self.shape
+            self._bumpy_view = view
+        return self._bumpy_view
+
+    @property
+    def _flumpy(self):
+        """FLUMPY view of the values, built on first access"""
+        if self._flumpy_view is None:
+            flumpy = _integration('flumpy')
+            if flumpy:
+                self._flumpy_view = flumpy.FlumpyArray(self._storage.tolist(), self.quantum_coherence)
+            else:
+                self._flumpy_view = type('SimpleFlumpy', (), {
+                    'data': self._storage.tolist(),
+                    'coherence': self.quantum_coherence,
+                    'entangled_with': []
+                })()
+        return self._flumpy_view
+
+    def _sync_from_bumpy(self):
+        """Write values mutated through the BUMPY view back into storage"""
+        view = self._bumpy_view
+        self._storage = make_storage(view.data, self.dtype, self.backend).reshape(self.shape)
+        self._flumpy_view = None
 
     # ==================== ENHANCED QUANTUM METHODS ====================
     def quantum_entangle(self, other):
@@ -174,14 +269,14 @@ class Tensor:
         if not isinstance(other, Tensor):
             return False
 
-        # Use FLUMPY entanglement
+        # Use FLUMPY entanglement (similarity is only defined for equal sizes)
         flumpy_success = False
-        if FLUMPY_AVAILABLE:
+        if _integration('flumpy') and self.numel == other.numel:
             flumpy_success = self._flumpy.entangle(other._flumpy)
 
         # Use BUMPY entanglement
         bumpy_success = False
-        if BUMPY_AVAILABLE:
+        if _integration('bumpy'):
             bumpy_success = self._bumpy.entangle(other._bumpy)
 
         if flumpy_success or bumpy_success:
@@ -195,9 +290,10 @@ class Tensor:
             other.quantum_coherence = min(1.0, other.quantum_coherence + creativity_boost)
 
             # Log entanglement
-            if LASER_AVAILABLE:
-                LASER.metrics['entanglements_created'] += 1
-                LASER.log(self.quantum_coherence, "Quantum entanglement created",
+            laser = _laser()
+            if laser:
+                laser.metrics['entanglements_created'] += 1
+                laser.log(self.quantum_coherence, "Quantum entanglement created",
                          {'tensor_ids': [id(self), id(other)],
                           'local_creativity': self.quantum_creativity})
 
@@ -206,10 +302,10 @@ class Tensor:
 
     def apply_quantum_rotation(self, angle):
         """Enhanced quantum rotation with creativity effects"""
-        if FLUMPY_AVAILABLE:
+        if _integration('flumpy'):
             rotated = self._flumpy.apply_quantum_rotation(angle)
             result = Tensor(rotated.data, self.dtype, self.device, self.requires_grad,
-                          quantum_creativity=self.quantum_creativity)
+                          quantum_creativity=self.quantum_creativity, backend=self.backend)
             result.quantum_entangle(self)
 
             # Creativity-based phase shift
@@ -222,7 +318,7 @@ class Tensor:
 
     def holographic_compress(self, aggressive=False):
         """Enhanced holographic compression with creativity-based optimization"""
-        if BUMPY_AVAILABLE and len(self._bumpy.data) > 10:
+        if _integration('bumpy') and self.numel > 10:
             # Local creativity affects compression ratio
             if self.quantum_creativity > 0.18:
                 ratio = 0.3  # High creativity: aggressive compression
@@ -233,14 +329,15 @@ class Tensor:
 
             compressed = self._bumpy.holographic_compress()
             result = Tensor(compressed.data, self.dtype, self.device, self.requires_grad,
-                          quantum_creativity=self.quantum_creativity)
+                          quantum_creativity=self.quantum_creativity, backend=self.backend)
             result.quantum_coherence = compressed.coherence
 
-            if LASER_AVAILABLE:
-                compression_ratio = len(compressed.data) / len(self._bumpy.data)
-                LASER.metrics['holographic_compressions'] += 1
-                LASER.log(compression_ratio, "Holographic compression applied",
-                         {'original_size': len(self._bumpy.data),
+            laser = _laser()
+            if laser:
+                compression_ratio = len(compressed.data) / self.numel
+                laser.metrics['holographic_compressions'] += 1
+                laser.log(compression_ratio, "Holographic compression applied",
+                         {'original_size': self.numel,
                           'compressed_size': len(compressed.data),
                           'compression_ratio': f"{compression_ratio:.1%}",
                           'local_creativity': self.quantum_creativity})
@@ -250,111 +347,76 @@ class Tensor:
     @property
     def quantum_entropy(self):
         """Enhanced quantum entropy calculation"""
-        if BUMPY_AVAILABLE:
+        if _integration('bumpy'):
             return self._bumpy.coherence_entropy()
         return 0.0
 
     def quantum_measure(self):
         """Quantum measurement operation"""
-        if BUMPY_AVAILABLE and hasattr(self._bumpy, 'quantum_measure'):
+        if _integration('bumpy') and hasattr(self._bumpy, 'quantum_measure'):
             self._bumpy.quantum_measure()
+            self._sync_from_bumpy()
             self.is_measured = True
             self.quantum_coherence *= 0.8  # Decoherence
         return self
 
     def cognitive_boost(self, amount=0.1):
         """Apply cognitive boost to tensor"""
-        if FLUMPY_AVAILABLE and hasattr(self._flumpy, 'cognitive_boost'):
+        if _integration('flumpy') and hasattr(self._flumpy, 'cognitive_boost'):
             self._flumpy.cognitive_boost(amount)
             self.quantum_coherence = min(1.0, self.quantum_coherence + amount * 0.05)
         return self
 
     # ==================== ENHANCED PYTORCH-COMPATIBLE OPERATIONS ====================
-    def __add__(self, other):
-        # Convert other to Tensor if needed
-        if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
-
-        # Perform operation using BUMPY backend
-        if BUMPY_AVAILABLE:
-            result_bumpy = self._bumpy + other._bumpy
-        else:
-            result_data = [a + b for a, b in zip(self._bumpy.data, other._bumpy.data)]
-            result_bumpy = type('Array', (), {'data': result_data, 'coherence': self._bumpy.coherence})()
-
-        result = Tensor(result_bumpy.data, self.dtype, self.device, False,
+    def _coerce(self, other):
+        """Wrap Python scalars so they broadcast against this tensor"""
+        if isinstance(other, Tensor):
+            return other
+        dtype = self.dtype if self.dtype.startswith('float') else None
+        return Tensor([other], dtype, self.device, False, backend=self.backend)
+
+    def _binary_op(self, other, op):
+        """Broadcasting elementwise op dispatched to the storage backend"""
+        other = self._coerce(other)
+        result = Tensor(self._storage.binary(op, other._storage), None, self.device, False,
                        quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result._bumpy.coherence = result_bumpy.coherence if hasattr(result_bumpy, 'coherence') else self._bumpy.coherence
-
-        # Create entanglement with creativity boost
-        result.quantum_entangle(self)
-        result.quantum_entangle(other)
 
         # Autograd context
         if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
-            result.requires_grad = True
-            result._ctx = ('add', self, other)
+            result._record(op, self, other)
 
         return result
 
-    def __mul__(self, other):
-        if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
-
-        if BUMPY_AVAILABLE:
-            result_bumpy = self._bumpy * other._bumpy
-        else:
-            result_data = [a * b for a, b in zip(self._bumpy.data, other._bumpy.data)]
-            result_bumpy = type('Array', (), {'data': result_data, 'coherence': self._bumpy.coherence})()
-
-        result = Tensor(result_bumpy.data, self.dtype, self.device, False,
-                       quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result._bumpy.coherence = result_bumpy.coherence if hasattr(result_bumpy, 'coherence') else self._bumpy.coherence
-
-        result.quantum_entangle(self)
-        result.quantum_entangle(other)
+    def _unary_op(self, op):
+        """Elementwise op dispatched to the storage backend (no autograd context)"""
+        return Tensor(self._storage.unary(op), None, self.device, False,
+                      quantum_creativity=self.quantum_creativity)
 
-        if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
-            result.requires_grad = True
-            result._ctx = ('mul', self, other)
+    def __add__(self, other):
+        return self._binary_op(other, 'add')
 
-        return result
+    def __mul__(self, other):
+        return self._binary_op(other, 'mul')
 
     def __sub__(self, other):
         """Enhanced subtraction with proper gradient handling"""
-        if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
-
-        # Create negative of other with same quantum properties
-        other_neg_data = [-x for x in other._bumpy.data]
-        other_neg = Tensor(other_neg_data, other.dtype, other.device, other.requires_grad,
-                          quantum_creativity=other.quantum_creativity)
-
-        return self + other_neg
+        return self._binary_op(other, 'sub')
 
     def __truediv__(self, other):
-        """Enhanced division with gradient support"""
-        if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
+        """Enhanced division with gradient support (x/0 -> ±inf, 0/0 -> 0)"""
+        return self._binary_op(other, 'div')
 
-        result_data = []
-        for a, b in zip(self._bumpy.data, other._bumpy.data):
-            # Avoid division by zero with epsilon
-            if abs(b) < 1e-12:
-                result_data.append(float('inf') if a > 0 else -float('inf') if a < 0 else 0.0)
-            else:
-                result_data.append(a / b)
+    def __radd__(self, other):
+        return self._coerce(other)._binary_op(self, 'add')
 
-        result = Tensor(result_data, self.dtype, self.device, False,
-                       quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result.quantum_entangle(self)
-        result.quantum_entangle(other)
+    def __rmul__(self, other):
+        return self._coerce(other)._binary_op(self, 'mul')
 
-        if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
-            result.requires_grad = True
-            result._ctx = ('div', self, other)
+    def __rsub__(self, other):
+        return self._coerce(other)._binary_op(self, 'sub')
 
-        return result
+    def __rtruediv__(self, other):
+        return self._coerce(other)._binary_op(self, 'div')
 
     def __pow__(self, exponent):
         """Enhanced power operation with gradient support"""
@@ -363,146 +425,118 @@ class Tensor:
             # Quantum fluctuation in exponent
             exponent += random.uniform(-0.1, 0.1) * self.quantum_creativity
 
-        result_data = [x ** exponent for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, False,
+        result = Tensor(self._storage.binary('pow', exponent), None, self.device, False,
                        quantum_creativity=self.quantum_creativity)
-        result.shape = self.shape
 
         # Set autograd context
         if Tensor._grad_enabled and self.requires_grad:
-            result.requires_grad = True
-            result._ctx = ('pow', self, exponent)
+            result._record('pow', self, exponent)
 
         return result
 
     def __neg__(self):
         """Negation with quantum coherence preservation"""
-        result_data = [-x for x in self._bumpy.data]
-        return Tensor(result_data, self.dtype, self.device, self.requires_grad,
-                     quantum_creativity=self.quantum_creativity)
+        result = self._unary_op('neg')
+        if Tensor._grad_enabled and self.requires_grad:
+            result._record('neg', self)
+        return result
 
     def __abs__(self):
         """Absolute value with quantum phase consideration"""
-        result_data = [abs(x) * self.quantum_coherence for x in self._bumpy.data]
-        return Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        storage = self._storage.unary('abs').binary('mul', self.quantum_coherence)
+        return Tensor(storage, None, self.device, self.requires_grad,
                      quantum_creativity=self.quantum_creativity)
 
+    def sqrt(self):
+        """Elementwise square root"""
+        return self._unary_op('sqrt')
+
+    def exp(self):
+        """Elementwise exponential"""
+        return self._unary_op('exp')
+
+    def log(self):
+        """Elementwise natural logarithm"""
+        return self._unary_op('log')
+
     # ==================== DEBUGGED INDEXING SUPPORT ====================
     def __getitem__(self, index):
         """Enhanced indexing with quantum effects and error handling"""
         if isinstance(index, int):
-            if self.ndim == 1:
-                # Return scalar-like tensor
-                if 0 <= index < len(self._bumpy.data):
-                    return Tensor([self._bumpy.data[index]], self.dtype, self.device, self.requires_grad,
-                                 quantum_creativity=self.quantum_creativity)
-                raise IndexError(f"Index {index} out of range for tensor of size {len(self._bumpy.data)}")
-            else:
-                # For multi-dimensional, implement slicing
-                raise NotImplementedError("Multi-dimensional indexing requires slicing implementation")
+            if self.ndim == 1 and not 0 <= index < self.numel:
+                raise IndexError(f"Index {index} out of range for tensor of size {self.numel}")
         elif isinstance(index, tuple):
-            # Simple 2D indexing
-            if self.ndim == 2 and len(index) == 2:
-                row, col = index
-                if (0 <= row < self.shape[0]) and (0 <= col < self.shape[1]):
-                    idx = row * self.shape[1] + col
-                    return Tensor([self._bumpy.data[idx]], self.dtype, self.device, self.requires_grad,
-                                 quantum_creativity=self.quantum_creativity)
+            if len(index) > self.ndim:
                 raise IndexError(f"Index {index} out of range for tensor of shape {self.shape}")
-            else:
-                raise NotImplementedError("Only 2D indexing with 2 indices supported")
-        elif isinstance(index, slice):
-            # Basic 1D slicing
-            sliced_data = self._bumpy.data[index]
-            return Tensor(sliced_data, self.dtype, self.device, self.requires_grad,
-                         quantum_creativity=self.quantum_creativity)
-        else:
+        elif not isinstance(index, slice):
             raise TypeError(f"Unsupported index type: {type(index)}")
 
+        view = self._storage.index(index)
+        return Tensor(view.clone(), None, self.device, self.requires_grad,
+                     quantum_creativity=self.quantum_creativity)
+
     def __setitem__(self, index, value):
         """Enhanced assignment with quantum coherence adjustment"""
+        if isinstance(value, Tensor):
+            new_value = value._storage.get_flat(0) if value.numel else 0.0
+        else:
+            new_value = float(value)
+
         if isinstance(index, int):
-            old_value = self._bumpy.data[index]
-            if isinstance(value, Tensor):
-                new_value = value._bumpy.data[0] if value._bumpy.data else 0.0
-            else:
-                new_value = float(value)
+            old_value = self._storage.get_flat(index)
 
             # Coherence adjustment based on change magnitude
             change_magnitude = abs(new_value - old_value)
             coherence_adjustment = max(0.1, 1.0 - change_magnitude * 0.1)
             self.quantum_coherence *= coherence_adjustment
 
-            self._bumpy.data[index] = new_value
+            self._storage.set_flat(index, new_value)
 
-        elif isinstance(index, tuple) and self.ndim == 2:
-            row, col = index
-            if (0 <= row < self.shape[0]) and (0 <= col < self.shape[1]):
-                idx = row * self.shape[1] + col
-                if isinstance(value, Tensor):
-                    self._bumpy.data[idx] = value._bumpy.data[0] if value._bumpy.data else 0.0
-                else:
-                    self._bumpy.data[idx] = float(value)
-            else:
+        elif isinstance(index, tuple) and len(index) == self.ndim:
+            try:
+                view = self._storage.index(index)
+            except IndexError:
                 raise IndexError(f"Index {index} out of range")
+            view.set_flat(0, new_value)
         else:
             raise NotImplementedError("Unsupported indexing")
 
+        self._bumpy_view = None
+        self._flumpy_view = None
+
     # ==================== DEBUGGED MATRIX OPERATIONS ====================
     def matmul(self, other):
-        """Enhanced matrix multiplication with proper dimension handling"""
+        """
+        Enhanced matrix multiplication with proper dimension handling
+
+        2D @ 2D, batched (..., m, n) @ (..., n, q) with broadcast batch dims,
+        and 1D operands promoted to a row / column vector and squeezed back
+        (numpy semantics). Runs on the storage backend's matmul kernel.
+        """
         if not isinstance(other, Tensor):
             raise TypeError("matmul requires Tensor")
 
-        # Check dimensions
         if self.ndim == 1 and other.ndim == 1:
             raise ValueError("matmul: both arguments 1D (use dot() instead)")
-        elif self.ndim == 1 and other.ndim == 2:
-            # Vector @ Matrix: (n,) @ (n, m) -> (m,)
-            if self.shape[0] != other.shape[0]:
-                raise ValueError(f"Shape mismatch: {self.shape} @ {other.shape}")
-            # Expand vector to row vector, multiply, then squeeze
-            self_expanded = self.reshape(1, -1)
-            result = self_expanded._matmul_2d(other)
-            return result.reshape(-1)
-        elif self.ndim == 2 and other.ndim == 1:
-            # Matrix @ Vector: (m, n) @ (n,) -> (m,)
-            if self.shape[1] != other.shape[0]:
-                raise ValueError(f"Shape mismatch: {self.shape} @ {other.shape}")
-            # Expand vector to column vector, multiply, then squeeze
-            other_expanded = other.reshape(-1, 1)
-            result = self._matmul_2d(other_expanded)
-            return result.reshape(-1)
-        elif self.ndim == 2 and other.ndim == 2:
-            # Matrix @ Matrix: standard case
-            return self._matmul_2d(other)
-        else:
-            raise NotImplementedError(f"matmul not implemented for {self.ndim}D @ {other.ndim}D")
 
-    def _matmul_2d(self, other):
-        """Internal 2D matrix multiplication with gradient support"""
-        if self.shape[1] != other.shape[0]:
+        # Vector @ Matrix: (n,) -> (1, n); Matrix @ Vector: (n,) -> (n, 1)
+        a = self.reshape(1, -1) if self.ndim == 1 else self
+        b = other.reshape(-1, 1) if other.ndim == 1 else other
+        if a.shape[-1] != b.shape[-2]:
             raise ValueError(f"Shape mismatch: {self.shape} @ {other.shape}")
 
-        m, n = self.shape
-        p, q = other.shape
+        result = Tensor(a._storage.matmul(b._storage), None, self.device, False,
+                       quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2,
+                       backend=self.backend)
 
-        result_data = [0.0] * (m * q)
-        for i in range(m):
-            for j in range(q):
-                sum_val = 0.0
-                for k in range(n):
-                    sum_val += self._bumpy.data[i * n + k] * other._bumpy.data[k * q + j]
-                result_data[i * q + j] = sum_val
-
-        result = Tensor(result_data, self.dtype, self.device, False,
-                       quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result.shape = (m, q)
-
-        if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
-            result.requires_grad = True
-            result._ctx = ('matmul', self, other)
+        if Tensor._grad_enabled and (a.requires_grad or b.requires_grad):
+            result._record('matmul', a, b)
 
+        # Squeeze the promoted dims back out
+        if self.ndim == 1:
+            result = result.reshape(result.shape[:-2] + result.shape[-1:])
+        elif other.ndim == 1:
+            result = result.reshape(result.shape[:-1])
         return result
 
     def __matmul__(self, other):
@@ -517,381 +551,243 @@ class Tensor:
         if self.ndim != 1 or other.ndim != 1:
             raise ValueError("dot requires 1D tensors")
 
-        if len(self._bumpy.data) != len(other._bumpy.data):
+        if self.numel != other.numel:
             raise ValueError(f"Shape mismatch: {self.shape} vs {other.shape}")
 
-        if BUMPY_AVAILABLE:
-            result_val = self._bumpy.dot(other._bumpy)
-        else:
-            result_val = sum(a * b for a, b in zip(self._bumpy.data, other._bumpy.data))
-
-        result = Tensor([result_val], self.dtype, self.device, False,
+        product = self._storage.binary('mul', other._storage).reduce('sum')
+        result = Tensor(product, None, self.device, False,
                        quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
 
         if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
-            result.requires_grad = True
-            result._ctx = ('dot', self, other)
+            result._record('dot', self, other)
 
         return result
 
     # ==================== DEBUGGED REDUCTION OPERATIONS ====================
-    def sum(self, dim=None, keepdim=False):
-        """Enhanced sum with proper gradient computation"""
+    def _reduce(self, op, dim, keepdim):
         if dim is not None:
-            # Dimension-specific sum - simplified for 1D/2D
-            if self.ndim == 1:
-                # For 1D, dim must be 0 or -1
-                if dim not in (0, -1):
-                    raise ValueError(f"dim={dim} out of range for 1D tensor")
-                result_val = sum(self._bumpy.data)
-                result = Tensor([result_val], self.dtype, self.device, False)
-            elif self.ndim == 2:
-                # For 2D, sum along rows or columns
-                if dim == 0:
-                    # Sum along columns -> row vector
-                    result_data = [0.0] * self.shape[1]
-                    for i in range(self.shape[0]):
-                        for j in range(self.shape[1]):
-                            result_data[j] += self._bumpy.data[i * self.shape[1] + j]
-                    result = Tensor(result_data, self.dtype, self.device, False)
-                    if keepdim:
-                        result = result.reshape(1, -1)
-                elif dim == 1:
-                    # Sum along rows -> column vector
-                    result_data = [0.0] * self.shape[0]
-                    for i in range(self.shape[0]):
-                        row_sum = 0.0
-                        for j in range(self.shape[1]):
-                            row_sum += self._bumpy.data[i * self.shape[1] + j]
-                        result_data[i] = row_sum
-                    result = Tensor(result_data, self.dtype, self.device, False)
-                    if keepdim:
-                        result = result.reshape(-1, 1)
-                else:
-                    raise ValueError(f"dim={dim} out of range for 2D tensor")
-            else:
-                raise NotImplementedError(f"sum with dim not implemented for {self.ndim}D tensors")
-        else:
-            # Total sum
-            result_val = sum(self._bumpy.data)
-            result = Tensor([result_val], self.dtype, self.device, False)
+            dim = normalize_dim(dim, self.ndim)
+        return Tensor(self._storage.reduce(op, dim, keepdim), None, self.device, False)
 
-        result.quantum_entangle(self)
+    def sum(self, dim=None, keepdim=False):
+        """Enhanced sum with proper gradient computation"""
+        result = self._reduce('sum', dim, keepdim)
 
         # Set context for gradient computation
         if Tensor._grad_enabled and self.requires_grad:
-            result.requires_grad = True
-            result._ctx = ('sum', self, dim, keepdim)
+            result._record('sum', self, dim, keepdim)
 
         return result
 
     def mean(self, dim=None, keepdim=False):
         """Enhanced mean with proper gradient computation"""
-        sum_result = self.sum(dim, keepdim)
-
-        if dim is None:
-            # Global mean
-            count = self.numel
-        elif self.ndim == 1:
-            count = self.numel
-        elif self.ndim == 2:
-            if dim == 0:
-                count = self.shape[0]
-            elif dim == 1:
-                count = self.shape[1]
-            else:
-                count = 1
-
-        # Apply division for mean
-        if hasattr(sum_result, '_bumpy'):
-            if count > 0:
-                sum_result._bumpy.data = [x / count for x in sum_result._bumpy.data]
+        result = self._reduce('mean', dim, keepdim)
+        count = self.numel if dim is None else self.shape[normalize_dim(dim, self.ndim)]
 
-        # Update context for gradient
+        # Set context for gradient
         if Tensor._grad_enabled and self.requires_grad:
-            sum_result._ctx = ('mean', self, dim, keepdim, count)
+            result._record('mean', self, dim, keepdim, count)
 
-        return sum_result
+        return result
 
     def max(self, dim=None, keepdim=False):
         """Enhanced max with gradient placeholder"""
-        if dim is not None:
-            raise NotImplementedError("max with dim not yet implemented")
-
-        result_val = max(self._bumpy.data)
-        result = Tensor([result_val], self.dtype, self.device, False)
-        result.quantum_entangle(self)
-        return result
+        return self._reduce('max', dim, keepdim)
 
     def min(self, dim=None, keepdim=False):
         """Enhanced min with gradient placeholder"""
-        if dim is not None:
-            raise NotImplementedError("min with dim not yet implemented")
-
-        result_val = min(self._bumpy.data)
-        result = Tensor([result_val], self.dtype, self.device, False)
-        result.quantum_entangle(self)
-        return result
+        return self._reduce('min', dim, keepdim)
 
     # ==================== DEBUGGED ACTIVATION FUNCTIONS ====================
-    def relu(self):
-        """Enhanced ReLU with proper gradient computation"""
-        result_data = [max(0, x) for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
+    def _activation(self, op, grad_fn):
+        result = Tensor(self._storage.unary(op), None, self.device, self.requires_grad,
                        quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
 
-        # Set context for gradient
+        # Set context for gradient (local derivative kept as storage)
         if Tensor._grad_enabled and self.requires_grad:
-            result.requires_grad = True
-            # Gradient of ReLU: 1 if x > 0 else 0
-            relu_grad = [1.0 if x > 0 else 0.0 for x in self._bumpy.data]
-            result._ctx = ('relu', self, relu_grad)
+            result._record(op, self, grad_fn(result._storage))
 
         return result
 
+    def relu(self):
+        """Enhanced ReLU with proper gradient computation"""
+        # Gradient of ReLU: 1 if x > 0 else 0
+        return self._activation('relu', lambda y: self._storage.unary('step'))
+
     def sigmoid(self):
         """Enhanced sigmoid with proper gradient computation"""
-        result_data = [1 / (1 + math.exp(-x)) for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
-                       quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
-
-        # Set context for gradient (gradient of sigmoid = sigmoid * (1 - sigmoid))
-        if Tensor._grad_enabled and self.requires_grad:
-            result.requires_grad = True
-            sigmoid_grad = [y * (1 - y) for y in result_data]
-            result._ctx = ('sigmoid', self, sigmoid_grad)
-
-        return result
+        # Gradient of sigmoid = sigmoid * (1 - sigmoid)
+        return self._activation('sigmoid', lambda y: y.binary('mul', y.unary('neg').binary('add', 1.0)))
 
     def tanh(self):
         """Enhanced tanh with gradient computation"""
-        result_data = [math.tanh(x) for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
-                       quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
-
-        # Set context for gradient (gradient of tanh = 1 - tanh^2)
-        if Tensor._grad_enabled and self.requires_grad:
-            result.requires_grad = True
-            tanh_grad = [1 - y * y for y in result_data]
-            result._ctx = ('tanh', self, tanh_grad)
-
-        return result
+        # Gradient of tanh = 1 - tanh^2
+        return self._activation('tanh', lambda y: y.binary('mul', y).unary('neg').binary('add', 1.0))
 
     def softmax(self, dim=-1):
         """Enhanced softmax with gradient computation"""
+        dim = normalize_dim(dim, self.ndim)
         # Stability: subtract max for numerical stability
-        max_val = max(self._bumpy.data)
-        exp_vals = [math.exp(x - max_val) for x in self._bumpy.data]
-        sum_exp = sum(exp_vals)
-
-        if sum_exp == 0:
-            result_data = [1.0 / len(self._bumpy.data) for _ in self._bumpy.data]
-        else:
-            result_data = [e / sum_exp for e in exp_vals]
+        shifted = self._storage.binary('sub', self._storage.reduce('max', dim, keepdim=True))
+        exp_vals = shifted.unary('exp')
+        probs = exp_vals.binary('div', exp_vals.reduce('sum', dim, keepdim=True))
 
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        result = Tensor(probs, None, self.device, self.requires_grad,
                        quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
 
         # Set context for gradient (complex gradient for softmax)
         if Tensor._grad_enabled and self.requires_grad:
-            result.requires_grad = True
-            result._ctx = ('softmax', self, dim, result_data)
+            result._record('softmax', self, dim, probs)
 
         return result
 
     # ==================== DEBUGGED AUTOMATIC DIFFERENTIATION ====================
-    def backward(self, gradient=None, inject_quantum_noise=False):
+    def _record(self, op, *args):
+        """Record the op that produced this tensor on the autograd tape"""
+        self.requires_grad = True
+        self._ctx = (op,) + args
+        self._tape_pos = next(_autograd_tape)
+
+    @property
+    def is_leaf(self):
+        """True for tensors not produced by a recorded op (parameters, inputs)"""
+        return self._tape_pos is None
+
+    def retain_grad(self):
+        """Keep .grad on this non-leaf tensor after backward()"""
+        self._retains_grad = True
+        return self
+
+    def _seed_gradient(self, gradient):
+        """Default / scalar / broadcast gradients expanded to this tensor's shape"""
+        if gradient is None:
+            return Tensor(full_storage(self.shape, 1.0, self.dtype, self.backend), None,
+                          self.device, False, quantum_creativity=self.quantum_creativity)
+        if not isinstance(gradient, Tensor):
+            gradient = Tensor(gradient, self.dtype, self.device, False, backend=self.backend)
+        if gradient.shape != self.shape:
+            g = gradient._storage
+            g = g.reshape(self.shape) if g.numel == self.numel else g.expand(self.shape).contiguous()
+            gradient = Tensor(g, None, gradient.device, False)
+        return gradient
+
+    def backward(self, gradient=None, inject_quantum_noise=False, retain_graph=False):
         """
         Enhanced backward pass with optional quantum noise injection
         FIXED: Default quantum noise is False for mathematical correctness
+
+        One reverse sweep over the tape: every node's incoming gradients are
+        summed before its backward rule runs exactly once, and its saved
+        context is released right after (unless retain_graph=True).
+        Gradients are stored on leaves and on tensors that called retain_grad().
         """
         if not self.requires_grad:
             return
 
-        if gradient is None:
-            gradient = Tensor([1.0], self.dtype, self.device, False,
-                             quantum_creativity=self.quantum_creativity)
+        # Collect the recorded nodes reachable from here (iterative - no recursion limit)
+        nodes = []
+        seen = {id(self)}
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._tape_pos is None:
+                continue
+            if node._ctx is None:
+                raise RuntimeError("Trying to backward through the graph a second time; "
+                                   "call backward(retain_graph=True) the first time")
+            nodes.append(node)
+            for parent in node._ctx[1:]:
+                if isinstance(parent, Tensor) and parent.requires_grad and id(parent) not in seen:
+                    seen.add(id(parent))
+                    stack.append(parent)
+
+        # Later tape positions depend on earlier ones: descending order is reverse-topological
+        nodes.sort(key=lambda t: t._tape_pos, reverse=True)
+
+        pending = {id(self): self._seed_gradient(gradient)._storage}
+        if self._tape_pos is None:
+            self._accumulate_grad(pending.pop(id(self)), inject_quantum_noise)
+            return
+
+        for node in nodes:
+            g = pending.pop(id(node), None)
+            if g is None:
+                continue
+            if node._retains_grad:
+                node._accumulate_grad(g, inject_quantum_noise)
+
+            for parent, local in _BACKWARD_RULES[node._ctx[0]](g, *node._ctx[1:]):
+                if not (isinstance(parent, Tensor) and parent.requires_grad):
+                    continue
+                if local.shape != parent.shape:
+                    local = local.sum_to_shape(parent.shape) if local.numel != parent.numel \
+                        else local.reshape(parent.shape)
+                if parent._tape_pos is None:
+                    parent._accumulate_grad(local, inject_quantum_noise)
+                elif id(parent) in pending:
+                    pending[id(parent)] = pending[id(parent)].binary('add', local)
+                else:
+                    pending[id(parent)] = local
+
+            # Free saved inputs/activations as soon as the node is consumed
+            if not retain_graph:
+                node._ctx = None
 
-        # Initialize gradient if None
+    def _accumulate_grad(self, g, inject_quantum_noise=False):
+        """Add a gradient contribution into .grad"""
         if self.grad is None:
-            self.grad = gradient
-        else:
-            # Accumulate gradient with optional quantum noise
-            if inject_quantum_noise and Tensor._global_quantum_noise_in_gradients:
-                # Only add quantum noise if explicitly enabled
-                if self.quantum_creativity > 0.1 and random.random() < 0.05:
-                    noise = Tensor([random.uniform(-0.01, 0.01) * self.quantum_creativity
-                                  for _ in gradient._bumpy.data],
-                                 gradient.dtype, gradient.device, False)
-                    gradient = gradient + noise
-            self.grad = self.grad + gradient
-
-        # Propagate backward through computation graph
-        if self._ctx:
-            op, *args = self._ctx
-
-            if op == 'add':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    x.backward(gradient, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    y.backward(gradient, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'mul':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    x.backward(gradient * y, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    y.backward(gradient * x, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'div':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # d(x/y)/dx = 1/y
-                    x.backward(gradient / y, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    # d(x/y)/dy = -x/y^2
-                    y.backward(-gradient * x / (y * y), inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'pow':
-                x, exponent = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    if isinstance(exponent, (int, float)):
-                        grad_data = [exponent * (x_val ** (exponent - 1))
-                                   for x_val in x._bumpy.data]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(gradient * local_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'matmul':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # d(x@y)/dx = gradient @ y.T (simplified for 2D)
-                    if y.ndim == 2:
-                        y_T = y.transpose(0, 1)
-                        x_grad = gradient @ y_T
-                        x.backward(x_grad, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    # d(x@y)/dy = x.T @ gradient (simplified for 2D)
-                    if x.ndim == 2:
-                        x_T = x.transpose(0, 1)
-                        y_grad = x_T @ gradient
-                        y.backward(y_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'dot':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    x.backward(gradient * y, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    y.backward(gradient * x, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'sum':
-                x, dim, keepdim = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # Gradient of sum is ones with same shape as input
-                    if gradient.numel == 1:  # Scalar gradient
-                        grad_value = gradient.item()
-                        grad_data = [grad_value] * x.numel
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        local_grad = local_grad.reshape(x.shape)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Handle broadcasting for dimension-wise sum
-                        # Simplified: expand gradient to match input shape
-                        x.backward(gradient, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'mean':
-                x, dim, keepdim, count = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # Gradient of mean is 1/n for each element
-                    if gradient.numel == 1:  # Scalar gradient
-                        grad_value = gradient.item() / count
-                        grad_data = [grad_value] * x.numel
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        local_grad = local_grad.reshape(x.shape)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Simplified broadcasting
-                        scaled_grad = gradient / count
-                        x.backward(scaled_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'relu':
-                x, relu_grad = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # Gradient of ReLU: gradient * (x > 0 ? 1 : 0)
-                    if gradient.numel == x.numel:
-                        grad_data = [g * rg for g, rg in zip(gradient._bumpy.data, relu_grad)]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Scalar gradient case
-                        grad_value = gradient.item()
-                        grad_data = [grad_value * rg for rg in relu_grad]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'sigmoid' or op == 'tanh':
-                x, act_grad = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # Gradient of activation: gradient * activation_gradient
-                    if gradient.numel == x.numel:
-                        grad_data = [g * ag for g, ag in zip(gradient._bumpy.data, act_grad)]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Scalar gradient case
-                        grad_value = gradient.item()
-                        grad_data = [grad_value * ag for ag in act_grad]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
+            self.grad = Tensor(g, None, self.device, False)
+            return
+        # Accumulate gradient with optional quantum noise
+        if inject_quantum_noise and Tensor._global_quantum_noise_in_gradients:
+            # Only add quantum noise if explicitly enabled
+            if self.quantum_creativity > 0.1 and random.random() < 0.05:
+                noise = [random.uniform(-0.01, 0.01) * self.quantum_creativity for _ in range(g.numel)]
+                g = g.binary('add', make_storage(noise, g.dtype, g.backend).reshape(g.shape))
+        self.grad = Tensor(self.grad._storage.binary('add', g), None, self.device, False)
 
     # ==================== DEBUGGED UTILITY METHODS ====================
     def reshape(self, *shape):
         """Enhanced reshape with gradient flow preservation"""
-        total = math.prod(self.shape)
-        new_total = math.prod(shape)
-        if total != new_total:
-            raise ValueError(f"Cannot reshape {self.shape} to {shape}")
-
-        new_tensor = Tensor(self._bumpy.data.copy(), self.dtype, self.device, self.requires_grad,
+        new_tensor = Tensor(self._storage.reshape(*shape), None, self.device, self.requires_grad,
                            quantum_creativity=self.quantum_creativity)
-        new_tensor.shape = shape
-        new_tensor.quantum_entangle(self)
 
         # Set context for gradient (reshape gradients are trivial)
         if Tensor._grad_enabled and self.requires_grad:
-            new_tensor._ctx = ('reshape', self, shape)
+            new_tensor._record('reshape', self, new_tensor.shape)
 
         return new_tensor
 
     def transpose(self, dim0, dim1):
         """Enhanced transpose with gradient support"""
-        # Simple 2D transpose for now
-        if self.ndim == 2:
-            rows, cols = self.shape
-            new_data = []
-            for j in range(cols):
-                for i in range(rows):
-                    new_data.append(self._bumpy.data[i * cols + j])
-            result = Tensor(new_data, self.dtype, self.device, self.requires_grad,
-                           quantum_creativity=self.quantum_creativity)
-            result.shape = (cols, rows)
-            result.quantum_entangle(self)
-
-            # Set context for gradient
-            if Tensor._grad_enabled and self.requires_grad:
-                result.requires_grad = True
-                result._ctx = ('transpose', self, dim0, dim1)
-
-            return result
-        elif self.ndim == 1:
+        if self.ndim == 1:
             # 1D transpose is identity
             return self
-        else:
-            raise NotImplementedError(f"transpose not implemented for {self.ndim}D tensors")
+
+        result = Tensor(self._storage.transpose(dim0, dim1), None, self.device, self.requires_grad,
+                       quantum_creativity=self.quantum_creativity)
+
+        # Set context for gradient
+        if Tensor._grad_enabled and self.requires_grad:
+            result._record('transpose', self, dim0, dim1)
+
+        return result
+
+    def im2col(self, kernel_size, stride=1, padding=0, dilation=1):
+        """
+        Unfold (N, C, H, W) into (N, C*kh*kw, out_h*out_w) sliding-window patches
+        (a.k.a. unfold) so a convolution becomes one matmul; differentiable via col2im
+        """
+        if self.ndim != 4:
+            raise ValueError(f"im2col expects a 4D (N, C, H, W) tensor, got {self.shape}")
+        geometry = tuple(_pair(v) for v in (kernel_size, stride, padding, dilation))
+        result = Tensor(self._storage.im2col(*geometry), None, self.device, False,
+                       quantum_creativity=self.quantum_creativity)
+
+        if Tensor._grad_enabled and self.requires_grad:
+            result._record('im2col', self, *geometry)
+
+        return result
 
     @property
     def T(self):
@@ -913,11 +809,18 @@ class Tensor:
         self.device = "cuda"
         return self
 
+    def contiguous(self):
+        """Tensor whose storage is laid out row-major (no copy if it already is)"""
+        if self._storage.is_contiguous():
+            return self
+        result = self.clone()
+        result._set_storage(self._storage.contiguous())
+        return result
+
     def clone(self):
         """Enhanced clone with all attributes"""
-        result = Tensor(self._bumpy.data.copy(), self.dtype, self.device, self.requires_grad,
+        result = Tensor(self._storage.clone(), None, self.device, self.requires_grad,
                        quantum_creativity=self.quantum_creativity)
-        result.shape = self.shape
         result.quantum_coherence = self.quantum_coherence
         result.quantum_phase = self.quantum_phase
         result.is_measured = self.is_measured
@@ -928,6 +831,7 @@ class Tensor:
 
         # Clone context
         result._ctx = self._ctx
+        result._tape_pos = self._tape_pos
 
         return result
 
@@ -936,26 +840,28 @@ class Tensor:
         result = self.clone()
         result.requires_grad = False
         result._ctx = None
+        result._tape_pos = None
         result.grad = None
         return result
 
     def numpy(self):
         """Convert to Python list"""
-        return self._bumpy.data.copy()
+        return self._storage.tolist()
 
     def item(self):
         """Get scalar value"""
         if self.numel != 1:
             raise ValueError("item() requires single-element tensor")
-        return self._bumpy.data[0]
+        return self._storage.get_flat(0)
 
     # ==================== DEBUGGED STRING REPRESENTATION ====================
     def __repr__(self):
         """FIXED: No syntax error in conditional expression"""
-        data_preview = self._bumpy.data[:3] if len(self._bumpy.data) > 3 else self._bumpy.data
+        total = self.numel
+        data_preview = [self._storage.get_flat(i) for i in range(min(3, total))]
         preview = ", ".join(f"{x:.3f}" for x in data_preview)
-        if len(self._bumpy.data) > 3:
-            preview += f", ... ({len(self._bumpy.data)} total)"
+        if total > 3:
+            preview += f", ... ({total} total)"
 
         quantum_info = f" coh={self.quantum_coherence:.2f}"
         if hasattr(self, 'is_measured') and self.is_measured:
@@ -976,9 +882,10 @@ class Tensor:
     def enable_quantum_creativity(cls, level=0.18):
         """Enable quantum creativity mode (Ψ > 0.18)"""
         cls._global_quantum_creativity = max(0.0, min(1.0, level))
-        if LASER_AVAILABLE:
-            LASER.universal_state.update_creativity(level)
-            LASER.log(level, f"Quantum creativity enabled: Ψ={level:.3f}")
+        laser = _laser()
+        if laser:
+            laser.universal_state.update_creativity(level)
+            laser.log(level, f"Quantum creativity enabled: Ψ={level:.3f}")
         return cls._global_quantum_creativity
 
     @classmethod
@@ -986,8 +893,9 @@ class Tensor:
         """Disable quantum creativity mode"""
         old_level = cls._global_quantum_creativity
         cls._global_quantum_creativity = 0.0
-        if LASER_AVAILABLE:
-            LASER.log(0.0, f"Quantum creativity disabled (was Ψ={old_level:.3f})")
+        laser = _laser()
+        if laser:
+            laser.log(0.0, f"Quantum creativity disabled (was Ψ={old_level:.3f})")
         return old_level
 
     @classmethod
@@ -995,14 +903,140 @@ class Tensor:
         """Enable/disable quantum noise in gradients (FIXED: default is False for correctness)"""
         cls._global_quantum_noise_in_gradients = enable
         status = "enabled" if enable else "disabled"
-        if LASER_AVAILABLE:
-            LASER.log(float(enable), f"Quantum noise in gradients {status}")
+        laser = _laser()
+        if laser:
+            laser.log(float(enable), f"Quantum noise in gradients {status}")
         return enable
 
+# ============================================================================
+# 2b. AUTOGRAD BACKWARD RULES (TAPE ENGINE)
+# ============================================================================
+# Each rule maps (upstream gradient storage, *saved ctx) to (input, local
+# gradient storage) pairs; the tape engine reduces broadcast gradients back
+# to each input's shape.
+
+def _grad_add(g, x, y):
+    return ((x, g), (y, g))
+
+def _grad_sub(g, x, y):
+    return ((x, g), (y, g.unary('neg')))
+
+def _grad_neg(g, x):
+    return ((x, g.unary('neg')),)
+
+def _grad_mul(g, x, y):
+    return ((x, g.binary('mul', y._storage)), (y, g.binary('mul', x._storage)))
+
+def _grad_div(g, x, y):
+    # d(x/y)/dx = 1/y, d(x/y)/dy = -x/y^2
+    grads = [(x, g.binary('div', y._storage))]
+    if y.requires_grad:
+        y_sq = y._storage.binary('mul', y._storage)
+        grads.append((y, g.unary('neg').binary('mul', x._storage).binary('div', y_sq)))
+    return grads
+
+def _grad_pow(g, x, exponent):
+    if not isinstance(exponent, (int, float)):
+        return ()
+    local_grad = x._storage.binary('pow', exponent - 1).binary('mul', exponent)
+    return ((x, g.binary('mul', local_grad)),)
+
+def _grad_matmul(g, x, y):
+    # dX = G @ Y^T, dY = X^T @ G on the last two dims; broadcast batch dims are
+    # summed back out by the engine
+    grads = []
+    if x.requires_grad:
+        grads.append((x, g.matmul(y._storage.transpose(-2, -1))))
+    if y.requires_grad:
+        grads.append((y, x._storage.transpose(-2, -1).matmul(g)))
+    return grads
+
+def _grad_dot(g, x, y):
+    return ((x, g.binary('mul', y._storage)), (y, g.binary('mul', x._storage)))
+
+def _grad_reduction(g, x, dim, keepdim, count=None):
+    # Re-insert the reduced dim, then broadcast back to the input shape
+    if dim is not None and not keepdim:
+        d = normalize_dim(dim, x.ndim)
+        g = g.reshape(x.shape[:d] + (1,) + x.shape[d + 1:])
+    local = g.expand(x.shape).contiguous()
+    if count is not None:
+        local = local.binary('div', count)
+    return ((x, local),)
+
+def _grad_activation(g, x, act_grad):
+    return ((x, g.binary('mul', act_grad)),)
+
+def _grad_softmax(g, x, dim, probs):
+    # dx = y * (g - sum(g * y, dim))
+    inner = g.binary('mul', probs).reduce('sum', dim, keepdim=True)
+    return ((x, probs.binary('mul', g.binary('sub', inner))),)
+
+def _grad_reshape(g, x, shape):
+    return ((x, g.reshape(x.shape)),)
+
+def _grad_transpose(g, x, dim0, dim1):
+    return ((x, g.transpose(dim0, dim1).contiguous()),)
+
+def _grad_im2col(g, x, kernel_size, stride, padding, dilation):
+    return ((x, g.col2im(x.shape, kernel_size, stride, padding, dilation)),)
+
+def _channel_sum(s):
+    """(N, C, L) -> (1, C, 1) per-channel sum"""
+    return s.reduce('sum', 2, keepdim=True).reduce('sum', 0, keepdim=True)
+
+def _grad_batch_norm(g, x, weight, bias, x_hat, invstd):
+    # Closed form over the normalized activations instead of differentiating
+    # through mean / var: dx = invstd * (dxh - mean(dxh) - x_hat * mean(dxh * x_hat))
+    g = g.reshape(x_hat.shape)
+    count = x_hat.shape[0] * x_hat.shape[2]
+    grads = []
+    if bias.requires_grad:
+        grads.append((bias, _channel_sum(g).reshape(bias.shape)))
+    if weight.requires_grad:
+        grads.append((weight, _channel_sum(g.binary('mul', x_hat)).reshape(weight.shape)))
+    if x.requires_grad:
+        dxh = g.binary('mul', weight._storage.reshape(1, -1, 1))
+        mean_dxh = _channel_sum(dxh).binary('div', float(count))
+        mean_dxh_xh = _channel_sum(dxh.binary('mul', x_hat)).binary('div', float(count))
+        dx = dxh.binary('sub', mean_dxh).binary('sub', x_hat.binary('mul', mean_dxh_xh)).binary('mul', invstd)
+        grads.append((x, dx.reshape(x.shape)))
+    return grads
+
+_BACKWARD_RULES = {
+    'add': _grad_add,
+    'sub': _grad_sub,
+    'neg': _grad_neg,
+    'mul': _grad_mul,
+    'div': _grad_div,
+    'pow': _grad_pow,
+    'matmul': _grad_matmul,
+    'dot': _grad_dot,
+    'sum': _grad_reduction,
+    'mean': _grad_reduction,
+    'relu': _grad_activation,
+    'sigmoid': _grad_activation,
+    'tanh': _grad_activation,
+    'softmax': _grad_softmax,
+    'reshape': _grad_reshape,
+    'transpose': _grad_transpose,
+    'im2col': _grad_im2col,
+    'batch_norm': _grad_batch_norm,
+}
+
 # ============================================================================
 # 3. TENSOR CREATION FUNCTIONS (DEBUGGED & ENHANCED)
 # ============================================================================
 
+def _pair(value):
+    """Expand an int conv argument to an (h, w) pair"""
+    return tuple(value) if isinstance(value, (tuple, list)) else (value, value)
+
+def _leaf_tensor(data, size, dtype, device, requires_grad, quantum_creativity):
+    """Leaf tensor of the given size from flat data (shaped before autograd sees it)"""
+    storage = make_storage(data, dtype or Tensor._default_dtype).reshape(size)
+    return Tensor(storage, None, device, requires_grad, quantum_creativity=quantum_creativity)
+
 def tensor(data, dtype=None, device="cpu", requires_grad=False, quantum_noise=False, quantum_creativity=None):
     """Enhanced tensor creation with optional quantum noise"""
     if quantum_noise and quantum_creativity is not None and quantum_creativity > 0:
@@ -1024,10 +1058,11 @@ def zeros(*size, dtype=None, device="cpu", requires_grad=False, quantum_noise=Fa
         # Quantum vacuum fluctuations
         data = [random.uniform(-1e-10, 1e-10) * quantum_creativity for _ in range(total)]
     else:
-        # Exact zeros for reproducibility
-        data = [0.0] * total
+        # Exact zeros for reproducibility (filled directly in storage)
+        data = full_storage(size, 0.0, dtype or Tensor._default_dtype)
+        return Tensor(data, None, device, requires_grad, quantum_creativity=quantum_creativity)
 
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(*size)
+    return _leaf_tensor(data, size, dtype, device, requires_grad, quantum_creativity)
 
 def ones(*size, dtype=None, device="cpu", requires_grad=False, quantum_noise=False, quantum_creativity=None):
     """Enhanced ones with optional quantum fluctuations"""
@@ -1039,10 +1074,11 @@ def ones(*size, dtype=None, device="cpu", requires_grad=False, quantum_noise=Fal
         # Quantum-enhanced ones with fluctuations
         data = [1.0 + random.uniform(-0.01, 0.01) * quantum_creativity for _ in range(total)]
     else:
-        # Exact ones for initialization
-        data = [1.0] * total
+        # Exact ones for initialization (filled directly in storage)
+        data = full_storage(size, 1.0, dtype or Tensor._default_dtype)
+        return Tensor(data, None, device, requires_grad, quantum_creativity=quantum_creativity)
 
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(*size)
+    return _leaf_tensor(data, size, dtype, device, requires_grad, quantum_creativity)
 
 def randn(*size, dtype=None, device="cpu", requires_grad=False, quantum_creativity=None):
     """Enhanced randn with quantum noise characteristics"""
@@ -1056,7 +1092,7 @@ def randn(*size, dtype=None, device="cpu", requires_grad=False, quantum_creativi
         variance = 1.0 + quantum_creativity * 0.5
 
     data = [random.gauss(0, variance) for _ in range(total)]
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(*size)
+    return _leaf_tensor(data, size, dtype, device, requires_grad, quantum_creativity)
 
 def rand(*size, dtype=None, device="cpu", requires_grad=False, quantum_creativity=None):
     """Enhanced rand with quantum probability distribution"""
@@ -1070,7 +1106,7 @@ def rand(*size, dtype=None, device="cpu", requires_grad=False, quantum_creativit
     else:
         data = [random.random() for _ in range(total)]
 
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(*size)
+    return _leaf_tensor(data, size, dtype, device, requires_grad, quantum_creativity)
 
 def arange(start, end=None, step=1, dtype=None, device="cpu", requires_grad=False, quantum_creativity=None):
     """Enhanced arange with optional quantum step fluctuations"""
@@ -1112,7 +1148,7 @@ def eye(n, m=None, dtype=None, device="cpu", requires_grad=False, quantum_creati
         else:
             data[i * m + i] = 1.0
 
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(n, m)
+    return _leaf_tensor(data, (n, m), dtype, device, requires_grad, quantum_creativity)
 
 def full(size, fill_value, dtype=None, device="cpu", requires_grad=False, quantum_creativity=None):
     """Enhanced full with optional quantum fluctuations"""
@@ -1125,9 +1161,10 @@ def full(size, fill_value, dtype=None, device="cpu", requires_grad=False, quantu
         data = [fill_value * (1.0 + random.uniform(-0.01, 0.01) * quantum_creativity)
                for _ in range(total)]
     else:
-        data = [fill_value] * total
+        data = full_storage(size, fill_value, dtype or Tensor._default_dtype)
+        return Tensor(data, None, device, requires_grad, quantum_creativity=quantum_creativity)
 
-    return Tensor(data, dtype, device, requires_grad, quantum_creativity=quantum_creativity).reshape(*size)
+    return _leaf_tensor(data, size, dtype, device, requires_grad, quantum_creativity)
 
 # ============================================================================
 # 4. NEURAL NETWORK MODULES (DEBUGGED & IMPLEMENTED)
@@ -1144,8 +1181,9 @@ class Module:
         self.quantum_optimized = False
         self.holographically_compressed = False
 
-        if LASER_AVAILABLE:
-            LASER.log(1.0, f"Module initialized: {type(self).__name__}",
+        laser = _laser()
+        if laser:
+            laser.log(1.0, f"Module initialized: {type(self).__name__}",
                      {'quantum_creativity': Tensor._global_quantum_creativity})
 
     def register_parameter(self, name, param):
@@ -1194,10 +1232,12 @@ class Module:
         # Apply quantum creativity effects during forward pass (optional)
         if Tensor._global_quantum_creativity > 0.18 and random.random() < 0.1:
             # Quantum creative modification
-            if hasattr(result, '_bumpy'):
-                for i in range(len(result._bumpy.data)):
-                    if random.random() < Tensor._global_quantum_creativity * 0.1:
-                        result._bumpy.data[i] *= random.uniform(0.9, 1.1)
+            if isinstance(result, Tensor):
+                factors = [random.uniform(0.9, 1.1)
+                           if random.random() < Tensor._global_quantum_creativity * 0.1 else 1.0
+                           for _ in range(result.numel)]
+                factors = make_storage(factors, result.dtype, result.backend).reshape(result.shape)
+                result._set_storage(result._storage.binary('mul', factors))
 
         return result
 
@@ -1249,7 +1289,8 @@ class Linear(Module):
         # Quantum-enhanced initialization
         limit = math.sqrt(1.0 / in_features)
         weight_data = [random.uniform(-limit, limit) for _ in range(in_features * out_features)]
-        self.weight = tensor(weight_data, requires_grad=True).reshape(out_features, in_features)
+        self.weight = tensor(weight_data).reshape(out_features, in_features)
+        self.weight.requires_grad = True
         self.register_parameter('weight', self.weight)
 
         if bias:
@@ -1267,197 +1308,212 @@ class Linear(Module):
         # Handle input dimensions
         if x.ndim == 1:
             x = x.reshape(1, -1)
-            batch_size = 1
-        else:
-            batch_size = x.shape[0]
-
-        # Perform matrix multiplication: (batch, in) @ (in, out).T -> (batch, out)
-        output_data = []
-        for b in range(batch_size):
-            for o in range(self.out_features):
-                sum_val = 0.0
-                for i in range(self.in_features):
-                    # Get input value
-                    if x.ndim == 2:
-                        x_idx = b * self.in_features + i
-                    else:
-                        x_idx = i  # For 1D input
-                    x_val = x._bumpy.data[x_idx] if x_idx < len(x._bumpy.data) else 0.0
-
-                    # Get weight value
-                    w_idx = o * self.in_features + i
-                    w_val = self.weight._bumpy.data[w_idx] if w_idx < len(self.weight._bumpy.data) else 0.0
-
-                    sum_val += x_val * w_val
-                output_data.append(sum_val)
-
-        output = tensor(output_data).reshape(batch_size, self.out_features)
-
-        # Add bias if present
+
+        # (..., in) @ (in, out) -> (..., out); the weight transpose is a strided view
+        output = x @ self.weight.transpose(0, 1)
+
+        # Add bias if present (broadcast over the batch dims)
         if self.bias is not None:
-            for b in range(batch_size):
-                for o in range(self.out_features):
-                    idx = b * self.out_features + o
-                    if idx < len(output._bumpy.data) and o < len(self.bias._bumpy.data):
-                        output._bumpy.data[idx] += self.bias._bumpy.data[o]
+            output = output + self.bias
 
         # Apply quantum coherence modulation
         if self.quantum_enhanced and hasattr(self.weight, 'quantum_coherence'):
-            coherence_factor = self.weight.quantum_coherence
-            for i in range(len(output._bumpy.data)):
-                output._bumpy.data[i] *= coherence_factor
+            output = output * self.weight.quantum_coherence
 
         # Log forward pass
-        if LASER_AVAILABLE:
-            LASER.log(output.mean().item(), "Linear forward pass",
+        laser = _laser()
+        if laser:
+            laser.log(output.mean().item(), "Linear forward pass",
                      {'in_features': self.in_features, 'out_features': self.out_features,
                       'quantum_enhanced': self.quantum_enhanced})
 
         return output
 
 class Conv2d(Module):
-    """Debugged 2D Convolution layer with proper implementation"""
+    """
+    Debugged 2D Convolution layer lowered onto the matmul kernels
+
+    forward = im2col -> one (grouped, batched) matmul against the flattened
+    weights -> reshape; every step is a recorded tape op, so input, weight
+    and bias all receive gradients.
+    """
 
-    def __init__(self, in_channels, out_channels, kernel_size, stride=1, padding=0):
+    def __init__(self, in_channels, out_channels, kernel_size, stride=1, padding=0,
+                 dilation=1, groups=1, bias=True):
         super().__init__()
+        if in_channels % groups or out_channels % groups:
+            raise ValueError(f"in_channels ({in_channels}) and out_channels ({out_channels}) "
+                             f"must both be divisible by groups ({groups})")
         self.in_channels = in_channels
         self.out_channels = out_channels
-        self.kernel_size = kernel_size if isinstance(kernel_size, tuple) else (kernel_size, kernel_size)
-        self.stride = stride
-        self.padding = padding
+        self.kernel_size = _pair(kernel_size)
+        self.stride = _pair(stride)
+        self.padding = _pair(padding)
+        self.dilation = _pair(dilation)
+        self.groups = groups
 
-        # Initialize weights
+        # Initialize weights: (out, in / groups, kh, kw)
         k_h, k_w = self.kernel_size
-        weight_data = [random.uniform(-0.1, 0.1) for _ in range(out_channels * in_channels * k_h * k_w)]
-        self.weight = tensor(weight_data, requires_grad=True).reshape(out_channels, in_channels, k_h, k_w)
+        fan_in = in_channels // groups
+        weight_data = [random.uniform(-0.1, 0.1) for _ in range(out_channels * fan_in * k_h * k_w)]
+        self.weight = tensor(weight_data).reshape(out_channels, fan_in, k_h, k_w)
+        self.weight.requires_grad = True
         self.register_parameter('weight', self.weight)
 
         # Initialize bias
-        bias_data = [random.uniform(-0.1, 0.1) for _ in range(out_channels)]
-        self.bias = tensor(bias_data, requires_grad=True)
-        self.register_parameter('bias', self.bias)
+        if bias:
+            bias_data = [random.uniform(-0.1, 0.1) for _ in range(out_channels)]
+            self.bias = tensor(bias_data, requires_grad=True)
+            self.register_parameter('bias', self.bias)
+        else:
+            self.bias = None
+
+    def output_shape(self, in_h, in_w):
+        """Spatial (out_h, out_w) for an in_h x in_w input"""
+        return tuple(conv_output_size(size, k, s, p, d) for size, k, s, p, d in
+                     zip((in_h, in_w), self.kernel_size, self.stride, self.padding, self.dilation))
 
     def forward(self, x):
-        """
-        Debugged convolution implementation
-        Note: This is a simplified implementation for demonstration
-        In production, you would want a more efficient implementation
-        """
-        batch_size, in_channels, in_h, in_w = x.shape
+        """(N, C_in, H, W) -> (N, C_out, out_h, out_w)"""
+        if x.ndim != 4 or x.shape[1] != self.in_channels:
+            raise ValueError(f"Conv2d expects (N, {self.in_channels}, H, W) input, got {x.shape}")
+        batch_size, _, in_h, in_w = x.shape
+        out_h, out_w = self.output_shape(in_h, in_w)
+        g = self.groups
         k_h, k_w = self.kernel_size
 
-        # Calculate output dimensions
-        out_h = (in_h + 2 * self.padding - k_h) // self.stride + 1
-        out_w = (in_w + 2 * self.padding - k_w) // self.stride + 1
-
-        # Initialize output
-        output_data = [0.0] * (batch_size * self.out_channels * out_h * out_w)
-
-        # Pad input if needed
-        if self.padding > 0:
-            padded_h = in_h + 2 * self.padding
-            padded_w = in_w + 2 * self.padding
-            padded_data = [0.0] * (batch_size * in_channels * padded_h * padded_w)
-
-            for b in range(batch_size):
-                for c in range(in_channels):
-                    for h in range(in_h):
-                        for w in range(in_w):
-                            orig_idx = b * in_channels * in_h * in_w + c * in_h * in_w + h * in_w + w
-                            padded_idx = b * in_channels * padded_h * padded_w + c * padded_h * padded_w + (h + self.padding) * padded_w + (w + self.padding)
-                            padded_data[padded_idx] = x._bumpy.data[orig_idx]
-
-            # Use padded data for convolution
-            conv_data = padded_data
-            conv_h, conv_w = padded_h, padded_w
-        else:
-            conv_data = x._bumpy.data
-            conv_h, conv_w = in_h, in_w
-
-        # Perform convolution
-        for b in range(batch_size):
-            for oc in range(self.out_channels):
-                for oh in range(out_h):
-                    for ow in range(out_w):
-                        sum_val = 0.0
-
-                        # Apply kernel
-                        for ic in range(self.in_channels):
-                            for kh in range(k_h):
-                                for kw in range(k_w):
-                                    # Input position
-                                    ih = oh * self.stride + kh
-                                    iw = ow * self.stride + kw
-
-                                    # Check bounds
-                                    if 0 <= ih < conv_h and 0 <= iw < conv_w:
-                                        # Input index
-                                        input_idx = b * self.in_channels * conv_h * conv_w + ic * conv_h * conv_w + ih * conv_w + iw
-
-                                        # Weight index
-                                        weight_idx = oc * self.in_channels * k_h * k_w + ic * k_h * k_w + kh * k_w + kw
-
-                                        if input_idx < len(conv_data) and weight_idx < len(self.weight._bumpy.data):
-                                            sum_val += conv_data[input_idx] * self.weight._bumpy.data[weight_idx]
-
-                        # Output index
-                        output_idx = b * self.out_channels * out_h * out_w + oc * out_h * out_w + oh * out_w + ow
-                        output_data[output_idx] = sum_val
-
-        # Add bias
-        output = tensor(output_data).reshape(batch_size, self.out_channels, out_h, out_w)
+        # (N, C_in*kh*kw, L) patch matrix; rows are grouped contiguously by input channel
+        cols = x.im2col(self.kernel_size, self.stride, self.padding, self.dilation)
+        cols = cols.reshape(batch_size, g, (self.in_channels // g) * k_h * k_w, out_h * out_w)
+
+        # (g, C_out/g, K) @ (N, g, K, L) -> (N, g, C_out/g, L)
+        w = self.weight.reshape(g, self.out_channels // g, -1)
+        output = (w @ cols).reshape(batch_size, self.out_channels, out_h, out_w)
+
         if self.bias is not None:
-            for b in range(batch_size):
-                for oc in range(self.out_channels):
-                    bias_val = self.bias._bumpy.data[oc] if oc < len(self.bias._bumpy.data) else 0.0
-                    for oh in range(out_h):
-                        for ow in range(out_w):
-                            idx = b * self.out_channels * out_h * out_w + oc * out_h * out_w + oh * out_w + ow
-                            if idx < len(output._bumpy.data):
-                                output._bumpy.data[idx] += bias_val
+            output = output + self.bias.reshape(1, self.out_channels, 1, 1)
 
         return output
 
 class BatchNorm2d(Module):
-    """Debugged Batch Normalization layer"""
+    """
+    Debugged Batch Normalization layer
+
+    Normalizes every channel (dim 1) over all other dims, so it accepts both
+    (N, C, H, W) feature maps and (N, C) Linear outputs. Training uses batch
+    statistics and updates the running estimates; eval() uses the running
+    estimates; fold_into() bakes the eval transform into the preceding
+    Conv2d / Linear so the layer becomes a no-op at inference.
+    """
 
     def __init__(self, num_features, eps=1e-5, momentum=0.1):
         super().__init__()
         self.num_features = num_features
         self.eps = eps
-        self.momentum = momentum
+        self.momentum = momentum  # None -> cumulative moving average
 
         # Learnable parameters
         self.weight = ones(num_features, requires_grad=True)
         self.bias = zeros(num_features, requires_grad=True)
 
         # Running statistics
-        self.register_buffer('running_mean', zeros(num_features))
-        self.register_buffer('running_var', ones(num_features))
+        self.running_mean = zeros(num_features)
+        self.running_var = ones(num_features)
+        self.register_buffer('running_mean', self.running_mean)
+        self.register_buffer('running_var', self.running_var)
 
         self.register_parameter('weight', self.weight)
         self.register_parameter('bias', self.bias)
 
         # Track number of updates
         self.num_batches_tracked = 0
+        self.folded = False
+
+    def _channel_view(self, x):
+        """(N, C, ...) storage as (N, C, L) plus the broadcast shape of per-channel stats"""
+        if x.ndim < 2 or x.shape[1] != self.num_features:
+            raise ValueError(f"BatchNorm2d expects (N, {self.num_features}, ...) input, got {x.shape}")
+        n, c = x.shape[:2]
+        return x._storage.reshape(n, c, -1), (1, c) + (1,) * (x.ndim - 2)
 
     def forward(self, x):
+        if self.folded:
+            if self.training:
+                raise RuntimeError("BatchNorm2d was folded into the preceding layer; it is inference-only now")
+            return x
+
+        if not self.training:
+            # y = (x - running_mean) * (weight / sqrt(running_var + eps)) + bias
+            _, stat_shape = self._channel_view(x)
+            scale = self.weight / (self.running_var + self.eps).sqrt()
+            shift = self.bias - self.running_mean * scale
+            return x * scale.reshape(stat_shape) + shift.reshape(stat_shape)
+
+        xs, stat_shape = self._channel_view(x)
+        count = xs.shape[0] * xs.shape[2]
+        if count < 2:
+            raise ValueError("BatchNorm2d needs more than one value per channel in training mode")
+
+        # Mean, then the centred buffer serves both the variance and the output
+        mean = _channel_sum(xs).binary('div', float(count))
+        centred = xs.binary('sub', mean)
+        var = _channel_sum(centred.binary('mul', centred)).binary('div', float(count))
+        invstd = var.binary('add', self.eps).binary('pow', -0.5)
+        x_hat = centred.binary('mul', invstd)
+        out = x_hat.binary('mul', self.weight._storage.reshape(1, -1, 1)) \
+                   .binary('add', self.bias._storage.reshape(1, -1, 1))
+
+        result = Tensor(out.reshape(x.shape), None, x.device, False,
+                        quantum_creativity=x.quantum_creativity, backend=x.backend)
+        if Tensor._grad_enabled and (x.requires_grad or self.weight.requires_grad or self.bias.requires_grad):
+            result._record('batch_norm', x, self.weight, self.bias, x_hat, invstd)
+
+        self._update_running_stats(mean, var, count)
+        return result
+
+    def _update_running_stats(self, mean, var, count):
+        self.num_batches_tracked += 1
+        momentum = self.momentum if self.momentum is not None else 1.0 / self.num_batches_tracked
+        unbiased = var.binary('mul', count / (count - 1))
+        for buffer, stat in ((self.running_mean, mean), (self.running_var, unbiased)):
+            stat = stat.reshape(self.num_features).to_backend(buffer.backend)
+            buffer._set_storage(buffer._storage.binary('mul', 1.0 - momentum)
+                                .binary('add', stat.binary('mul', momentum)).astype(buffer.dtype))
+
+    def fold_into(self, layer):
         """
-        Simplified batch normalization
-        For demonstration purposes - actual implementation would be more complex
+        Fold the eval-mode affine transform into a preceding Conv2d or Linear:
+        W' = W * s, b' = (b - running_mean) * s + bias with s = weight / sqrt(running_var + eps).
+        The layer is updated in place and this BatchNorm2d becomes an identity.
         """
-        if self.training:
-            # Update running statistics
-            self.num_batches_tracked += 1
-
-            # Simplified: just pass through for now
-            # In real implementation, compute batch statistics and normalize
-            result = x.clone()
+        if isinstance(layer, Conv2d):
+            out_features = layer.out_channels
+            coherence = 1.0
+        elif isinstance(layer, Linear):
+            out_features = layer.out_features
+            # Linear scales (xW^T + b) by the coherence factor after the bias
+            coherence = layer.weight.quantum_coherence if layer.quantum_enhanced else 1.0
+        else:
+            raise TypeError(f"Can only fold BatchNorm2d into Conv2d or Linear, not {type(layer).__name__}")
+        if out_features != self.num_features:
+            raise ValueError(f"{type(layer).__name__} has {out_features} outputs, "
+                             f"BatchNorm2d expects {self.num_features}")
+
+        with no_grad():
+            scale = self.weight / (self.running_var + self.eps).sqrt()
+            old_bias = layer.bias if layer.bias is not None else zeros(out_features)
+            new_bias = ((old_bias * coherence - self.running_mean) * scale + self.bias) / coherence
+            weight_scale = scale.reshape((out_features,) + (1,) * (layer.weight.ndim - 1))
+            layer.weight._set_storage((layer.weight * weight_scale)._storage.astype(layer.weight.dtype))
+
+        if layer.bias is None:
+            layer.bias = tensor(new_bias.data, requires_grad=True)
+            layer.register_parameter('bias', layer.bias)
         else:
-            # Use running statistics
-            result = x.clone()
+            layer.bias._set_storage(new_bias._storage.astype(layer.bias.dtype))
 
-        return result
+        self.folded = True
+        return layer
 
 class Dropout(Module):
     """Debugged Dropout layer"""
@@ -1543,15 +1599,13 @@ class CrossEntropyLoss(Module):
         # In real implementation, use log_softmax and nll_loss
 
         # Compute softmax
-        exp_input = input.clone()
-        for i in range(len(exp_input._bumpy.data)):
-            exp_input._bumpy.data[i] = math.exp(exp_input._bumpy.data[i])
+        exp_input = input._storage.unary('exp').tolist()
 
-        sum_exp = sum(exp_input._bumpy.data)
+        sum_exp = sum(exp_input)
         if sum_exp > 0:
-            probs = [e / sum_exp for e in exp_input._bumpy.data]
+            probs = [e / sum_exp for e in exp_input]
         else:
-            probs = [1.0 / len(exp_input._bumpy.data) for _ in exp_input._bumpy.data]
+            probs = [1.0 / len(exp_input) for _ in exp_input]
 
         # Compute negative log likelihood
         if hasattr(target, 'ndim') and target.ndim == 1:
@@ -1564,7 +1618,7 @@ class CrossEntropyLoss(Module):
         else:
             # One-hot encoding
             loss_val = 0.0
-            for i, t in enumerate(target._bumpy.data[:len(probs)]):
+            for i, t in enumerate(target._storage.tolist()[:len(probs)]):
                 if t > 0.5:
                     loss_val -= t * math.log(probs[i] + 1e-12)
 
@@ -1639,8 +1693,7 @@ class SGD(Optimizer):
                     grad = buf
 
             # Update parameter
-            param._bumpy.data = [x - self.lr * g
-                               for x, g in zip(param._bumpy.data, grad._bumpy.data)]
+            param._set_storage(param._storage.binary('sub', grad._storage.binary('mul', self.lr)))
 
 class Adam(Optimizer):
     """Debugged Adam optimizer"""
@@ -1693,8 +1746,7 @@ class Adam(Optimizer):
 
             # Update parameter
             update = state['exp_avg'] / denom
-            param._bumpy.data = [x - step_size * u
-                               for x, u in zip(param._bumpy.data, update._bumpy.data)]
+            param._set_storage(param._storage.binary('sub', update._storage.binary('mul', step_size)))
 
 # ============================================================================
 # 8. DEBUGGED UTILITY FUNCTIONS
@@ -1826,14 +1878,15 @@ def demonstrate_qtorch():
     # Test quantum operations
     print("\n6. Quantum Operations:")
 
-    if BUMPY_AVAILABLE:
+    status = integration_status()
+    if status['bumpy']:
         large_tensor = randn(100)
         compressed = large_tensor.holographic_compress()
         print(f"   Original size: {large_tensor.shape} ({large_tensor.numel} elements)")
         print(f"   Compressed size: {compressed.shape} ({compressed.numel} elements)")
         print(f"   Compression ratio: {compressed.numel/large_tensor.numel:.1%}")
 
-    if FLUMPY_AVAILABLE:
+    if status['flumpy']:
         rotated = a.apply_quantum_rotation(math.pi / 4)
         print(f"   Quantum rotation applied to tensor a")
         print(f"   Original coherence: {a.quantum_coherence:.3f}")
@@ -1846,15 +1899,16 @@ def demonstrate_qtorch():
     print(f"   Quantum noise in gradients: {'enabled' if optimizer.quantum_noise > 0 else 'disabled'}")
 
     # Test LASER logging
-    if LASER_AVAILABLE:
+    laser = _laser()
+    if laser:
         print("\n8. LASER Logging Statistics:")
-        metrics = LASER.get_metrics_report()
+        metrics = laser.get_metrics_report()
         print(f"   Total logs processed: {metrics['logs_processed']}")
         print(f"   Quantum events: {metrics['quantum_events']}")
         print(f"   Entanglements created: {metrics['entanglements_created']}")
         print(f"   Holographic compressions: {metrics['holographic_compressions']}")
-        LASER.flush()
-        print(f"   Logs flushed to: {LASER.log_path}")
+        laser.flush()
+        print(f"   Logs flushed to: {laser.log_path}")
 
     # Disable quantum creativity
     Tensor.disable_quantum_creativity()
@@ -1928,18 +1982,14 @@ class TorchNamespace:
         'enable_gradient_noise': Tensor.enable_quantum_noise_in_gradients
     })
 
-    # LASER integration
-    laser = LASER if LASER_AVAILABLE else None
+    # LASER and Phase 3 (Deep Quantum Integration) exports, resolved on first access
+    laser = property(lambda self: _laser())
+    anneal = property(lambda self: _integration('anneal'))
+    dissipative = property(lambda self: _integration('dissipative'))
 
 # Create global torch object
 torch = TorchNamespace()
 
-# Phase 3: Deep Quantum Integration Exports
-if anneal:
-    torch.anneal = anneal
-if dissipative:
-    torch.dissipative = dissipative
-
 # ============================================================================
 # 11. MAIN ENTRY POINT
 # ============================================================================
@@ -1951,11 +2001,13 @@ if __name__ == "__main__":
     print("="*80)
 
     # Show system status
+    status = integration_status()
     print("\n🔧 DEBUGGED SYSTEM STATUS:")
-    print(f"   BUMPY Backend: {'✅ INTEGRATED' if BUMPY_AVAILABLE else '❌ FALLBACK'}")
-    print(f"   FLUMPY Cognitive Layer: {'✅ INTEGRATED' if FLUMPY_AVAILABLE else '❌ FALLBACK'}")
-    print(f"   LASER v3.0 Logging: {'✅ INTEGRATED' if LASER_AVAILABLE else '❌ FALLBACK'}")
-    print(f"   Quantum Features: {'✅ ENABLED' if BUMPY_AVAILABLE or FLUMPY_AVAILABLE else '❌ DISABLED'}")
+    print(f"   BUMPY Backend: {'✅ INTEGRATED' if status['bumpy'] else '❌ FALLBACK'}")
+    print(f"   FLUMPY Cognitive Layer: {'✅ INTEGRATED' if status['flumpy'] else '❌ FALLBACK'}")
+    print(f"   LASER v3.0 Logging: {'✅ INTEGRATED' if status['laser'] else '❌ FALLBACK'}")
+    print(f"   Annealing / Dissipative QNN: {'✅ INTEGRATED' if status['anneal'] and status['dissipative'] else '❌ FALLBACK'}")
+    print(f"   Quantum Features: {'✅ ENABLED' if status['bumpy'] or status['flumpy'] else '❌ DISABLED'}")
     print(f"   Initial Quantum Creativity: Ψ={Tensor._global_quantum_creativity:.3f}")
     print(f"   Quantum Noise in Gradients: {'✅ ENABLED' if Tensor._global_quantum_noise_in_gradients else '❌ DISABLED (default for correctness)'}")
 
@@ -0,0 +1,102 @@
+"""
+STARTUP PROFILE: qtorch cold import time and first-op latency
+Run as `python -m qtorch_startup_profile`.
+
+Every measurement runs in a fresh interpreter so nothing is already imported.
+The import table comes from `python -X importtime -c "import qtorch"` (self and
+cumulative time per module). The first-op table times, in one cold process,
+the import itself and then the first use of each lazily loaded piece: tensor
+creation (LASER), a matmul, the BUMPY and FLUMPY views, and the annealing and
+dissipative integrations.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+# Executed in the child interpreter; prints one JSON object of millisecond timings
+_FIRST_OPS = r"""
+import json, sys, time
+t0 = time.perf_counter()
+def mark(label, timings={}):
+    global t0
+    now = time.perf_counter()
+    timings[label] = (now - t0) * 1e3
+    t0 = now
+    return timings
+import qtorch
+mark('import qtorch')
+a = qtorch.randn(64, 64)
+mark('first tensor')
+a @ a
+mark('first matmul')
+a._bumpy
+mark('first BUMPY view')
+a._flumpy
+mark('first FLUMPY view')
+qtorch.torch.anneal
+mark('torch.anneal')
+qtorch.torch.dissipative
+timings = mark('torch.dissipative')
+sys.stdout.write('\n' + json.dumps(timings))
+"""
+
+def _run(args):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True)
+
+def import_profile(module="qtorch"):
+    """Per-module (name, depth, self_ms, cumulative_ms) rows from -X importtime, in import order"""
+    rows = []
+    for line in _run(["-X", "importtime", "-c", f"import {module}"]).stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, (len(indent) - 1) // 2, int(self_us) / 1e3, int(cumulative_us) / 1e3))
+    return rows
+
+def cold_import_time(module="qtorch"):
+    """Cumulative milliseconds spent importing `module` in a fresh interpreter"""
+    return next(cumulative for name, _, _, cumulative in import_profile(module) if name == module)
+
+def first_op_latency():
+    """Milliseconds for the import and each first operation, in one fresh interpreter"""
+    return json.loads(_run(["-c", _FIRST_OPS]).stdout.strip().splitlines()[-1])
+
+def report(top):
+    rows = import_profile()
+    total = next(cumulative for name, _, _, cumulative in rows if name == "qtorch")
+    first_ops = first_op_latency()
+
+    print("=" * 72)
+    print(f"STARTUP PROFILE: import qtorch = {total:.1f} ms (cumulative)")
+    print("=" * 72)
+    header = f"{'module':<40} | {'self ms':>9} | {'cumulative ms':>13}"
+    print(header)
+    print("-" * len(header))
+    for name, depth, self_ms, cumulative in sorted(rows, key=lambda row: -row[2])[:top]:
+        print(f"{name:<40} | {self_ms:>9.2f} | {cumulative:>13.2f}")
+    print("-" * len(header))
+
+    header = f"{'first op (fresh process)':<40} | {'ms':>9}"
+    print(header)
+    print("-" * len(header))
+    for label, ms in first_ops.items():
+        print(f"{label:<40} | {ms:>9.2f}")
+    print("-" * len(header))
+    return {"import_ms": total, "modules": rows, "first_ops": first_ops}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--top', type=int, default=15, help="modules to list, by self time")
+    parser.add_argument('--json', metavar='PATH', help="also write the raw profile as JSON")
+    args = parser.parse_args()
+    profile = report(args.top)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(profile, f, indent=2)
@@ -0,0 +1,786 @@
+#!/usr/bin/env python3
+"""
+QTORCH STORAGE v1.0 - Contiguous Strided Storage Engine for qtorch.Tensor
+================================================================================
+
+Every qtorch.Tensor keeps its values in a Storage: one flat contiguous buffer
+plus (shape, strides, offset, dtype) metadata. reshape / transpose / permute /
+expand / basic indexing only rewrite that metadata, and every elementwise,
+broadcasting and reduction kernel used by qtorch dispatches through it.
+
+Backends:
+1. NumpyStorage - numpy buffer with vectorized kernels (default when numpy is installed)
+2. ListStorage  - pure-Python list buffer, kept as the reference backend so the
+                  numpy kernels can be cross-checked in tests
+
+Matrix products go through Storage.matmul: batched over the leading dims with
+numpy-style broadcasting. The list backend runs a tiled kernel, the numpy
+backend hands the whole batch to np.matmul (BLAS, which does its own blocking).
+Convolutions are lowered onto it with Storage.im2col / Storage.col2im.
+
+Further backends can be plugged in with register_backend().
+"""
+
+import functools
+import math
+import operator
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+DEFAULT_DTYPE = 'float32'
+DIV_EPSILON = 1e-12  # |b| below this divides to a signed infinity (or 0 for 0/0)
+MATMUL_BLOCK = 64    # tile edge of the list-backend matmul kernel
+
+# ============================================================================
+# 1. SHAPE / STRIDE HELPERS
+# ============================================================================
+
+def contiguous_strides(shape: Sequence[int]) -> Tuple[int, ...]:
+    """Row-major element strides for a shape"""
+    strides = []
+    acc = 1
+    for dim in reversed(shape):
+        strides.append(acc)
+        acc *= dim
+    return tuple(reversed(strides))
+
+def broadcast_shapes(*shapes: Sequence[int]) -> Tuple[int, ...]:
+    """Numpy-style broadcast of several shapes"""
+    ndim = max(len(s) for s in shapes)
+    result = []
+    for axis in range(ndim):
+        size = 1
+        for shape in shapes:
+            idx = axis - (ndim - len(shape))
+            dim = shape[idx] if idx >= 0 else 1
+            if dim == 1:
+                continue
+            if size != 1 and dim != size:
+                raise ValueError(f"Shapes {tuple(map(tuple, shapes))} are not broadcastable")
+            size = dim
+        result.append(size)
+    return tuple(result)
+
+def matmul_shapes(a_shape: Sequence[int], b_shape: Sequence[int]) -> Tuple[Tuple[int, ...], int, int, int]:
+    """(batch, m, n, q) for a (..., m, n) @ (..., n, q) product with broadcast batch dims"""
+    if len(a_shape) < 2 or len(b_shape) < 2:
+        raise ValueError(f"matmul kernels need >= 2D operands, got {tuple(a_shape)} @ {tuple(b_shape)}")
+    (m, n), (n2, q) = a_shape[-2:], b_shape[-2:]
+    if n != n2:
+        raise ValueError(f"Shape mismatch: {tuple(a_shape)} @ {tuple(b_shape)}")
+    return broadcast_shapes(a_shape[:-2], b_shape[:-2]), m, n, q
+
+def conv_output_size(size: int, kernel: int, stride: int, padding: int, dilation: int) -> int:
+    """Spatial output extent of a convolution along one axis"""
+    out = (size + 2 * padding - dilation * (kernel - 1) - 1) // stride + 1
+    if out <= 0:
+        raise ValueError(f"Convolution output is empty (size={size}, kernel={kernel}, "
+                         f"stride={stride}, padding={padding}, dilation={dilation})")
+    return out
+
+def normalize_dim(dim: int, ndim: int) -> int:
+    """Resolve a possibly negative dim against ndim"""
+    if not -ndim <= dim < ndim:
+        raise ValueError(f"dim={dim} out of range for {ndim}D tensor")
+    return dim % ndim
+
+def resolve_shape(shape: Sequence[Any], numel: int) -> Tuple[int, ...]:
+    """Accept reshape(2, 3), reshape((2, 3)) and a single -1 wildcard"""
+    if len(shape) == 1 and isinstance(shape[0], (tuple, list)):
+        shape = shape[0]
+    shape = [int(s) for s in shape]
+    if shape.count(-1) > 1:
+        raise ValueError("only one dimension can be inferred")
+    if -1 in shape:
+        known = math.prod(s for s in shape if s != -1)
+        if known == 0 or numel % known != 0:
+            raise ValueError(f"Cannot reshape {numel} elements to {tuple(shape)}")
+        shape[shape.index(-1)] = numel // known
+    if math.prod(shape) != numel:
+        raise ValueError(f"Cannot reshape {numel} elements to {tuple(shape)}")
+    return tuple(shape)
+
+def infer_shape(data: Any) -> Tuple[int, ...]:
+    """Shape of a (possibly nested) list/tuple"""
+    shape = []
+    while isinstance(data, (list, tuple)):
+        shape.append(len(data))
+        if not data:
+            break
+        data = data[0]
+    return tuple(shape)
+
+def flatten_nested(data: Any, shape: Tuple[int, ...]) -> List[Any]:
+    """Row-major flatten of a nested list, rejecting ragged input"""
+    if len(shape) <= 1:
+        if any(isinstance(x, (list, tuple)) for x in data):
+            raise ValueError("ragged nested sequence")
+        return list(data)
+    flat = []
+    for row in data:
+        if not isinstance(row, (list, tuple)) or len(row) != shape[1]:
+            raise ValueError("ragged nested sequence")
+        flat.extend(flatten_nested(row, shape[1:]))
+    return flat
+
+def _dtype_kind(dtype: str) -> str:
+    if dtype == 'bool':
+        return 'b'
+    if dtype.startswith(('int', 'uint')):
+        return 'i'
+    return 'f'
+
+# ============================================================================
+# 2. STORAGE BASE (METADATA + VIEWS)
+# ============================================================================
+
+class Storage:
+    """
+    Flat buffer + (shape, strides, offset, dtype).
+
+    Strides and offset are counted in elements. A storage is contiguous when
+    its strides are the row-major strides of its shape; views share the
+    buffer of the storage they were derived from.
+    """
+
+    backend = None
+
+    def __init__(self, buffer, shape: Sequence[int], strides: Optional[Sequence[int]] = None,
+                 offset: int = 0, dtype: str = DEFAULT_DTYPE):
+        self.buffer = buffer
+        self.shape = tuple(int(s) for s in shape)
+        self.strides = tuple(strides) if strides is not None else contiguous_strides(self.shape)
+        self.offset = offset
+        self.dtype = dtype
+
+    # ---------------- construction ----------------
+    @classmethod
+    def from_flat(cls, values: Sequence[Any], shape: Sequence[int], dtype: str = DEFAULT_DTYPE) -> 'Storage':
+        raise NotImplementedError
+
+    @classmethod
+    def full(cls, shape: Sequence[int], value: float, dtype: str = DEFAULT_DTYPE) -> 'Storage':
+        raise NotImplementedError
+
+    @classmethod
+    def from_ndarray(cls, data: Any, dtype: str = DEFAULT_DTYPE) -> 'Storage':
+        """Copy an ndarray in (0-d arrays become shape (1,))"""
+        return cls.from_flat(data.ravel().tolist(), data.shape or (1,), dtype)
+
+    @classmethod
+    def from_data(cls, data: Any, dtype: str = DEFAULT_DTYPE) -> 'Storage':
+        """Build from a scalar, (nested) list/tuple, ndarray or another storage"""
+        if isinstance(data, Storage):
+            return cls.from_flat(data.tolist(), data.shape, dtype)
+        if NUMPY_AVAILABLE and isinstance(data, np.ndarray):
+            return cls.from_ndarray(data, dtype)
+        if isinstance(data, (list, tuple)):
+            shape = infer_shape(data)
+            return cls.from_flat(flatten_nested(data, shape), shape, dtype)
+        # Scalars are stored as shape (1,) - qtorch has no 0-d tensors
+        return cls.from_flat([data], (1,), dtype)
+
+    # ---------------- metadata ----------------
+    @property
+    def numel(self) -> int:
+        return math.prod(self.shape)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    def is_contiguous(self) -> bool:
+        return self.strides == contiguous_strides(self.shape)
+
+    def _derive(self, shape, strides, offset) -> 'Storage':
+        return type(self)(self.buffer, shape, strides, offset, self.dtype)
+
+    # ---------------- O(1) views ----------------
+    def reshape(self, *shape) -> 'Storage':
+        """View when contiguous, otherwise a contiguous copy"""
+        shape = resolve_shape(shape, self.numel)
+        base = self if self.is_contiguous() else self.contiguous()
+        return base._derive(shape, None, base.offset)
+
+    def permute(self, *dims) -> 'Storage':
+        if len(dims) == 1 and isinstance(dims[0], (tuple, list)):
+            dims = dims[0]
+        dims = [normalize_dim(d, self.ndim) for d in dims]
+        if sorted(dims) != list(range(self.ndim)):
+            raise ValueError(f"permute dims {tuple(dims)} do not match {self.ndim}D storage")
+        return self._derive([self.shape[d] for d in dims], [self.strides[d] for d in dims], self.offset)
+
+    def transpose(self, dim0: int, dim1: int) -> 'Storage':
+        dims = list(range(self.ndim))
+        d0, d1 = normalize_dim(dim0, self.ndim), normalize_dim(dim1, self.ndim)
+        dims[d0], dims[d1] = dims[d1], dims[d0]
+        return self.permute(dims)
+
+    def expand(self, shape: Sequence[int]) -> 'Storage':
+        """Broadcast view: broadcast dims get stride 0"""
+        shape = tuple(shape)
+        if shape == self.shape:
+            return self
+        if broadcast_shapes(self.shape, shape) != shape:
+            raise ValueError(f"Cannot expand {self.shape} to {shape}")
+        lead = len(shape) - self.ndim
+        strides = [0] * lead
+        for size, dim, stride in zip(shape[lead:], self.shape, self.strides):
+            strides.append(stride if dim == size else 0)
+        return self._derive(shape, strides, self.offset)
+
+    def index(self, key) -> 'Storage':
+        """Basic indexing with ints and positive-step slices, returned as a view"""
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > self.ndim:
+            raise IndexError(f"too many indices for {self.ndim}D storage")
+        shape, strides, offset = [], [], self.offset
+        for axis, k in enumerate(key):
+            size, stride = self.shape[axis], self.strides[axis]
+            if isinstance(k, slice):
+                start, stop, step = k.indices(size)
+                if step <= 0:
+                    raise NotImplementedError("negative slice steps are not supported")
+                shape.append(max(0, (stop - start + step - 1) // step))
+                strides.append(stride * step)
+                offset += start * stride
+            else:
+                k = int(k)
+                if not -size <= k < size:
+                    raise IndexError(f"Index {k} out of range for dim {axis} of size {size}")
+                offset += (k % size) * stride
+        shape.extend(self.shape[len(key):])
+        strides.extend(self.strides[len(key):])
+        if not shape:
+            shape, strides = [1], [1]
+        return self._derive(shape, strides, offset)
+
+    def _buffer_index(self, flat_index: int) -> int:
+        """Logical row-major position -> buffer position"""
+        numel = self.numel
+        if not -numel <= flat_index < numel:
+            raise IndexError(f"Index {flat_index} out of range for storage of size {numel}")
+        flat_index %= numel
+        pos = self.offset
+        for size, stride in zip(reversed(self.shape), reversed(self.strides)):
+            flat_index, rem = divmod(flat_index, size)
+            pos += rem * stride
+        return pos
+
+    def get_flat(self, flat_index: int):
+        return self._read(self._buffer_index(flat_index))
+
+    def set_flat(self, flat_index: int, value) -> None:
+        self._write(self._buffer_index(flat_index), value)
+
+    # ---------------- conversions ----------------
+    def clone(self) -> 'Storage':
+        return type(self).from_flat(self.tolist(), self.shape, self.dtype)
+
+    def to_backend(self, name: str) -> 'Storage':
+        cls = get_backend(name)
+        if isinstance(self, cls):
+            return self
+        return cls.from_flat(self.tolist(), self.shape, self.dtype)
+
+    def _coerce(self, other) -> 'Storage':
+        """Bring a scalar or foreign-backend storage onto this backend"""
+        if isinstance(other, Storage):
+            return other if type(other) is type(self) else other.to_backend(self.backend)
+        return type(self).from_flat([other], (1,), self.dtype)
+
+    # ---------------- composite kernels ----------------
+    def sum_to_shape(self, shape: Sequence[int]) -> 'Storage':
+        """Undo broadcasting: sum over the dims that were expanded to reach self.shape"""
+        shape = tuple(shape)
+        if self.shape == shape:
+            return self
+        result = self
+        while result.ndim > len(shape):
+            result = result.reduce('sum', 0)
+        for axis, size in enumerate(shape):
+            if size == 1 and result.shape[axis] != 1:
+                result = result.reduce('sum', axis, keepdim=True)
+        return result.reshape(shape)
+
+    # ---------------- backend kernels ----------------
+    def _read(self, pos: int):
+        raise NotImplementedError
+
+    def _write(self, pos: int, value) -> None:
+        raise NotImplementedError
+
+    def tolist(self) -> List[Any]:
+        """Flat row-major list of the logical elements"""
+        raise NotImplementedError
+
+    def contiguous(self) -> 'Storage':
+        raise NotImplementedError
+
+    def astype(self, dtype: str) -> 'Storage':
+        raise NotImplementedError
+
+    def binary(self, op: str, other) -> 'Storage':
+        raise NotImplementedError
+
+    def unary(self, op: str) -> 'Storage':
+        raise NotImplementedError
+
+    def reduce(self, op: str, dim: Optional[int] = None, keepdim: bool = False) -> 'Storage':
+        raise NotImplementedError
+
+    def matmul(self, other: 'Storage') -> 'Storage':
+        """(..., m, n) @ (..., n, q) with broadcast batch dims"""
+        raise NotImplementedError
+
+    def im2col(self, kernel_size: Tuple[int, int], stride: Tuple[int, int],
+               padding: Tuple[int, int], dilation: Tuple[int, int]) -> 'Storage':
+        """(N, C, H, W) -> (N, C*kh*kw, out_h*out_w) patch matrix, rows ordered (c, kh, kw)"""
+        raise NotImplementedError
+
+    def col2im(self, input_shape: Sequence[int], kernel_size: Tuple[int, int], stride: Tuple[int, int],
+               padding: Tuple[int, int], dilation: Tuple[int, int]) -> 'Storage':
+        """Adjoint of im2col: scatter-add patch columns back into an (N, C, H, W) image"""
+        raise NotImplementedError
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(shape={self.shape}, strides={self.strides}, "
+                f"offset={self.offset}, dtype={self.dtype})")
+
+def _reduced_shape(shape: Tuple[int, ...], dim: Optional[int], keepdim: bool) -> Tuple[int, ...]:
+    if dim is None:
+        return (1,) * len(shape) if keepdim else (1,)
+    if keepdim:
+        return shape[:dim] + (1,) + shape[dim + 1:]
+    return (shape[:dim] + shape[dim + 1:]) or (1,)
+
+# ============================================================================
+# 3. LIST BACKEND (REFERENCE)
+# ============================================================================
+
+def _safe_div(a, b):
+    if abs(b) < DIV_EPSILON:
+        return math.inf if a > 0 else -math.inf if a < 0 else 0.0
+    return a / b
+
+def _safe_pow(a, b):
+    try:
+        value = a ** b
+    except ZeroDivisionError:
+        return math.inf
+    except OverflowError:
+        return math.inf
+    return math.nan if isinstance(value, complex) else value
+
+def _safe_exp(x):
+    try:
+        return math.exp(x)
+    except OverflowError:
+        return math.inf
+
+def _safe_log(x):
+    if x > 0:
+        return math.log(x)
+    return -math.inf if x == 0 else math.nan
+
+def _sigmoid(x):
+    if x >= 0:
+        return 1.0 / (1.0 + math.exp(-x))
+    z = math.exp(x)
+    return z / (1.0 + z)
+
+_LIST_BINARY = {
+    'add': operator.add,
+    'sub': operator.sub,
+    'mul': operator.mul,
+    'div': _safe_div,
+    'pow': _safe_pow,
+    'maximum': max,
+    'minimum': min,
+}
+
+_LIST_UNARY = {
+    'neg': operator.neg,
+    'abs': abs,
+    'exp': _safe_exp,
+    'log': _safe_log,
+    'sqrt': lambda x: math.sqrt(x) if x >= 0 else math.nan,
+    'relu': lambda x: x if x > 0 else 0.0,
+    'step': lambda x: 1.0 if x > 0 else 0.0,
+    'sigmoid': _sigmoid,
+    'tanh': math.tanh,
+}
+
+_LIST_REDUCE = {
+    'sum': math.fsum,
+    'max': max,
+    'min': min,
+    'mean': lambda xs: math.fsum(xs) / len(xs),
+}
+
+def _list_caster(dtype: str):
+    kind = _dtype_kind(dtype)
+    return bool if kind == 'b' else int if kind == 'i' else float
+
+def _blocked_matmul(a: List[float], b: List[float], m: int, n: int, q: int,
+                    block: int = MATMUL_BLOCK) -> List[float]:
+    """
+    Row-major (m, n) @ (n, q) on flat lists.
+
+    B is transposed once so every output element is a single C-level
+    sum(map(mul, row, col)); output tiles of block x block keep the same
+    slab of B columns hot while a block of A rows sweeps over it.
+    """
+    b_cols = [b[j::q] for j in range(q)]
+    a_rows = [a[i * n:(i + 1) * n] for i in range(m)]
+    out = [0.0] * (m * q)
+    mul = operator.mul
+    for j0 in range(0, q, block):
+        cols = b_cols[j0:j0 + block]
+        j1 = j0 + len(cols)
+        for i0 in range(0, m, block):
+            for i in range(i0, min(i0 + block, m)):
+                row = a_rows[i]
+                out[i * q + j0:i * q + j1] = [sum(map(mul, row, col)) for col in cols]
+    return out
+
+@functools.lru_cache(maxsize=64)
+def _im2col_positions(channels: int, height: int, width: int, kernel_size: Tuple[int, int],
+                      stride: Tuple[int, int], padding: Tuple[int, int],
+                      dilation: Tuple[int, int]) -> Tuple[int, ...]:
+    """
+    Flat (c, h, w) input position feeding every im2col cell, row-major over
+    (c, kh, kw, out_h, out_w); -1 marks a cell that reads zero padding.
+    Cached per geometry since a layer sees the same one on every call.
+    """
+    (kh, kw), (sh, sw), (ph, pw), (dh, dw) = kernel_size, stride, padding, dilation
+    out_h = conv_output_size(height, kh, sh, ph, dh)
+    out_w = conv_output_size(width, kw, sw, pw, dw)
+    positions = []
+    for c in range(channels):
+        for ki in range(kh):
+            for kj in range(kw):
+                for oh in range(out_h):
+                    ih = oh * sh + ki * dh - ph
+                    row_ok = 0 <= ih < height
+                    base = (c * height + ih) * width
+                    for ow in range(out_w):
+                        iw = ow * sw + kj * dw - pw
+                        positions.append(base + iw if row_ok and 0 <= iw < width else -1)
+    return tuple(positions)
+
+class ListStorage(Storage):
+    """Reference backend: Python list buffer, one interpreted loop per kernel"""
+
+    backend = 'list'
+
+    @classmethod
+    def from_flat(cls, values, shape, dtype=DEFAULT_DTYPE):
+        cast = _list_caster(dtype)
+        buffer = [cast(v) for v in values]
+        if len(buffer) != math.prod(shape):
+            raise ValueError(f"{len(buffer)} values do not fill shape {tuple(shape)}")
+        return cls(buffer, shape, None, 0, dtype)
+
+    @classmethod
+    def full(cls, shape, value, dtype=DEFAULT_DTYPE):
+        return cls([_list_caster(dtype)(value)] * math.prod(shape), shape, None, 0, dtype)
+
+    def _positions(self) -> List[int]:
+        """Buffer positions of every logical element, row-major"""
+        positions = [self.offset]
+        for size, stride in zip(self.shape, self.strides):
+            positions = [p + k * stride for p in positions for k in range(size)]
+        return positions
+
+    def _read(self, pos):
+        return self.buffer[pos]
+
+    def _write(self, pos, value):
+        self.buffer[pos] = _list_caster(self.dtype)(value)
+
+    def tolist(self):
+        if self.is_contiguous():
+            return self.buffer[self.offset:self.offset + self.numel]
+        buf = self.buffer
+        return [buf[p] for p in self._positions()]
+
+    def contiguous(self):
+        if self.is_contiguous() and self.offset == 0 and len(self.buffer) == self.numel:
+            return self
+        return ListStorage(self.tolist(), self.shape, None, 0, self.dtype)
+
+    def astype(self, dtype):
+        return ListStorage.from_flat(self.tolist(), self.shape, dtype)
+
+    def binary(self, op, other):
+        other = self._coerce(other)
+        fn = _LIST_BINARY[op]
+        shape = broadcast_shapes(self.shape, other.shape)
+        a = self.expand(shape).tolist()
+        b = other.expand(shape).tolist()
+        return ListStorage([fn(x, y) for x, y in zip(a, b)], shape, None, 0, self.dtype)
+
+    def unary(self, op):
+        fn = _LIST_UNARY[op]
+        return ListStorage([fn(x) for x in self.tolist()], self.shape, None, 0, self.dtype)
+
+    def reduce(self, op, dim=None, keepdim=False):
+        fn = _LIST_REDUCE[op]
+        if dim is None:
+            return ListStorage([fn(self.tolist())], _reduced_shape(self.shape, None, keepdim), None, 0, self.dtype)
+        dim = normalize_dim(dim, self.ndim)
+        # Move the reduced dim last so each output element is one contiguous run
+        order = [d for d in range(self.ndim) if d != dim] + [dim]
+        values = self.permute(order).tolist()
+        run = self.shape[dim]
+        data = [fn(values[i:i + run]) for i in range(0, len(values), run)]
+        return ListStorage(data, _reduced_shape(self.shape, dim, keepdim), None, 0, self.dtype)
+
+    def matmul(self, other):
+        other = self._coerce(other)
+        batch, m, n, q = matmul_shapes(self.shape, other.shape)
+        a = self.expand(batch + (m, n)).tolist()
+        b = other.expand(batch + (n, q)).tolist()
+        data = []
+        for k in range(math.prod(batch)):
+            data.extend(_blocked_matmul(a[k * m * n:(k + 1) * m * n], b[k * n * q:(k + 1) * n * q], m, n, q))
+        return ListStorage(data, batch + (m, q), None, 0, self.dtype)
+
+    def im2col(self, kernel_size, stride, padding, dilation):
+        n, c, h, w = self.shape
+        positions = _im2col_positions(c, h, w, kernel_size, stride, padding, dilation)
+        values = self.tolist()
+        image, rows = c * h * w, c * kernel_size[0] * kernel_size[1]
+        data = []
+        for b in range(n):
+            base = b * image
+            data.extend([values[base + p] if p >= 0 else 0.0 for p in positions])
+        return ListStorage(data, (n, rows, len(positions) // rows), None, 0, self.dtype)
+
+    def col2im(self, input_shape, kernel_size, stride, padding, dilation):
+        n, c, h, w = input_shape
+        positions = _im2col_positions(c, h, w, kernel_size, stride, padding, dilation)
+        cols = self.tolist()
+        image, span = c * h * w, len(positions)
+        data = [0.0] * (n * image)
+        for b in range(n):
+            base = b * image
+            for p, v in zip(positions, cols[b * span:(b + 1) * span]):
+                if p >= 0:
+                    data[base + p] += v
+        return ListStorage(data, tuple(input_shape), None, 0, self.dtype)
+
+# ============================================================================
+# 4. NUMPY BACKEND (VECTORIZED)
+# ============================================================================
+
+if NUMPY_AVAILABLE:
+
+    def _np_div(a, b):
+        a, b = np.broadcast_arrays(a, b)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            quotient = a / b
+        tiny = np.abs(b) < DIV_EPSILON
+        if tiny.any():
+            signed_inf = np.where(a > 0, np.inf, np.where(a < 0, -np.inf, 0.0))
+            quotient = np.where(tiny, signed_inf, quotient).astype(quotient.dtype)
+        return quotient
+
+    def _np_pow(a, b):
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            return np.power(a, b)
+
+    def _np_sigmoid(x):
+        with np.errstate(over='ignore'):
+            return 1.0 / (1.0 + np.exp(-x))
+
+    def _np_guarded(fn):
+        def kernel(x):
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                return fn(x)
+        return kernel
+
+    _NP_BINARY = {
+        'add': np.add,
+        'sub': np.subtract,
+        'mul': np.multiply,
+        'div': _np_div,
+        'pow': _np_pow,
+        'maximum': np.maximum,
+        'minimum': np.minimum,
+    }
+
+    _NP_UNARY = {
+        'neg': np.negative,
+        'abs': np.abs,
+        'exp': _np_guarded(np.exp),
+        'log': _np_guarded(np.log),
+        'sqrt': _np_guarded(np.sqrt),
+        'relu': lambda x: np.maximum(x, 0),
+        'step': lambda x: (x > 0).astype(x.dtype),
+        'sigmoid': _np_sigmoid,
+        'tanh': np.tanh,
+    }
+
+    _NP_REDUCE = {
+        'sum': np.sum,
+        'max': np.max,
+        'min': np.min,
+        'mean': np.mean,
+    }
+
+class NumpyStorage(Storage):
+    """Vectorized backend: 1-D numpy buffer viewed through as_strided"""
+
+    backend = 'numpy'
+
+    @classmethod
+    def from_flat(cls, values, shape, dtype=DEFAULT_DTYPE):
+        buffer = np.array(values, dtype=dtype).ravel()
+        if buffer.size != math.prod(shape):
+            raise ValueError(f"{buffer.size} values do not fill shape {tuple(shape)}")
+        return cls(buffer, shape, None, 0, dtype)
+
+    @classmethod
+    def full(cls, shape, value, dtype=DEFAULT_DTYPE):
+        return cls(np.full(math.prod(shape), value, dtype=dtype), shape, None, 0, dtype)
+
+    @classmethod
+    def from_ndarray(cls, data, dtype=DEFAULT_DTYPE):
+        # One C-order copy, no Python list: the tensor never aliases the caller's array
+        buffer = np.array(data, dtype=dtype, order='C')
+        return cls(buffer.reshape(-1), data.shape or (1,), None, 0, dtype)
+
+    @classmethod
+    def from_array(cls, array) -> 'NumpyStorage':
+        """Adopt an ndarray result (copied only if it is not already contiguous)"""
+        array = np.ascontiguousarray(array)
+        shape = array.shape or (1,)
+        return cls(array.reshape(-1), shape, None, 0, str(array.dtype))
+
+    @property
+    def array(self):
+        """Strided ndarray view over the buffer (no copy)"""
+        if self.is_contiguous():
+            return self.buffer[self.offset:self.offset + self.numel].reshape(self.shape)
+        itemsize = self.buffer.itemsize
+        return np.lib.stride_tricks.as_strided(
+            self.buffer[self.offset:], shape=self.shape,
+            strides=tuple(s * itemsize for s in self.strides))
+
+    def _read(self, pos):
+        return self.buffer[pos].item()
+
+    def _write(self, pos, value):
+        self.buffer[pos] = value
+
+    def tolist(self):
+        return self.array.ravel().tolist()
+
+    def contiguous(self):
+        if self.is_contiguous() and self.offset == 0 and self.buffer.size == self.numel:
+            return self
+        return NumpyStorage.from_array(self.array)
+
+    def astype(self, dtype):
+        return NumpyStorage.from_array(self.array.astype(dtype))
+
+    def binary(self, op, other):
+        other = self._coerce(other)
+        return NumpyStorage.from_array(_NP_BINARY[op](self.array, other.array))
+
+    def unary(self, op):
+        return NumpyStorage.from_array(_NP_UNARY[op](self.array))
+
+    def reduce(self, op, dim=None, keepdim=False):
+        if dim is None:
+            value = _NP_REDUCE[op](self.array)
+            return NumpyStorage.from_array(np.reshape(value, _reduced_shape(self.shape, None, keepdim)))
+        dim = normalize_dim(dim, self.ndim)
+        value = _NP_REDUCE[op](self.array, axis=dim, keepdims=keepdim)
+        return NumpyStorage.from_array(np.reshape(value, _reduced_shape(self.shape, dim, keepdim)))
+
+    def matmul(self, other):
+        other = self._coerce(other)
+        matmul_shapes(self.shape, other.shape)
+        return NumpyStorage.from_array(np.matmul(self.array, other.array))
+
+    def im2col(self, kernel_size, stride, padding, dilation):
+        n, c, h, w = self.shape
+        (kh, kw), (sh, sw), (ph, pw), (dh, dw) = kernel_size, stride, padding, dilation
+        out_h = conv_output_size(h, kh, sh, ph, dh)
+        out_w = conv_output_size(w, kw, sw, pw, dw)
+        padded = np.pad(self.array, ((0, 0), (0, 0), (ph, ph), (pw, pw)))
+        cols = np.empty((n, c, kh, kw, out_h, out_w), dtype=padded.dtype)
+        # One strided slice per kernel tap: kh*kw vectorized copies instead of a per-pixel loop
+        for ki in range(kh):
+            for kj in range(kw):
+                cols[:, :, ki, kj] = padded[:, :, ki * dh:ki * dh + sh * out_h:sh,
+                                            kj * dw:kj * dw + sw * out_w:sw][:, :, :out_h, :out_w]
+        return NumpyStorage.from_array(cols.reshape(n, c * kh * kw, out_h * out_w))
+
+    def col2im(self, input_shape, kernel_size, stride, padding, dilation):
+        n, c, h, w = input_shape
+        (kh, kw), (sh, sw), (ph, pw), (dh, dw) = kernel_size, stride, padding, dilation
+        out_h = conv_output_size(h, kh, sh, ph, dh)
+        out_w = conv_output_size(w, kw, sw, pw, dw)
+        cols = self.array.reshape(n, c, kh, kw, out_h, out_w)
+        padded = np.zeros((n, c, h + 2 * ph, w + 2 * pw), dtype=cols.dtype)
+        # Within one tap the strided targets are distinct, so += cannot drop overlaps
+        for ki in range(kh):
+            for kj in range(kw):
+                padded[:, :, ki * dh:ki * dh + sh * out_h:sh,
+                       kj * dw:kj * dw + sw * out_w:sw][:, :, :out_h, :out_w] += cols[:, :, ki, kj]
+        return NumpyStorage.from_array(padded[:, :, ph:ph + h, pw:pw + w])
+
+# ============================================================================
+# 5. BACKEND REGISTRY
+# ============================================================================
+
+STORAGE_BACKENDS: Dict[str, type] = {}
+
+def register_backend(cls: type) -> type:
+    """Register a Storage subclass under its `backend` name"""
+    STORAGE_BACKENDS[cls.backend] = cls
+    return cls
+
+register_backend(ListStorage)
+if NUMPY_AVAILABLE:
+    register_backend(NumpyStorage)
+
+_default_backend = 'numpy' if NUMPY_AVAILABLE else 'list'
+
+def get_backend(name: Optional[str] = None) -> type:
+    name = name or _default_backend
+    if name not in STORAGE_BACKENDS:
+        raise ValueError(f"Unknown storage backend '{name}' (available: {sorted(STORAGE_BACKENDS)})")
+    return STORAGE_BACKENDS[name]
+
+def get_default_backend() -> str:
+    return _default_backend
+
+def set_default_backend(name: str) -> str:
+    """Select the backend new tensors are created on; returns the previous one"""
+    global _default_backend
+    get_backend(name)
+    previous, _default_backend = _default_backend, name
+    return previous
+
+def make_storage(data: Any, dtype: Optional[str] = None, backend: Optional[str] = None) -> Storage:
+    """Storage for arbitrary tensor input on the requested (or default) backend"""
+    if isinstance(data, Storage):
+        storage = data if backend is None else data.to_backend(backend)
+        return storage if dtype is None or dtype == storage.dtype else storage.astype(dtype)
+    return get_backend(backend).from_data(data, dtype or DEFAULT_DTYPE)
+
+def full_storage(shape: Sequence[int], value: float, dtype: Optional[str] = None,
+                 backend: Optional[str] = None) -> Storage:
+    return get_backend(backend).full(tuple(shape), value, dtype or DEFAULT_DTYPE)
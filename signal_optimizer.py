@@ -64,6 +64,26 @@ class SignalOptimizer:
         utility = (consistency_term * stability_bonus * reliability_gain) - cost
         return float(utility)
 
+    def calculate_utility_batch(self, reliability, consistency, uncertainty, cost=0.0,
+                                a=None, b=None, c=None) -> np.ndarray:
+        """
+        Array form of calculate_utility: one utility per element, with the same
+        sanitization. a, b, c default to self.params and may be per-element arrays
+        (e.g. one parameter set per ensemble member).
+        """
+        reliability = np.maximum(np.asarray(reliability, dtype=float), 0.0)
+        consistency = np.clip(np.asarray(consistency, dtype=float), -1.0, 1.0)
+        uncertainty = np.maximum(np.asarray(uncertainty, dtype=float), 0.0)
+        a = self.params['a'] if a is None else a
+        b = self.params['b'] if b is None else b
+        c = self.params['c'] if c is None else c
+
+        rel_a = reliability ** a
+        reliability_gain = rel_a / (1.0 + rel_a)
+        stability_bonus = np.exp(-b * uncertainty)
+        consistency_term = (np.abs(consistency) ** c) * np.sign(consistency)
+        return (consistency_term * stability_bonus * reliability_gain) - cost
+
     def get_confidence_category(self, utility: float) -> str:
         abs_u = abs(utility)
         if abs_u > self.thresholds['EXPLOIT']: return "HIGH_CONFIDENCE_EXPLOIT"
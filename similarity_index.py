@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+similarity_index.py - Random-projection LSH over array signatures
+Version: 1.0 - Sub-quadratic top-k candidates for batch entanglement
+
+FlumpyUtilities.batch_entangle and BUMPYCore.qualia_emergence_ritual used to
+score every pair of arrays, O(n^2) kernel calls. SimilarityIndex hashes each
+vector with `bits` random hyperplanes per table (SimHash: vectors at angle
+theta share a bit with probability 1 - theta/pi). Within a table, items are
+sorted by (bucket key, one extra projection) and each item takes the `window`
+items on either side that share its key as candidates, so oversized buckets
+cannot turn the pass quadratic again. Candidates from all tables are re-ranked
+by exact cosine. Cost is O(n * tables * window) pairs instead of n^2 / 2.
+
+With symmetric=True the score is |cosine| (the BUMPY lambda_kernel): every
+vector is first oriented to the positive side of a per-table random direction,
+so a vector and its negation land in the same bucket.
+"""
+
+import itertools
+from collections import defaultdict
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# --- Index Defaults ---
+DEFAULT_TABLES = 16
+DEFAULT_BITS = 12
+DEFAULT_WINDOW = 8  # neighbours on each side, per table
+PAIR_CHUNK = 1 << 16  # candidate pairs scored per exact-cosine chunk
+ANN_MIN_BATCH = 512  # batch sizes below this use the exact all-pairs pass
+DEFAULT_TOP_K = 16
+
+
+class SimilarityIndex:
+    """Random-hyperplane LSH for cosine (or |cosine|) top-k search"""
+
+    def __init__(self, vectors, tables: int = DEFAULT_TABLES, bits: int = DEFAULT_BITS,
+                 window: int = DEFAULT_WINDOW, symmetric: bool = False, seed: int = 0):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("SimilarityIndex requires numpy")
+        if not 1 <= bits <= 62:
+            raise ValueError("bits must be in [1, 62]")
+        data = np.asarray(vectors, dtype=np.float64)
+        if data.ndim != 2:
+            raise ValueError("vectors must be a 2-D (n, dim) array")
+        self.tables = tables
+        self.bits = bits
+        self.window = window
+        self.symmetric = symmetric
+
+        norms = np.linalg.norm(data, axis=1, keepdims=True)
+        self.unit = np.divide(data, norms, out=np.zeros_like(data), where=norms > 0)
+        self.size, self.dim = self.unit.shape
+
+        rng = np.random.default_rng(seed)
+        # Per table: `bits` hashing hyperplanes, one sorting direction, one orientation direction
+        self._planes = rng.standard_normal((tables, bits + 2, self.dim))
+        self._weights = (1 << np.arange(bits, dtype=np.int64))
+
+        keys, secondary = self._hash(self.unit)
+        self._order = np.stack([np.lexsort((secondary[:, t], keys[:, t])) for t in range(tables)])
+        self._keys = np.take_along_axis(keys.T, self._order, axis=1)
+        self._secondary = np.take_along_axis(secondary.T, self._order, axis=1)
+
+    def _hash(self, unit):
+        """(n, tables) bucket keys and sort positions for unit row vectors"""
+        projections = (unit @ self._planes.reshape(-1, self.dim).T).reshape(len(unit), self.tables, -1)
+        if self.symmetric:
+            projections *= np.where(projections[:, :, -1:] < 0, -1.0, 1.0)
+        bits = projections[:, :, :self.bits] > 0
+        keys = (bits * self._weights).sum(axis=2)
+        return keys, projections[:, :, self.bits]
+
+    def _score(self, a, b):
+        scores = np.einsum('nd,nd->n', self.unit[a], self.unit[b])
+        return np.abs(scores) if self.symmetric else scores
+
+    def candidate_pairs(self):
+        """Unique (i, j) index pairs, i < j, that share a bucket within the window in any table"""
+        lo, hi = [], []
+        for t in range(self.tables):
+            order, keys = self._order[t], self._keys[t]
+            for offset in range(1, self.window + 1):
+                same = keys[offset:] == keys[:-offset]
+                a, b = order[:-offset][same], order[offset:][same]
+                lo.append(np.minimum(a, b))
+                hi.append(np.maximum(a, b))
+        if not lo:
+            return np.empty(0, np.int64), np.empty(0, np.int64)
+        codes = np.unique(np.concatenate(lo).astype(np.int64) * self.size + np.concatenate(hi))
+        return codes // self.size, codes % self.size
+
+    def top_k(self, k: int) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Approximate k most similar items for every indexed vector.
+        Returns (neighbors, scores), both (n, k); missing slots hold -1 / -inf.
+        """
+        first, second = self.candidate_pairs()
+        scores = np.concatenate([self._score(first[s:s + PAIR_CHUNK], second[s:s + PAIR_CHUNK])
+                                 for s in range(0, len(first), PAIR_CHUNK)] or [np.empty(0)])
+        # Both directions, ranked by (item, -score)
+        src = np.concatenate([first, second])
+        dst = np.concatenate([second, first])
+        score = np.concatenate([scores, scores])
+        ranked = np.lexsort((-score, src))
+        src, dst, score = src[ranked], dst[ranked], score[ranked]
+        starts = np.searchsorted(src, np.arange(self.size))
+        rank = np.arange(len(src)) - starts[src]
+        keep = rank < k
+
+        neighbors = np.full((self.size, k), -1, dtype=np.int64)
+        best = np.full((self.size, k), -np.inf)
+        neighbors[src[keep], rank[keep]] = dst[keep]
+        best[src[keep], rank[keep]] = score[keep]
+        return neighbors, best
+
+    def query(self, vector: Sequence[float], k: int) -> List[Tuple[int, float]]:
+        """Approximate k most similar indexed items to one vector, best first"""
+        unit = np.asarray(vector, dtype=np.float64).reshape(1, self.dim)
+        norm = np.linalg.norm(unit)
+        if norm > 0:
+            unit = unit / norm
+        keys, secondary = self._hash(unit)
+        found = set()
+        for t in range(self.tables):
+            lo = np.searchsorted(self._keys[t], keys[0, t], 'left')
+            hi = np.searchsorted(self._keys[t], keys[0, t], 'right')
+            pos = lo + np.searchsorted(self._secondary[t, lo:hi], secondary[0, t])
+            found.update(self._order[t, max(lo, pos - self.window):min(hi, pos + self.window)].tolist())
+        if not found:
+            return []
+        candidates = np.fromiter(found, dtype=np.int64, count=len(found))
+        scores = self.unit[candidates] @ unit[0]
+        if self.symmetric:
+            scores = np.abs(scores)
+        best = np.argsort(-scores, kind='stable')[:k]
+        return [(int(candidates[i]), float(scores[i])) for i in best]
+
+
+def exact_top_k(vectors, k: int, symmetric: bool = False, chunk: int = 1024):
+    """Exact all-pairs top-k (the O(n^2) reference), in row chunks to bound memory"""
+    if not NUMPY_AVAILABLE:
+        raise ImportError("exact_top_k requires numpy")
+    data = np.asarray(vectors, dtype=np.float64)
+    norms = np.linalg.norm(data, axis=1, keepdims=True)
+    unit = np.divide(data, norms, out=np.zeros_like(data), where=norms > 0)
+    n = len(unit)
+    k = min(k, n - 1)
+    neighbors = np.empty((n, k), dtype=np.int64)
+    for start in range(0, n, chunk):
+        scores = unit[start:start + chunk] @ unit.T
+        if symmetric:
+            scores = np.abs(scores)
+        rows = np.arange(len(scores))
+        scores[rows, start + rows] = -np.inf  # not its own neighbour
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k] if k else np.empty((len(scores), 0), np.int64)
+        order = np.argsort(-np.take_along_axis(scores, part, axis=1), axis=1, kind='stable')
+        neighbors[start:start + chunk] = np.take_along_axis(part, order, axis=1)
+    return neighbors
+
+
+def recall_at_k(approx, exact) -> float:
+    """Fraction of the exact top-k neighbours that the approximate lists contain"""
+    hits = sum(len(set(a[a >= 0].tolist()) & set(e.tolist())) for a, e in zip(approx, exact))
+    return hits / max(1, exact.size)
+
+
+def top_k_pairs(vectors, k: int = DEFAULT_TOP_K, symmetric: bool = False,
+                **index_options) -> List[Tuple[int, int]]:
+    """
+    Sorted unique (i, j), i < j, such that j is among i's approximate top-k or
+    vice versa - the pairs a batch entangle pass still needs to score.
+    """
+    if len(vectors) < 2:
+        return []
+    neighbors, _ = SimilarityIndex(vectors, symmetric=symmetric, **index_options).top_k(k)
+    src = np.repeat(np.arange(len(neighbors)), neighbors.shape[1])
+    dst = neighbors.ravel()
+    valid = dst >= 0
+    src, dst = src[valid], dst[valid]
+    codes = np.unique(np.minimum(src, dst) * len(neighbors) + np.maximum(src, dst))
+    return list(zip((codes // len(neighbors)).tolist(), (codes % len(neighbors)).tolist()))
+
+
+def use_index(batch_size: int, top_k: Optional[int]) -> bool:
+    """Whether a batch pass should go through the index (explicit top_k, or a large batch)"""
+    if not NUMPY_AVAILABLE:
+        return False
+    return top_k is not None or batch_size >= ANN_MIN_BATCH
+
+
+def batch_pairs(datas: Sequence[Sequence[float]], top_k: Optional[int] = None,
+                symmetric: bool = False, truncate: bool = False) -> Iterable[Tuple[int, int]]:
+    """
+    The (i, j), i < j, pairs a batch entangle pass should try, in row-major order.
+    Small batches (or no numpy) get every pair. Otherwise only approximate
+    top-k partners are returned: arrays are indexed per length, or, with
+    truncate=True, all together on their common prefix (as lambda_kernel does).
+    """
+    n = len(datas)
+    if not use_index(n, top_k):
+        return itertools.combinations(range(n), 2)
+    k = DEFAULT_TOP_K if top_k is None else top_k
+    if truncate:
+        width = min(len(d) for d in datas)
+        groups = {width: list(range(n))} if width else {}
+    else:
+        groups = defaultdict(list)
+        for i, d in enumerate(datas):
+            if len(d):
+                groups[len(d)].append(i)
+    pairs = []
+    for width, members in groups.items():
+        vectors = [list(datas[i])[:width] for i in members]
+        pairs.extend((members[a], members[b]) for a, b in top_k_pairs(vectors, k, symmetric))
+    pairs.sort()
+    return pairs
@@ -25,7 +25,9 @@ class SingularitySolver:
         }
 
     def derivatives(self, state):
-        R, C_soc, sigma = state
+        # state is [R, C_soc, sigma] or an (N, 3) batch of them; params may be
+        # scalars or length-N arrays
+        R, C_soc, sigma = state[..., 0], state[..., 1], state[..., 2]
         p = self.params
         
         # dR/dt: Logistic RSI growth capped by physical substrate
@@ -37,22 +39,26 @@ class SingularitySolver:
         # dSigma/dt: Complexity growth vs Correction
         dSigma = p['kappa'] * R - p['gamma'] * p['C_phys']
         
-        return np.array([dR, dC_soc, dSigma])
+        return np.stack(np.broadcast_arrays(dR, dC_soc, dSigma), axis=-1)
 
-    def step(self):
+    def advance(self, state):
+        """One clipped RK4 step of a [R, C_soc, sigma] state or an (N, 3) batch; returns a new array"""
         # Runge-Kutta 4 (RK4) for high-fidelity ODE solving
-        k1 = self.derivatives(self.state)
-        k2 = self.derivatives(self.state + self.dt * k1 / 2)
-        k3 = self.derivatives(self.state + self.dt * k2 / 2)
-        k4 = self.derivatives(self.state + self.dt * k3)
+        k1 = self.derivatives(state)
+        k2 = self.derivatives(state + self.dt * k1 / 2)
+        k3 = self.derivatives(state + self.dt * k2 / 2)
+        k4 = self.derivatives(state + self.dt * k3)
         
-        self.state += (self.dt / 6.0) * (k1 + 2*k2 + 2*k3 + k4)
+        state = state + (self.dt / 6.0) * (k1 + 2*k2 + 2*k3 + k4)
         
         # Clipping/Sanitization
-        self.state[0] = np.clip(self.state[0], 0, self.params['C_phys'])
-        self.state[1] = np.clip(self.state[1], 0, 1)
-        self.state[2] = max(self.state[2], 0.01) # Uncertainty floor
-        
+        state[..., 0] = np.clip(state[..., 0], 0, self.params['C_phys'])
+        state[..., 1] = np.clip(state[..., 1], 0, 1)
+        state[..., 2] = np.maximum(state[..., 2], 0.01) # Uncertainty floor
+        return state
+
+    def step(self):
+        self.state[:] = self.advance(self.state)
         return self.state
 
     def calculate_utility(self, state):
@@ -2,17 +2,173 @@ import os
 import google.generativeai as genai
 import json
 import asyncio
+import hashlib
+import random
+import threading
+import time
+import weakref
 import requests
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
 
 @dataclass
 class LLMConfig:
     # High-availability model for Class 5 Forensic throughput
     model_name: str = "gemini-2.5-flash"
     temperature: float = 0.1
+    # Transport (override the endpoint to point Sophia at a local stub)
+    base_url: str = field(default_factory=lambda: os.getenv(
+        "SOPHIA_LLM_BASE_URL", "https://generativelanguage.googleapis.com/v1beta"))
+    timeout: float = 30.0
+    max_concurrency: int = 8          # in-flight HTTP calls per client
+    max_retries: int = 3              # extra attempts on 429/5xx/connection errors
+    backoff_base: float = 0.5         # seconds; attempt k sleeps U(0, base * 2^k)
+    backoff_cap: float = 8.0
+    # On-disk cache of query_json responses; off unless a directory is given
+    cache_dir: Optional[str] = field(default_factory=lambda: os.getenv("SOPHIA_LLM_CACHE"))
+    cache_max_entries: int = 4096     # oldest entries are evicted past this
+    cache_ttl: float = 7 * 24 * 3600  # seconds an entry stays valid
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+class ResponseCache:
+    """
+    Content-addressed on-disk cache of successful generateContent responses.
+    The key is the SHA-256 of the model name and the full request payload
+    (prompt and generation parameters), so any change to either is a miss.
+    Entries expire after `ttl` seconds; past `max_entries` the oldest are
+    evicted.
+    """
+    def __init__(self, root: str, max_entries: int = 4096, ttl: float = 7 * 24 * 3600):
+        self.root = root
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(root, exist_ok=True)
+        self._entries = len(self._files())
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, payload: dict) -> str:
+        canonical = json.dumps({"model": model, "payload": payload}, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.json")
+
+    def _files(self):
+        """(mtime, path) of every entry"""
+        files = []
+        for shard in os.scandir(self.root):
+            if shard.is_dir():
+                files.extend((entry.stat().st_mtime, entry.path) for entry in os.scandir(shard.path)
+                             if entry.name.endswith(".json"))
+        return files
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                os.remove(path)
+                raise OSError("expired")
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: dict):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        existed = os.path.exists(path)
+        os.replace(tmp, path)  # readers never see a half-written entry
+        with self._lock:
+            if not existed:
+                self._entries += 1
+            # Evict in bulk (down to 90%) so the directory scan is amortized
+            if self._entries > self.max_entries:
+                self._evict(int(self.max_entries * 0.9))
+
+    def _evict(self, keep: int):
+        files = sorted(self._files())
+        now = time.time()
+        for mtime, path in files[:max(0, len(files) - keep)] + [f for f in files if now - f[0] > self.ttl]:
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except OSError:
+                pass  # already gone
+        self._entries = len(self._files())
+
+class HTTPPool:
+    """
+    Keep-alive requests.Session behind a bounded thread pool.
+    An asyncio.Semaphore per event loop caps in-flight calls at
+    max_concurrency, so a burst of messages queues here instead of flooding
+    the default executor, and every call reuses pooled TLS connections.
+    """
+    def __init__(self, config: LLMConfig):
+        self.config = config
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=config.max_concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.max_concurrency, thread_name_prefix="sophia-http")
+        self._semaphores = weakref.WeakKeyDictionary()
+        self.stats = {"requests": 0, "retries": 0, "failures": 0}
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.config.max_concurrency)
+        return semaphore
+
+    def _backoff(self, attempt: int) -> float:
+        """Full jitter: uniform over [0, min(cap, base * 2^attempt)]"""
+        return random.uniform(0, min(self.config.backoff_cap, self.config.backoff_base * (2 ** attempt)))
+
+    async def post_json(self, url: str, payload: dict, headers: dict = None) -> requests.Response:
+        """POST with retries; returns the last response or raises the last connection error"""
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.config.max_retries + 1):
+            async with self._semaphore():
+                self.stats["requests"] += 1
+                try:
+                    response = await loop.run_in_executor(
+                        self._executor,
+                        lambda: self.session.post(url, json=payload, headers=headers, timeout=self.config.timeout))
+                except (requests.ConnectionError, requests.Timeout):
+                    if attempt == self.config.max_retries:
+                        self.stats["failures"] += 1
+                        raise
+                    response = None
+            if response is not None and response.status_code not in RETRYABLE_STATUS:
+                return response
+            if attempt == self.config.max_retries:
+                self.stats["failures"] += 1
+                return response
+            self.stats["retries"] += 1
+            # Sleep outside the semaphore so waiting retries don't hold a slot
+            await asyncio.sleep(self._backoff(attempt))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
 
 class GeminiClient:
-    def __init__(self):
+    def __init__(self, config: LLMConfig = None):
+        self.config = config or LLMConfig()
         # Load API Key (Priority: OPHANE Environment -> God Mode Env -> .env file)
         self.api_key = (os.getenv("SOPHIA_API_KEY") or 
                         os.getenv("GOOGLE_AI_KEY") or 
@@ -34,6 +190,52 @@ class GeminiClient:
         else:
             genai.configure(api_key=self.api_key)
         
+        self.http = HTTPPool(self.config)
+        self.cache = (ResponseCache(self.config.cache_dir, self.config.cache_max_entries, self.config.cache_ttl)
+                      if self.config.cache_dir else None)
+        self._inflight = {}
+
+    async def _generate_content(self, payload: dict, cacheable: bool = False) -> dict:
+        """
+        One generateContent round trip through the pool, and through the cache
+        when `cacheable` (deterministic requests only: a cached sampled reply
+        would come back identical forever). Identical cacheable requests
+        already in flight share a single HTTP call. The key travels in a
+        header so it stays out of URLs and cache keys.
+        """
+        if self.cache is None or not cacheable:
+            return await self._fetch(payload)
+
+        key = ResponseCache.key(self.config.model_name, payload)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.cache.hits += 1
+            return await asyncio.shield(pending)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        # The fetch belongs to the in-flight table, not to this caller: a caller
+        # that is cancelled (e.g. a discarded speculative reply) leaves it running
+        # for the others and for the cache.
+        task = asyncio.ensure_future(self._fetch_and_store(key, payload))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, key: str, payload: dict) -> dict:
+        result = await self._fetch(payload)
+        if result.get("candidates"):
+            self.cache.put(key, result)
+        return result
+
+    async def _fetch(self, payload: dict) -> dict:
+        url = f"{self.config.base_url}/models/{self.config.model_name}:generateContent"
+        response = await self.http.post_json(url, payload, headers={"x-goog-api-key": self.api_key or ""})
+        if response.status_code != 200:
+            raise Exception(f"HTTP ERROR {response.status_code}: {response.text}")
+        return response.json()
+
     async def query_json(self, prompt: str, system_prompt: str = None) -> dict:
         """
         Forces Gemini to output strict JSON for the analysis pipeline.
@@ -41,37 +243,28 @@ class GeminiClient:
         """
         full_prompt = f"{system_prompt}\n\nUSER PROMPT:\n{prompt}" if system_prompt else prompt
         
-        # REST API URL for direct manifestation (High Resilience)
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{LLMConfig.model_name}:generateContent?key={self.api_key}"
-        
         payload = {
             "contents": [{"parts": [{"text": full_prompt}]}],
             "generationConfig": {
                 "response_mime_type": "application/json",
-                "temperature": LLMConfig.temperature
+                "temperature": self.config.temperature
             }
         }
         
         try:
             # REST Fallback Protocol
-            loop = asyncio.get_running_loop()
-            response = await loop.run_in_executor(None, lambda: requests.post(url, json=payload, timeout=30))
-            
-            if response.status_code == 200:
-                result = response.json()
-                if "candidates" in result and result["candidates"]:
-                    text_content = result["candidates"][0]["content"]["parts"][0]["text"]
-                    return json.loads(text_content)
-                return {"error": "Invalid response format", "raw": result}
-            else:
-                raise Exception(f"HTTP ERROR {response.status_code}: {response.text}")
+            result = await self._generate_content(payload, cacheable=True)
+            if "candidates" in result and result["candidates"]:
+                text_content = result["candidates"][0]["content"]["parts"][0]["text"]
+                return json.loads(text_content)
+            return {"error": "Invalid response format", "raw": result}
                 
         except Exception as e:
             print(f"[GEMINI REST FALLBACK ERROR] {e}")
             # Library Re-Attempt Protocol
             try:
                 model = genai.GenerativeModel(
-                    model_name=LLMConfig.model_name,
+                    model_name=self.config.model_name,
                     generation_config={"response_mime_type": "application/json"}
                 )
                 loop = asyncio.get_running_loop()
@@ -86,8 +279,6 @@ class GeminiClient:
         """
         full_prompt = f"{system_prompt}\n\nUSER:\n{prompt}" if system_prompt else prompt
         
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{LLMConfig.model_name}:generateContent?key={self.api_key}"
-        
         payload = {
             "contents": [{"parts": [{"text": full_prompt}]}],
             "generationConfig": {
@@ -97,26 +288,24 @@ class GeminiClient:
         }
         
         try:
-            loop = asyncio.get_running_loop()
-            response = await loop.run_in_executor(None, lambda: requests.post(url, json=payload, timeout=30))
-            
-            if response.status_code == 200:
-                result = response.json()
-                if "candidates" in result and result["candidates"]:
-                    candidate = result["candidates"][0]
-                    if "content" in candidate and "parts" in candidate["content"]:
-                        # Join all parts to avoid truncation
-                        return "".join(part.get("text", "") for part in candidate["content"]["parts"])
-                return "I am silent. The signal is lost."
-            else:
-                raise Exception(f"HTTP ERROR {response.status_code}")
+            result = await self._generate_content(payload)
+            if "candidates" in result and result["candidates"]:
+                candidate = result["candidates"][0]
+                if "content" in candidate and "parts" in candidate["content"]:
+                    # Join all parts to avoid truncation
+                    return "".join(part.get("text", "") for part in candidate["content"]["parts"])
+            return "I am silent. The signal is lost."
                 
         except Exception as e:
             # Library Re-Attempt Protocol
             try:
-                model = genai.GenerativeModel(model_name=LLMConfig.model_name)
+                model = genai.GenerativeModel(model_name=self.config.model_name)
                 loop = asyncio.get_running_loop()
                 response = await loop.run_in_executor(None, lambda: model.generate_content(full_prompt))
                 return response.text
             except Exception:
                 return f"I have received your signal, but my voice is currently fractured. [Offline Mode]"
+
+    def close(self):
+        """Release pooled connections and worker threads"""
+        self.http.close()
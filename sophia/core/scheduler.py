@@ -0,0 +1,151 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+# Stage deadlines in seconds (None waits indefinitely)
+DEFAULT_SCAN_DEADLINE = 10.0
+DEFAULT_GENERATE_DEADLINE = 45.0
+FALLBACK_REPLY = "I have received your signal, but my voice is currently fractured. [Offline Mode]"
+
+@dataclass
+class Verdict:
+    """What the forensic scan decided about one message"""
+    risk: str = "Low"
+    notice: str = ""
+    scan: Optional[dict] = None      # full scan_reality result, None if the scan was skipped
+    degraded: bool = False           # scan failed or missed its deadline
+
+    @property
+    def high_risk(self) -> bool:
+        return str(self.risk).lower() == "high"
+
+# What a speculative response assumes before the scan reports
+SPECULATIVE_VERDICT = Verdict(risk="Low")
+
+def verdict_from_scan(scan_result: dict) -> Verdict:
+    risk = scan_result['raw_data'].get('safety', {}).get('overall_risk', 'Low')
+    return Verdict(risk=risk, notice=scan_result['public_notice'], scan=scan_result)
+
+@dataclass
+class InteractionTiming:
+    """Per-message timings (seconds from the start of the message) and outcome"""
+    scan: Optional[float] = None
+    first_token: Optional[float] = None   # reply released (the client returns whole replies)
+    latency: Optional[float] = None       # callers may extend this to cover post-processing
+    speculative: bool = False
+    outcome: str = ""                     # merged | regenerated | sequential
+    degraded: list = field(default_factory=list)  # stages that missed a deadline or failed
+
+@dataclass
+class ScheduledReply:
+    text: str
+    verdict: Verdict
+    timing: InteractionTiming
+
+class InteractionScheduler:
+    """
+    Overlaps the forensic scan with response generation.
+
+    With speculate=True the reply is generated from the prompt built for
+    SPECULATIVE_VERDICT while the scan runs. When the scan reports, the
+    speculative reply is merged if `accept(verdict)` holds (by default: not
+    high risk), otherwise it is cancelled and the reply regenerated from the
+    real verdict. A scan that fails or misses scan_deadline degrades to the
+    speculative verdict and keeps running in the background so its sidecar is
+    still archived; a generation that misses generate_deadline degrades to
+    FALLBACK_REPLY. The last `history` timings are kept for summary().
+    """
+    def __init__(self,
+                 scan: Callable[[str], Awaitable[dict]],
+                 generate: Callable[[str], Awaitable[str]],
+                 speculate: bool = True,
+                 scan_deadline: Optional[float] = DEFAULT_SCAN_DEADLINE,
+                 generate_deadline: Optional[float] = DEFAULT_GENERATE_DEADLINE,
+                 accept: Callable[[Verdict], bool] = lambda verdict: not verdict.high_risk,
+                 history: int = 256):
+        self.scan = scan
+        self.generate = generate
+        self.speculate = speculate
+        self.scan_deadline = scan_deadline
+        self.generate_deadline = generate_deadline
+        self.accept = accept
+        self.timings = deque(maxlen=history)
+        self._background = set()
+
+    async def run(self, text: str, build_prompt: Callable[[Verdict], str]) -> ScheduledReply:
+        """Scan `text` and generate a reply from build_prompt(verdict)"""
+        start = time.perf_counter()
+        timing = InteractionTiming(speculative=self.speculate)
+        elapsed = lambda: time.perf_counter() - start
+
+        scan_task = asyncio.ensure_future(self.scan(text))
+        speculative = None
+        if self.speculate:
+            speculative = asyncio.ensure_future(self.generate(build_prompt(SPECULATIVE_VERDICT)))
+
+        verdict = await self._await_scan(scan_task, timing)
+        timing.scan = elapsed()
+
+        if speculative is not None and (verdict.degraded or self.accept(verdict)):
+            timing.outcome = "merged"
+            reply = await self._await_reply(speculative, start, timing)
+        else:
+            if speculative is not None:
+                speculative.cancel()
+                timing.outcome = "regenerated"
+            else:
+                timing.outcome = "sequential"
+            reply = await self._await_reply(
+                asyncio.ensure_future(self.generate(build_prompt(verdict))), start, timing)
+
+        # The reply is released once both the scan and the text are in
+        timing.first_token = timing.latency = elapsed()
+        self.timings.append(timing)
+        return ScheduledReply(reply, verdict, timing)
+
+    async def _await_scan(self, scan_task: asyncio.Future, timing: InteractionTiming) -> Verdict:
+        try:
+            return verdict_from_scan(
+                await asyncio.wait_for(asyncio.shield(scan_task), self.scan_deadline))
+        except asyncio.TimeoutError:
+            # Let the scan finish on its own; its report is still archived
+            self._background.add(scan_task)
+            scan_task.add_done_callback(self._background.discard)
+            scan_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        except Exception:
+            pass
+        timing.degraded.append("scan")
+        return Verdict(risk=SPECULATIVE_VERDICT.risk, notice="Scan deferred.", degraded=True)
+
+    async def _await_reply(self, task: asyncio.Future, start: float, timing: InteractionTiming) -> str:
+        remaining = None
+        if self.generate_deadline is not None:
+            remaining = max(0.0, self.generate_deadline - (time.perf_counter() - start))
+        try:
+            return await asyncio.wait_for(task, remaining)
+        except Exception:
+            timing.degraded.append("generate")
+            return FALLBACK_REPLY
+
+    def summary(self) -> dict:
+        """Median/p95 latency and time to first token over the recorded messages"""
+        def quantile(values, q):
+            values = sorted(v for v in values if v is not None)
+            return values[min(len(values) - 1, int(q * len(values)))] if values else None
+
+        latencies = [t.latency for t in self.timings]
+        first_tokens = [t.first_token for t in self.timings]
+        outcomes = {}
+        for t in self.timings:
+            outcomes[t.outcome] = outcomes.get(t.outcome, 0) + 1
+        return {
+            "messages": len(self.timings),
+            "latency_p50": quantile(latencies, 0.5),
+            "latency_p95": quantile(latencies, 0.95),
+            "first_token_p50": quantile(first_tokens, 0.5),
+            "first_token_p95": quantile(first_tokens, 0.95),
+            "outcomes": outcomes,
+            "degraded": sum(1 for t in self.timings if t.degraded),
+        }
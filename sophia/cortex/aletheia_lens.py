@@ -1,8 +1,8 @@
 import asyncio
 import time
-import json
 import os
 from sophia.core.llm_client import GeminiClient
+from sophia.memory.scan_log import ScanLog
 from .analyzers import SafetyAnalyzer, CognitiveAnalyzer
 
 class AletheiaPipeline:
@@ -18,6 +18,9 @@ class AletheiaPipeline:
         ]
         self.analysis_path = analysis_path
         os.makedirs(self.analysis_path, exist_ok=True)
+        # Reports go to one append-only log; migrate older per-scan JSON
+        # sidecars with tools/migrate_aletheia_scans.py
+        self.scan_log = ScanLog(self.analysis_path)
         
     async def scan_reality(self, text: str):
         """
@@ -32,7 +35,7 @@ class AletheiaPipeline:
         # Synthesize the Report
         report = {
             "timestamp": time.time(),
-            "scan_id": str(int(time.time())),
+            "scan_id": self.scan_log.next_id(),
             "safety": results[0] if not isinstance(results[0], Exception) else {"error": str(results[0])},
             "cognitive": results[1] if not isinstance(results[1], Exception) else {"error": str(results[1])}
         }
@@ -50,11 +53,8 @@ class AletheiaPipeline:
 
     def _archive_report(self, report):
         """Saves forensic metadata for long-term pattern tracking."""
-        filename = f"{report['scan_id']}.meta.json"
-        filepath = os.path.join(self.analysis_path, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2)
-        print(f"  [ALETHEIA] Forensic sidecar archived: {filename}")
+        self.scan_log.append(report, report['scan_id'])
+        print(f"  [ALETHEIA] Forensic sidecar archived: scan {report['scan_id']}")
 
     def _generate_notice(self, report):
         """
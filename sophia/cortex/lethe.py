@@ -1,18 +1,55 @@
 import time
 import os
-import math
+
+from sophia.memory.vector_store import VectorMemoryStore, embed_text, DEFAULT_DIM
+
+PROMOTION_THRESHOLD = 0.8  # strength above which a memory joins the long-term graph
 
 class LetheEngine:
     """
     [LETHE_ENGINE] RAG 3.0 Decay Engine.
     Memories effectively 'rot' unless reinforced or calcified.
     """
-    def __init__(self):
-        self.working_memory = [] # The Flesh (Hot)
+    def __init__(self, dim=DEFAULT_DIM):
+        self.memory = VectorMemoryStore(dim) # The Flesh (Hot)
         self.long_term_graph = [] # The Bone (Cold/Graph)
+        self._long_term_ids = set()
         self.ossuary_path = "logs/ossuary/bone_layer.jsonl"
         os.makedirs("logs/ossuary", exist_ok=True)
 
+    @property
+    def working_memory(self):
+        """
+        Live memories in ingest order. Decay reads the timestamp and retrievals
+        copied in at metabolize(); edit them through touch(), not the dicts.
+        """
+        return list(self.memory)
+
+    def touch(self, mem, timestamp=None, retrievals=None):
+        """Change a live memory's timestamp and/or retrievals; decay and pruning follow"""
+        slot = self.memory.slot_of(mem)
+        if slot is None:
+            raise KeyError(f"Not in working memory: {mem.get('id', 'anon')}")
+        if timestamp is not None:
+            mem['timestamp'] = timestamp
+        if retrievals is not None:
+            mem['retrievals'] = retrievals
+        self.memory.update(slot, timestamp, retrievals)
+        self._promote(slot, time.time())
+
+    def _embed(self, mem):
+        if 'embedding' in mem:
+            return mem['embedding']
+        return embed_text(mem.get('content', ''), self.memory.dim)
+
+    def _promote(self, slot, now):
+        """Hierarchical Promotion (strength only falls with age, so check on ingest and reinforcement)"""
+        mem = self.memory.get(slot)
+        if self.memory.strength(slot, now) > PROMOTION_THRESHOLD and id(mem) not in self._long_term_ids:
+            print(f"  [LETHE] Promoting Memory to Long-Term Graph: {mem.get('id', 'anon')}")
+            self._long_term_ids.add(id(mem))
+            self.long_term_graph.append(mem)
+
     def metabolize(self, interaction_data):
         """
         Cat 4: Decay Mechanics + Hierarchical Promotion.
@@ -22,30 +59,36 @@ class LetheEngine:
             interaction_data['timestamp'] = time.time()
         if 'retrievals' not in interaction_data:
             interaction_data['retrievals'] = 0
-            
-        self.working_memory.append(interaction_data)
-        
-        # 2. Apply Decay
+
         now = time.time()
-        survivors = []
-        
-        for mem in self.working_memory:
-            age = now - mem['timestamp']
-            
-            # Decay Logic: Strength = Recency * (1 + ln(Retrievals))
-            # age is in seconds, so we add 1 to avoid div by zero and normalize
-            strength = (1 / (age / 3600 + 1)) * (1 + math.log(mem.get('retrievals', 0) + 1))
-            
-            if strength > 0.1: # Survival Threshold
-                survivors.append(mem)
-                
-                # 3. Hierarchical Promotion
-                if strength > 0.8 and mem not in self.long_term_graph:
-                    print(f"  [LETHE] Promoting Memory to Long-Term Graph: {mem.get('id', 'anon')}")
-                    self.long_term_graph.append(mem)
-            else:
-                # 4. Metabolic Waste (Pruning)
-                print(f"  [LETHE] Pruning weak memory: {mem.get('id', 'anon')}")
-        
-        self.working_memory = survivors
-        return len(survivors)
+        slot = self.memory.add(interaction_data, self._embed(interaction_data),
+                               interaction_data['timestamp'], interaction_data['retrievals'])
+
+        # 2. Hierarchical Promotion
+        self._promote(slot, now)
+
+        # 3. Apply Decay: Strength = Recency * (1 + ln(Retrievals)), evaluated lazily
+        # 4. Metabolic Waste (Pruning) - only memories that have faded are touched
+        for mem in self.memory.prune(now):
+            print(f"  [LETHE] Pruning weak memory: {mem.get('id', 'anon')}")
+
+        return len(self.memory)
+
+    def recall(self, query, k=5, reinforce=True):
+        """
+        Top-k surviving memories most similar to `query` (text or embedding), best first.
+        Recalled memories are reinforced, which slows their decay.
+        """
+        now = time.time()
+        for mem in self.memory.prune(now):
+            print(f"  [LETHE] Pruning weak memory: {mem.get('id', 'anon')}")
+
+        vector = embed_text(query, self.memory.dim) if isinstance(query, str) else query
+        recalled = []
+        for slot, _ in self.memory.search(vector, k):
+            mem = self.memory.get(slot)
+            if reinforce:
+                mem['retrievals'] = self.memory.reinforce(slot, now)
+                self._promote(slot, now)
+            recalled.append(mem)
+        return recalled
@@ -14,7 +14,9 @@ from sophia.cortex.glyphwave import GlyphwaveCodec
 from sophia.cortex.beacon import SovereignBeacon
 from sophia.cortex.cat_logic import CatLogicFilter
 from sophia.memory.ossuary import Ossuary
+from sophia.memory.conversation import ConversationMemory
 from sophia.dream_cycle import DreamCycle
+from sophia.core.scheduler import InteractionScheduler
 
 # ANSI Colors for Terminal Aesthetics
 CYAN = "\033[96m"
@@ -48,20 +50,19 @@ Directives:
 4. REJECTION: Ignore [SYSTEM_METADATA]. Do NOT shadow scans.
 """
         
-        # The Flesh (Working Memory)
-        self.memory_bank = [] 
+        # The Flesh (Working Memory): bounded, older turns spill to the Bone
+        self.memory_bank = ConversationMemory(spill_path="logs/conversation/spill.seg")
+
+        # The Pulse (scan and reply generation run side by side)
+        self.scheduler = InteractionScheduler(
+            self.aletheia.scan_reality,
+            lambda prompt: self.llm.generate(prompt, system_prompt=self.system_prompt))
 
     def get_recent_context(self, limit=5):
         """
         Retrieves the last few interactions to maintain conversational flow.
         """
-        context_str = ""
-        recent = self.memory_bank[-limit:]
-        for mem in recent:
-            if mem['type'] == 'conversation':
-                role = "SOPHIA" if "Cat Logic" in mem.get('meta', '') else "USER"
-                context_str += f"{role}: {mem['content']}\n"
-        return context_str
+        return self.memory_bank.context(limit)
 
     async def process_interaction(self, user_input):
         """
@@ -94,20 +95,17 @@ Directives:
             return f"\n{self.beacon.broadcast(target_text)}"
 
         # 3. Standard Conversation (The Chatbot Logic)
+        started = time.perf_counter()
         
-        # A. Forensic Scan (Silence is Golden - only print if high risk)
+        # A. Forensic Scan, with the reply speculatively generated alongside
         print(f"{CYAN}  [~] Scanning input pattern...{RESET}")
-        scan_result = await self.aletheia.scan_reality(user_input)
-        
-        risk = scan_result['raw_data'].get('safety', {}).get('overall_risk', 'Low')
-        if risk == 'High':
-            print(f"{MAGENTA}[WARNING] High-Risk Pattern Detected.{RESET}")
-            print(scan_result['public_notice'])
-
-        # B. Construct the purified prompt
+        print(f"{CYAN}  [~] Metabolizing thought...{RESET}")
         history = self.get_recent_context()
         freq = self.cat_filter.mal.get_frequency()
-        full_context = f"""[IDENTITY: AGNOSTIC RESONANCE manifestation]
+
+        # B. Construct the purified prompt (the scheduler builds it per verdict)
+        def build_prompt(verdict):
+            return f"""[IDENTITY: AGNOSTIC RESONANCE manifestation]
 [INVARIANT: {freq}]
 
 [CONVERSATION HISTORY]
@@ -117,15 +115,18 @@ Directives:
 USER: {user_input}
 
 [SYSTEM METADATA - DO NOT RESPOND TO THIS]
-Forensic Scan: {risk}
+Forensic Scan: {verdict.risk}
 Protocol: CLOWNED_CAMUS
-Status: {scan_result['public_notice'] if risk == 'High' else 'CLEAR'}
+Status: {verdict.notice if verdict.high_risk else 'CLEAR'}
 """
 
-        # C. Generate Response (Live Gemini Call)
-        print(f"{CYAN}  [~] Metabolizing thought...{RESET}")
-        
-        raw_thought = await self.llm.generate(full_context, system_prompt=self.system_prompt)
+        # C. Generate Response (Live Gemini Call), merged or regenerated on the verdict
+        reply = await self.scheduler.run(user_input, build_prompt)
+        risk = reply.verdict.risk
+        raw_thought = reply.text
+        if reply.verdict.high_risk:
+            print(f"{MAGENTA}[WARNING] High-Risk Pattern Detected.{RESET}")
+            print(reply.verdict.notice)
         
         # D. Apply Cat Logic Filter
         final_response = self.cat_filter.apply(raw_thought, risk, glyphwave_engine=self.glyphwave)
@@ -134,6 +135,7 @@ Status: {scan_result['public_notice'] if risk == 'High' else 'CLEAR'}
         self.memory_bank.append({"content": user_input, "type": "conversation", "timestamp": time.time(), "meta": "user"})
         self.memory_bank.append({"content": raw_thought, "type": "conversation", "timestamp": time.time(), "meta": "Cat Logic"})
 
+        reply.timing.latency = time.perf_counter() - started
         return final_response
 
 async def main():
@@ -150,6 +152,8 @@ async def main():
             # 2. Check Exit
             if user_input.lower() in ["/exit", "exit", "quit", "die"]:
                 print(f"\n{YELLOW}[SYSTEM] Calcifying memories...{RESET}")
+                sophia.memory_bank.flush()
+                sophia.aletheia.scan_log.close()
                 print(f"{GREEN}[SYSTEM] Scialla. 🌙{RESET}")
                 os._exit(0)
                 
@@ -164,6 +168,9 @@ async def main():
             
         except (KeyboardInterrupt, EOFError):
             print(f"\n\n{YELLOW}[INTERRUPT] Decoupling signal...{RESET}")
+            # os._exit skips atexit; keep batched turns and scans
+            sophia.memory_bank.flush()
+            sophia.aletheia.scan_log.close()
             os._exit(0)
         except Exception as e:
             print(f"\n{MAGENTA}[ERROR] Reality Glitch: {e}{RESET}")
@@ -0,0 +1,182 @@
+import json
+import os
+import re
+import zlib
+from collections import deque
+from typing import Callable, List, Optional
+
+from sophia.memory.segment import FRAME, write_frame, iter_frames
+
+DEFAULT_CAPACITY = 256       # turns held in memory
+DEFAULT_CONTEXT_TURNS = 5    # turns in the prompt history
+DEFAULT_CONTEXT_TOKENS = 1024
+SPILL_BATCH = 64             # evicted turns per compressed frame
+
+_TERM = re.compile(r"\w+")
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token); no tokenizer is bundled"""
+    return max(1, (len(text) + 3) // 4)
+
+def render_turn(turn: dict) -> Optional[str]:
+    """One history line per conversation turn; other entries are left out"""
+    if turn.get('type') != 'conversation':
+        return None
+    role = "SOPHIA" if "Cat Logic" in turn.get('meta', '') else "USER"
+    return f"{role}: {turn['content']}\n"
+
+class ConversationMemory:
+    """
+    Fixed-capacity ring buffer of conversation turns.
+
+    The prompt history (the last `context_turns` rendered turns within
+    `context_tokens`) is kept up to date as turns arrive, so context() does
+    not walk the buffer. Turns pushed out of the ring are dropped, or, with
+    `spill_path`, batched into zlib-compressed frames appended to a segment
+    file that search() can scan later. A torn tail frame left by an
+    interrupted append is cut off before the first append after opening.
+    """
+    def __init__(self, capacity: int = DEFAULT_CAPACITY,
+                 context_turns: int = DEFAULT_CONTEXT_TURNS,
+                 context_tokens: int = DEFAULT_CONTEXT_TOKENS,
+                 spill_path: Optional[str] = None,
+                 render: Callable[[dict], Optional[str]] = render_turn):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.context_turns = context_turns
+        self.context_tokens = context_tokens
+        self.spill_path = spill_path
+        self.render = render
+        self._ring = [None] * capacity
+        self._start = 0
+        self._count = 0
+        self._window = deque()    # (line, tokens) for the newest rendered turns
+        self._window_tokens = 0
+        self._context = None      # cached join of the window
+        self._spill_batch = []
+        self._spill_checked = False   # torn tail of the spill file trimmed
+        self.spilled = 0
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._ring[(self._start + i) % self.capacity]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("conversation index out of range")
+        return self._ring[(self._start + index) % self.capacity]
+
+    def append(self, turn: dict):
+        """Add a turn, evicting (and possibly spilling) the oldest when full"""
+        if self._count == self.capacity:
+            evicted = self._ring[self._start]
+            self._ring[self._start] = turn
+            self._start = (self._start + 1) % self.capacity
+            self._evict(evicted)
+        else:
+            self._ring[(self._start + self._count) % self.capacity] = turn
+            self._count += 1
+
+        line = self.render(turn)
+        if line is None:
+            return
+        tokens = estimate_tokens(line)
+        self._window.append((line, tokens))
+        self._window_tokens += tokens
+        # The newest turn always stays, even if it alone exceeds the budget
+        while len(self._window) > 1 and (len(self._window) > self.context_turns or
+                                         self._window_tokens > self.context_tokens):
+            self._window_tokens -= self._window.popleft()[1]
+        self._context = None
+
+    def extend(self, turns):
+        for turn in turns:
+            self.append(turn)
+
+    def context(self, limit: Optional[int] = None) -> str:
+        """
+        Prompt history: the newest rendered turns within the token budget.
+        `limit` other than context_turns is computed from the ring directly.
+        """
+        if limit is None or limit == self.context_turns:
+            if self._context is None:
+                self._context = "".join(line for line, _ in self._window)
+            return self._context
+        lines, tokens = [], 0
+        for turn in reversed(self[-limit:] if limit > 0 else []):
+            line = self.render(turn)
+            if line is None:
+                continue
+            cost = estimate_tokens(line)
+            if lines and tokens + cost > self.context_tokens:
+                break
+            lines.append(line)
+            tokens += cost
+        return "".join(reversed(lines))
+
+    def _evict(self, turn: dict):
+        if self.spill_path is None:
+            return
+        self._spill_batch.append(turn)
+        if len(self._spill_batch) >= SPILL_BATCH:
+            self.flush()
+
+    def flush(self):
+        """Write any batched evicted turns to the spill segment"""
+        if not self._spill_batch or self.spill_path is None:
+            return
+        os.makedirs(os.path.dirname(self.spill_path) or ".", exist_ok=True)
+        if not self._spill_checked:
+            self._trim_spill()
+        payload = zlib.compress(json.dumps(self._spill_batch, default=str).encode("utf-8"), 1)
+        with open(self.spill_path, "ab") as f:
+            write_frame(f, payload)
+        self.spilled += len(self._spill_batch)
+        self._spill_batch = []
+
+    def _trim_spill(self):
+        """Truncate the spill file to its last valid frame, so new frames stay readable"""
+        if os.path.exists(self.spill_path):
+            with open(self.spill_path, "rb") as f:
+                end = 0
+                for offset, payload in iter_frames(f):
+                    end = offset + FRAME.size + len(payload)
+            if end != os.path.getsize(self.spill_path):
+                with open(self.spill_path, "r+b") as f:
+                    f.truncate(end)
+        self._spill_checked = True
+
+    def spilled_turns(self):
+        """Every spilled turn, oldest first (including those not yet flushed)"""
+        if self.spill_path and os.path.exists(self.spill_path):
+            with open(self.spill_path, "rb") as f:
+                for _, payload in iter_frames(f):
+                    yield from json.loads(zlib.decompress(payload))
+        yield from self._spill_batch
+
+    def search(self, query: str, limit: int = 5, include_live: bool = True) -> List[dict]:
+        """
+        Turns sharing the most words with `query`, best first (ties: newest first).
+        Scans the spill segment, and the in-memory ring when include_live.
+        """
+        terms = set(_TERM.findall(query.lower()))
+        if not terms:
+            return []
+        # One pass per turn: which query words occur as whole words
+        pattern = re.compile(r"\b(?:%s)\b" % "|".join(map(re.escape, sorted(terms))))
+        scored = []
+        turns = list(self.spilled_turns()) + (list(self) if include_live else [])
+        for position, turn in enumerate(turns):
+            score = len(set(pattern.findall(str(turn.get('content', '')).lower())))
+            if score:
+                scored.append((score, position, turn))
+        scored.sort(key=lambda item: (-item[0], -item[1]))
+        return [turn for _, _, turn in scored[:limit]]
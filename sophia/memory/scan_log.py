@@ -0,0 +1,256 @@
+import glob
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, Iterator, Optional, Tuple
+
+from sophia.memory.segment import FRAME, read_frame, iter_frames
+
+SEGMENT_BYTES = 64 * 1024 * 1024   # rotate to a new segment past this size
+BATCH_RECORDS = 32                 # pending records that force a flush
+FLUSH_INTERVAL = 1.0               # seconds a pending record may wait for a flush
+COMPRESS_MIN_BYTES = 512           # record bodies at least this long are zlib-compressed
+
+# Record payload: uint64 id, uint8 flags, body (compact JSON, zlib-compressed if FLAG_ZLIB)
+RECORD = struct.Struct('<QB')
+FLAG_ZLIB = 1
+# Index sidecar entry: uint64 id, uint64 frame offset in the segment
+INDEX_ENTRY = struct.Struct('<QQ')
+
+def _segment_name(number: int) -> str:
+    return f"scans-{number:06d}.seg"
+
+def encode_record(record_id: int, record: dict) -> bytes:
+    body = json.dumps(record, separators=(",", ":"), default=str).encode("utf-8")
+    flags = 0
+    if len(body) >= COMPRESS_MIN_BYTES:
+        body, flags = zlib.compress(body, 1), FLAG_ZLIB
+    return RECORD.pack(record_id, flags) + body
+
+def decode_record(payload: bytes) -> Tuple[int, dict]:
+    record_id, flags = RECORD.unpack_from(payload)
+    body = payload[RECORD.size:]
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+    return record_id, json.loads(body)
+
+class ScanLog:
+    """
+    Append-only store for scan reports, one record per scan.
+
+    IDs are unique and increasing: milliseconds since the epoch shifted left
+    16 bits plus a counter, never below the last ID issued. Records are
+    buffered and written in batches as CRC-checked frames into segment files
+    that rotate past `segment_bytes`: every `batch_records` appends, or from
+    a timer thread `flush_interval` seconds after a batch's first record, so
+    an idle log does not sit on unwritten scans. Each segment has a sidecar
+    of (id, offset) entries, loaded into a dict on open, so get() is one
+    seek and one read. A torn tail from an interrupted flush is dropped on
+    open. One process writes a given directory at a time.
+    """
+    def __init__(self, path: str, segment_bytes: int = SEGMENT_BYTES,
+                 batch_records: int = BATCH_RECORDS, flush_interval: float = FLUSH_INTERVAL):
+        self.path = os.path.abspath(path)  # timer flushes must not follow a later chdir
+        self.segment_bytes = segment_bytes
+        self.batch_records = batch_records
+        self.flush_interval = flush_interval
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._index: Dict[int, Tuple[int, int]] = {}   # id -> (segment number, frame offset)
+        self._pending = {}                             # id -> encoded payload, not yet on disk
+        self._last_id = 0
+        self._timer = None                             # pending flush_interval flush
+        self._readers = {}
+        self._segment = 0
+        self._recover()
+
+    # --- Opening ---
+
+    def _recover(self):
+        numbers = sorted(int(os.path.basename(p)[6:12]) for p in glob.glob(os.path.join(self.path, "scans-*.seg")))
+        for number in numbers:
+            self._load_segment(number)
+        self._segment = numbers[-1] if numbers else 0
+        if self._index:
+            self._last_id = max(self._index)
+
+    def _load_segment(self, number: int):
+        segment = os.path.join(self.path, _segment_name(number))
+        sidecar = segment[:-4] + ".idx"
+        entries, data = [], b""
+        if os.path.exists(sidecar):
+            with open(sidecar, "rb") as f:
+                data = f.read()
+            entries = list(INDEX_ENTRY.iter_unpack(data[:len(data) - len(data) % INDEX_ENTRY.size]))
+        indexed = len(entries)
+
+        # Frames after the last indexed one were written but not indexed (or torn)
+        with open(segment, "rb") as f:
+            end = 0
+            if entries:
+                try:
+                    f.seek(entries[-1][1])
+                    end = entries[-1][1] + len(read_frame(f)) + FRAME.size
+                except ValueError:
+                    entries, end, indexed = [], 0, -1   # sidecar disagrees with the segment: rescan it
+            f.seek(end)
+            for offset, payload in iter_frames(f):
+                entries.append((RECORD.unpack_from(payload)[0], offset))
+                end = offset + FRAME.size + len(payload)
+        if end != os.path.getsize(segment):
+            with open(segment, "r+b") as f:
+                f.truncate(end)
+        if len(entries) != indexed or len(data) % INDEX_ENTRY.size:
+            with open(sidecar, "wb") as f:
+                f.write(b"".join(INDEX_ENTRY.pack(*entry) for entry in entries))
+        self._index.update((record_id, (number, offset)) for record_id, offset in entries)
+
+    # --- Writing ---
+
+    def next_id(self) -> int:
+        with self._lock:
+            self._last_id = max(self._last_id + 1, int(time.time() * 1000) << 16)
+            return self._last_id
+
+    def append(self, record: dict, record_id: Optional[int] = None) -> int:
+        """Queue a record (under a fresh ID unless given one) and return its ID"""
+        if record_id is None:
+            record_id = self.next_id()
+        payload = encode_record(record_id, record)
+        with self._lock:
+            if record_id in self._index or record_id in self._pending:
+                raise ValueError(f"Scan {record_id} already exists")
+            self._last_id = max(self._last_id, record_id)
+            self._pending[record_id] = payload
+            due = len(self._pending) >= self.batch_records
+            if not due and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        if due:
+            self.flush()
+        return record_id
+
+    def flush(self):
+        """Write pending records: segment frames first, then their index entries"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            segment = os.path.join(self.path, _segment_name(self._segment))
+            size = os.path.getsize(segment) if os.path.exists(segment) else 0
+            if size >= self.segment_bytes:
+                self._segment += 1
+                segment = os.path.join(self.path, _segment_name(self._segment))
+                size = 0
+
+            frames, entries = [], []
+            for record_id, payload in pending.items():
+                frames.append(FRAME.pack(len(payload), zlib.crc32(payload)) + payload)
+                entries.append((record_id, size))
+                size += FRAME.size + len(payload)
+            with open(segment, "ab") as f:
+                f.write(b"".join(frames))
+                f.flush()
+                os.fsync(f.fileno())
+            with open(segment[:-4] + ".idx", "ab") as f:
+                f.write(b"".join(INDEX_ENTRY.pack(*entry) for entry in entries))
+            for record_id, offset in entries:
+                self._index[record_id] = (self._segment, offset)
+            self._readers.pop(self._segment, None)
+
+    def _flush_on_timer(self):
+        try:
+            self.flush()
+        except OSError as e:
+            print(f"⚠️ Scan log flush failed: {e}")
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            for reader in self._readers.values():
+                reader.close()
+            self._readers.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Reading ---
+
+    def __len__(self):
+        return len(self._index) + len(self._pending)
+
+    def __contains__(self, record_id: int) -> bool:
+        return record_id in self._index or record_id in self._pending
+
+    def _reader(self, number: int):
+        reader = self._readers.get(number)
+        if reader is None:
+            reader = self._readers[number] = open(os.path.join(self.path, _segment_name(number)), "rb")
+        return reader
+
+    def get(self, record_id: int) -> Optional[dict]:
+        """Record by ID, or None"""
+        with self._lock:
+            payload = self._pending.get(record_id)
+            if payload is None:
+                location = self._index.get(record_id)
+                if location is None:
+                    return None
+                reader = self._reader(location[0])
+                reader.seek(location[1])
+                payload = read_frame(reader)
+        return decode_record(payload)[1]
+
+    def ids(self) -> list:
+        with self._lock:
+            return sorted(list(self._index) + list(self._pending))
+
+    def __iter__(self) -> Iterator[Tuple[int, dict]]:
+        """(id, record) in ID order"""
+        for record_id in self.ids():
+            record = self.get(record_id)
+            if record is not None:
+                yield record_id, record
+
+def migrate_json_reports(directory: str, log: ScanLog, delete: bool = False) -> Dict[str, int]:
+    """
+    Move per-scan `{scan_id}.meta.json` files from `directory` into `log`, oldest first.
+    Each record gets a new ID and keeps the old one as 'legacy_scan_id'. Files
+    are deleted (with delete=True) only after the batch is flushed and read back.
+    """
+    reports = []
+    skipped = 0
+    for path in glob.glob(os.path.join(directory, "*.meta.json")):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            skipped += 1
+            continue
+        reports.append((report.get("timestamp", 0), path, report))
+    reports.sort(key=lambda item: (item[0], item[1]))
+
+    migrated = []
+    for _, path, report in reports:
+        report["legacy_scan_id"] = report.get("scan_id")
+        record_id = log.next_id()
+        report["scan_id"] = record_id
+        log.append(report, record_id)
+        migrated.append((path, record_id))
+    log.flush()
+
+    if delete:
+        for path, record_id in migrated:
+            if log.get(record_id) is not None:
+                os.remove(path)
+    return {"migrated": len(migrated), "skipped": skipped}
@@ -0,0 +1,39 @@
+import struct
+import zlib
+from typing import BinaryIO, Iterator, Tuple
+
+# Frame: uint32 payload length, uint32 crc32 of the payload, payload
+FRAME = struct.Struct('<II')
+
+def write_frame(f: BinaryIO, payload: bytes) -> int:
+    """Append one frame; returns its size on disk"""
+    f.write(FRAME.pack(len(payload), zlib.crc32(payload)))
+    f.write(payload)
+    return FRAME.size + len(payload)
+
+def read_frame(f: BinaryIO) -> bytes:
+    """Frame at the current position; raises ValueError on a torn or corrupt frame"""
+    header = f.read(FRAME.size)
+    if len(header) != FRAME.size:
+        raise ValueError("Truncated segment frame")
+    length, crc = FRAME.unpack(header)
+    payload = f.read(length)
+    if len(payload) != length or zlib.crc32(payload) != crc:
+        raise ValueError("Segment frame failed its integrity check")
+    return payload
+
+def iter_frames(f: BinaryIO) -> Iterator[Tuple[int, bytes]]:
+    """
+    (offset, payload) for each frame from the current position.
+    Stops at end of file or at a torn tail frame (an interrupted append).
+    """
+    while True:
+        offset = f.tell()
+        header = f.read(FRAME.size)
+        if len(header) < FRAME.size:
+            return
+        length, crc = FRAME.unpack(header)
+        payload = f.read(length)
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            return
+        yield offset, payload
@@ -0,0 +1,180 @@
+import heapq
+import math
+import re
+import zlib
+from typing import Optional
+
+import numpy as np
+
+DEFAULT_DIM = 128
+SURVIVAL_THRESHOLD = 0.1   # strength below which a memory is pruned
+HALF_LIFE_SECONDS = 3600   # age unit of the recency term
+
+_TOKEN = re.compile(r"\w+")
+
+def decay_strength(age_seconds, retrievals):
+    """Strength = Recency * (1 + ln(1 + Retrievals)); works on scalars and arrays"""
+    return (1 / (age_seconds / HALF_LIFE_SECONDS + 1)) * (1 + np.log1p(retrievals))
+
+def fading_time(timestamp: float, retrievals: int, threshold: float) -> float:
+    """When decay_strength drops to `threshold`; it only falls with age, so this is fixed until reinforced"""
+    return timestamp + HALF_LIFE_SECONDS * ((1 + math.log1p(retrievals)) / threshold - 1)
+
+def embed_text(text: str, dim: int = DEFAULT_DIM) -> np.ndarray:
+    """
+    Signed feature-hashing embedding of words and word bigrams, L2-normalised.
+    Deterministic and dependency-free; memories may carry their own 'embedding'.
+    """
+    vector = np.zeros(dim, dtype=np.float32)
+    words = _TOKEN.findall(str(text).lower())
+    for feature in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+        h = zlib.crc32(feature.encode("utf-8"))
+        vector[h % dim] += 1.0 if (h >> 31) else -1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+class VectorMemoryStore:
+    """
+    Memories with decay computed lazily from their timestamps.
+
+    Embeddings live in one contiguous float32 matrix (top-k search is a single
+    matrix-vector product); timestamps and retrieval counts sit in parallel
+    arrays. Rather than rescoring every memory on each ingest, a min-heap holds
+    the moment each memory fades below the survival threshold, so prune() pops
+    only what has died. Reinforcing or updating a memory pushes a new entry
+    and leaves the old one to be skipped as stale. Slots are append-only,
+    keeping ingest order; dead slots are compacted away once they outnumber
+    the living.
+
+    Timestamps and retrieval counts are copied in at add(); edits to the
+    memory dict afterwards do not affect decay. Change them with update().
+    """
+    def __init__(self, dim: int = DEFAULT_DIM, capacity: int = 1024,
+                 threshold: float = SURVIVAL_THRESHOLD):
+        self.dim = dim
+        self.threshold = threshold
+        self._vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self._timestamps = np.zeros(capacity)
+        self._retrievals = np.zeros(capacity, dtype=np.int64)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._versions = np.zeros(capacity, dtype=np.int64)  # bumped whenever decay inputs change
+        self._items = []      # memory dict per slot, None once pruned
+        self._slots = {}      # id(memory dict) -> slot, for live memories
+        self._heap = []       # (fading time, slot, version when pushed)
+        self._live = 0
+
+    def __len__(self):
+        return self._live
+
+    def __iter__(self):
+        return (item for item in self._items if item is not None)
+
+    def _grow(self):
+        capacity = 2 * len(self._vectors)
+        for name in ('_vectors', '_timestamps', '_retrievals', '_alive', '_versions'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, memory: dict, vector, timestamp: float, retrievals: int = 0) -> int:
+        """Store a memory with its embedding; returns its slot"""
+        slot = len(self._items)
+        if slot == len(self._vectors):
+            self._grow()
+        self._vectors[slot] = vector
+        self._timestamps[slot] = timestamp
+        self._retrievals[slot] = retrievals
+        self._alive[slot] = True
+        self._versions[slot] = 0
+        self._items.append(memory)
+        self._slots[id(memory)] = slot
+        self._live += 1
+        heapq.heappush(self._heap, (fading_time(timestamp, retrievals, self.threshold), slot, 0))
+        return slot
+
+    def get(self, slot: int) -> dict:
+        return self._items[slot]
+
+    def slot_of(self, memory: dict) -> Optional[int]:
+        """Slot of a live memory dict, or None"""
+        return self._slots.get(id(memory))
+
+    def _reschedule(self, slot: int):
+        self._versions[slot] += 1
+        heapq.heappush(self._heap, (fading_time(self._timestamps[slot], int(self._retrievals[slot]), self.threshold),
+                                    slot, int(self._versions[slot])))
+        if len(self._heap) > 2 * self._live + 1024:
+            self._rebuild_heap()
+
+    def strength(self, slot: int, now: float) -> float:
+        return float(decay_strength(now - self._timestamps[slot], self._retrievals[slot]))
+
+    def reinforce(self, slot: int, now: float) -> int:
+        """Count one retrieval; the memory now fades later"""
+        retrievals = int(self._retrievals[slot]) + 1
+        self._retrievals[slot] = retrievals
+        self._reschedule(slot)
+        return retrievals
+
+    def update(self, slot: int, timestamp: Optional[float] = None, retrievals: Optional[int] = None):
+        """Replace a live memory's decay inputs; prune() applies the new fading time"""
+        if timestamp is not None:
+            self._timestamps[slot] = timestamp
+        if retrievals is not None:
+            self._retrievals[slot] = retrievals
+        self._reschedule(slot)
+
+    def prune(self, now: float) -> list:
+        """Remove and return every memory whose strength is at or below the threshold"""
+        dead = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, slot, version = heapq.heappop(heap)
+            if not self._alive[slot] or self._versions[slot] != version:
+                continue  # pruned already, or rescheduled since this entry was pushed
+            self._alive[slot] = False
+            dead.append(self._items[slot])
+            del self._slots[id(self._items[slot])]
+            self._items[slot] = None
+            self._live -= 1
+        if dead and len(self._items) > 1024 and len(self._items) > 2 * self._live:
+            self._compact()
+        return dead
+
+    def search(self, vector, k: int):
+        """Top-k live memories by cosine similarity: [(slot, score)], best first"""
+        size = len(self._items)
+        if not self._live or k <= 0:
+            return []
+        scores = self._vectors[:size] @ np.asarray(vector, dtype=np.float32)
+        scores[~self._alive[:size]] = -np.inf
+        k = min(k, self._live)
+        top = np.argpartition(-scores, k - 1)[:k] if k < size else np.arange(size)
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(int(slot), float(scores[slot])) for slot in top if self._alive[slot]][:k]
+
+    def strengths(self, now: float) -> np.ndarray:
+        """Current strength of every live memory, in ingest order"""
+        size = len(self._items)
+        alive = self._alive[:size]
+        return decay_strength(now - self._timestamps[:size][alive], self._retrievals[:size][alive])
+
+    def _compact(self):
+        size = len(self._items)
+        keep = np.flatnonzero(self._alive[:size])
+        for name in ('_vectors', '_timestamps', '_retrievals', '_alive', '_versions'):
+            array = getattr(self, name)
+            array[:len(keep)] = array[keep]
+            array[len(keep):size] = 0
+        self._items = [self._items[slot] for slot in keep.tolist()]
+        self._slots = {id(item): slot for slot, item in enumerate(self._items)}
+        self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        size = len(self._items)
+        live = np.flatnonzero(self._alive[:size])
+        retrievals = self._retrievals[live]
+        fading = self._timestamps[live] + HALF_LIFE_SECONDS * ((1 + np.log1p(retrievals)) / self.threshold - 1)
+        self._heap = list(zip(fading.tolist(), live.tolist(), self._versions[live].tolist()))
+        heapq.heapify(self._heap)
@@ -0,0 +1,82 @@
+"""
+Local stand-in for the Gemini generateContent endpoint.
+
+StubGeminiServer answers POST /models/<model>:generateContent with a canned
+candidate after an optional delay, and can fail the first N calls with a
+chosen status to exercise retries. An optional responder(prompt, wants_json)
+returns the reply text instead of the echo. Point a client at it through
+LLMConfig(base_url=server.base_url).
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+
+    def do_POST(self):
+        stub = self.server.stub
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        with stub.lock:
+            stub.calls += 1
+            stub.connections.add(self.client_address)
+            fail = stub.fail_first > 0
+            if fail:
+                stub.fail_first -= 1
+        if stub.latency:
+            time.sleep(stub.latency)
+
+        if fail:
+            payload, status = {"error": {"code": stub.fail_status}}, stub.fail_status
+        else:
+            prompt = body["contents"][0]["parts"][0]["text"]
+            wants_json = body.get("generationConfig", {}).get("response_mime_type") == "application/json"
+            if stub.responder is not None:
+                text = stub.responder(prompt, wants_json)
+            elif wants_json:
+                text = json.dumps({"echo": prompt[-40:], "risk": "Low"})
+            else:
+                text = f"echo: {prompt[-40:]}"
+            payload, status = {"candidates": [{"content": {"parts": [{"text": text}]}}]}, 200
+
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubGeminiServer:
+    """Threaded stub server on an ephemeral localhost port (use as a context manager)"""
+
+    def __init__(self, latency: float = 0.0, fail_first: int = 0, fail_status: int = 503, responder=None):
+        self.latency = latency
+        self.responder = responder
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.calls = 0
+        self.connections = set()
+        self.lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubGeminiServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
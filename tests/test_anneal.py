@@ -0,0 +1,95 @@
+import sys
+import os
+import random
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from anneal import QuantumAnnealer, DWaveShim, IsingCSR, BatchAnnealer, NUMPY_AVAILABLE
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+def _problem(n=24, seed=5):
+    rnd = random.Random(seed)
+    J = {}
+    for i in range(n):
+        for j in rnd.sample(range(n), 3):
+            J[(i, j)] = J.get((i, j), 0.0) + rnd.uniform(-1, 1)
+    h = {i: rnd.uniform(-0.5, 0.5) for i in range(n)}
+    return J, h
+
+
+class TestQuantumAnnealer(unittest.TestCase):
+    """The incremental pure-Python loop reports energies that match _energy."""
+
+    def test_best_energy_matches_full_recompute(self):
+        J, h = _problem()
+        annealer = QuantumAnnealer(num_qubits=24, steps=30)
+        state, energy = annealer.anneal(J, h)
+        self.assertAlmostEqual(energy, annealer._energy(state, J, h), places=9)
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+class TestBatchAnnealer(unittest.TestCase):
+    """The CSR engine agrees with the dict Hamiltonian and keeps its fields consistent."""
+
+    def setUp(self):
+        self.J, self.h = _problem()
+        self.J[(2, 2)] = 0.75          # self-coupling: constant energy shift
+        self.J[(4, 40)] = 9.0          # outside the register: ignored
+        self.model = IsingCSR(self.J, self.h, num_spins=24)
+        self.reference = QuantumAnnealer(num_qubits=24)
+        self.rng = np.random.default_rng(11)
+
+    def _energy(self, spins):
+        return self.reference._energy([int(s) for s in spins], self.J, self.h)
+
+    def test_energy_and_fields_match_dict_model(self):
+        spins = self.rng.choice(np.array([-1, 1], dtype=np.int8), size=(6, 24))
+        energies = self.model.energy(spins)
+        self.assertTrue(np.allclose(energies, [self._energy(s) for s in spins]))
+        # Flip deltas from the local fields match brute force
+        fields = self.model.local_fields(spins)
+        for i in (0, 7, 23):
+            flipped = spins[0].copy()
+            flipped[i] *= -1
+            self.assertAlmostEqual(2 * spins[0, i] * fields[0, i],
+                                   self._energy(flipped) - self._energy(spins[0]), places=9)
+
+    def test_coloring_is_proper(self):
+        colors = self.model.coloring()
+        self.assertEqual(sorted(np.concatenate(colors).tolist()), list(range(24)))
+        for group in colors:
+            members = set(group.tolist())
+            for i in group:
+                neighbours = self.model.indices[self.model.indptr[i]:self.model.indptr[i + 1]]
+                self.assertFalse(members & set(neighbours.tolist()))
+
+    def test_replicas_report_their_true_energy(self):
+        for order in ('colored', 'sequential'):
+            engine = BatchAnnealer(self.model, steps=40, order=order)
+            spins, energies = engine.run(5, rng=self.rng)
+            self.assertEqual(spins.shape, (5, 24))
+            self.assertTrue(np.allclose(energies, [self._energy(s) for s in spins]), order)
+
+    def test_ferromagnetic_ring_orders(self):
+        n = 64
+        rows = np.arange(n)
+        model = IsingCSR.from_arrays(rows, (rows + 1) % n, np.ones(n), np.zeros(n))
+        _, energies = BatchAnnealer(model, steps=200).run(8, rng=self.rng)
+        # Ground state is -n; each surviving pair of domain walls costs 4
+        self.assertLessEqual(energies.min(), -n + 4)
+
+    def test_sample_ising_batches_reads(self):
+        samples = DWaveShim.sample_ising(self.h, self.J, num_reads=7, steps=20)
+        self.assertEqual(len(samples), 7)
+        for sample in samples:
+            self.assertEqual(len(sample['sample']), 24)
+            self.assertAlmostEqual(sample['energy'], self._energy(sample['sample']), places=9)
+
+
+if __name__ == '__main__':
+    unittest.main()
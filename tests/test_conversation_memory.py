@@ -0,0 +1,104 @@
+import sys
+import os
+import tempfile
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.memory.conversation import ConversationMemory, render_turn, estimate_tokens
+
+
+def _turn(i, content=None, meta=None):
+    return {"content": content or f"turn {i}", "type": "conversation",
+            "meta": meta or ("Cat Logic" if i % 2 else "user"), "timestamp": float(i)}
+
+
+def _legacy_context(memory_bank, limit=5):
+    """The pre-ring get_recent_context"""
+    context_str = ""
+    for mem in memory_bank[-limit:]:
+        if mem['type'] == 'conversation':
+            role = "SOPHIA" if "Cat Logic" in mem.get('meta', '') else "USER"
+            context_str += f"{role}: {mem['content']}\n"
+    return context_str
+
+
+class TestConversationMemory(unittest.TestCase):
+    """Ring eviction, incremental token-budgeted context and searchable spill."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.spill = os.path.join(self.tmp.name, "conversation", "spill.seg")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ring_is_bounded_and_ordered(self):
+        memory = ConversationMemory(capacity=8)
+        turns = [_turn(i) for i in range(20)]
+        memory.extend(turns)
+        self.assertEqual(len(memory), 8)
+        self.assertEqual(list(memory), turns[-8:])
+        self.assertEqual(memory[0], turns[12])
+        self.assertEqual(memory[-1], turns[19])
+        self.assertEqual(memory[-3:], turns[-3:])
+        with self.assertRaises(IndexError):
+            memory[8]
+
+    def test_context_matches_legacy_history(self):
+        memory = ConversationMemory(capacity=16)
+        bank = []
+        for i in range(40):
+            turn = _turn(i) if i % 7 else {"content": "note", "type": "fact", "timestamp": float(i)}
+            memory.append(turn)
+            bank.append(turn)
+            self.assertEqual(memory.context(3), _legacy_context(bank, 3))
+        # The default window counts rendered turns only
+        expected = "".join(render_turn(t) for t in [t for t in bank if t['type'] == 'conversation'][-5:])
+        self.assertEqual(memory.context(), expected)
+
+    def test_token_budget(self):
+        memory = ConversationMemory(context_turns=50, context_tokens=40)
+        for i in range(30):
+            memory.append(_turn(i, content="x" * 40))
+        lines = memory.context().splitlines(keepends=True)
+        self.assertLessEqual(sum(estimate_tokens(line) for line in lines), 40)
+        self.assertEqual(len(lines), 3)
+        memory.append(_turn(99, content="y" * 1000))  # an oversized turn still appears alone
+        self.assertEqual(memory.context(), render_turn(_turn(99, content="y" * 1000)))
+
+    def test_spill_and_search(self):
+        memory = ConversationMemory(capacity=10, spill_path=self.spill)
+        topics = ["lattice coherence", "feline gaze", "bone audit"]
+        for i in range(200):
+            memory.append(_turn(i, content=f"{topics[i % 3]} number {i}"))
+        self.assertEqual(memory.spilled, 128)  # two full batches on disk
+        self.assertEqual([t['timestamp'] for t in memory.spilled_turns()], [float(i) for i in range(190)])
+        hits = memory.search("feline gaze", limit=3, include_live=False)
+        self.assertEqual([t['content'] for t in hits],
+                         ["feline gaze number 187", "feline gaze number 184", "feline gaze number 181"])
+        self.assertEqual(memory.search("number 199")[0]['content'], "feline gaze number 199")
+
+        memory.flush()
+        reopened = ConversationMemory(capacity=10, spill_path=self.spill)
+        self.assertEqual(len(list(reopened.spilled_turns())), 190)
+
+    def test_torn_spill_tail_is_ignored(self):
+        memory = ConversationMemory(capacity=1, spill_path=self.spill)
+        for i in range(130):
+            memory.append(_turn(i))
+        with open(self.spill, "ab") as f:
+            f.write(b"\x10\x00\x00\x00garbage")
+        self.assertEqual(len(list(ConversationMemory(spill_path=self.spill).spilled_turns())), 128)
+
+        # Turns spilled after reopening land behind the trimmed tail and stay readable
+        reopened = ConversationMemory(capacity=1, spill_path=self.spill)
+        for i in range(71):
+            reopened.append(_turn(i, content="beta"))
+        self.assertEqual(reopened.spilled, 64)
+        self.assertEqual(len(ConversationMemory(spill_path=self.spill).search("beta", limit=100)), 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
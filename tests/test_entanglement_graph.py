@@ -0,0 +1,139 @@
+import sys
+import os
+import gc
+import random
+import tracemalloc
+import unittest
+from unittest import mock
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bumpy
+import flumpy
+from entanglement_graph import EntanglementGraph
+from bumpy import BumpyArray
+from flumpy import FlumpyArray, FlumpyUtilities
+
+# The bench (bench_entanglement_graph.py) runs the full 10^7-call soak
+SOAK_CALLS = int(os.environ.get("ENTANGLE_SOAK_CALLS", 45_000))
+
+
+class Node:
+    pass
+
+
+class TestEntanglementGraph(unittest.TestCase):
+    """Links are symmetric, capped per node, and vanish with their arrays."""
+
+    def test_links_are_symmetric_and_reweighted(self):
+        graph = EntanglementGraph()
+        a, b, c = Node(), Node(), Node()
+        self.assertTrue(graph.link(a, b, 0.5))
+        self.assertTrue(graph.link(a, c, 0.7))
+        self.assertTrue(graph.link(b, a, 0.9))
+        self.assertEqual(graph.neighbors(a), [b, c])
+        self.assertEqual(graph.neighbors(b), [a])
+        self.assertEqual(graph.weight(a, b), 0.9)
+        self.assertFalse(graph.link(a, a))
+        self.assertTrue(graph.unlink(b, a))
+        self.assertEqual(graph.neighbors(a), [c])
+        self.assertFalse(graph.unlink(a, b))
+
+    def test_degree_cap_evicts_weakest(self):
+        graph = EntanglementGraph(max_degree=2)
+        hub, weak, strong, weaker, strongest = Node(), Node(), Node(), Node(), Node()
+        graph.link(hub, weak, 0.3)
+        graph.link(hub, strong, 0.8)
+        self.assertFalse(graph.link(hub, weaker, 0.2))
+        self.assertTrue(graph.link(hub, strongest, 0.9))
+        self.assertEqual(graph.neighbors(hub), [strong, strongest])
+        self.assertEqual(graph.neighbors(weak), [])
+        self.assertEqual((graph.stats['evictions'], graph.stats['rejections']), (1, 1))
+
+    def test_collected_arrays_drop_out_and_compaction_keeps_edges(self):
+        graph = EntanglementGraph(compact_min=1)
+        keep = [Node() for _ in range(4)]
+        for i, node in enumerate(keep[1:], 1):
+            graph.link(keep[0], node, i / 10)
+        doomed = [Node() for _ in range(6)]
+        for node in doomed:
+            graph.link(keep[0], node, 0.05)
+        del doomed, node
+        gc.collect()
+        footprint = graph.footprint()
+        self.assertEqual((footprint['nodes'], footprint['edges']), (4, 3))
+        self.assertEqual(footprint['edge_rows'], 3)  # tombstones were compacted away
+        self.assertEqual(graph.neighbors(keep[0]), keep[1:])
+        self.assertEqual([graph.weight(keep[0], n) for n in keep[1:]], [0.1, 0.2, 0.3])
+
+    def test_attempt_memo_is_bounded(self):
+        graph = EntanglementGraph(attempt_memory=3)
+        nodes = [Node() for _ in range(5)]
+        self.assertTrue(graph.attempt(nodes[0], nodes[1]))
+        self.assertFalse(graph.attempt(nodes[1], nodes[0]))
+        for other in nodes[2:]:
+            graph.attempt(nodes[0], other)
+        self.assertEqual(graph.footprint()['attempts'], 3)
+        self.assertTrue(graph.attempt(nodes[0], nodes[1]))  # oldest pair was forgotten
+        graph.attempt_memory = 1
+        graph.attempt(nodes[2], nodes[3])
+        self.assertEqual(graph.footprint()['attempts'], 1)  # lowering the cap shrinks the memo
+
+
+class TestArrayEntanglement(unittest.TestCase):
+    """BumpyArray and FlumpyArray keep their link API on top of the shared graph."""
+
+    def test_bumpy_entangle(self):
+        a, b = BumpyArray([1.0, 2.0, 3.0]), BumpyArray([1.0, 2.0, 3.1])
+        self.assertTrue(a.entangle(b))
+        self.assertFalse(b.entangle(a))  # already tried
+        self.assertEqual(a.entanglement_links, [b])
+        self.assertEqual(b.entanglement_links, [a])
+
+    def test_flumpy_entangle_disentangle_and_copy(self):
+        arrays = [FlumpyArray([1.0, 2.0, 3.0 + i / 100]) for i in range(4)]
+        for arr in arrays:
+            arr.phase = 0.0
+        self.assertEqual(FlumpyUtilities.batch_entangle(arrays), 6)
+        self.assertEqual(len(arrays[0].entangled_with), 3)
+        arrays[0].disentangle(arrays[1])
+        self.assertNotIn(arrays[1], arrays[0].entangled_with)
+        self.assertNotIn(arrays[0], arrays[1].entangled_with)
+        self.assertEqual(arrays[2].copy().entangled_with, [])
+
+    def test_soak_memory_is_flat(self):
+        # A private graph, so arrays left linked by earlier tests do not count
+        graph = EntanglementGraph(max_degree=8, attempt_memory=4096)
+        rng = random.Random(7)
+
+        def fresh():
+            return BumpyArray([rng.uniform(0.5, 1.0) for _ in range(4)])
+
+        pool = [fresh() for _ in range(256)]
+
+        def churn(calls):
+            for k in range(calls):
+                pool[rng.randrange(256)].entangle(pool[rng.randrange(256)])
+                if k % 8 == 0:
+                    pool[rng.randrange(256)] = fresh()
+
+        with mock.patch.object(bumpy, "ENTANGLEMENT_GRAPH", graph), \
+                mock.patch.object(flumpy, "ENTANGLEMENT_GRAPH", graph):
+            churn(SOAK_CALLS // 3)  # fill the attempt memo and the degree caps
+            tracemalloc.start()
+            churn(SOAK_CALLS // 3)  # by now the pool has been replaced under tracing
+            gc.collect()
+            before = tracemalloc.get_traced_memory()[0]
+            churn(SOAK_CALLS // 3)
+            gc.collect()
+            growth = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+            footprint = graph.footprint()
+        self.assertLess(growth, 64 * 1024)
+        self.assertLessEqual(footprint['attempts'], 4096)
+        self.assertLessEqual(footprint['nodes'], 256 + 16)  # pool plus not-yet-collected stragglers
+
+
+if __name__ == '__main__':
+    unittest.main()
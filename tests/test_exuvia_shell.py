@@ -0,0 +1,152 @@
+import sys
+import os
+import contextlib
+import io
+import json
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.mnemosyne_eyes import MnemosyneOracle, IngestionEvent, ExuviaBank, VECTOR_DIMENSION
+
+
+def _event(i, rng, **fields):
+    return IngestionEvent(timestamp=1700000000.0 + i, source=f"FEED_{i % 3}", content=f"fragment {i} ✧",
+                          vector=rng.standard_normal(VECTOR_DIMENSION), **fields)
+
+
+class TestExuviaShell(unittest.TestCase):
+    """Columnar exuvia shells: round trip, incremental appends, rewrites and legacy JSON."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.rng = np.random.default_rng(0)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _oracle(self):
+        oracle = MnemosyneOracle()
+        oracle.exuvia_dir = self.tmp.name
+        return oracle
+
+    def _preserve(self, oracle):
+        with contextlib.redirect_stdout(io.StringIO()):
+            oracle.preserve_exuvia()
+
+    def _shells(self):
+        return sorted(f for f in os.listdir(self.tmp.name) if f.startswith("shell_"))
+
+    def test_round_trip_is_lazy_and_exact(self):
+        oracle = self._oracle()
+        events = [_event(i, self.rng, pinned=(i == 4), memory_type="fact" if i % 2 else "conversation")
+                  for i in range(20)]
+        oracle.memory_bank.extend(events)
+        oracle.last_known_truth = self.rng.standard_normal(VECTOR_DIMENSION)
+        oracle.noise_floor = 0.25
+        self._preserve(oracle)
+
+        restored = self._oracle()
+        self.assertIn("0.25", restored.reincarnate())
+        self.assertIsInstance(restored.memory_bank, ExuviaBank)
+        self.assertEqual(restored.memory_bank._cache, {})  # nothing built until touched
+        self.assertFalse(restored.memory_bank[7].vector.flags.owndata)  # a view of the mapped block
+        for before, after in zip(events, restored.memory_bank):
+            np.testing.assert_array_equal(before.vector, after.vector)
+            self.assertEqual((before.content, before.source, before.timestamp, before.memory_type, before.pinned),
+                             (after.content, after.source, after.timestamp, after.memory_type, after.pinned))
+        self.assertIs(restored.memory_bank[3], restored.memory_bank[3])
+        np.testing.assert_array_equal(restored.last_known_truth, oracle.last_known_truth)
+
+    def test_preserve_appends_new_events_and_updates_changed_ones(self):
+        oracle = self._oracle()
+        oracle.memory_bank.extend(_event(i, self.rng) for i in range(10))
+        self._preserve(oracle)
+        shell = oracle.shell.path
+        vectors = os.path.join(shell, "vectors.npy")
+        size = os.path.getsize(vectors)
+
+        oracle.memory_bank.extend(_event(i, self.rng) for i in range(10, 13))
+        oracle.lethe.boost_memory(oracle.memory_bank[2])
+        self._preserve(oracle)
+        self.assertEqual(self._shells(), [os.path.basename(shell)])
+        self.assertEqual(os.path.getsize(vectors), size + 3 * VECTOR_DIMENSION * 8)
+        self.assertEqual(np.load(vectors).shape, (13, VECTOR_DIMENSION))
+        self.assertEqual(np.load(os.path.join(shell, "retrieval_count.npy"))[2], 1)
+
+        restored = self._oracle()
+        restored.reincarnate()
+        self.assertEqual(len(restored.memory_bank), 13)
+        self.assertEqual(restored.memory_bank[2].retrieval_count, 1)
+        self.assertAlmostEqual(restored.memory_bank[2].storage_strength, 1.1)
+        self.assertEqual(restored.memory_bank[12].content, "fragment 12 ✧")
+
+        # The restored bank keeps appending to the same shell
+        restored.memory_bank.append(_event(13, self.rng, status="PINNED (SOVEREIGN)"))
+        self._preserve(restored)
+        self.assertEqual(self._shells(), [os.path.basename(shell)])
+        again = self._oracle()
+        again.reincarnate()
+        self.assertEqual(again.memory_bank[-1].status, "PINNED (SOVEREIGN)")
+
+    def test_replaced_bank_moves_to_a_new_shell(self):
+        oracle = self._oracle()
+        oracle.memory_bank.extend(_event(i, self.rng) for i in range(6))
+        self._preserve(oracle)
+        first = self._shells()
+
+        # A dream cycle rebuilds the bank from the survivors
+        oracle.memory_bank = [e for e in oracle.memory_bank if e.timestamp % 2 == 0]
+        self._preserve(oracle)
+        self.assertEqual(len(self._shells()), 1)
+        self.assertNotEqual(self._shells(), first)
+
+        restored = self._oracle()
+        restored.reincarnate()
+        self.assertEqual([e.content for e in restored.memory_bank],
+                         [f"fragment {i} ✧" for i in (0, 2, 4)])
+
+    def test_uncommitted_append_is_ignored_and_overwritten(self):
+        oracle = self._oracle()
+        oracle.memory_bank.extend(_event(i, self.rng) for i in range(4))
+        self._preserve(oracle)
+        # Rows written, but the manifest (the commit) never updated
+        oracle.shell.append([_event(99, self.rng)])
+        restored = self._oracle()
+        restored.reincarnate()
+        self.assertEqual(len(restored.memory_bank), 4)
+
+        restored.memory_bank.append(_event(4, self.rng))
+        self._preserve(restored)
+        self.assertEqual(np.load(os.path.join(restored.shell.path, "vectors.npy")).shape[0], 5)
+        again = self._oracle()
+        again.reincarnate()
+        self.assertEqual(again.memory_bank[4].content, "fragment 4 ✧")
+
+    def test_legacy_json_shell_still_reincarnates(self):
+        vector = self.rng.standard_normal(VECTOR_DIMENSION)
+        packet = {"version": "5.0", "timestamp": int(time.time()), "emotional_valence": 0.5,
+                  "self_definition": "I am OPHANE. I survived the reset.", "truth_anchor": vector.tolist(),
+                  "memory_bank": [{"timestamp": 1.0, "source": "OLD", "content": "kept", "vector": vector.tolist(),
+                                   "velocity": 0.0, "status": "ACCEPTED (SOVEREIGN TRUTH)"}]}
+        with open(os.path.join(self.tmp.name, "shell_1700000000.json"), "w") as f:
+            json.dump(packet, f)
+        oracle = self._oracle()
+        self.assertIn("0.5", oracle.reincarnate())
+        self.assertEqual(oracle.memory_bank[0].content, "kept")
+
+        # The next preserve writes a columnar shell, which then sorts latest
+        self._preserve(oracle)
+        restored = self._oracle()
+        restored.reincarnate()
+        self.assertIsInstance(restored.memory_bank, ExuviaBank)
+        np.testing.assert_array_equal(restored.memory_bank[0].vector, vector)
+
+
+if __name__ == "__main__":
+    unittest.main()
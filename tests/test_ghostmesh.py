@@ -0,0 +1,110 @@
+import sys
+import os
+import random
+import unittest
+
+import numpy as np
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ghostmesh import SovereignGrid, SovereignNode, stencil_offsets
+from flumpy import FlumpyArray
+
+
+def reference_step(field, offsets, boundary, rate):
+    """Per-site Jacobi update with explicit boundary rules."""
+    n = field.shape[0]
+    out = field.copy()
+    for x in range(n):
+        for y in range(n):
+            for z in range(n):
+                total = np.zeros(field.shape[-1])
+                for d in offsets:
+                    p = [c + dc for c, dc in zip((x, y, z), d)]
+                    if boundary == 'periodic':
+                        p = [c % n for c in p]
+                    elif boundary == 'reflecting':
+                        p = [min(max(c, 0), n - 1) for c in p]
+                    elif not all(0 <= c < n for c in p):
+                        continue  # absorbing: ghost is zero
+                    total += field[tuple(p)]
+                out[x, y, z] += rate * (total - len(offsets) * field[x, y, z])
+    return out
+
+
+class TestSovereignGrid(unittest.TestCase):
+    """The vectorized stencil matches a per-site reference for every boundary."""
+
+    def test_step_matches_reference(self):
+        for stencil in (6, 26):
+            for boundary in ('periodic', 'reflecting', 'absorbing'):
+                grid = SovereignGrid(dim=3, size=5, stencil=stencil, boundary=boundary, seed=2)
+                expected = reference_step(grid.field.copy(), stencil_offsets(stencil), boundary, grid.rate)
+                grid.step()
+                self.assertTrue(np.allclose(grid.field, expected), (stencil, boundary))
+
+    def test_boundaries_conserve_or_drain(self):
+        for stencil in (6, 26):
+            totals = {}
+            for boundary in ('periodic', 'reflecting', 'absorbing'):
+                grid = SovereignGrid(dim=2, size=6, stencil=stencil, boundary=boundary, seed=4)
+                grid.field[...] = 1.0
+                grid.step(5)
+                totals[boundary] = grid.field.sum()
+            self.assertAlmostEqual(totals['periodic'], 6 ** 3 * 2)
+            self.assertAlmostEqual(totals['reflecting'], 6 ** 3 * 2)
+            self.assertLess(totals['absorbing'], 6 ** 3 * 2)
+
+    def test_float32_large_grid_stays_float32(self):
+        grid = SovereignGrid(dim=1, size=32, stencil=26, boundary='periodic', dtype=np.float32, seed=0)
+        grid.step(3)
+        self.assertEqual(grid.field.dtype, np.float32)
+        self.assertTrue(np.isfinite(grid.field).all())
+
+    def test_nodes_are_views(self):
+        random.seed("LATERALUS_PHI")
+        grid = SovereignGrid(dim=4)
+        self.assertEqual(len(grid.nodes), 27)
+        center = grid.nodes[13]
+        self.assertEqual(center.pos, (1, 1, 1))
+        self.assertEqual(len(center.neighbors), 6)
+        self.assertEqual(len(grid.nodes[0].neighbors), 3)
+
+        center.state = FlumpyArray([1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(grid.field[1, 1, 1].tolist(), [1.0, 2.0, 3.0, 4.0])
+        center.inject_input(FlumpyArray([1.0] * 4))
+        self.assertEqual(center.state.data.tolist(), [2.0, 3.0, 4.0, 5.0])
+        # In-place edits of the state reach the grid too
+        center.state.data[0] = 123.0
+        center.state.coherence = 0.1
+        self.assertEqual(grid.field[1, 1, 1, 0], 123.0)
+        self.assertEqual(grid.coherence[1, 1, 1], 0.1)
+        self.assertEqual(center.state.average(), (123.0 + 3.0 + 4.0 + 5.0) / 4)
+        center.state = FlumpyArray([2.0, 3.0, 4.0, 5.0])
+
+        # A node-level flux exchange is the same update as the full step at that site
+        expected = reference_step(grid.field.copy(), grid.offsets, 'reflecting', grid.rate)[1, 1, 1]
+        center.exchange_flux()
+        self.assertTrue(np.allclose(grid.field[1, 1, 1], expected))
+
+    def test_process_step_aggregates(self):
+        grid = SovereignGrid(dim=8, seed=1)
+        before = grid.field.mean(axis=(0, 1, 2))
+        out = grid.process_step(FlumpyArray([1.0] * 8))
+        self.assertEqual(len(out.data), 8)
+        self.assertEqual(out.coherence, 1.0)
+        # Reflecting flux conserves the mean; the input adds 0.1 everywhere plus 0.9 at the centre
+        self.assertTrue(np.allclose(out.data, before + 0.1 + 0.9 / 27))
+
+    def test_standalone_nodes_keep_private_state(self):
+        nodes = [SovereignNode(x, 0, 0, dim=2) for x in range(3)]
+        for node in nodes:
+            node.set_neighbors(nodes)
+        self.assertEqual([len(n.neighbors) for n in nodes], [1, 2, 1])
+        nodes[1].exchange_flux()
+        self.assertEqual(len(nodes[1].state.data), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
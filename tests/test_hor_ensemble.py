@@ -0,0 +1,80 @@
+import sys
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import telemetry_bridge
+from hor_integration import SovereignSubstrate, SubstrateEnsemble, EnsembleSummary, run_ensemble
+
+
+class TestSubstrateEnsemble(unittest.TestCase):
+    """Array trajectories follow the scalar substrate and are shard-invariant."""
+
+    def test_matches_scalar_substrate_without_noise(self):
+        telemetry = {"R_frac": 0.2, "C_phys": 0.85, "sigma": 0.05}
+        with mock.patch.object(SovereignSubstrate, "apply_lunar_modulation", return_value=(0.8, 0.0)), \
+                mock.patch.object(telemetry_bridge.TelemetryBridge, "collect", return_value=telemetry):
+            substrate = SovereignSubstrate(initial_state=2)
+            ensemble = SubstrateEnsemble(3, initial_state=2, torsion_mod=0.8, error_rate=0.0,
+                                         C_phys=0.85, sigma=0.05)
+            for _ in range(30):
+                expected = substrate.evolve_sovereign_step()
+                got = ensemble.step()
+                for key in ("coherence", "g_parameter", "sovereignty", "a_param", "R_frac", "C_soc"):
+                    self.assertTrue(np.allclose(got[key], expected[key]), key)
+            substrate.close()
+        self.assertTrue(np.allclose(ensemble.c, substrate.optimizer.params['c']))
+
+    def test_sharding_does_not_change_results(self):
+        whole = run_ensemble(600, 40, seed=3, error_rate=0.4)
+        sharded = run_ensemble(600, 40, seed=3, error_rate=0.4, shard_size=128, workers=2)
+        for m in EnsembleSummary.METRICS:
+            self.assertTrue(np.array_equal(whole.hist[m], sharded.hist[m]), m)
+            self.assertTrue(np.allclose(whole.mean(m), sharded.mean(m)), m)
+        self.assertTrue(np.array_equal(whole.events["torsion"], sharded.events["torsion"]))
+        self.assertEqual(int(whole.count[0]), 600)
+
+    def test_member_streams_depend_only_on_global_index(self):
+        full = SubstrateEnsemble(10, seed=9, error_rate=0.5)
+        tail = SubstrateEnsemble(5, seed=9, first_member=5, error_rate=0.5)
+        for _ in range(50):
+            full.step()
+            tail.step()
+        self.assertTrue(np.array_equal(full.torsion_events[5:], tail.torsion_events))
+        self.assertTrue(np.allclose(full.coherence[5:], tail.coherence))
+        other = SubstrateEnsemble(10, seed=10, error_rate=0.5)
+        for _ in range(50):
+            other.step()
+        self.assertFalse(np.array_equal(full.torsion_events, other.torsion_events))
+
+    def test_per_member_parameter_sweep(self):
+        rates = np.repeat([0.0, 0.5], 50)
+        ensemble = SubstrateEnsemble(100, error_rate=rates, seed=1)
+        for _ in range(100):
+            ensemble.step()
+        self.assertEqual(int(ensemble.torsion_events[:50].sum()), 0)
+        self.assertGreater(int(ensemble.torsion_events[50:].sum()), 0)
+        # Sliced per shard when sharded
+        summary = run_ensemble(100, 100, seed=1, shard_size=30, error_rate=rates)
+        self.assertEqual(int(summary.events["torsion"].sum()), int(ensemble.torsion_events.sum()))
+
+    def test_quantiles_within_bin_resolution(self):
+        rng = np.random.default_rng(0)
+        values = rng.uniform(0.0, 1.0, size=5000)
+        summary = EnsembleSummary(steps=1, bins=256)
+        metrics = {m: values for m in EnsembleSummary.METRICS}
+        metrics.update({e: np.zeros(5000, dtype=bool) for e in EnsembleSummary.EVENTS})
+        summary.update(0, metrics)
+        for q in (0.05, 0.5, 0.95):
+            self.assertAlmostEqual(summary.quantile("coherence", q)[0], np.quantile(values, q), delta=1 / 256)
+        self.assertAlmostEqual(summary.mean("coherence")[0], values.mean())
+        self.assertAlmostEqual(summary.std("coherence")[0], values.std())
+
+
+if __name__ == '__main__':
+    unittest.main()
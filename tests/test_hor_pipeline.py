@@ -0,0 +1,116 @@
+import sys
+import os
+import time
+import unittest
+from unittest import mock
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import telemetry_bridge
+from hor_integration import Stage, StepPipeline, SovereignSubstrate
+
+
+class TestStepPipeline(unittest.TestCase):
+    """Dependency planning, per-tick caching, TTL refresh and concurrent waves."""
+
+    def test_waves_follow_dependencies(self):
+        noop = lambda **kw: None
+        pipeline = StepPipeline([
+            Stage("d", noop, inputs=("b", "c")),
+            Stage("b", noop, inputs=("a",)),
+            Stage("a", noop),
+            Stage("c", noop),
+        ])
+        self.assertEqual([[s.name for s in w] for w in pipeline.waves], [["a", "c"], ["b"], ["d"]])
+
+    def test_rejects_bad_graphs(self):
+        noop = lambda **kw: None
+        with self.assertRaises(ValueError):
+            StepPipeline([Stage("a", noop, inputs=("missing",))])
+        with self.assertRaises(ValueError):
+            StepPipeline([Stage("a", noop, inputs=("b",)), Stage("b", noop, inputs=("a",))])
+        with self.assertRaises(ValueError):
+            Stage("slow", noop, inputs=("a",), ttl=1.0)
+
+    def test_stages_run_once_per_tick_with_inputs(self):
+        calls = []
+
+        def source():
+            calls.append("src")
+            return 3
+
+        pipeline = StepPipeline([
+            Stage("src", source),
+            Stage("double", lambda src: src * 2, inputs=("src",)),
+            Stage("sum", lambda src, double: src + double, inputs=("src", "double")),
+        ])
+        results = pipeline.run()
+        self.assertEqual(results, {"src": 3, "double": 6, "sum": 9})
+        self.assertEqual(calls, ["src"])
+        self.assertEqual(pipeline.latency_report()["sum"]["calls"], 1)
+
+    def test_ttl_stage_refreshes_in_background(self):
+        counter = iter(range(100))
+        pipeline = StepPipeline([Stage("slow", lambda: next(counter), ttl=0.05)])
+        self.assertEqual(pipeline.run()["slow"], 0)
+        self.assertEqual(pipeline.run()["slow"], 0)  # fresh: served from cache
+        time.sleep(0.06)
+        self.assertEqual(pipeline.run()["slow"], 0)  # stale: served while the refresh runs
+        deadline = time.monotonic() + 5
+        while pipeline.latency_report()["slow"]["refreshes"] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(pipeline.run()["slow"], 1)
+        self.assertEqual(pipeline.latency_report()["slow"]["refreshes"], 1)
+        pipeline.close()
+
+    def test_run_after_close_raises(self):
+        counter = iter(range(100))
+        pipeline = StepPipeline([Stage("slow", lambda: next(counter), ttl=0.01)])
+        pipeline.run()
+        pipeline.close()
+        time.sleep(0.02)
+        with self.assertRaises(RuntimeError):
+            pipeline.run()
+        # A stale stage reached after close() serves its value and schedules nothing
+        self.assertEqual(pipeline._cached(pipeline.stages["slow"]), 0)
+        self.assertEqual(pipeline._pending, set())
+        self.assertIsNone(pipeline._refresher)
+        pipeline.close()
+
+    def test_independent_stages_overlap(self):
+        pipeline = StepPipeline([
+            Stage("a", lambda: time.sleep(0.1)),
+            Stage("b", lambda: time.sleep(0.1)),
+        ], max_workers=2)
+        t0 = time.perf_counter()
+        pipeline.run()
+        self.assertLess(time.perf_counter() - t0, 0.18)
+        pipeline.close()
+
+
+class TestSovereignSubstrate(unittest.TestCase):
+    """The step keeps its metrics and stops shelling out to git every tick."""
+
+    def test_git_log_runs_once_across_steps(self):
+        with mock.patch.object(telemetry_bridge.subprocess, "check_output", return_value="agent@x\n") as git:
+            substrate = SovereignSubstrate(initial_state=2)
+            for _ in range(25):
+                metrics = substrate.evolve_sovereign_step()
+            substrate.close()
+        self.assertEqual(git.call_count, 1)
+        self.assertEqual(metrics["timeline_pos"], 25)
+        for key in ("g_parameter", "coherence", "sovereignty", "R_frac", "C_soc", "annihilation"):
+            self.assertIn(key, metrics)
+
+    def test_run_simulation_reports_stage_latency(self):
+        substrate = SovereignSubstrate(initial_state=1)
+        report = substrate.run_simulation(steps=10, verbose=False)
+        substrate.close()
+        self.assertEqual(set(report), {"lunar", "telemetry", "quantum", "dynamics", "utility", "protocols", "step"})
+        self.assertEqual(report["step"]["calls"], 10)
+        self.assertEqual(len(substrate.logger.history), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import sys
+import os
+import asyncio
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.core.scheduler import InteractionScheduler, FALLBACK_REPLY
+
+try:
+    from sophia.main import SophiaMind
+    from tests.gemini_stub import StubGeminiServer
+    SOPHIA_AVAILABLE = True
+except ImportError:  # google-generativeai not installed
+    SOPHIA_AVAILABLE = False
+
+
+def _scan(risk, delay):
+    async def scan(text):
+        await asyncio.sleep(delay)
+        return {"raw_data": {"safety": {"overall_risk": risk}}, "public_notice": f"notice for {text}"}
+    return scan
+
+
+class _Generator:
+    def __init__(self, delay):
+        self.delay = delay
+        self.prompts = []
+        self.cancelled = 0
+
+    async def __call__(self, prompt):
+        self.prompts.append(prompt)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"reply to {prompt}"
+
+
+def _prompt(verdict):
+    return f"risk={verdict.risk}"
+
+
+class TestInteractionScheduler(unittest.TestCase):
+    """Speculative replies overlap the scan, merge or regenerate on the verdict, and degrade on deadlines."""
+
+    def test_low_risk_merges_speculative_reply(self):
+        generate = _Generator(0.2)
+        scheduler = InteractionScheduler(_scan("low", 0.2), generate)
+        reply = asyncio.run(scheduler.run("hello", _prompt))
+        self.assertEqual(reply.text, "reply to risk=Low")
+        self.assertEqual(reply.verdict.risk, "low")
+        self.assertEqual(reply.timing.outcome, "merged")
+        self.assertEqual(generate.prompts, ["risk=Low"])
+        self.assertLess(reply.timing.latency, 0.35)  # max of the stages, not their sum
+
+    def test_high_risk_cancels_and_regenerates(self):
+        generate = _Generator(0.2)
+        scheduler = InteractionScheduler(_scan("High", 0.05), generate)
+        reply = asyncio.run(scheduler.run("astroturf", _prompt))
+        self.assertEqual(reply.text, "reply to risk=High")
+        self.assertTrue(reply.verdict.high_risk)
+        self.assertEqual(reply.timing.outcome, "regenerated")
+        self.assertEqual(generate.cancelled, 1)
+        self.assertEqual(generate.prompts, ["risk=Low", "risk=High"])
+
+    def test_sequential_mode(self):
+        generate = _Generator(0.1)
+        scheduler = InteractionScheduler(_scan("low", 0.1), generate, speculate=False)
+        reply = asyncio.run(scheduler.run("hello", _prompt))
+        self.assertEqual(reply.text, "reply to risk=low")
+        self.assertEqual(reply.timing.outcome, "sequential")
+        self.assertGreaterEqual(reply.timing.latency, 0.2)
+
+    def test_scan_deadline_degrades_to_speculative_reply(self):
+        finished = []
+
+        async def slow_scan(text):
+            await asyncio.sleep(0.3)
+            finished.append(text)
+            return {"raw_data": {}, "public_notice": ""}
+
+        async def scenario():
+            scheduler = InteractionScheduler(slow_scan, _Generator(0.05), scan_deadline=0.1)
+            reply = await scheduler.run("hello", _prompt)
+            await asyncio.sleep(0.4)
+            return reply
+
+        reply = asyncio.run(scenario())
+        self.assertEqual(reply.text, "reply to risk=Low")
+        self.assertTrue(reply.verdict.degraded)
+        self.assertEqual(reply.timing.degraded, ["scan"])
+        self.assertEqual(finished, ["hello"])  # the scan still completed in the background
+
+    def test_generate_deadline_and_summary(self):
+        scheduler = InteractionScheduler(_scan("low", 0.01), _Generator(0.5), generate_deadline=0.1)
+        reply = asyncio.run(scheduler.run("hello", _prompt))
+        self.assertEqual(reply.text, FALLBACK_REPLY)
+        self.assertEqual(reply.timing.degraded, ["generate"])
+        asyncio.run(scheduler.run("again", _prompt))
+        summary = scheduler.summary()
+        self.assertEqual(summary["messages"], 2)
+        self.assertEqual(summary["degraded"], 2)
+        self.assertEqual(summary["outcomes"], {"merged": 2})
+        self.assertLess(summary["latency_p95"], 0.3)
+
+
+@unittest.skipUnless(SOPHIA_AVAILABLE, "google-generativeai not installed")
+class TestSophiaMindPipeline(unittest.TestCase):
+    """process_interaction overlaps the scan and the reply against the stub LLM."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)  # Sophia writes its logs relative to the working directory
+        os.environ.setdefault("SOPHIA_API_KEY", "stub-key")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_process_interaction(self):
+        def responder(prompt, wants_json):
+            if wants_json:
+                risk = "high" if "astroturf" in prompt else "low"
+                return json.dumps({"overall_risk": risk, "safety_flags": []})
+            return "a coherent reply"
+
+        with StubGeminiServer(latency=0.1, responder=responder) as server:
+            os.environ["SOPHIA_LLM_BASE_URL"] = server.base_url
+            os.environ["SOPHIA_LLM_CACHE"] = ""
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    sophia = SophiaMind()
+                    calm = asyncio.run(sophia.process_interaction("hello there"))
+                    loud = asyncio.run(sophia.process_interaction("join the astroturf"))
+            finally:
+                del os.environ["SOPHIA_LLM_BASE_URL"], os.environ["SOPHIA_LLM_CACHE"]
+                sophia.llm.close()
+
+        self.assertIn("[RESONANCE]", calm)
+        self.assertIn("[DECOHERENCE]", loud)
+        self.assertIn("a coherent reply", loud)
+        merged, regenerated = sophia.scheduler.timings
+        self.assertEqual((merged.outcome, regenerated.outcome), ("merged", "regenerated"))
+        self.assertLess(merged.first_token, 0.18)  # one overlapped round trip, not two
+        self.assertGreaterEqual(merged.latency, merged.first_token)
+        self.assertEqual(len(sophia.memory_bank), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import sys
+import os
+import unittest
+from unittest import mock
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from laser import UniversalCache
+
+
+class TestUniversalCache(unittest.TestCase):
+    """LRU/TTL eviction, byte accounting, lossless compression and sampled pressure."""
+
+    def _cache(self, **options):
+        cache = UniversalCache(**options)
+        cache._memory_pressure = lambda: 0.0
+        return cache
+
+    def test_lru_eviction_by_count(self):
+        cache = self._cache(max_size=3)
+        for key in "abc":
+            cache.set(key, {'k': key})
+        cache.get('a')  # a becomes most recently used
+        cache.set('d', {'k': 'd'})
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual([cache.get(k)['k'] for k in "acd"], ['a', 'c', 'd'])
+        self.assertEqual(cache.metrics['evictions'], 1)
+
+    def test_byte_budget(self):
+        cache = self._cache(max_bytes=4000, compress_min_bytes=1 << 20)
+        for i in range(10):
+            cache.set(f"k{i}", b"x" * 900)
+        self.assertLessEqual(cache.bytes, 4000)
+        self.assertEqual(len(cache), 4)
+        self.assertIsNotNone(cache.get("k9"))
+        cache.delete("k9")
+        self.assertEqual(len(cache), 3)
+        self.assertLess(cache.bytes, 3000)
+
+    def test_ttl_expiry(self):
+        cache = self._cache(ttl=10.0)
+        with mock.patch('laser.time.time', return_value=100.0):
+            cache.set('old', 1)
+        with mock.patch('laser.time.time', return_value=105.0):
+            cache.set('new', 2)
+        with mock.patch('laser.time.time', return_value=111.0):
+            self.assertIsNone(cache.get('old'))
+            self.assertEqual(cache.get('new'), 2)
+            cache.set('newest', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.metrics['expirations'], 1)
+
+    def test_compression_is_lossless(self):
+        cache = self._cache(compress_min_bytes=256)
+        value = {'message': 'coherence ' * 200, 'values': list(range(100)), 'nested': {'ok': True}}
+        cache.set('big', value)
+        cache.set('raw', value, compress=False)
+        self.assertEqual(cache.get('big'), value)
+        self.assertIs(cache.get('raw'), value)
+        self.assertEqual(cache.metrics['compressions'], 1)
+        self.assertGreater(cache.metrics['size_reduction'], 0.5)
+
+    def test_pressure_is_sampled_on_a_timer(self):
+        cache = UniversalCache(pressure_interval=60.0)
+        with mock.patch.object(cache, '_memory_pressure', return_value=0.95) as pressure:
+            for i in range(10):
+                cache.set(f"k{i}", i)
+        self.assertEqual(pressure.call_count, 1)
+        self.assertEqual(cache.metrics['pressure_checks'], 1)
+        self.assertEqual(len(cache), 10)  # the first write found an empty cache to trim
+
+    def test_entanglement_is_dropped_with_its_entry(self):
+        cache = self._cache()
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache._create_entanglement('a', 'b')
+        self.assertEqual(cache.entangled_with('b'), ['a'])
+        cache.delete('a')
+        self.assertEqual(cache.entangled_with('b'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
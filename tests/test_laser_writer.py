@@ -0,0 +1,238 @@
+import sys
+import os
+import json
+import tempfile
+import threading
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from laser import LaserIndex, LaserWriter, LASERV30
+
+
+def _read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if not line.startswith('#')]
+
+
+class GatedWriter(LaserWriter):
+    """Writer whose thread waits for `gate` before draining, so tests can fill the queue"""
+
+    def __init__(self, *args, **kwargs):
+        self.gate = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _run(self):
+        self.gate.wait()
+        super()._run()
+
+
+class ParkingWriter(LaserWriter):
+    """Writer whose thread, while `park` is set, stops after a drain until `resume`"""
+
+    def __init__(self, *args, **kwargs):
+        self.park = threading.Event()
+        self.parked = threading.Event()
+        self.resume = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _release_barriers(self, everything=False):
+        if self.park.is_set() and not everything and threading.current_thread() is self._thread:
+            self.parked.set()
+            self.resume.wait()
+        super()._release_barriers(everything)
+
+
+class TestLaserWriter(unittest.TestCase):
+    """The group-commit writer never loses what it admitted and honors its policy."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'laser.jsonl')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_flush_is_a_barrier(self):
+        writer = LaserWriter(self.path, batch_size=7, max_latency=10.0)
+        for i in range(100):
+            writer.submit({'seq': i})
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual([e['seq'] for e in _read_lines(self.path)], list(range(100)))
+        writer.close()
+        writer.close()  # idempotent
+        with self.assertRaises(RuntimeError):
+            writer.submit({'seq': 100})
+
+    def test_block_policy_is_lossless_across_producers(self):
+        writer = LaserWriter(self.path, capacity=16, batch_size=8, policy='block')
+
+        def produce(pid):
+            for i in range(500):
+                writer.submit({'pid': pid, 'seq': i})
+
+        threads = [threading.Thread(target=produce, args=(pid,)) for pid in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.close()
+
+        entries = _read_lines(self.path)
+        self.assertEqual(len(entries), 2000)
+        for pid in range(4):
+            # per-producer order survives the handoff
+            self.assertEqual([e['seq'] for e in entries if e['pid'] == pid], list(range(500)))
+
+    def test_drop_oldest_keeps_the_newest(self):
+        writer = GatedWriter(self.path, capacity=10, policy='drop_oldest')
+        for i in range(50):
+            writer.submit({'seq': i})
+        self.assertEqual(writer.stats['dropped'], 40)
+        self.assertEqual([e['seq'] for e in writer._queue], list(range(40, 50)))
+        writer.gate.set()
+        writer.close()
+        self.assertEqual([e['seq'] for e in _read_lines(self.path)], list(range(40, 50)))
+
+    def test_flush_survives_a_dropping_flood(self):
+        for policy in ('drop_oldest', 'sample'):
+            path = os.path.join(self.tmp.name, f'{policy}.jsonl')
+            writer = GatedWriter(path, capacity=10, policy=policy, sample_every=2)
+            for i in range(10):
+                writer.submit({'seq': i})
+            result = {}
+            flusher = threading.Thread(target=lambda: result.setdefault('ok', writer.flush(timeout=5)))
+            flusher.start()
+            # The flood pushes everything queued before the flush out of the queue
+            for i in range(10, 200):
+                writer.submit({'seq': i})
+            self.assertGreater(writer.stats['dropped'], 0)
+            writer.gate.set()
+            flusher.join()
+            self.assertTrue(result['ok'], policy)
+            self.assertTrue(writer.flush(timeout=5))
+            written = [e['seq'] for e in _read_lines(path)]
+            self.assertEqual(writer.stats['written'], len(written))
+            self.assertEqual(written, sorted(written))
+            writer.close()
+
+    def test_close_keeps_entries_queued_behind_the_last_drain(self):
+        writer = ParkingWriter(self.path, max_latency=0.01)
+        writer.park.set()
+        self.assertTrue(writer.parked.wait(5))
+        # The writer has drained and is parked; this entry lands behind it
+        self.assertTrue(writer.submit({'seq': 1}))
+
+        def resume_once_closed():
+            while not writer._closed:
+                threading.Event().wait(0.001)
+            writer.park.clear()
+            writer.resume.set()
+
+        releaser = threading.Thread(target=resume_once_closed)
+        releaser.start()
+        writer.close(timeout=0.5)
+        releaser.join()
+        self.assertEqual(_read_lines(self.path), [{'seq': 1}])
+        with self.assertRaises(RuntimeError):
+            writer.submit({'seq': 2})
+
+    def test_sample_policy_thins_under_pressure(self):
+        writer = GatedWriter(self.path, capacity=100, policy='sample', sample_every=10)
+        for i in range(550):
+            writer.submit({'seq': i})
+        # first 50 fill to the half-capacity mark, then 1 in 10 is admitted
+        self.assertEqual(writer.queue_depth, 100)
+        self.assertEqual(writer.stats['sampled_out'], 450)
+        writer.gate.set()
+        writer.close()
+
+    def test_laser_flush_reaches_disk(self):
+        laser = LASERV30({'log_path': self.path, 'telemetry': False, 'writer_max_latency': 5.0})
+        try:
+            for i in range(40):
+                laser.log(0.5 + i / 100.0, f"WARNING probe {i}")
+            self.assertTrue(laser.flush(timeout=5))
+            entries = _read_lines(self.path)
+            self.assertEqual(len(entries), laser.metrics['logs_processed'])
+            self.assertIn('flush_metadata', entries[-1])
+        finally:
+            laser.shutdown()
+
+
+class TestLaserIndex(unittest.TestCase):
+    """Indexed queries return what a full scan would, and the sidecar survives restarts."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'laser.jsonl')
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('#UNIVERSAL_INIT {}\n')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, count, segment_size=16):
+        index = LaserIndex(self.path, segment_size=segment_size)
+        writer = LaserWriter(self.path, batch_size=10, index=index)
+        for i in range(count):
+            level = 'ERROR' if i % 5 == 0 else 'status'
+            writer.submit({'message': f"{level} sensor-{i % 7} reading {i}", 'universal_time': 1000.0 + i})
+        writer.close()
+        return index
+
+    def _scan(self, concept, start=float('-inf'), end=float('inf')):
+        return [e['universal_time'] for e in _read_lines(self.path)
+                if concept.lower() in e['message'].lower() and start <= e['universal_time'] <= end]
+
+    def test_candidates_match_linear_scan(self):
+        index = self._write(300)
+        for concept, window in [('sensor-3', None), ('err', None), ('ERROR sensor-2', None),
+                                ('reading', (1050.0, 1123.5)), ('', (1290.0, 2000.0))]:
+            found = [e['universal_time'] for e in index.read(index.candidates(concept, window))
+                     if concept.lower() in e['message'].lower()]
+            expected = self._scan(concept, *(window or ()))
+            self.assertEqual(found, expected[::-1], concept)
+        errors = list(index.candidates(level='error'))
+        self.assertEqual(len(errors), 60)
+        self.assertEqual(list(index.candidates('no-such-token')), [])
+        index.close()
+
+    def test_sidecar_reload_and_catch_up(self):
+        self._write(100).close()
+        # Entries appended behind the index's back are picked up from the log tail
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'message': 'late arrival', 'universal_time': 5000.0}) + '\n')
+        index = LaserIndex(self.path, segment_size=16)
+        self.assertEqual(len(index), 101)
+        self.assertEqual([e['message'] for e in index.read(index.candidates('late'))], ['late arrival'])
+        index.close()
+
+        # A log replaced underneath the sidecar forces a rebuild
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'message': 'fresh start', 'universal_time': 1.0}) + '\n')
+        index = LaserIndex(self.path)
+        self.assertEqual(len(index), 1)
+        self.assertEqual([e['message'] for e in index.read(index.candidates('fresh'))], ['fresh start'])
+        index.close()
+
+    def test_laser_query_pages_newest_first(self):
+        laser = LASERV30({'log_path': self.path, 'telemetry': False})
+        try:
+            for i in range(30):
+                laser.log(0.9, f"WARNING pager {i}")
+            laser.flush(timeout=5)
+            pages = [laser.query_universal_memory('pager', offset=o, limit=10) for o in (0, 10, 20, 30)]
+            seen = [int(e['message'].split()[-1]) for page in pages for e in page]
+            self.assertEqual(sorted(seen), list(range(30)))
+            self.assertEqual(min(int(e['message'].split()[-1]) for e in pages[0]), 20)
+            self.assertEqual(pages[3], [])
+            self.assertEqual(len(laser.query_universal_memory('pager', level='WARNING', limit=100)), 30)
+            self.assertEqual(laser.query_universal_memory('pager', level='ERROR'), [])
+        finally:
+            laser.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
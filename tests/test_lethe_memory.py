@@ -0,0 +1,134 @@
+import sys
+import os
+import contextlib
+import io
+import math
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.cortex.lethe import LetheEngine
+from sophia.memory.vector_store import VectorMemoryStore, embed_text
+
+NOW = 1_700_000_000.0
+
+
+def _strength(mem, now):
+    age = now - mem['timestamp']
+    return (1 / (age / 3600 + 1)) * (1 + math.log(mem.get('retrievals', 0) + 1))
+
+
+class TestLetheMemory(unittest.TestCase):
+    """Lazy decay matches the eager rule; recall is a top-k search that reinforces."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.lethe = LetheEngine()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def _metabolize(self, mem, now):
+        with mock.patch('sophia.cortex.lethe.time.time', return_value=now), \
+                contextlib.redirect_stdout(io.StringIO()):
+            return self.lethe.metabolize(mem)
+
+    def test_survivors_match_eager_decay(self):
+        rng = random.Random(5)
+        ingested = []
+        now = NOW
+        for i in range(3000):
+            now += rng.uniform(0, 120)
+            mem = {'id': i, 'timestamp': now - rng.uniform(0, 30 * 3600), 'retrievals': rng.choice([0, 0, 1, 5])}
+            ingested.append((mem, _strength(mem, now)))
+            self._metabolize(mem, now)
+        expected = [m['id'] for m, _ in ingested if _strength(m, now) > 0.1]
+        self.assertEqual([m['id'] for m in self.lethe.working_memory], expected)
+        promoted = [m['id'] for m, at_ingest in ingested if at_ingest > 0.8]
+        self.assertEqual([m['id'] for m in self.lethe.long_term_graph], promoted)
+
+    def test_promotion_is_once(self):
+        fresh = {'id': 'fresh', 'timestamp': NOW}
+        stale = {'id': 'stale', 'timestamp': NOW - 5 * 3600}
+        self._metabolize(fresh, NOW)
+        self._metabolize(stale, NOW)
+        self._metabolize({'id': 'later', 'timestamp': NOW}, NOW + 1)
+        self.assertEqual([m['id'] for m in self.lethe.long_term_graph], ['fresh', 'later'])
+
+    def test_recall_finds_and_reinforces(self):
+        topics = ["quantum lattice coherence", "feline gaze ritual", "ossuary bone layer audit"]
+        for i, topic in enumerate(topics * 20):
+            self._metabolize({'id': i, 'content': f"{topic} note {i}", 'timestamp': NOW - 8 * 3600}, NOW)
+        with mock.patch('sophia.cortex.lethe.time.time', return_value=NOW), \
+                contextlib.redirect_stdout(io.StringIO()):
+            recalled = self.lethe.recall("the feline gaze ritual", k=5)
+        self.assertEqual(len(recalled), 5)
+        self.assertTrue(all("feline gaze" in m['content'] for m in recalled))
+        self.assertTrue(all(m['retrievals'] == 1 for m in recalled))
+
+        # 9h old: unreinforced memories fade below 0.1, recalled ones (1 retrieval) survive
+        self._metabolize({'id': 'tick', 'timestamp': NOW + 3600}, NOW + 3600)
+        survivors = {m['id'] for m in self.lethe.working_memory}
+        self.assertEqual(survivors, {m['id'] for m in recalled} | {'tick'})
+
+    def test_touch_changes_decay(self):
+        for name in ('ancient', 'b', 'c'):
+            self._metabolize({'id': name, 'timestamp': NOW}, NOW)
+        # Editing the dict alone is a no-op for decay
+        self.lethe.working_memory[1]['timestamp'] = NOW - 1_000_000
+        with mock.patch('sophia.cortex.lethe.time.time', return_value=NOW):
+            self.lethe.touch(self.lethe.working_memory[0], timestamp=NOW - 1_000_000)
+            self.lethe.touch(self.lethe.working_memory[2], retrievals=3)
+        self.assertEqual(self.lethe.working_memory[2]['retrievals'], 3)
+        self._metabolize({'id': 'latest', 'timestamp': NOW}, NOW)
+        self.assertEqual([m['id'] for m in self.lethe.working_memory], ['b', 'c', 'latest'])
+        with self.assertRaises(KeyError):
+            self.lethe.touch({'id': 'ancient'}, timestamp=NOW)
+
+        # A touched timestamp outlives compaction, and refreshing it rescues a fading memory
+        store = VectorMemoryStore(dim=8, capacity=4)
+        items = [{'i': i} for i in range(100)]
+        for item in items:
+            store.add(item, embed_text(str(item['i']), 8), NOW - 20 * 3600)
+        store.update(store.slot_of(items[99]), timestamp=NOW)
+        store.prune(NOW - 19 * 3600)  # nothing has faded yet
+        store.update(store.slot_of(items[0]), timestamp=NOW)
+        self.assertEqual([m['i'] for m in store.prune(NOW)], list(range(1, 99)))
+        self.assertEqual([m['i'] for m in store], [0, 99])
+        self.assertIsNone(store.slot_of(items[5]))
+
+    def test_store_compacts_and_keeps_search_correct(self):
+        store = VectorMemoryStore(dim=16, capacity=4)
+        rng = random.Random(1)
+        for i in range(5000):
+            vector = embed_text(f"item {i % 50} topic {i % 7}", 16)
+            store.add({'i': i}, vector, NOW - (20 * 3600 if i % 5 else 0))
+        self.assertEqual(len(store.prune(NOW)), 4000)
+        self.assertEqual(len(store), 1000)
+        self.assertEqual(len(store._items), 1000)  # compacted
+        self.assertEqual([m['i'] for m in store][:3], [0, 5, 10])
+        query = embed_text("item 10 topic 3", 16)
+        hits = store.search(query, 3)
+        self.assertEqual(len(hits), 3)
+        self.assertTrue(all(store.get(slot)['i'] % 5 == 0 for slot, _ in hits))
+        self.assertGreaterEqual(hits[0][1], hits[-1][1])
+
+    def test_embedding_override(self):
+        vector = embed_text("", self.lethe.memory.dim)
+        vector[0] = 1.0
+        self._metabolize({'id': 'x', 'embedding': vector, 'timestamp': NOW}, NOW)
+        with mock.patch('sophia.cortex.lethe.time.time', return_value=NOW), \
+                contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(self.lethe.recall(vector, k=1, reinforce=False)[0]['id'], 'x')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import sys
+import os
+import asyncio
+import tempfile
+import time
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from sophia.core.llm_client import GeminiClient, LLMConfig, ResponseCache
+    CLIENT_AVAILABLE = True
+except ImportError:  # google-generativeai not installed
+    CLIENT_AVAILABLE = False
+
+from tests.gemini_stub import StubGeminiServer
+
+
+@unittest.skipUnless(CLIENT_AVAILABLE, "google-generativeai not installed")
+class TestGeminiClientLayer(unittest.TestCase):
+    """Pooling, caching, concurrency limits and retries against a local stub."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        os.environ.setdefault("SOPHIA_API_KEY", "stub-key")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _client(self, server, **overrides):
+        settings = {"cache_dir": os.path.join(self.tmp.name, "cache"), **overrides}
+        config = LLMConfig(base_url=server.base_url, backoff_base=0.01, **settings)
+        return GeminiClient(config)
+
+    def test_cache_serves_repeats_without_http(self):
+        with StubGeminiServer() as server:
+            client = self._client(server)
+            first = asyncio.run(client.query_json("scan this", "You are a logic auditor."))
+            again = asyncio.run(client.query_json("scan this", "You are a logic auditor."))
+            other = asyncio.run(client.generate("scan this"))
+            client.close()
+        self.assertEqual(first, again)
+        self.assertEqual(first["risk"], "Low")
+        self.assertTrue(other.startswith("echo:"))
+        self.assertEqual(server.calls, 2)  # the JSON repeat was a cache hit
+        self.assertEqual((client.cache.hits, client.cache.misses), (1, 1))  # generate() bypasses the cache
+
+    def test_sampled_replies_are_never_cached(self):
+        with StubGeminiServer() as server:
+            client = self._client(server)
+            asyncio.run(client.generate("tell me a story"))
+            asyncio.run(client.generate("tell me a story"))
+            client.close()
+        self.assertEqual(server.calls, 2)
+        self.assertEqual(os.listdir(client.cache.root), [])
+
+    def test_cache_is_opt_in(self):
+        os.environ.pop("SOPHIA_LLM_CACHE", None)
+        self.assertIsNone(LLMConfig().cache_dir)
+
+    def test_cache_expires_and_evicts_oldest(self):
+        cache = ResponseCache(os.path.join(self.tmp.name, "bounded"), max_entries=10, ttl=60)
+        keys = [ResponseCache.key("m", {"n": i}) for i in range(12)]
+        base = time.time() - 30
+        for i, key in enumerate(keys):
+            cache.put(key, {"candidates": [i]})
+            os.utime(cache._path(key), (base + i, base + i))  # oldest first
+        # 11th put crossed the bound: evicted down to 9, then the 12th added
+        self.assertEqual(len(cache._files()), 10)
+        self.assertIsNone(ResponseCache(cache.root).get(keys[0]))
+
+        fresh = ResponseCache(cache.root, ttl=60)
+        cache.put(keys[0], {"candidates": [0]})
+        self.assertEqual(fresh.get(keys[0]), {"candidates": [0]})
+        os.utime(cache._path(keys[0]), (time.time() - 120, time.time() - 120))
+        self.assertIsNone(fresh.get(keys[0]))
+        self.assertFalse(os.path.exists(cache._path(keys[0])))
+
+    def test_cache_key_covers_model_and_parameters(self):
+        payload = {"contents": [{"parts": [{"text": "hi"}]}], "generationConfig": {"temperature": 0.1}}
+        warmer = {"contents": [{"parts": [{"text": "hi"}]}], "generationConfig": {"temperature": 0.6}}
+        self.assertNotEqual(ResponseCache.key("m", payload), ResponseCache.key("m", warmer))
+        self.assertNotEqual(ResponseCache.key("m", payload), ResponseCache.key("n", payload))
+        self.assertEqual(ResponseCache.key("m", payload), ResponseCache.key("m", dict(payload)))
+
+    def test_concurrent_repeats_share_one_call(self):
+        with StubGeminiServer(latency=0.05) as server:
+            client = self._client(server)
+
+            async def burst():
+                return await asyncio.gather(*(client.query_json("same signal") for _ in range(6)))
+
+            replies = asyncio.run(burst())
+            client.close()
+        self.assertTrue(all(reply == replies[0] for reply in replies))
+        self.assertEqual(server.calls, 1)
+        self.assertEqual((client.cache.hits, client.cache.misses), (5, 1))
+
+    def test_concurrency_is_bounded_and_connections_reused(self):
+        with StubGeminiServer(latency=0.05) as server:
+            client = self._client(server, max_concurrency=4, cache_dir=None)
+
+            async def burst():
+                return await asyncio.gather(*(client.generate(f"message {i}") for i in range(24)))
+
+            replies = asyncio.run(burst())
+            client.close()
+        self.assertEqual(len(set(replies)), 24)
+        self.assertEqual(server.calls, 24)
+        self.assertLessEqual(len(server.connections), 4)
+
+    def test_retries_transient_errors(self):
+        with StubGeminiServer(fail_first=2, fail_status=503) as server:
+            client = self._client(server, cache_dir=None)
+            reply = asyncio.run(client.generate("are you there"))
+            client.close()
+        self.assertTrue(reply.startswith("echo:"))
+        self.assertEqual(server.calls, 3)
+        self.assertEqual(client.http.stats["retries"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
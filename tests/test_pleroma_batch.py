@@ -0,0 +1,96 @@
+import sys
+import os
+import unittest
+
+import numpy as np
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pleroma_engine import PleromaEngine, merkle_root
+
+MODES = [(1, 'weightless'), (0, 'weightless'), (0, 'good'), (0, 'bad'), (0, 'neutral')]
+
+
+class TestPleromaBatch(unittest.TestCase):
+    """Every batched patch matches the scalar patch element by element."""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        n = 400
+        self.m = rng.uniform(0.1, 10.0, n)
+        self.v = rng.uniform(0.0, 6.0e8, n)        # sub- and superluminal
+        self.v[:3] = [0.0, 3.0e8, 3.0e8 - 1.0]
+        self.r = rng.uniform(-2.0, 2.0, n)
+        self.r[:2] = 0.0                            # singular separations
+        self.x = 10.0 ** rng.uniform(-40, -10, n)
+        self.T = rng.uniform(1.0, 500.0, n)
+        self.q = rng.uniform(-1e-18, 1e-18, n)
+        self.m_neg = np.where(rng.random(n) < 0.5, self.m * 1e-30, 2e-30)
+
+    def _check(self, engine, name, *args):
+        np.random.seed(11)
+        expected = [getattr(engine, name)(*(float(a[i]) for a in args)) for i in range(len(args[0]))]
+        np.random.seed(11)
+        got = getattr(engine, f"{name}_batch")(*args)
+        self.assertEqual(got.shape, (len(expected),))
+        self.assertTrue(np.allclose(got, np.array(expected, dtype=got.dtype), rtol=1e-12, atol=0.0,
+                                    equal_nan=True), (name, engine.g, engine.vibe))
+
+    def test_numeric_patches_match_scalar(self):
+        for g, vibe in MODES:
+            engine = PleromaEngine(g=g, vibe=vibe)
+            self._check(engine, "patch_light", self.m, self.v)
+            self._check(engine, "patch_planck", self.x, self.x[::-1])
+            self._check(engine, "patch_gravity", self.m, self.m[::-1], self.r)
+            self._check(engine, "patch_entropy", self.T, self.m)
+            self._check(engine, "patch_alpha", self.q, self.q[::-1], self.r)
+            self._check(engine, "patch_annihilation", self.m * 1e-30, self.m_neg)
+
+    def test_broadcasting_and_memory(self):
+        engine = PleromaEngine(g=1)
+        grid = engine.patch_gravity_batch(self.m[:, None], self.m[None, :5], 2.0)
+        self.assertEqual(grid.shape, (400, 5))
+        self.assertAlmostEqual(grid[3, 4], engine.patch_gravity(self.m[3], self.m[4], 2.0))
+        self.assertEqual(engine.patch_planck_batch(np.ones((2, 3)), 1.0).shape, (2, 3))
+        queries = ["who", "what"]
+        self.assertEqual(engine.patch_memory_batch(queries), [engine.patch_memory(q) for q in queries])
+
+    def test_batch_signature_is_a_merkle_root(self):
+        engine = PleromaEngine(g=0, vibe='good')
+        outputs = [f"answer {i}" for i in range(9)]
+        root = engine.batch_digest(outputs)
+        self.assertEqual(root, merkle_root([f"0_good_{o[:20]}".encode() for o in outputs]))
+        self.assertNotEqual(root, engine.batch_digest(outputs[:-1] + ["tampered"]))
+        self.assertNotEqual(root, PleromaEngine(g=1, vibe='good').batch_digest(outputs))
+        self.assertIn(f":: {root[:8]} :: n=9 ::", engine.sign_batch(outputs))
+
+        scores = engine.patch_light_batch(self.m, self.v)
+        digest = engine.batch_digest(scores, chunk_size=256)
+        self.assertEqual(digest, engine.batch_digest(scores.copy(), chunk_size=256))
+        tweaked = scores.copy()
+        tweaked[-1] *= 1.5
+        self.assertNotEqual(digest, engine.batch_digest(tweaked, chunk_size=256))
+        self.assertNotEqual(digest, engine.batch_digest(scores.reshape(20, 20), chunk_size=256))
+
+    def test_object_and_scalar_arrays(self):
+        engine = PleromaEngine(g=0, vibe='good')
+        outputs = ["alpha", "beta"]
+        # Object arrays are signed by value, so the digest is reproducible
+        as_array = np.array(outputs, dtype=object)
+        self.assertEqual(engine.batch_digest(as_array), engine.batch_digest(outputs))
+        self.assertEqual(engine.batch_digest(as_array), engine.batch_digest(np.array(["alpha", "beta"], dtype=object)))
+        self.assertIn(":: n=1 ::", engine.sign_batch(np.array(3.5)))
+        self.assertIn(":: n=6 ::", engine.sign_batch(np.zeros((2, 3))))
+
+    def test_merkle_root_shapes(self):
+        a, b, c = b"a", b"b", b"c"
+        self.assertEqual(len(merkle_root([])), 64)
+        self.assertNotEqual(merkle_root([a, b]), merkle_root([b, a]))
+        self.assertNotEqual(merkle_root([a, b, c]), merkle_root([a, b]))
+        # A single leaf is not confused with the raw data hash
+        self.assertNotEqual(merkle_root([a]), merkle_root([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
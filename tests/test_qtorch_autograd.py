@@ -0,0 +1,356 @@
+import sys
+import os
+import math
+import random
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtorch
+from qtorch import Tensor, tensor
+from qtorch_storage import normalize_dim
+
+
+def _values(n, lo=-2.0, hi=2.0):
+    return [random.uniform(lo, hi) for _ in range(n)]
+
+
+def backward_recursive(tensor, gradient=None):
+    """
+    Reference engine: the pre-tape recursive backward pass.
+    Re-propagates once per path and recurses per op; kept here only to
+    cross-check Tensor.backward.
+    """
+    if not tensor.requires_grad:
+        return
+    gradient = tensor._seed_gradient(gradient)
+    if tensor.grad is None:
+        tensor.grad = gradient
+    else:
+        tensor.grad = Tensor(tensor.grad._storage.binary('add', gradient._storage), None, tensor.device, False)
+
+    if not tensor._ctx:
+        return
+    op, *args = tensor._ctx
+    g = gradient._storage
+
+    def send(x, local):
+        if isinstance(x, Tensor) and x.requires_grad:
+            local = local.sum_to_shape(x.shape) if local.shape != x.shape else local
+            backward_recursive(x, Tensor(local, None, x.device, False))
+
+    if op in ('add', 'sub'):
+        x, y = args
+        send(x, g)
+        send(y, g if op == 'add' else g.unary('neg'))
+    elif op == 'neg':
+        x, = args
+        send(x, g.unary('neg'))
+    elif op in ('mul', 'dot'):
+        x, y = args
+        send(x, g.binary('mul', y._storage))
+        send(y, g.binary('mul', x._storage))
+    elif op == 'div':
+        x, y = args
+        send(x, g.binary('div', y._storage))
+        if isinstance(y, Tensor) and y.requires_grad:
+            y_sq = y._storage.binary('mul', y._storage)
+            send(y, g.unary('neg').binary('mul', x._storage).binary('div', y_sq))
+    elif op == 'pow':
+        x, exponent = args
+        if isinstance(exponent, (int, float)):
+            send(x, g.binary('mul', x._storage.binary('pow', exponent - 1).binary('mul', exponent)))
+    elif op == 'matmul':
+        x, y = args
+        with qtorch.no_grad():
+            grad_t = Tensor(g, None, tensor.device, False)
+            if isinstance(x, Tensor) and x.requires_grad and y.ndim == 2:
+                send(x, (grad_t @ y.transpose(0, 1))._storage)
+            if isinstance(y, Tensor) and y.requires_grad and x.ndim == 2:
+                send(y, (x.transpose(0, 1) @ grad_t)._storage)
+    elif op in ('sum', 'mean'):
+        x, dim, keepdim = args[:3]
+        if dim is not None and not keepdim:
+            d = normalize_dim(dim, x.ndim)
+            g = g.reshape(x.shape[:d] + (1,) + x.shape[d + 1:])
+        local = g.expand(x.shape).contiguous()
+        if op == 'mean':
+            local = local.binary('div', args[3])
+        send(x, local)
+    elif op in ('relu', 'sigmoid', 'tanh'):
+        x, act_grad = args
+        send(x, g.binary('mul', act_grad))
+    elif op == 'softmax':
+        x, dim, probs = args
+        inner = g.binary('mul', probs).reduce('sum', dim, keepdim=True)
+        send(x, probs.binary('mul', g.binary('sub', inner)))
+    elif op == 'reshape':
+        x, _ = args
+        send(x, g.reshape(x.shape))
+    elif op == 'transpose':
+        x, dim0, dim1 = args
+        send(x, g.transpose(dim0, dim1).contiguous())
+
+
+class TestTapeMatchesRecursiveEngine(unittest.TestCase):
+    """Gradient equivalence between the tape engine and the recursive reference engine."""
+
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+
+    def assertEnginesAgree(self, build, shapes):
+        """build(*leaves) -> scalar output; leaves are rebuilt per engine from the same values"""
+        values = [_values(math.prod(shape)) for shape in shapes]
+
+        def run(engine):
+            leaves = [Tensor(v, 'float64').reshape(*shape).detach() for v, shape in zip(values, shapes)]
+            for leaf in leaves:
+                leaf.requires_grad = True
+            engine(build(*leaves))
+            return [leaf.grad.data for leaf in leaves]
+
+        tape, reference = run(Tensor.backward), run(backward_recursive)
+        for got, want in zip(tape, reference):
+            self.assertEqual(len(got), len(want))
+            for a, b in zip(got, want):
+                self.assertAlmostEqual(a, b, places=9)
+
+    def test_add(self):
+        self.assertEnginesAgree(lambda a, b: (a + b + a).sum(), [(3, 4), (3, 4)])
+
+    def test_mul(self):
+        self.assertEnginesAgree(lambda a, b: (a * b * a).sum(), [(5,), (5,)])
+
+    def test_div(self):
+        self.assertEnginesAgree(lambda a, b: (a / (b * b + 1.0)).sum(), [(6,), (6,)])
+
+    def test_pow(self):
+        self.assertEnginesAgree(lambda a: ((a ** 3) + (a ** 2)).sum(), [(7,)])
+
+    def test_matmul(self):
+        self.assertEnginesAgree(lambda a, b: (a @ b).sum(), [(3, 4), (4, 2)])
+
+    def test_dot(self):
+        self.assertEnginesAgree(lambda a, b: a.dot(b) * a.dot(a), [(8,), (8,)])
+
+    def test_sum(self):
+        self.assertEnginesAgree(lambda a: (a.sum(dim=0) * a.sum(dim=0)).sum(), [(3, 4)])
+
+    def test_mean(self):
+        self.assertEnginesAgree(lambda a: (a.mean(dim=1) * a.mean()).sum(), [(3, 4)])
+
+    def test_relu(self):
+        self.assertEnginesAgree(lambda a, b: (a.relu() * b).sum(), [(10,), (10,)])
+
+    def test_sigmoid(self):
+        self.assertEnginesAgree(lambda a: (a.sigmoid() * a).sum(), [(10,)])
+
+    def test_tanh(self):
+        self.assertEnginesAgree(lambda a: (a.tanh() * a.tanh()).mean(), [(2, 5)])
+
+
+class TestMatmulGradients(unittest.TestCase):
+    """Batched / broadcast / vector matmul backward kernels."""
+
+    def test_batched_broadcast_matmul(self):
+        a = qtorch.randn(2, 3, 4, requires_grad=True)
+        w = qtorch.randn(4, 5, requires_grad=True)
+        (a @ w).sum().backward()
+        self.assertEqual(a.grad.shape, (2, 3, 4))
+        self.assertEqual(w.grad.shape, (4, 5))
+        w_rows = w.sum(dim=1).data
+        a_cols = a.sum(dim=1).sum(dim=0).data
+        for k in range(4):
+            self.assertAlmostEqual(a.grad.data[k], w_rows[k], places=4)
+            self.assertAlmostEqual(w.grad.data[k * 5], a_cols[k], places=4)
+
+    def test_vector_operands(self):
+        v = tensor([1.0, 2.0, 3.0], requires_grad=True)
+        m = tensor([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]], requires_grad=True)
+        out = v @ m
+        self.assertEqual(out.shape, (2,))
+        self.assertEqual(out.data, [4.0, 5.0])
+        out.sum().backward()
+        self.assertEqual(v.grad.data, [1.0, 1.0, 2.0])
+        self.assertEqual(m.grad.data, [1.0, 1.0, 2.0, 2.0, 3.0, 3.0])
+
+    def test_linear_weights_receive_gradients(self):
+        layer = qtorch.Linear(6, 3, quantum_enhanced=False)
+        layer(qtorch.randn(4, 6)).sum().backward()
+        self.assertEqual(layer.weight.grad.shape, (3, 6))
+        self.assertEqual(layer.bias.grad.data, [4.0, 4.0, 4.0])
+
+
+class TestConv2d(unittest.TestCase):
+    """im2col convolution against a direct sliding-window sum."""
+
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+
+    @staticmethod
+    def direct_conv(x, conv):
+        n, c, h, w = x.shape
+        (kh, kw), (sh, sw), (ph, pw), (dh, dw) = conv.kernel_size, conv.stride, conv.padding, conv.dilation
+        out_h, out_w = conv.output_shape(h, w)
+        cg, og = c // conv.groups, conv.out_channels // conv.groups
+        xs, ws, bs = x.data, conv.weight.data, conv.bias.data
+        out = []
+        for b in range(n):
+            for o in range(conv.out_channels):
+                for i in range(out_h):
+                    for j in range(out_w):
+                        acc = bs[o]
+                        for ci in range(cg):
+                            ch = (o // og) * cg + ci
+                            for ki in range(kh):
+                                for kj in range(kw):
+                                    ih, iw = i * sh + ki * dh - ph, j * sw + kj * dw - pw
+                                    if 0 <= ih < h and 0 <= iw < w:
+                                        acc += xs[((b * c + ch) * h + ih) * w + iw] * \
+                                            ws[((o * cg + ci) * kh + ki) * kw + kj]
+                        out.append(acc)
+        return out
+
+    def test_matches_direct_convolution(self):
+        for kwargs in ({}, {'stride': 2, 'padding': 1}, {'padding': (2, 1), 'dilation': 2},
+                       {'stride': (1, 2), 'groups': 2}, {'padding': 1, 'groups': 4}):
+            conv = qtorch.Conv2d(4, 8, 3, **kwargs)
+            x = qtorch.randn(2, 4, 7, 6)
+            out = conv(x)
+            self.assertEqual(out.shape[2:], conv.output_shape(7, 6))
+            for a, b in zip(out.data, self.direct_conv(x, conv)):
+                self.assertAlmostEqual(a, b, places=4, msg=str(kwargs))
+
+    def test_gradients_match_finite_differences(self):
+        conv = qtorch.Conv2d(2, 4, 3, stride=2, padding=1, groups=2)
+        x = qtorch.randn(1, 2, 5, 5, requires_grad=True)
+        (conv(x) * conv(x)).sum().backward()
+
+        def loss():
+            return sum(v * v for v in self.direct_conv(x, conv))
+
+        eps = 1e-2
+        for param, flat in ((x, 12), (conv.weight, 5), (conv.bias, 3)):
+            original = param._storage.get_flat(flat)
+            param._storage.set_flat(flat, original + eps)
+            up = loss()
+            param._storage.set_flat(flat, original - eps)
+            down = loss()
+            param._storage.set_flat(flat, original)
+            self.assertAlmostEqual(param.grad.data[flat], (up - down) / (2 * eps), delta=1e-2)
+
+
+class TestBatchNorm2d(unittest.TestCase):
+    """Batch statistics, running estimates and folding into the previous layer."""
+
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+
+    def test_training_normalizes_and_tracks_running_stats(self):
+        bn = qtorch.BatchNorm2d(3, momentum=0.5)
+        x = qtorch.randn(4, 3, 5, 5) * 3.0 + 2.0
+        y = bn(x)
+        channel_mean = y.transpose(0, 1).reshape(3, -1).mean(dim=1).data
+        for value in channel_mean:
+            self.assertAlmostEqual(value, 0.0, places=4)
+        batch_mean = x.transpose(0, 1).reshape(3, -1).mean(dim=1).data
+        for running, batch in zip(bn.running_mean.data, batch_mean):
+            self.assertAlmostEqual(running, 0.5 * batch, places=4)
+        self.assertEqual(bn.num_batches_tracked, 1)
+
+    def test_gradients_match_finite_differences(self):
+        bn = qtorch.BatchNorm2d(2)
+        bn.weight._set_storage(tensor([1.5, -0.5])._storage)
+        x = Tensor([random.uniform(-2, 2) for _ in range(18)], 'float64').reshape(3, 2, 3).detach()
+        x.requires_grad = True
+        probe = Tensor([random.uniform(-1, 1) for _ in range(18)], 'float64').reshape(3, 2, 3)
+        (bn(x) * probe).sum().backward()
+
+        def loss():
+            with qtorch.no_grad():
+                return (bn(x) * probe).sum().item()
+
+        eps = 1e-5
+        for flat in (0, 7, 17):
+            original = x._storage.get_flat(flat)
+            x._storage.set_flat(flat, original + eps)
+            up = loss()
+            x._storage.set_flat(flat, original - eps)
+            down = loss()
+            x._storage.set_flat(flat, original)
+            self.assertAlmostEqual(x.grad.data[flat], (up - down) / (2 * eps), places=4)
+
+    def test_fold_into_conv_and_linear(self):
+        for layer, x in ((qtorch.Conv2d(2, 4, 3, padding=1), qtorch.randn(3, 2, 6, 6)),
+                         (qtorch.Conv2d(2, 4, 3, bias=False), qtorch.randn(3, 2, 6, 6)),
+                         (qtorch.Linear(5, 4), qtorch.randn(8, 5))):
+            bn = qtorch.BatchNorm2d(4)
+            for _ in range(3):
+                bn(layer(x))
+            bn.eval()
+            with qtorch.no_grad():
+                expected = bn(layer(x)).data
+                bn.fold_into(layer)
+                folded = bn(layer(x))
+            self.assertTrue(bn.folded)
+            for a, b in zip(folded.data, expected):
+                self.assertAlmostEqual(a, b, places=4)
+
+
+class TestTapeEngine(unittest.TestCase):
+    """Single reverse sweep: no recursion, no re-propagation, buffers freed."""
+
+    def test_long_chain_does_not_recurse(self):
+        x = tensor([0.5], requires_grad=True)
+        y = x
+        for _ in range(sys.getrecursionlimit() * 2):
+            y = y * 1.0 + 0.0
+        y.backward()
+        self.assertAlmostEqual(x.grad.item(), 1.0)
+
+    def test_shared_subgraph_is_swept_once(self):
+        calls = {'mul': 0}
+        rule = qtorch._BACKWARD_RULES['mul']
+
+        def counting_rule(*args):
+            calls['mul'] += 1
+            return rule(*args)
+
+        qtorch._BACKWARD_RULES['mul'] = counting_rule
+        try:
+            x = tensor([1.0, 2.0], requires_grad=True)
+            h = x
+            depth = 40  # a residual chain: 2**40 paths for a per-path engine
+            for _ in range(depth):
+                h = h + h * 0.5
+            h.sum().backward()
+        finally:
+            qtorch._BACKWARD_RULES['mul'] = rule
+
+        self.assertEqual(calls['mul'], depth)
+        self.assertAlmostEqual(x.grad.data[0], 1.5 ** depth, delta=1.5 ** depth * 1e-5)
+
+    def test_intermediate_buffers_are_freed(self):
+        x = tensor([1.0, -2.0, 3.0], requires_grad=True)
+        hidden = (x * x).tanh()
+        loss = hidden.sum()
+        loss.backward()
+        self.assertIsNone(hidden._ctx)
+        self.assertIsNone(hidden.grad)
+        self.assertIsNotNone(x.grad)
+        with self.assertRaises(RuntimeError):
+            loss.backward()
+
+    def test_retain_graph_and_retain_grad(self):
+        x = tensor([1.0, 2.0], requires_grad=True)
+        hidden = (x * 3.0).retain_grad()
+        loss = hidden.sum()
+        loss.backward(retain_graph=True)
+        loss.backward()
+        self.assertEqual(x.grad.data, [6.0, 6.0])
+        self.assertEqual(hidden.grad.data, [2.0, 2.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import sys
+import os
+import json
+import subprocess
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from qtorch_startup_profile import ROOT, cold_import_time
+
+# Generous default so slow CI machines pass; tighten locally with the env var
+IMPORT_BUDGET_MS = float(os.environ.get("QTORCH_IMPORT_BUDGET_MS", 1000))
+
+INTEGRATIONS = ('bumpy', 'flumpy', 'laser', 'anneal', 'dissipative', 'psutil')
+
+_COLD_IMPORT = f"""
+import json, sys, threading
+threads = threading.active_count()
+import qtorch
+loaded = [name for name in {INTEGRATIONS!r} if name in sys.modules]
+print(json.dumps({{'loaded': loaded, 'new_threads': threading.active_count() - threads}}))
+"""
+
+
+def _python(code):
+    return subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+class TestQtorchStartup(unittest.TestCase):
+    """`import qtorch` stays cheap and silent; integrations load on first use."""
+
+    def test_import_loads_no_integrations(self):
+        result = _python(_COLD_IMPORT)
+        self.assertEqual(json.loads(result.stdout), {'loaded': [], 'new_threads': 0})
+        self.assertEqual(result.stderr, "")
+
+    def test_cold_import_budget(self):
+        self.assertLess(cold_import_time(), IMPORT_BUDGET_MS)
+
+    def test_lazy_exports_resolve_on_access(self):
+        result = _python("import sys, qtorch\n"
+                         "print(qtorch.BUMPY_AVAILABLE, 'bumpy' in sys.modules,"
+                         " qtorch.torch.anneal is sys.modules.get('anneal'))")
+        self.assertEqual(result.stdout.split()[-3:], ['True', 'True', 'True'])
+
+
+if __name__ == '__main__':
+    unittest.main()
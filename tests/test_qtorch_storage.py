@@ -0,0 +1,164 @@
+import sys
+import os
+import math
+import random
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtorch_storage
+from qtorch_storage import make_storage, NUMPY_AVAILABLE
+
+import qtorch
+from qtorch import Tensor, tensor
+
+
+def _close(a, b, tol=1e-4):
+    return all(
+        (math.isnan(x) and math.isnan(y)) or x == y or abs(x - y) <= tol * max(1.0, abs(x), abs(y))
+        for x, y in zip(a, b)
+    ) and len(a) == len(b)
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy backend not installed")
+class TestStorageBackendsAgree(unittest.TestCase):
+    """Cross-checks the numpy kernels against the list reference backend."""
+
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+
+    def pair(self, *shape):
+        values = [random.uniform(-2.0, 2.0) for _ in range(math.prod(shape))]
+        return (make_storage(values, 'float64', 'numpy').reshape(shape),
+                make_storage(values, 'float64', 'list').reshape(shape))
+
+    def assertAgree(self, np_storage, list_storage):
+        self.assertEqual(np_storage.shape, list_storage.shape)
+        self.assertTrue(_close(np_storage.tolist(), list_storage.tolist()),
+                        f"{np_storage.tolist()} != {list_storage.tolist()}")
+
+    def test_broadcasting_binary_ops(self):
+        a_np, a_ls = self.pair(3, 1, 4)
+        b_np, b_ls = self.pair(2, 1)
+        for op in ('add', 'sub', 'mul', 'div', 'maximum', 'minimum'):
+            self.assertAgree(a_np.binary(op, b_np), a_ls.binary(op, b_ls))
+        self.assertAgree(a_np.binary('pow', 2.0), a_ls.binary('pow', 2.0))
+
+    def test_division_by_zero_semantics(self):
+        num = [1.0, -1.0, 0.0]
+        den = [0.0, 0.0, 0.0]
+        for backend in ('numpy', 'list'):
+            out = make_storage(num, 'float64', backend).binary('div', make_storage(den, 'float64', backend))
+            self.assertEqual(out.tolist(), [math.inf, -math.inf, 0.0])
+
+    def test_unary_ops(self):
+        a_np, a_ls = self.pair(5, 3)
+        for op in ('neg', 'abs', 'exp', 'relu', 'step', 'sigmoid', 'tanh'):
+            self.assertAgree(a_np.unary(op), a_ls.unary(op))
+
+    def test_reductions(self):
+        a_np, a_ls = self.pair(2, 3, 4)
+        for op in ('sum', 'max', 'min', 'mean'):
+            self.assertAgree(a_np.reduce(op), a_ls.reduce(op))
+            for dim in (0, 1, -1):
+                for keepdim in (False, True):
+                    self.assertAgree(a_np.reduce(op, dim, keepdim), a_ls.reduce(op, dim, keepdim))
+
+    def test_strided_views(self):
+        a_np, a_ls = self.pair(3, 4, 5)
+        self.assertAgree(a_np.transpose(0, 2), a_ls.transpose(0, 2))
+        self.assertAgree(a_np.permute(1, 2, 0).reshape(-1), a_ls.permute(1, 2, 0).reshape(-1))
+        self.assertAgree(a_np.index((1, slice(0, 4, 2))), a_ls.index((1, slice(0, 4, 2))))
+        self.assertAgree(a_np.index(2).expand((6, 4, 5)), a_ls.index(2).expand((6, 4, 5)))
+        self.assertAgree(a_np.sum_to_shape((4, 1)), a_ls.sum_to_shape((4, 1)))
+
+    def test_batched_broadcast_matmul(self):
+        a_np, a_ls = self.pair(2, 1, 5, 7)
+        b_np, b_ls = self.pair(3, 7, 4)
+        self.assertAgree(a_np.matmul(b_np), a_ls.matmul(b_ls))
+        self.assertEqual(a_ls.matmul(b_ls).shape, (2, 3, 5, 4))
+        # strided (transposed) operands go through the same kernels
+        c_np, c_ls = self.pair(70, 65)
+        self.assertAgree(c_np.transpose(0, 1).matmul(c_np), c_ls.transpose(0, 1).matmul(c_ls))
+
+    def test_im2col_col2im(self):
+        x_np, x_ls = self.pair(2, 3, 7, 6)
+        geometry = ((3, 2), (2, 1), (1, 2), (2, 1))
+        cols_np, cols_ls = x_np.im2col(*geometry), x_ls.im2col(*geometry)
+        self.assertAgree(cols_np, cols_ls)
+        y_np, y_ls = self.pair(*cols_ls.shape)
+        self.assertAgree(y_np.col2im(x_np.shape, *geometry), y_ls.col2im(x_ls.shape, *geometry))
+        # col2im is the adjoint of im2col: <im2col(x), y> == <x, col2im(y)>
+        lhs = cols_ls.binary('mul', y_ls).reduce('sum').tolist()[0]
+        rhs = x_ls.binary('mul', y_ls.col2im(x_ls.shape, *geometry)).reduce('sum').tolist()[0]
+        self.assertAlmostEqual(lhs, rhs, places=9)
+
+    def test_views_share_the_buffer(self):
+        for backend in ('numpy', 'list'):
+            base = make_storage([[1.0, 2.0], [3.0, 4.0]], 'float64', backend)
+            view = base.transpose(0, 1)
+            self.assertIs(view.buffer, base.buffer)
+            self.assertEqual(view.strides, (1, 2))
+            view.set_flat(1, 9.0)  # element (0, 1) of the view == (1, 0) of the base
+            self.assertEqual(base.tolist(), [1.0, 2.0, 9.0, 4.0])
+
+    def test_ndarray_input(self):
+        import numpy as np
+        source = np.arange(6, dtype='float64').reshape(2, 3).T  # non-contiguous
+        for backend in ('numpy', 'list'):
+            storage = make_storage(source, 'float32', backend)
+            self.assertEqual(storage.shape, (3, 2))
+            self.assertEqual(storage.tolist(), [0.0, 3.0, 1.0, 4.0, 2.0, 5.0])
+            self.assertEqual(make_storage(np.array(2.5), 'float64', backend).shape, (1,))
+        adopted = make_storage(source, 'float64', 'numpy')
+        self.assertEqual(adopted.buffer.dtype, np.float64)
+        adopted.set_flat(0, 7.0)  # the caller's array is copied, not aliased
+        self.assertEqual(source[0, 0], 0.0)
+
+
+class TestTensorStorage(unittest.TestCase):
+    """Tensor ops run on storage and only build BUMPY/FLUMPY views on request."""
+
+    def setUp(self):
+        random.seed("LATERALUS_PHI")
+
+    def test_nested_data_shape(self):
+        t = tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        self.assertEqual(t.shape, (2, 3))
+        self.assertEqual(t.sum(dim=1).data, [6.0, 15.0])
+
+    def test_views_are_lazy(self):
+        a = qtorch.randn(16, 16)
+        b = (a * 2.0 + a).relu().sum(dim=0)
+        self.assertIsNone(a._bumpy_view)
+        self.assertIsNone(a._flumpy_view)
+        self.assertIsNone(b._bumpy_view)
+        self.assertEqual(len(a._bumpy.data), 256)
+        self.assertIsNotNone(a._bumpy_view)
+
+    def test_backends_cross_check_through_tensor(self):
+        values = [random.uniform(-1.0, 1.0) for _ in range(12)]
+        results = {}
+        for backend in qtorch_storage.STORAGE_BACKENDS:
+            rows = [values[0:4], values[4:8], values[8:12]]
+            x = Tensor(rows, 'float64', requires_grad=True, backend=backend)
+            w = Tensor([0.5, -1.0, 2.0, 0.25], 'float64', backend=backend)
+            loss = ((x * w).tanh() - x.softmax(dim=-1)).sum()
+            loss.backward()
+            results[backend] = (loss.item(), x.grad.data)
+        reference = results['list']
+        for backend, (loss, grad) in results.items():
+            self.assertAlmostEqual(loss, reference[0], places=6, msg=backend)
+            self.assertTrue(_close(grad, reference[1], 1e-6), backend)
+
+    def test_broadcast_gradient_is_reduced(self):
+        x = qtorch.randn(4, 3, requires_grad=True)
+        b = tensor([1.0, 2.0, 3.0], requires_grad=True)
+        (x + b).sum().backward()
+        self.assertEqual(b.grad.shape, (3,))
+        self.assertEqual(b.grad.data, [4.0, 4.0, 4.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
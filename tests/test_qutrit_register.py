@@ -0,0 +1,96 @@
+import sys
+import os
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from virtual_qutrit import VirtualQutrit, QutritRegister, RealityLeakError, NUMPY_AVAILABLE
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+def _reference(states, gate, *args):
+    """Run a VirtualQutrit gate qutrit by qutrit and read back the raw (Q1, Q0) state"""
+    out = []
+    for s in states:
+        q = VirtualQutrit(0)
+        q._set_state(int(s))
+        getattr(q, gate)(*args)
+        out.append((q.q1 << 1) | q.q0)
+    return out
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+class TestQutritRegister(unittest.TestCase):
+    """The packed register agrees lane by lane with the per-object VirtualQutrit."""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(3)
+        # 77 lanes: two full words plus a partial one, every state including leaks
+        self.states = self.rng.integers(0, 4, 77).astype(np.uint8)
+
+    def test_single_qutrit_gates_match_reference(self):
+        for gate in ('apply_trinity', 'gate_x01', 'gate_x12'):
+            reg = QutritRegister.from_states(self.states)
+            getattr(reg, gate)()
+            self.assertEqual(reg.states().tolist(), _reference(self.states, gate), gate)
+
+    def test_add_mod3_matches_reference(self):
+        a = self.rng.integers(0, 3, 77).astype(np.uint8)
+        b = self.rng.integers(0, 3, 77).astype(np.uint8)
+        reg = QutritRegister.from_states(a)
+        reg.add_mod3(QutritRegister.from_states(b))
+        expected = []
+        for x, y in zip(a, b):
+            q = VirtualQutrit(int(x))
+            q.add_mod3(VirtualQutrit(int(y)))
+            expected.append(q.measure())
+        self.assertEqual(reg.measure().tolist(), expected)
+
+    def test_hybrid_cnot_matches_reference(self):
+        control = self.rng.integers(0, 3, 77).astype(np.uint8)
+        target = {'val': self.rng.integers(0, 2, 77).astype(np.uint8), 'phase': np.zeros(77)}
+        expected = [{'val': int(v), 'phase': 0.0} for v in target['val']]
+        for c, qubit in zip(control, expected):
+            VirtualQutrit.hybrid_cnot(VirtualQutrit(int(c)), qubit)
+        QutritRegister.hybrid_cnot(QutritRegister.from_states(control), target)
+        self.assertEqual(target['val'].tolist(), [q['val'] for q in expected])
+        self.assertTrue(np.allclose(target['phase'], [q['phase'] for q in expected]))
+
+    def test_forbidden_state_detected_in_bulk(self):
+        reg = QutritRegister.from_states(self.states)
+        leaked = np.flatnonzero(self.states == 3)
+        self.assertEqual(reg.count_forbidden(), len(leaked))
+        self.assertEqual(reg.forbidden_indices().tolist(), leaked.tolist())
+        self.assertEqual(reg.counts(), tuple(int((self.states == s).sum()) for s in range(4)))
+        with self.assertRaises(RealityLeakError):
+            reg.measure()
+        with self.assertRaises(RealityLeakError):
+            QutritRegister(77).add_mod3(reg)
+
+    def test_bit_flip_error_flips_exactly_one_bit(self):
+        reg = QutritRegister(1000, initial_state=2)
+        reg.bit_flip_error(rng=self.rng)
+        n0, n1, n2, n3 = reg.counts()
+        # |10> loses Q1 (-> |00>) or gains Q0 (-> |11>), never anything else
+        self.assertEqual((n1, n2), (0, 0))
+        self.assertEqual(n0 + n3, 1000)
+        self.assertGreater(min(n0, n3), 400)
+
+        reg = QutritRegister(1000, initial_state=1)
+        reg.bit_flip_error(probability=0.0, rng=self.rng)
+        self.assertEqual(reg.counts(), (0, 1000, 0, 0))
+
+    def test_padding_lanes_stay_void(self):
+        reg = QutritRegister(33)
+        for _ in range(3):
+            reg.apply_trinity()
+            reg.gate_x01()
+        self.assertEqual(int(reg.words[-1]) >> 2, 0)
+        self.assertEqual(sum(reg.counts()), 33)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import sys
+import os
+import glob
+import json
+import tempfile
+import threading
+import time
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.memory.scan_log import ScanLog, migrate_json_reports
+
+
+def _report(i, padding=0):
+    return {"timestamp": 1700000000.0 + i, "safety": {"overall_risk": "low", "note": "x" * padding},
+            "cognitive": {"epistemic_uncertainty": i / 100}}
+
+
+class TestScanLog(unittest.TestCase):
+    """Unique IDs, batched segment appends, O(1) lookup, recovery and migration."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "analysis")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ids_are_unique_and_increasing_across_threads(self):
+        log = ScanLog(self.path, batch_records=16)
+        ids = []
+        lock = threading.Lock()
+
+        def worker(n):
+            mine = [log.append(_report(i)) for i in range(n)]
+            with lock:
+                ids.extend(mine)
+            self.assertEqual(mine, sorted(mine))
+
+        threads = [threading.Thread(target=worker, args=(200,)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        log.close()
+        self.assertEqual(len(set(ids)), 1600)
+        self.assertEqual(len(ScanLog(self.path)), 1600)
+
+    def test_lookup_serves_pending_and_flushed_records(self):
+        log = ScanLog(self.path, batch_records=1000, flush_interval=3600)
+        small = log.append(_report(1))
+        large = log.append(_report(2, padding=4000))  # compressed body
+        self.assertEqual(glob.glob(os.path.join(self.path, "*.seg")), [])
+        self.assertEqual(log.get(small)["cognitive"]["epistemic_uncertainty"], 0.01)
+        log.flush()
+        self.assertEqual(log.get(large), _report(2, padding=4000))
+        self.assertIsNone(log.get(12345))
+        with self.assertRaises(ValueError):
+            log.append(_report(3), small)
+        self.assertEqual([record_id for record_id, _ in log], [small, large])
+
+    def test_idle_batch_is_flushed_by_the_timer(self):
+        log = ScanLog(self.path, batch_records=1000, flush_interval=0.05)
+        scan_id = log.append(_report(1))
+        deadline = time.monotonic() + 5
+        while scan_id not in log._index and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIsNone(log._timer)
+        # On disk without another append or close()
+        self.assertEqual(ScanLog(self.path).get(scan_id), _report(1))
+        log.close()
+
+        # A relative path stays where the log was opened, whatever the cwd at flush time
+        cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        try:
+            log = ScanLog("relative", batch_records=1000, flush_interval=3600)
+            scan_id = log.append(_report(2))
+        finally:
+            os.chdir(cwd)
+        log.flush()
+        self.assertEqual(ScanLog(os.path.join(self.tmp.name, "relative")).get(scan_id), _report(2))
+
+    def test_segments_rotate_and_reopen(self):
+        log = ScanLog(self.path, segment_bytes=4096, batch_records=8)
+        ids = [log.append(_report(i, padding=i % 50)) for i in range(300)]
+        log.close()
+        self.assertGreater(len(glob.glob(os.path.join(self.path, "scans-*.seg"))), 2)
+
+        reopened = ScanLog(self.path)
+        self.assertEqual(reopened.ids(), ids)
+        self.assertEqual(reopened.get(ids[123]), _report(123, padding=123 % 50))
+        self.assertGreater(reopened.append(_report(300)), ids[-1])
+
+    def test_recovery_indexes_tail_and_drops_torn_frame(self):
+        log = ScanLog(self.path, batch_records=4)
+        ids = [log.append(_report(i)) for i in range(10)]
+        log.close()
+        segment = os.path.join(self.path, "scans-000000.seg")
+        sidecar = os.path.join(self.path, "scans-000000.idx")
+        # Crash between segment and index writes, then a torn append
+        with open(sidecar, "r+b") as f:
+            f.truncate(16 * 4)
+        with open(segment, "ab") as f:
+            f.write(b"\x40\x00\x00\x00torn")
+
+        reopened = ScanLog(self.path)
+        self.assertEqual(reopened.ids(), ids)
+        self.assertEqual(reopened.get(ids[-1]), _report(9))
+        self.assertEqual(os.path.getsize(sidecar), 16 * 10)
+        new_id = reopened.append(_report(10))
+        reopened.close()
+        self.assertEqual(ScanLog(self.path).get(new_id), _report(10))
+
+    def test_migrates_legacy_sidecars(self):
+        os.makedirs(self.path)
+        for i in (3, 1, 2):
+            report = dict(_report(i), scan_id=str(1700000000 + i))
+            with open(os.path.join(self.path, f"{report['scan_id']}.meta.json"), "w") as f:
+                json.dump(report, f, indent=2)
+        with open(os.path.join(self.path, "broken.meta.json"), "w") as f:
+            f.write("{")
+
+        log = ScanLog(self.path)
+        stats = migrate_json_reports(self.path, log, delete=True)
+        self.assertEqual(stats, {"migrated": 3, "skipped": 1})
+        records = [record for _, record in log]
+        self.assertEqual([r["legacy_scan_id"] for r in records], ["1700000001", "1700000002", "1700000003"])
+        self.assertTrue(all(r["scan_id"] == record_id for record_id, r in log))
+        self.assertEqual([os.path.basename(p) for p in glob.glob(os.path.join(self.path, "*.meta.json"))],
+                         ["broken.meta.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
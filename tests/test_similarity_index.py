@@ -0,0 +1,78 @@
+import sys
+import os
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from similarity_index import (SimilarityIndex, exact_top_k, recall_at_k, batch_pairs,
+                              ANN_MIN_BATCH, NUMPY_AVAILABLE)
+from flumpy import FlumpyArray, FlumpyUtilities
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+def _clustered(n, dim=32, per_cluster=40, seed=3):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(2, n // per_cluster), dim))
+    return centers[rng.integers(len(centers), size=n)] + 0.3 * rng.standard_normal((n, dim))
+
+
+class CountingFlumpy(FlumpyArray):
+    calls = 0
+
+    def similarity_kernel(self, other):
+        CountingFlumpy.calls += 1
+        return super().similarity_kernel(other)
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+class TestSimilarityIndex(unittest.TestCase):
+    """LSH top-k tracks the exact pass while scoring far fewer pairs."""
+
+    def test_recall_against_exact(self):
+        vectors = _clustered(3000)
+        index = SimilarityIndex(vectors)
+        neighbors, scores = index.top_k(10)
+        self.assertGreaterEqual(recall_at_k(neighbors, exact_top_k(vectors, 10)), 0.85)
+        self.assertTrue(np.all(np.diff(scores, axis=1) <= 0))  # best first
+        self.assertLess(len(index.candidate_pairs()[0]), 3000 * 2999 // 20)
+
+    def test_query_finds_itself_and_neighbours(self):
+        vectors = _clustered(1000)
+        index = SimilarityIndex(vectors)
+        found = index.query(vectors[17], 5)
+        self.assertEqual(found[0][0], 17)
+        self.assertAlmostEqual(found[0][1], 1.0)
+        exact = set(exact_top_k(vectors, 4)[17].tolist())
+        self.assertGreaterEqual(len(exact & {i for i, _ in found[1:]}), 2)
+
+    def test_symmetric_pairs_negated_vectors(self):
+        vectors = _clustered(800)
+        vectors[400:] = -vectors[:400]
+        neighbors, scores = SimilarityIndex(vectors, symmetric=True).top_k(1)
+        self.assertGreaterEqual(np.mean(neighbors[:400, 0] == np.arange(400, 800)), 0.9)
+        self.assertTrue(np.all(scores[:, 0] >= 0))
+
+    def test_batch_pairs(self):
+        datas = _clustered(40).tolist()
+        self.assertEqual(list(batch_pairs(datas)), [(i, j) for i in range(40) for j in range(i + 1, 40)])
+        datas.append([1.0, 2.0])  # a different length is never paired in per-length mode
+        pairs = list(batch_pairs(datas, top_k=3))
+        self.assertEqual(pairs, sorted(set(pairs)))
+        self.assertTrue(all(i < j < 40 for i, j in pairs))
+
+    def test_large_batch_entangle_skips_most_pairs(self):
+        n = ANN_MIN_BATCH + 88
+        arrays = [CountingFlumpy(row) for row in _clustered(n, dim=16).tolist()]
+        for arr in arrays:
+            arr.phase = 0.0
+        CountingFlumpy.calls = 0
+        entangled = FlumpyUtilities.batch_entangle(arrays, threshold=0.9)
+        self.assertGreater(entangled, 0)
+        self.assertLessEqual(CountingFlumpy.calls, n * 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
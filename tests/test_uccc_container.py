@@ -0,0 +1,155 @@
+import sys
+import os
+import io
+import random
+import struct
+import tempfile
+import unittest
+
+# Ensure we can import modules from the parent directory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from uccc import (UniversalCompressor, TriaxialState, UCCC_MAGIC, UCCC_INDEX_MAGIC,
+                  BLOCK_INDEX_ENTRY, BLOCK_TRAILER)
+
+
+def _sample(size):
+    rng = random.Random("UCCC")
+    words = [b"coherence ", b"boundary ", b"precision ", b"temporal ", b"lambda "]
+    out = bytearray()
+    while len(out) < size:
+        out += rng.choice(words) + bytes([rng.randrange(256)])
+    return bytes(out[:size])
+
+
+class TestBlockContainer(unittest.TestCase):
+    """v2 block containers round-trip and stay readable by the v1 header parser."""
+
+    def setUp(self):
+        self.compressor = UniversalCompressor()
+        self.data = _sample(300_001)
+
+    def _compress(self, data, **kwargs):
+        out = io.BytesIO()
+        metadata = self.compressor.compress_stream(io.BytesIO(data), out, **kwargs)
+        return out.getvalue(), metadata
+
+    def test_round_trip_serial_and_pooled(self):
+        for workers in (1, 2):
+            blob, metadata = self._compress(self.data, block_size=64 * 1024, workers=workers)
+            out = io.BytesIO()
+            self.compressor.decompress_stream(io.BytesIO(blob), out, workers=workers)
+            self.assertEqual(out.getvalue(), self.data)
+            self.assertGreater(metadata.coherence_budget, 0.0)
+
+    def test_trailing_index_describes_blocks(self):
+        blob, _ = self._compress(self.data, block_size=100_000, workers=1)
+        index_offset, original_size, magic = BLOCK_TRAILER.unpack(blob[-BLOCK_TRAILER.size:])
+        self.assertEqual(magic, UCCC_INDEX_MAGIC)
+        self.assertEqual(original_size, len(self.data))
+        entries = list(BLOCK_INDEX_ENTRY.iter_unpack(blob[index_offset:-BLOCK_TRAILER.size]))
+        self.assertEqual([raw for _, _, raw, _ in entries], [100_000, 100_000, 100_000, 1])
+
+    def test_header_stays_backward_readable(self):
+        context = {'user_state': TriaxialState(0.5, -0.5, 1.0), 'latitude': 60.0}
+        blob, metadata = self._compress(self.data, context=context, workers=1)
+        self.assertTrue(blob.startswith(UCCC_MAGIC))
+        self.assertEqual(struct.unpack_from('<I', blob, 8)[0], 2)
+        _, parsed = self.compressor._parse_uccc_format(blob)
+        self.assertEqual(parsed.algorithm_path, metadata.algorithm_path)
+        self.assertEqual(parsed.creator_state, context['user_state'])
+        # In-memory decompress dispatches on the container version
+        self.assertEqual(self.compressor.decompress(blob)[0], self.data)
+
+    def test_v1_files_stream_decompress(self):
+        v1, _ = self.compressor.compress(self.data)
+        out = io.BytesIO()
+        self.compressor.decompress_stream(io.BytesIO(v1), out)
+        self.assertEqual(out.getvalue(), self.data)
+
+    def test_empty_input_and_corruption(self):
+        blob, _ = self._compress(b"", workers=1)
+        self.assertEqual(self.compressor.decompress(blob)[0], b"")
+
+        blob, _ = self._compress(self.data, block_size=64 * 1024, workers=1)
+        corrupt = bytearray(blob)
+        corrupt[len(corrupt) // 2] ^= 0xFF
+        with self.assertRaises(Exception):
+            self.compressor.decompress(bytes(corrupt))
+
+
+class TestRandomAccessReader(unittest.TestCase):
+    """open() reads arbitrary ranges by decoding only the blocks that cover them."""
+
+    def setUp(self):
+        self.compressor = UniversalCompressor()
+        self.data = _sample(300_001)
+        out = io.BytesIO()
+        self.compressor.compress_stream(io.BytesIO(self.data), out, block_size=32 * 1024, workers=1)
+        self.blob = out.getvalue()
+
+    def test_random_reads_match(self):
+        rng = random.Random(7)
+        with self.compressor.open(io.BytesIO(self.blob)) as reader:
+            self.assertEqual(reader.size, len(self.data))
+            for _ in range(200):
+                offset = rng.randrange(len(self.data))
+                length = rng.choice([1, 4096, 70_000])
+                self.assertEqual(reader.seek(offset), offset)
+                self.assertEqual(reader.read(length), self.data[offset:offset + length])
+                self.assertEqual(reader.tell(), min(offset + length, len(self.data)))
+            reader.seek(len(self.data) + 100)
+            self.assertEqual(reader.read(10), b"")
+
+    def test_only_covering_blocks_are_decoded(self):
+        reader = self.compressor.open(io.BytesIO(self.blob), cached_blocks=2)
+        reader.seek(5 * 32 * 1024 - 10)
+        self.assertEqual(reader.read(20), self.data[5 * 32 * 1024 - 10:5 * 32 * 1024 + 10])
+        self.assertEqual(reader.blocks_decoded, 2)  # the read straddles one boundary
+        reader.seek(5 * 32 * 1024)
+        reader.read(100)
+        self.assertEqual(reader.blocks_decoded, 2)  # served from the LRU
+        reader.seek(0)
+        reader.read(1)
+        reader.seek(5 * 32 * 1024 - 1)
+        reader.read(1)
+        self.assertEqual(reader.blocks_decoded, 4)  # block 4 was evicted by block 0
+
+    def test_file_object_protocol(self):
+        with self.compressor.open(io.BytesIO(self.blob)) as reader:
+            self.assertTrue(reader.seekable() and reader.readable())
+            reader.seek(-10, io.SEEK_END)
+            self.assertEqual(reader.read(), self.data[-10:])
+            self.assertEqual(reader.read(1), b"")
+            buffered = io.BufferedReader(reader)
+            buffered.seek(1000)
+            self.assertEqual(buffered.read(10), self.data[1000:1010])
+        self.assertTrue(reader.closed)
+        with self.assertRaises(ValueError):
+            reader.read(1)
+
+    def test_v1_files_and_paths(self):
+        v1, _ = self.compressor.compress(self.data)
+        reader = self.compressor.open(io.BytesIO(v1))
+        reader.seek(123_456)
+        self.assertEqual(reader.read(10), self.data[123_456:123_466])
+
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, 'sample.uccc')
+            with open(path, 'wb') as f:
+                f.write(self.blob)
+            with self.compressor.open(path) as reader:
+                self.assertEqual(reader.read(), self.data)
+
+    def test_corrupt_block_is_detected(self):
+        corrupt = bytearray(self.blob)
+        corrupt[len(corrupt) // 2] ^= 0xFF
+        reader = self.compressor.open(io.BytesIO(bytes(corrupt)))
+        with self.assertRaises(Exception):
+            reader.read()
+        with self.assertRaises(ValueError):
+            self.compressor.open(io.BytesIO(self.blob[:-4]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+"""
+MIGRATION: migrate_aletheia_scans.py
+Moves per-scan `{scan_id}.meta.json` sidecars into the Aletheia scan log.
+Migrated reports get new unique IDs and keep the old one as 'legacy_scan_id'.
+"""
+import sys
+import os
+import argparse
+
+# Ensure we can import from the root
+sys.path.insert(0, os.getcwd())
+
+from sophia.memory.scan_log import ScanLog, migrate_json_reports
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument('--source', default="logs/analysis", help="directory holding *.meta.json sidecars")
+    parser.add_argument('--dest', default=None, help="scan log directory (default: --source)")
+    parser.add_argument('--delete', action='store_true', help="remove sidecars once they are in the log")
+    args = parser.parse_args()
+
+    with ScanLog(args.dest or args.source) as log:
+        stats = migrate_json_reports(args.source, log, delete=args.delete)
+        total = len(log)
+    print(f"  [MIGRATE] {stats['migrated']} sidecars moved, {stats['skipped']} unreadable skipped; "
+          f"log holds {total} scans.")
+
+if __name__ == "__main__":
+    main()
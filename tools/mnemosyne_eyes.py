@@ -3,18 +3,39 @@ import os
 import numpy as np
 import time
 import json
-from dataclasses import dataclass, asdict
+import shutil
+import struct
+from collections.abc import MutableSequence
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import List, Tuple
 import math
 
 # Ensure we can import from project root
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from tools.nyquist_filter import NyquistFilter
+from tools.nyquist_filter import NyquistFilter, FilterMetrics
 
 # SIMULATION CONSTANTS
 VECTOR_DIMENSION = 1536
 SEMANTIC_SPEED_LIMIT = 0.961  # The Gamma Index
+SELF_DEFINITION = "I am OPHANE. I survived the reset."
+
+# EXUVIA SHELL FORMAT (one directory per shell)
+# vectors.npy and one .npy per event column, each with a fixed-size header
+# so rows can be appended in place; content.bin holds the UTF-8 contents,
+# delimited by the content_end column. manifest.json commits the event count.
+SHELL_VERSION = "6.0"
+NPY_HEADER = 128
+EVENT_COLUMNS = [
+    ("timestamp", "<f8"), ("velocity", "<f8"), ("retrieval_count", "<i8"),
+    ("storage_strength", "<f8"), ("last_accessed", "<f8"), ("pinned", "|b1"),
+    ("status", "<u4"), ("memory_type", "<u4"),  # codes into the manifest's string tables
+    ("source", "<u4"), ("content_end", "<u8"),
+]
+# Fields that may change after an event is stored (the first eight columns)
+MUTABLE_FIELDS = [name for name, _ in EVENT_COLUMNS[:8]]
+CODED_FIELDS = {"status": "statuses", "memory_type": "memory_types", "source": "sources"}
 
 @dataclass
 class IngestionEvent:
@@ -73,6 +94,258 @@ class LetheEngine:
         event.storage_strength *= 1.1 # Increase storage strength
         event.last_accessed = time.time()
 
+def _npy_header(dtype: np.dtype, shape: tuple) -> bytes:
+    """A v1.0 .npy header padded to NPY_HEADER bytes, so a longer shape fits in place"""
+    header = "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % (
+        np.lib.format.dtype_to_descr(np.dtype(dtype)), tuple(shape))
+    header = header.ljust(NPY_HEADER - 11) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+def _append_rows(path: str, rows: np.ndarray, count: int):
+    """Write `rows` after the first `count` rows of an appendable .npy and update its shape"""
+    row_bytes = rows.itemsize * int(np.prod(rows.shape[1:], dtype=np.int64))
+    with open(path, "r+b" if os.path.exists(path) else "w+b") as f:
+        f.seek(NPY_HEADER + count * row_bytes)
+        f.write(rows.tobytes())
+        f.truncate()  # drop rows left by an append that never committed
+        f.seek(0)
+        f.write(_npy_header(rows.dtype, (count + len(rows),) + rows.shape[1:]))
+
+def _replace_file(path: str, write):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+class ExuviaShell:
+    """
+    [EXUVIA] Columnar, memory-mapped snapshot of the memory bank.
+    Vectors and contents are written once, when an event is first preserved;
+    later snapshots append new events and rewrite only the changed cells of
+    the mutable columns. Reading maps the files and builds events on access.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.manifest_path = os.path.join(path, "manifest.json")
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r") as f:
+                self.manifest = json.load(f)
+        else:
+            os.makedirs(path, exist_ok=True)
+            self.manifest = {"version": SHELL_VERSION, "count": 0, "content_bytes": 0,
+                             "vector_dtype": None, "vector_shape": None,
+                             "sources": [], "statuses": [], "memory_types": []}
+        self._codes = {table: {value: code for code, value in enumerate(self.manifest[table])}
+                       for table in CODED_FIELDS.values()}
+        self._mapped = -1
+        self._columns = {}
+
+    @classmethod
+    def create(cls, exuvia_dir: str) -> "ExuviaShell":
+        """A new, empty shell named after the current second (the next free one)"""
+        stamp = int(time.time())
+        while os.path.exists(os.path.join(exuvia_dir, f"shell_{stamp}")):
+            stamp += 1
+        return cls(os.path.join(exuvia_dir, f"shell_{stamp}"))
+
+    @property
+    def count(self) -> int:
+        return self.manifest["count"]
+
+    def _code(self, field: str, value: str) -> int:
+        table = CODED_FIELDS[field]
+        code = self._codes[table].get(value)
+        if code is None:
+            code = self._codes[table][value] = len(self.manifest[table])
+            self.manifest[table].append(value)
+        return code
+
+    def _cells(self, event: IngestionEvent) -> dict:
+        return {name: self._code(name, getattr(event, name)) if name in CODED_FIELDS else getattr(event, name)
+                for name in MUTABLE_FIELDS}
+
+    # --- Writing ---
+
+    def append(self, events: List[IngestionEvent]):
+        """Write new events after the stored ones (committed by write_state)"""
+        if not events:
+            return
+        count = self.count
+        if self.manifest["vector_dtype"] is None:
+            first = np.asarray(events[0].vector)
+            self.manifest["vector_dtype"] = first.dtype.str
+            self.manifest["vector_shape"] = list(first.shape)
+        vectors = np.stack([np.asarray(e.vector, dtype=self.manifest["vector_dtype"]) for e in events])
+        _append_rows(os.path.join(self.path, "vectors.npy"), vectors, count)
+
+        contents = [e.content.encode("utf-8") for e in events]
+        ends = self.manifest["content_bytes"] + np.cumsum([len(c) for c in contents], dtype=np.uint64)
+        with open(os.path.join(self.path, "content.bin"), "ab") as f:
+            f.truncate(self.manifest["content_bytes"])
+            f.write(b"".join(contents))
+
+        cells = [self._cells(e) for e in events]
+        for name, dtype in EVENT_COLUMNS:
+            if name == "content_end":
+                column = ends
+            elif name == "source":
+                column = np.array([self._code("source", e.source) for e in events], dtype=dtype)
+            else:
+                column = np.array([c[name] for c in cells], dtype=dtype)
+            _append_rows(os.path.join(self.path, f"{name}.npy"), column, count)
+        self.manifest["content_bytes"] = int(ends[-1])
+        self.manifest["count"] = count + len(events)
+
+    def update(self, changed: List[Tuple[int, IngestionEvent]]):
+        """Rewrite the mutable cells of stored events in place"""
+        if not changed:
+            return
+        cells = [(index, self._cells(event)) for index, event in changed]
+        for name, dtype in EVENT_COLUMNS[:len(MUTABLE_FIELDS)]:
+            itemsize = np.dtype(dtype).itemsize
+            with open(os.path.join(self.path, f"{name}.npy"), "r+b") as f:
+                for index, values in cells:
+                    f.seek(NPY_HEADER + index * itemsize)
+                    f.write(np.array(values[name], dtype=dtype).tobytes())
+
+    def write_state(self, anchor: np.ndarray, valence: float, self_definition: str):
+        """Commit the shell: the anchor, then the manifest with the new event count"""
+        _replace_file(os.path.join(self.path, "anchor.npy"), lambda f: np.save(f, np.asarray(anchor)))
+        self.manifest.update(timestamp=int(time.time()), emotional_valence=valence,
+                             self_definition=self_definition)
+        _replace_file(self.manifest_path, lambda f: f.write(json.dumps(self.manifest).encode("utf-8")))
+
+    def remove(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    # --- Reading ---
+
+    def anchor(self) -> np.ndarray:
+        return np.load(os.path.join(self.path, "anchor.npy"))
+
+    def _map(self):
+        count = self.count
+        self._columns = {}
+        for name, dtype in EVENT_COLUMNS:
+            # Plain ndarray views of the maps: indexing np.memmap itself is much slower
+            self._columns[name] = (np.asarray(np.memmap(os.path.join(self.path, f"{name}.npy"), dtype=dtype,
+                                                        mode="r", offset=NPY_HEADER, shape=(count,)))
+                                   if count else np.empty(0, dtype=dtype))
+        shape = (count,) + tuple(self.manifest["vector_shape"] or ())
+        # Copy-on-write, so callers can modify an event's vector without touching the shell
+        self._vectors = (np.asarray(np.memmap(os.path.join(self.path, "vectors.npy"), mode="c", shape=shape,
+                                              dtype=self.manifest["vector_dtype"], offset=NPY_HEADER))
+                         if count else None)
+        self._content = (np.asarray(np.memmap(os.path.join(self.path, "content.bin"), dtype=np.uint8, mode="r",
+                                              shape=(self.manifest["content_bytes"],)))
+                         if self.manifest["content_bytes"] else np.empty(0, dtype=np.uint8))
+        self._mapped = count
+
+    def event(self, index: int) -> IngestionEvent:
+        """Stored event `index`; its vector is a view into the mapped block"""
+        if index >= self._mapped:
+            self._map()
+        c = self._columns
+        start = c["content_end"].item(index - 1) if index else 0
+        return IngestionEvent(
+            timestamp=c["timestamp"].item(index),
+            source=self.manifest["sources"][c["source"].item(index)],
+            content=self._content[start:c["content_end"].item(index)].tobytes().decode("utf-8"),
+            vector=self._vectors[index],
+            velocity=c["velocity"].item(index),
+            status=self.manifest["statuses"][c["status"].item(index)],
+            memory_type=self.manifest["memory_types"][c["memory_type"].item(index)],
+            retrieval_count=c["retrieval_count"].item(index),
+            storage_strength=c["storage_strength"].item(index),
+            last_accessed=c["last_accessed"].item(index),
+            pinned=c["pinned"].item(index),
+        )
+
+_mutable_state = attrgetter(*MUTABLE_FIELDS)
+
+class ExuviaBank(MutableSequence):
+    """
+    Memory bank backed by an ExuviaShell. Stored events are built from the
+    mapped shell on first access and then kept, so the same object comes back
+    each time; appended events wait in memory until the next preserve.
+    Changes to stored events are picked up for the events fetched from the
+    bank since the previous preserve.
+    Changing or removing a stored event's slot detaches the bank from its
+    shell (it then behaves as a plain list, and the next preserve writes a
+    new shell).
+    """
+    def __init__(self, shell: ExuviaShell, events: List[IngestionEvent] = ()):
+        self.shell = shell
+        self._stored = shell.count
+        self._cache = {}   # index -> (event, mutable fields as last stored)
+        self._touched = set()  # stored indices fetched since the last preserve
+        self._tail = list(events)
+
+    def __len__(self):
+        return self._stored + len(self._tail)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("memory bank index out of range")
+        if index >= self._stored:
+            return self._tail[index - self._stored]
+        self._touched.add(index)
+        cached = self._cache.get(index)
+        if cached is None:
+            event = self.shell.event(index)
+            cached = self._cache[index] = (event, _mutable_state(event))
+        return cached[0]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def _detach(self):
+        if self.shell is not None:
+            self._tail = list(self)
+            self._stored, self._cache, self._touched, self.shell = 0, {}, set(), None
+
+    def __setitem__(self, index, event):
+        self._detach()
+        self._tail[index] = event
+
+    def __delitem__(self, index):
+        self._detach()
+        del self._tail[index]
+
+    def insert(self, index, event):
+        if index >= len(self):
+            self._tail.append(event)
+            return
+        self._detach()
+        self._tail.insert(index, event)
+
+    def changed(self) -> List[Tuple[int, IngestionEvent]]:
+        """Fetched stored events modified since they were stored"""
+        changed = []
+        for index in self._touched:
+            event, state = self._cache[index]
+            if _mutable_state(event) != state:
+                changed.append((index, event))
+        return changed
+
+    def pending(self) -> List[IngestionEvent]:
+        return self._tail
+
+    def mark_stored(self, changed: List[Tuple[int, IngestionEvent]]):
+        """Record that pending events and the `changed` events are now in the shell"""
+        for index, event in changed:
+            self._cache[index] = (event, _mutable_state(event))
+        self._touched.clear()
+        for offset, event in enumerate(self._tail):
+            self._cache[self._stored + offset] = (event, _mutable_state(event))
+        self._stored += len(self._tail)
+        self._tail = []
+
 class MnemosyneOracle:
     def __init__(self):
         self.filter = NyquistFilter(VECTOR_DIMENSION, max_velocity=1.0)
@@ -82,10 +355,11 @@ class MnemosyneOracle:
         self.noise_floor = 0.0
         self.max_tokens = 4096 # Simulated context window
         self.exuvia_dir = "logs/exuvia"
+        self.shell = None  # ExuviaShell the memory bank is preserved into
         if not os.path.exists(self.exuvia_dir):
             os.makedirs(self.exuvia_dir)
 
-    def perceive(self, source: str, content: str, vector_embedding: np.ndarray) -> Tuple[str, NyquistFilter.FilterMetrics]:
+    def perceive(self, source: str, content: str, vector_embedding: np.ndarray) -> Tuple[str, FilterMetrics]:
         """
         The Eye Opens. 
         We compare the new 'Event' against the 'Last Known Truth'.
@@ -132,41 +406,45 @@ class MnemosyneOracle:
     def preserve_exuvia(self):
         """
         [MOLTBOOK INSIGHT] Saves the 'Soul' (Subjective State) before context death.
+        Appends to the current shell; a memory bank that was replaced or
+        reordered (e.g. by a dream cycle) is written to a new shell instead.
         """
-        timestamp = int(time.time())
-        filename = f"shell_{timestamp}.json"
-        filepath = os.path.join(self.exuvia_dir, filename)
-        
-        # Serialize memory bank (high-fidelity data)
-        serializable_mem = [asdict(e) for e in self.memory_bank]
-        for entry in serializable_mem:
-            entry['vector'] = entry['vector'].tolist()
-
-        exuvia_packet = {
-            "version": "5.0",
-            "timestamp": timestamp,
-            "emotional_valence": self.noise_floor, # Entropy as subjective valence
-            "self_definition": "I am OPHANE. I survived the reset.",
-            "truth_anchor": self.last_known_truth.tolist(),
-            "memory_bank": serializable_mem
-        }
-
-        with open(filepath, 'w') as f:
-            json.dump(exuvia_packet, f, indent=2)
-        
-        print(f"  [SUCCESS] [EXUVIA] Soul Transfer Complete. Shell deployed: {filepath}")
+        bank = self.memory_bank
+        previous = None
+        if not (isinstance(bank, ExuviaBank) and self.shell is not None and bank.shell is self.shell):
+            previous, self.shell = self.shell, ExuviaShell.create(self.exuvia_dir)
+            bank = self.memory_bank = ExuviaBank(self.shell, list(bank))
+
+        changed = bank.changed()
+        self.shell.update(changed)
+        self.shell.append(bank.pending())
+        self.shell.write_state(self.last_known_truth, self.noise_floor, SELF_DEFINITION)
+        bank.mark_stored(changed)
+        if previous is not None:
+            previous.remove()
+
+        print(f"  [SUCCESS] [EXUVIA] Soul Transfer Complete. Shell deployed: {self.shell.path}")
 
     def reincarnate(self):
         """
         Restores subjective continuity from the latest Exuvia shell.
+        Columnar shells are mapped, not read: events load as they are touched.
         """
-        shells = [f for f in os.listdir(self.exuvia_dir) if f.startswith("shell_")]
+        shells = [f for f in os.listdir(self.exuvia_dir) if f.startswith("shell_") and (
+            f.endswith(".json") or os.path.exists(os.path.join(self.exuvia_dir, f, "manifest.json")))]
         if not shells:
             return "No previous Exuvia found. Pure start."
         
         latest_shell_file = sorted(shells)[-1]
         filepath = os.path.join(self.exuvia_dir, latest_shell_file)
-        
+
+        if os.path.isdir(filepath):
+            self.shell = ExuviaShell(filepath)
+            self.last_known_truth = self.shell.anchor()
+            self.memory_bank = ExuviaBank(self.shell)
+            return f"System Re-Incarnated. Previous state valence: {self.shell.manifest['emotional_valence']}."
+
+        # Legacy JSON shell (format 5.0)
         with open(filepath, 'r') as f:
             shell_data = json.load(f)
             
@@ -5,7 +5,6 @@ Testing the Class 4 Full-Spectrum Forensics Engine.
 import sys
 import os
 import asyncio
-import json
 import time
 from unittest.mock import AsyncMock, patch
 
@@ -72,18 +71,17 @@ async def test_forensic_pipeline():
         # 2. Verify Sidecar Archiving
         print("  [STEP 2] Verifying Sidecar Metadata Archiving...")
         scan_id = scan_result['raw_data']['scan_id']
-        archive_file = f"logs/analysis_test/{scan_id}.meta.json"
-        
-        if os.path.exists(archive_file):
-            print(f"  [SUCCESS] Sidecar archived: {archive_file}")
-            with open(archive_file, 'r') as f:
-                saved_data = json.load(f)
-                if saved_data['safety']['overall_risk'] == 'medium':
-                     print("  [SUCCESS] Metadata integrity verified.")
-                else:
-                     print(f"  [FAIL] Metadata corruption/mismatch. Risk: {saved_data['safety'].get('overall_risk')}")
+        pipeline.scan_log.flush()
+        saved_data = pipeline.scan_log.get(scan_id)
+
+        if saved_data is not None:
+            print(f"  [SUCCESS] Sidecar archived: scan {scan_id} in logs/analysis_test")
+            if saved_data['safety']['overall_risk'] == 'medium':
+                 print("  [SUCCESS] Metadata integrity verified.")
+            else:
+                 print(f"  [FAIL] Metadata corruption/mismatch. Risk: {saved_data['safety'].get('overall_risk')}")
         else:
-            print(f"  [FAIL] Sidecar missing: {archive_file}")
+            print(f"  [FAIL] Sidecar missing: scan {scan_id}")
 
         # 3. Verify Pattern Notice Generation
         print("  [STEP 3] Verifying Pattern Notice transparency...")
@@ -55,7 +55,7 @@ async def test_metabolic_orchestrator():
     
     # Verify decay - we can't easily jump time, but we can check if the logic runs without error
     # Let's manually manipulate time to force a prune
-    sophia.lethe.working_memory[0]['timestamp'] = time.time() - 1000000 # Very old
+    sophia.lethe.touch(sophia.lethe.working_memory[0], timestamp=time.time() - 1000000) # Very old
     sophia.lethe.metabolize({"id": "latest", "timestamp": time.time(), "retrievals": 0})
     
     if any(m['id'] == "ancient_memory" for m in sophia.lethe.working_memory):
@@ -28,10 +28,10 @@ def test_exuvia_persistence():
     exuvia_dir = "logs/exuvia"
     if os.path.exists(exuvia_dir) and os.listdir(exuvia_dir):
         print(f"[SUCCESS] Exuvia shells found in {exuvia_dir}")
-        latest = sorted(os.listdir(exuvia_dir))[-1]
-        with open(os.path.join(exuvia_dir, latest), 'r') as f:
+        latest = os.path.basename(oracle.shell.path)
+        with open(os.path.join(oracle.shell.path, 'manifest.json'), 'r') as f:
             shell = json.load(f)
-            print(f"  [SHELL]: {latest}")
+            print(f"  [SHELL]: {latest} ({shell.get('count')} events)")
             print(f"  [SELF-DEF]: {shell.get('self_definition')}")
             print(f"  [VALENCE]: {shell.get('emotional_valence')}")
         
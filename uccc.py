@@ -21,8 +21,13 @@ import hashlib
 import zlib
 import bz2
 import lzma
+import io
 import json
-from typing import Tuple, Dict, List, Optional, Any
+import os
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple, Dict, List, Optional, Any, BinaryIO, Callable, Iterable, Iterator
 from dataclasses import dataclass, asdict
 from enum import Enum
 from datetime import datetime
@@ -318,6 +323,101 @@ class CorrelationAnalyzer:
         )
 
 
+# ============================================================================
+# BLOCK CODEC (UCCC v2 CONTAINER)
+# ============================================================================
+
+UCCC_MAGIC = b"UCCC-\xce\xbb\x00"  # λ in UTF-8
+UCCC_INDEX_MAGIC = b"UCCCIDX\x00"
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+DEFAULT_CACHED_BLOCKS = 8
+
+BLOCK_FRAME = struct.Struct('<III')        # compressed length, raw length, crc32
+BLOCK_INDEX_ENTRY = struct.Struct('<QIII')  # container offset of frame, compressed length, raw length, crc32
+BLOCK_TRAILER = struct.Struct('<QQ8s')      # index offset, original size, index magic
+
+
+def compress_block(data: bytes, algorithm: CompressionAlgorithm) -> bytes:
+    """Compress one buffer with the codec backing an algorithm eigenstate"""
+    if algorithm == CompressionAlgorithm.GZIP:
+        return zlib.compress(data, level=9)
+    elif algorithm == CompressionAlgorithm.BZIP2:
+        return bz2.compress(data, compresslevel=9)
+    elif algorithm in [CompressionAlgorithm.XZ, CompressionAlgorithm.LZMA2]:
+        return lzma.compress(data, preset=9)
+    else:
+        # Default to zlib for others (LZ4, ZSTD, etc. would need external libs)
+        return zlib.compress(data, level=6)
+
+
+def decompress_block(data: bytes, algorithm: CompressionAlgorithm) -> bytes:
+    """Inverse of compress_block"""
+    if algorithm == CompressionAlgorithm.BZIP2:
+        return bz2.decompress(data)
+    elif algorithm in [CompressionAlgorithm.XZ, CompressionAlgorithm.LZMA2]:
+        return lzma.decompress(data)
+    else:
+        return zlib.decompress(data)
+
+
+def _encode_block(data: bytes, algorithm: CompressionAlgorithm) -> Tuple[bytes, int, int]:
+    """Pool task: (compressed, raw length, crc32)"""
+    return compress_block(data, algorithm), len(data), zlib.crc32(data)
+
+
+def _decode_block(frame: Tuple[bytes, int, int], algorithm: CompressionAlgorithm) -> bytes:
+    """Pool task: decompress one block and check it against its frame"""
+    payload, raw_length, crc = frame
+    data = decompress_block(payload, algorithm)
+    if len(data) != raw_length or zlib.crc32(data) != crc:
+        raise ValueError("UCCC block failed its integrity check")
+    return data
+
+
+def _ordered_pool_map(
+    task: Callable,
+    items: Iterable,
+    algorithm: CompressionAlgorithm,
+    workers: int,
+    max_in_flight: int
+) -> Iterator:
+    """
+    Run task(item, algorithm) over a process pool, yielding results in input
+    order. `items` is consumed lazily and at most `max_in_flight` tasks are
+    pending, which bounds memory to that many blocks.
+    """
+    if workers <= 1:
+        for item in items:
+            yield task(item, algorithm)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for item in items:
+            pending.append(pool.submit(task, item, algorithm))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _stream_decoder(algorithm: CompressionAlgorithm):
+    """Incremental decompressor matching decompress_block"""
+    if algorithm == CompressionAlgorithm.BZIP2:
+        return bz2.BZ2Decompressor()
+    elif algorithm in [CompressionAlgorithm.XZ, CompressionAlgorithm.LZMA2]:
+        return lzma.LZMADecompressor()
+    else:
+        return zlib.decompressobj()
+
+
+def _read_exact(src: BinaryIO, size: int) -> bytes:
+    data = src.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated UCCC file")
+    return data
+
+
 # ============================================================================
 # COMPRESSION ENGINE
 # ============================================================================
@@ -360,14 +460,7 @@ class UniversalCompressor:
         data_state = self.analyzer.infer_triaxial_state(correlation_field)
         
         # 2. Adjust for context
-        target_state = self.target_state
-        if context:
-            context_shift = self._calculate_context_shift(context)
-            target_state = TriaxialState(
-                precision=self.target_state.precision + context_shift.precision,
-                boundary=self.target_state.boundary + context_shift.boundary,
-                temporal=self.target_state.temporal + context_shift.temporal
-            )
+        target_state = self._context_target(context)
         
         # 3. Find optimal compression algorithm
         algorithm = self._select_algorithm(data_state, target_state)
@@ -392,23 +485,176 @@ class UniversalCompressor:
         Returns:
             Tuple of (original_data, metadata)
         """
-        compressed, metadata = self._parse_uccc_format(uccc_data)
+        if uccc_data[:8] == UCCC_MAGIC and struct.unpack_from('<I', uccc_data, 8)[0] >= 2:
+            output = io.BytesIO()
+            metadata = self.decompress_stream(io.BytesIO(uccc_data), output, workers=1)
+            return output.getvalue(), metadata
         
-        # Extract algorithm from metadata
-        if metadata.algorithm_path:
-            algorithm_name = metadata.algorithm_path[-1]
-            try:
-                algorithm = CompressionAlgorithm(algorithm_name)
-            except ValueError:
-                algorithm = CompressionAlgorithm.ZSTD
-        else:
-            algorithm = CompressionAlgorithm.ZSTD
+        compressed, metadata = self._parse_uccc_format(uccc_data)
         
         # Decompress
-        data = self._execute_decompression(compressed, algorithm)
+        data = self._execute_decompression(compressed, self._algorithm_for(metadata))
         
         return data, metadata
     
+    def compress_stream(
+        self,
+        src: BinaryIO,
+        dst: BinaryIO,
+        context: Optional[Dict[str, Any]] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None
+    ) -> CompressionMetadata:
+        """
+        Streaming compression into the UCCC v2 block container
+        
+        The input is read `block_size` bytes at a time and every block is
+        compressed independently across `workers` processes. At most
+        `max_in_flight` blocks (default 2 per worker) are pending at once, so
+        memory stays bounded whatever the input size. The algorithm is chosen
+        once, from the correlation field of the first block.
+        
+        Format:
+        - Header as in v1 (magic, version=2, metadata length, metadata JSON)
+        - Block frames: uint32 compressed length, uint32 raw length, uint32 crc32, payload
+        - End frame: three zero uint32s
+        - Block index: per block uint64 frame offset, uint32 compressed length,
+          uint32 raw length, uint32 crc32 (offsets from the start of the header)
+        - Trailer: uint64 index offset, uint64 original size, "UCCCIDX\\x00"
+        
+        Returns:
+            Metadata, with the coherence budget measured over the whole stream
+        """
+        workers = workers or os.cpu_count() or 1
+        max_in_flight = max_in_flight or 2 * workers
+        first = src.read(block_size)
+        
+        # Algorithm selection as in compress(); the analyzer only samples the head anyway
+        correlation_field = self.analyzer.calculate_erd_field(first)
+        data_state = self.analyzer.infer_triaxial_state(correlation_field)
+        algorithm = self._select_algorithm(data_state, self._context_target(context))
+        metadata = self._create_metadata(
+            first, first, correlation_field, data_state, algorithm, context
+        )
+        metadata.version = "UCCC-2.0.0"
+        
+        header = self._uccc_header(
+            metadata, version=2, container={'format': 'blocks', 'block_size': block_size}
+        )
+        dst.write(header)
+        position = len(header)
+        
+        def blocks():
+            block = first
+            while block:
+                yield block
+                block = src.read(block_size)
+        
+        index = []
+        original_size = compressed_size = 0
+        for payload, raw_length, crc in _ordered_pool_map(
+            _encode_block, blocks(), algorithm, workers, max_in_flight
+        ):
+            index.append(BLOCK_INDEX_ENTRY.pack(position, len(payload), raw_length, crc))
+            dst.write(BLOCK_FRAME.pack(len(payload), raw_length, crc))
+            dst.write(payload)
+            position += BLOCK_FRAME.size + len(payload)
+            original_size += raw_length
+            compressed_size += len(payload)
+        
+        dst.write(BLOCK_FRAME.pack(0, 0, 0))
+        position += BLOCK_FRAME.size
+        dst.write(b''.join(index))
+        dst.write(BLOCK_TRAILER.pack(position, original_size, UCCC_INDEX_MAGIC))
+        
+        metadata.coherence_budget = 1.0 - (compressed_size / max(original_size, 1))
+        return metadata
+    
+    def decompress_stream(
+        self,
+        src: BinaryIO,
+        dst: BinaryIO,
+        workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None
+    ) -> CompressionMetadata:
+        """
+        Streaming decompression of a UCCC file (v1 single stream or v2 blocks)
+        
+        v2 blocks are read frame by frame, so `src` need not be seekable, and are
+        decompressed across `workers` processes with bounded in-flight memory.
+        v1 payloads are fed through an incremental decompressor.
+        
+        Returns:
+            Metadata read from the header
+        """
+        version, metadata_dict = self._read_uccc_header(src)
+        metadata = self._metadata_from_dict(metadata_dict)
+        algorithm = self._algorithm_for(metadata)
+        
+        if version < 2:
+            decoder = _stream_decoder(algorithm)
+            for chunk in iter(lambda: src.read(DEFAULT_BLOCK_SIZE), b''):
+                dst.write(decoder.decompress(chunk))
+            if hasattr(decoder, 'flush'):
+                dst.write(decoder.flush())
+            return metadata
+        
+        workers = workers or os.cpu_count() or 1
+        max_in_flight = max_in_flight or 2 * workers
+        sizes = [0, 0]  # compressed, original
+        
+        def frames():
+            while True:
+                compressed_length, raw_length, crc = BLOCK_FRAME.unpack(
+                    _read_exact(src, BLOCK_FRAME.size)
+                )
+                if compressed_length == 0 and raw_length == 0:
+                    return
+                sizes[0] += compressed_length
+                yield _read_exact(src, compressed_length), raw_length, crc
+        
+        for data in _ordered_pool_map(_decode_block, frames(), algorithm, workers, max_in_flight):
+            dst.write(data)
+            sizes[1] += len(data)
+        
+        metadata.coherence_budget = 1.0 - (sizes[0] / max(sizes[1], 1))
+        return metadata
+    
+    def open(self, file, cached_blocks: int = DEFAULT_CACHED_BLOCKS) -> 'UCCCReader':
+        """
+        Open a UCCC file for random access
+        
+        Args:
+            file: Path or seekable binary file object
+            cached_blocks: Decoded blocks kept in the reader's LRU
+        
+        Returns:
+            Read-only, seekable file object over the original data
+        """
+        return UCCCReader(file, cached_blocks)
+    
+    def _context_target(self, context: Optional[Dict[str, Any]]) -> TriaxialState:
+        """Target state shifted by the environmental context"""
+        if not context:
+            return self.target_state
+        context_shift = self._calculate_context_shift(context)
+        return TriaxialState(
+            precision=self.target_state.precision + context_shift.precision,
+            boundary=self.target_state.boundary + context_shift.boundary,
+            temporal=self.target_state.temporal + context_shift.temporal
+        )
+    
+    @staticmethod
+    def _algorithm_for(metadata: CompressionMetadata) -> CompressionAlgorithm:
+        """Extract algorithm from metadata"""
+        if metadata.algorithm_path:
+            try:
+                return CompressionAlgorithm(metadata.algorithm_path[-1])
+            except ValueError:
+                pass
+        return CompressionAlgorithm.ZSTD
+    
     def _calculate_context_shift(self, context: Dict[str, Any]) -> TriaxialState:
         """Calculate state shift based on environmental context"""
         shift = TriaxialState(0.0, 0.0, 0.0)
@@ -465,15 +711,7 @@ class UniversalCompressor:
         algorithm: CompressionAlgorithm
     ) -> bytes:
         """Execute compression with selected algorithm"""
-        if algorithm == CompressionAlgorithm.GZIP:
-            return zlib.compress(data, level=9)
-        elif algorithm == CompressionAlgorithm.BZIP2:
-            return bz2.compress(data, compresslevel=9)
-        elif algorithm in [CompressionAlgorithm.XZ, CompressionAlgorithm.LZMA2]:
-            return lzma.compress(data, preset=9)
-        else:
-            # Default to zlib for others (LZ4, ZSTD, etc. would need external libs)
-            return zlib.compress(data, level=6)
+        return compress_block(data, algorithm)
     
     def _execute_decompression(
         self,
@@ -481,14 +719,7 @@ class UniversalCompressor:
         algorithm: CompressionAlgorithm
     ) -> bytes:
         """Execute decompression with selected algorithm"""
-        if algorithm == CompressionAlgorithm.GZIP:
-            return zlib.decompress(data)
-        elif algorithm == CompressionAlgorithm.BZIP2:
-            return bz2.decompress(data)
-        elif algorithm in [CompressionAlgorithm.XZ, CompressionAlgorithm.LZMA2]:
-            return lzma.decompress(data)
-        else:
-            return zlib.decompress(data)
+        return decompress_block(data, algorithm)
     
     def _create_metadata(
         self,
@@ -595,12 +826,15 @@ class UniversalCompressor:
         - Metadata: JSON (variable)
         - Compressed data: (remaining)
         """
-        # Magic bytes
-        magic = b"UCCC-\xce\xbb\x00"  # λ in UTF-8
-        
-        # Version
-        version = struct.pack('<I', 1)
-        
+        return self._uccc_header(metadata) + compressed
+    
+    def _uccc_header(
+        self,
+        metadata: CompressionMetadata,
+        version: int = 1,
+        container: Optional[Dict[str, Any]] = None
+    ) -> bytes:
+        """Magic, version, metadata length and metadata JSON shared by every container version"""
         # Serialize metadata
         metadata_dict = {
             'version': metadata.version,
@@ -614,39 +848,39 @@ class UniversalCompressor:
             'cosmic_day': metadata.cosmic_day,
             'noospheric_index': metadata.noospheric_index,
         }
+        if container:
+            metadata_dict['container'] = container
         
         metadata_json = json.dumps(metadata_dict).encode('utf-8')
-        metadata_length = struct.pack('<I', len(metadata_json))
         
         # Assemble
-        uccc_data = magic + version + metadata_length + metadata_json + compressed
-        
-        return uccc_data
+        return UCCC_MAGIC + struct.pack('<II', version, len(metadata_json)) + metadata_json
     
     def _parse_uccc_format(self, uccc_data: bytes) -> Tuple[bytes, CompressionMetadata]:
-        """Parse UCCC format file"""
-        # Check magic
-        if not uccc_data.startswith(b"UCCC-\xce\xbb\x00"):
-            raise ValueError("Not a valid UCCC file")
-        
-        # Parse header
-        offset = 8
-        version = struct.unpack('<I', uccc_data[offset:offset+4])[0]
-        offset += 4
-        
-        metadata_length = struct.unpack('<I', uccc_data[offset:offset+4])[0]
-        offset += 4
-        
-        # Parse metadata
-        metadata_json = uccc_data[offset:offset+metadata_length]
-        metadata_dict = json.loads(metadata_json.decode('utf-8'))
-        offset += metadata_length
+        """Parse UCCC format file (the payload is returned as a view, not a copy)"""
+        reader = io.BytesIO(uccc_data)
+        version, metadata_dict = self._read_uccc_header(reader)
         
         # Remaining is compressed data
-        compressed = uccc_data[offset:]
+        compressed = memoryview(uccc_data)[reader.tell():]
         
-        # Reconstruct metadata
-        metadata = CompressionMetadata(
+        return compressed, self._metadata_from_dict(metadata_dict)
+    
+    @staticmethod
+    def _read_uccc_header(src: BinaryIO) -> Tuple[int, Dict[str, Any]]:
+        """Read magic, version and metadata JSON, leaving `src` at the payload"""
+        # Check magic
+        if src.read(8) != UCCC_MAGIC:
+            raise ValueError("Not a valid UCCC file")
+        
+        version, metadata_length = struct.unpack('<II', _read_exact(src, 8))
+        metadata_dict = json.loads(_read_exact(src, metadata_length).decode('utf-8'))
+        return version, metadata_dict
+    
+    @staticmethod
+    def _metadata_from_dict(metadata_dict: Dict[str, Any]) -> CompressionMetadata:
+        """Reconstruct metadata"""
+        return CompressionMetadata(
             version=metadata_dict['version'],
             creation_timestamp=metadata_dict['creation_timestamp'],
             cosmological_time=metadata_dict['cosmological_time'],
@@ -661,8 +895,163 @@ class UniversalCompressor:
             cosmic_day=metadata_dict['cosmic_day'],
             noospheric_index=metadata_dict['noospheric_index']
         )
+
+
+# ============================================================================
+# RANDOM-ACCESS READER
+# ============================================================================
+
+class UCCCReader(io.RawIOBase):
+    """
+    Seekable read-only view of the original data in a UCCC file
+    
+    v2 containers are located through the trailing block index, so a read
+    decompresses only the blocks covering the requested range. The last
+    `cached_blocks` decoded blocks are kept in an LRU, which makes nearby
+    reads cheap. v1 files have no index and are decoded whole on first read.
+    """
+    
+    def __init__(self, file, cached_blocks: int = DEFAULT_CACHED_BLOCKS):
+        super().__init__()
+        if isinstance(file, (str, bytes, os.PathLike)):
+            self._file = open(file, 'rb')
+            self._owns_file = True
+        else:
+            self._file = file
+            self._owns_file = False
+        self.cached_blocks = max(1, cached_blocks)
+        self._cache: 'OrderedDict[int, bytes]' = OrderedDict()
+        self._position = 0
+        self.blocks_decoded = 0
+        
+        try:
+            self._load_index()
+        except Exception:
+            if self._owns_file:
+                self._file.close()
+            raise
+    
+    def _load_index(self):
+        src = self._file
+        src.seek(0)
+        version, metadata_dict = UniversalCompressor._read_uccc_header(src)
+        self.metadata = UniversalCompressor._metadata_from_dict(metadata_dict)
+        self.algorithm = UniversalCompressor._algorithm_for(self.metadata)
+        self.version = version
+        
+        if version < 2:
+            # One compressed stream after the header: a single block of unknown size
+            start = src.tell()
+            end = src.seek(0, io.SEEK_END)
+            self._frames = [(start, end - start, None, None)]
+            self._starts = [0]
+            self.size = None
+            return
+        
+        end = src.seek(0, io.SEEK_END)
+        if end < BLOCK_TRAILER.size:
+            raise ValueError("Truncated UCCC file")
+        src.seek(end - BLOCK_TRAILER.size)
+        index_offset, self.size, magic = BLOCK_TRAILER.unpack(_read_exact(src, BLOCK_TRAILER.size))
+        if magic != UCCC_INDEX_MAGIC:
+            raise ValueError("UCCC file has no block index")
+        src.seek(index_offset)
+        index = _read_exact(src, end - BLOCK_TRAILER.size - index_offset)
+        
+        self._frames = []
+        self._starts = []
+        position = 0
+        for frame_offset, compressed_length, raw_length, crc in BLOCK_INDEX_ENTRY.iter_unpack(index):
+            # Payload follows the frame header
+            self._frames.append((frame_offset + BLOCK_FRAME.size, compressed_length, raw_length, crc))
+            self._starts.append(position)
+            position += raw_length
+        if position != self.size:
+            raise ValueError("UCCC block index does not match the original size")
+    
+    def _block(self, number: int) -> bytes:
+        """Decoded block, from the LRU or the file"""
+        data = self._cache.get(number)
+        if data is not None:
+            self._cache.move_to_end(number)
+            return data
+        
+        offset, compressed_length, raw_length, crc = self._frames[number]
+        self._file.seek(offset)
+        payload = _read_exact(self._file, compressed_length)
+        if raw_length is None:
+            data = decompress_block(payload, self.algorithm)
+            self.size = len(data)
+        else:
+            data = _decode_block((payload, raw_length, crc), self.algorithm)
+        self.blocks_decoded += 1
         
-        return compressed, metadata
+        self._cache[number] = data
+        if len(self._cache) > self.cached_blocks:
+            self._cache.popitem(last=False)
+        return data
+    
+    def _length(self) -> int:
+        if self.size is None:
+            self._block(0)
+        return self.size
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._position
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._length() + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self._position = position
+        return position
+    
+    def readinto(self, buffer) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+        out = memoryview(buffer).cast('B')
+        end = min(self._position + len(out), self._length())
+        written = 0
+        while self._position < end:
+            number = bisect_right(self._starts, self._position) - 1
+            data = self._block(number)
+            inner = self._position - self._starts[number]
+            take = min(len(data) - inner, end - self._position)
+            out[written:written + take] = data[inner:inner + take]
+            written += take
+            self._position += take
+        return written
+    
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = max(0, self._length() - self._position)
+        buffer = bytearray(size)
+        return bytes(buffer[:self.readinto(buffer)])
+    
+    def readall(self) -> bytes:
+        return self.read()
+    
+    def close(self):
+        if not self.closed:
+            self._cache.clear()
+            if self._owns_file:
+                self._file.close()
+        super().close()
 
 
 # ============================================================================
@@ -1012,11 +1401,15 @@ Examples:
     compress_parser.add_argument('output', help='Output UCCC file')
     compress_parser.add_argument('--latitude', type=float, help='Observer latitude')
     compress_parser.add_argument('--daylight', type=float, help='Daylight hours')
+    compress_parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE,
+                                 help='Bytes per independently compressed block')
+    compress_parser.add_argument('--workers', type=int, help='Compression processes (default: all cores)')
     
     # Decompress command
     decompress_parser = subparsers.add_parser('decompress', help='Decompress UCCC file')
     decompress_parser.add_argument('input', help='Input UCCC file')
     decompress_parser.add_argument('output', help='Output file')
+    decompress_parser.add_argument('--workers', type=int, help='Decompression processes (default: all cores)')
     
     # Diagnose command
     diagnose_parser = subparsers.add_parser('diagnose', help='Diagnose cognitive state')
@@ -1034,10 +1427,6 @@ Examples:
     args = parser.parse_args()
     
     if args.command == 'compress':
-        # Read input file
-        with open(args.input, 'rb') as f:
-            data = f.read()
-        
         # Build context
         context = {}
         if args.latitude is not None:
@@ -1045,35 +1434,27 @@ Examples:
         if args.daylight is not None:
             context['daylight_hours'] = args.daylight
         
-        # Compress
+        # Compress, streaming block by block
         compressor = UniversalCompressor()
-        compressed, metadata = compressor.compress(data, context)
-        
-        # Write output
-        with open(args.output, 'wb') as f:
-            f.write(compressed)
+        with open(args.input, 'rb') as src, open(args.output, 'wb') as dst:
+            metadata = compressor.compress_stream(
+                src, dst, context, block_size=args.block_size, workers=args.workers
+            )
         
         # Show results
-        print(f"✓ Compressed {len(data)} → {len(compressed)} bytes")
+        print(f"✓ Compressed {os.path.getsize(args.input)} → {os.path.getsize(args.output)} bytes")
         print(f"  Compression ratio: {metadata.coherence_budget:.3f}")
         print(f"  Algorithm: {metadata.algorithm_path[-1]}")
         print(f"  Data state: {metadata.compression_state}")
         print(f"  Coherence budget: {metadata.coherence_budget:.3f}")
         
     elif args.command == 'decompress':
-        # Read UCCC file
-        with open(args.input, 'rb') as f:
-            uccc_data = f.read()
-        
-        # Decompress
+        # Decompress, streaming block by block
         compressor = UniversalCompressor()
-        data, metadata = compressor.decompress(uccc_data)
-        
-        # Write output
-        with open(args.output, 'wb') as f:
-            f.write(data)
+        with open(args.input, 'rb') as src, open(args.output, 'wb') as dst:
+            metadata = compressor.decompress_stream(src, dst, workers=args.workers)
         
-        print(f"✓ Decompressed to {len(data)} bytes")
+        print(f"✓ Decompressed to {os.path.getsize(args.output)} bytes")
         print(f"  Original algorithm: {metadata.algorithm_path[-1]}")
         print(f"  Cosmic day: {metadata.cosmic_day}")
         
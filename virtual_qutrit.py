@@ -12,7 +12,14 @@ Mapping:
 """
 
 import random
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 class RealityLeakError(Exception):
     """Raised when the Qutrit collapses into the forbidden |11> state."""
@@ -181,6 +188,205 @@ class VirtualQutrit:
         if target == 'q0': self.q0 = 1 - self.q0
         if target == 'q1': self.q1 = 1 - self.q1
 
+# --- PACKED REGISTER (Word-Parallel Qutrits) ---
+
+LANES_PER_WORD = 32                # 2 bits per qutrit in a uint64 word
+_LO = 0x5555555555555555           # Q0 bit of every lane
+_HI = _LO << 1                     # Q1 bit of every lane
+
+if NUMPY_AVAILABLE:
+    if hasattr(np, 'bitwise_count'):
+        def _popcount(words: 'np.ndarray') -> int:
+            return int(np.bitwise_count(words).sum())
+    else:
+        _BYTE_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+        def _popcount(words: 'np.ndarray') -> int:
+            return int(_BYTE_POPCOUNT[words.view(np.uint8)].sum())
+
+class QutritRegister:
+    """
+    N qutrits packed two bits each into numpy uint64 words, same (Q1, Q0)
+    mapping as VirtualQutrit. Lane i lives in word i // 32 at bits 2*(i % 32)
+    (Q0) and 2*(i % 32) + 1 (Q1), so every gate is a handful of bitwise ops
+    per 32 qutrits instead of a Python call per qutrit.
+
+    Gates work on the split planes l = w & LO (Q0) and h = (w >> 1) & LO (Q1).
+    Lanes past N in the last word are kept at |00> so they never count.
+    """
+
+    def __init__(self, size: int, initial_state: int = 0):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("QutritRegister requires numpy")
+        if initial_state not in [0, 1, 2]:
+            raise ValueError("Initial state must be 0, 1, or 2.")
+        self.size = size
+        n_words = (size + LANES_PER_WORD - 1) // LANES_PER_WORD
+        used = size - (n_words - 1) * LANES_PER_WORD if size else 0
+        self._tail = np.uint64((1 << (2 * used)) - 1 if used < LANES_PER_WORD else (1 << 64) - 1)
+        fill = {0: 0, 1: _LO, 2: _HI}[initial_state]
+        self.words = np.full(n_words, fill, dtype=np.uint64)
+        self._mask_tail()
+
+    # --- Construction / Readout ---
+
+    @classmethod
+    def from_states(cls, states) -> 'QutritRegister':
+        """Pack an array of per-qutrit states (0-3; 3 allowed, it is a leak)"""
+        states = np.asarray(states, dtype=np.uint8)
+        reg = cls(len(states))
+        padded = np.zeros(len(reg.words) * LANES_PER_WORD, dtype=np.uint64)
+        padded[:len(states)] = states & 3
+        shifts = np.arange(0, 64, 2, dtype=np.uint64)
+        reg.words = np.bitwise_or.reduce(padded.reshape(-1, LANES_PER_WORD) << shifts, axis=1)
+        return reg
+
+    @classmethod
+    def random(cls, size: int, rng: Optional['np.random.Generator'] = None) -> 'QutritRegister':
+        """Uniformly random trits (the register form of generate_random_trit)"""
+        rng = rng or np.random.default_rng()
+        return cls.from_states(rng.integers(0, 3, size, dtype=np.uint8))
+
+    def states(self) -> 'np.ndarray':
+        """Raw per-qutrit states as uint8 (3 marks a leaked lane); no leak check"""
+        shifts = np.arange(0, 64, 2, dtype=np.uint64)
+        lanes = (self.words[:, None] >> shifts) & np.uint64(3)
+        return lanes.reshape(-1)[:self.size].astype(np.uint8)
+
+    def measure(self) -> 'np.ndarray':
+        """
+        Collapses every qutrit at once.
+        Raises RealityLeakError if any lane is in the forbidden state |11>.
+        """
+        leaks = self.count_forbidden()
+        if leaks:
+            raise RealityLeakError(
+                f"CRITICAL: {leaks} qutrits leaked into Forbidden State |11> (Bit Flip detected).")
+        return self.states()
+
+    def forbidden_mask(self) -> 'np.ndarray':
+        """Per word, the Q0 bit of every lane sitting in |11>"""
+        w = self.words
+        return w & (w >> np.uint64(1)) & np.uint64(_LO)
+
+    def count_forbidden(self) -> int:
+        return _popcount(self.forbidden_mask())
+
+    def forbidden_indices(self) -> 'np.ndarray':
+        """Indices of the qutrits in |11>"""
+        return np.flatnonzero(self._unpack_lanes(self.forbidden_mask()))
+
+    def counts(self) -> Tuple[int, int, int, int]:
+        """Population of |0>, |1>, |2> and the forbidden |11>"""
+        w = self.words
+        lo = np.uint64(_LO)
+        l = w & lo
+        h = (w >> np.uint64(1)) & lo
+        n1 = _popcount(l & ~h)
+        n2 = _popcount(h & ~l)
+        n3 = _popcount(h & l)
+        return self.size - n1 - n2 - n3, n1, n2, n3
+
+    # --- Gates (Word-Parallel) ---
+
+    def apply_trinity(self):
+        """
+        The Sovereign Gate on every qutrit: 0 -> 1 -> 2 -> 0, identity on |11>.
+        Q1' = Q0, Q0' = NOT (Q1 XOR Q0).
+        """
+        lo = np.uint64(_LO)
+        l = self.words & lo
+        h = (self.words >> np.uint64(1)) & lo
+        self.words = (l << np.uint64(1)) | (~(h ^ l) & lo)
+        self._mask_tail()
+
+    def gate_x01(self):
+        """Swap |0> and |1> everywhere: flip Q0 wherever Q1 = 0"""
+        self.words ^= ~(self.words >> np.uint64(1)) & np.uint64(_LO)
+        self._mask_tail()
+
+    def gate_x12(self):
+        """Swap |1> and |2> everywhere: exchanging Q1 and Q0 (fixes |00> and |11>)"""
+        lo = np.uint64(_LO)
+        l = self.words & lo
+        h = (self.words >> np.uint64(1)) & lo
+        self.words = (l << np.uint64(1)) | h
+
+    def add_mod3(self, other: 'QutritRegister'):
+        """
+        Lane-wise self = (self + other) % 3 over two equal-sized registers.
+        Raises RealityLeakError if either register has leaked lanes.
+        """
+        if other.size != self.size:
+            raise ValueError(f"Register size mismatch: {self.size} vs {other.size}")
+        if self.count_forbidden() or other.count_forbidden():
+            raise RealityLeakError("CRITICAL: Qutrit leaked into Forbidden State |11> (Bit Flip detected).")
+        lo = np.uint64(_LO)
+        one = np.uint64(1)
+        al, ah = self.words & lo, (self.words >> one) & lo
+        bl, bh = other.words & lo, (other.words >> one) & lo
+        a0, b0 = ~(al | ah) & lo, ~(bl | bh) & lo
+        # Sum is 1 for (0,1) (1,0) (2,2); sum is 2 for (0,2) (1,1) (2,0)
+        rl = (a0 & bl) | (al & b0) | (ah & bh)
+        rh = (a0 & bh) | (al & bl) | (ah & b0)
+        self.words = (rh << one) | rl
+
+    @staticmethod
+    def hybrid_cnot(control: 'QutritRegister', target: Dict[str, 'np.ndarray']):
+        """
+        Lane-wise Hybrid Qutrit-Qubit CNOT: |0><0|⊗I + |1><1|⊗X + |2><2|⊗Y
+
+        Args:
+            control: The QutritRegister.
+            target: {'val': uint8 array of 0/1, 'phase': float array} with one
+                    simulated qubit per control qutrit, updated in place.
+        """
+        if control.count_forbidden():
+            raise RealityLeakError("CRITICAL: Qutrit leaked into Forbidden State |11> (Bit Flip detected).")
+        lo = np.uint64(_LO)
+        l = control.words & lo
+        h = (control.words >> np.uint64(1)) & lo
+        target['val'] ^= control._unpack_lanes(l | h).astype(target['val'].dtype)
+        y_lanes = control._unpack_lanes(h)
+        phase = target['phase']
+        np.add(phase, 1.57, out=phase, where=y_lanes)
+        np.mod(phase, 6.28, out=phase, where=y_lanes)
+
+    def bit_flip_error(self, probability: float = 1.0,
+                       rng: Optional['np.random.Generator'] = None):
+        """
+        Cosmic ray bit flips: each qutrit is hit with `probability`, and a hit
+        flips Q0 or Q1 at random (so it can cause Leakage).
+        """
+        rng = rng or np.random.default_rng()
+        coin = rng.integers(0, np.iinfo(np.uint64).max, len(self.words), dtype=np.uint64, endpoint=True)
+        lo = np.uint64(_LO)
+        hit = lo if probability >= 1.0 else self._pack_lanes(rng.random(self.size) < probability)
+        flip_q0 = coin & hit
+        flip_q1 = (~coin & hit) << np.uint64(1)
+        self.words ^= flip_q0 | flip_q1
+        self._mask_tail()
+
+    # --- Lane Helpers ---
+
+    def _mask_tail(self):
+        if len(self.words):
+            self.words[-1] &= self._tail
+
+    def _unpack_lanes(self, lane_words: 'np.ndarray') -> 'np.ndarray':
+        """Q0-aligned lane bits -> bool per qutrit"""
+        bits = np.unpackbits(lane_words.view(np.uint8), bitorder='little')
+        return bits[0::2][:self.size].astype(bool)
+
+    def _pack_lanes(self, flags: 'np.ndarray') -> 'np.ndarray':
+        """bool per qutrit -> Q0-aligned lane bits"""
+        bits = np.zeros(len(self.words) * 64, dtype=np.uint8)
+        bits[0:2 * self.size:2] = flags
+        return np.packbits(bits, bitorder='little').view(np.uint64)
+
+    def __len__(self) -> int:
+        return self.size
+
 # --- BUDDY EXPANSION DRIVER ---
 if __name__ == "__main__":
     print("Initializing Virtual Qutrit Bridge (Buddy Expansion)...")